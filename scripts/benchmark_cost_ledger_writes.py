@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Concurrent cost ledger append benchmark ($0, no network).
+
+Runs the same workload twice against a fresh temporary ledger: once with the
+default per-event writer (one lock acquisition and one fsync per append), once
+with group commit enabled (concurrent appends share both). Every append uses
+``require_fsync=True`` and a unique idempotency key, so each acknowledgement
+is a durable new event in both modes.
+
+HOW TO USE:
+  python scripts/benchmark_cost_ledger_writes.py                   # 32 writers x 50 events
+  python scripts/benchmark_cost_ledger_writes.py --writers 8 --events 200
+  python scripts/benchmark_cost_ledger_writes.py --window-ms 5     # longer commit window
+  python scripts/benchmark_cost_ledger_writes.py --json            # machine-readable
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Barrier
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from deepr.observability.cost_ledger import CostLedger
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+def run_mode(writers: int, events: int, window_ms: float | None) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = CostLedger(ledger_path=Path(tmp) / "cost_ledger.jsonl", group_commit_window_ms=window_ms)
+        barrier = Barrier(writers)
+
+        def writer(index: int) -> list[float]:
+            latencies = []
+            barrier.wait()
+            for n in range(events):
+                started = time.perf_counter()
+                ledger.record_event(
+                    "benchmark",
+                    "local",
+                    0.001,
+                    idempotency_key=f"bench-{index}-{n}",
+                    require_fsync=True,
+                )
+                latencies.append(time.perf_counter() - started)
+            return latencies
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=writers) as pool:
+            latencies = [sample for batch in pool.map(writer, range(writers)) for sample in batch]
+        elapsed = time.perf_counter() - started
+        recorded = len(ledger.get_events())
+
+    return {
+        "events": recorded,
+        "seconds": elapsed,
+        "events_per_second": recorded / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=32, help="Concurrent writer threads (default: 32)")
+    parser.add_argument("--events", type=int, default=50, help="Appends per writer (default: 50)")
+    parser.add_argument("--window-ms", type=float, default=2.0, help="Group commit window (default: 2 ms)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = {
+        "per_event": run_mode(args.writers, args.events, None),
+        "group_commit": run_mode(args.writers, args.events, args.window_ms),
+    }
+    if args.json:
+        print(json.dumps({"writers": args.writers, "events_per_writer": args.events, **results}, indent=2))
+        return 0
+
+    print(f"{args.writers} writers x {args.events} durable appends")
+    for name, row in results.items():
+        print(
+            f"  {name:<13} {row['events_per_second']:8.0f} events/s  "
+            f"p50 {row['p50_ms']:7.2f} ms  p99 {row['p99_ms']:7.2f} ms  max {row['max_ms']:7.2f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Local LazyGraphRAG indexing and retrieval benchmark ($0, no network).
+
+Checks the documented LazyGraphRAG target ("index 10k docs in under 5
+minutes") and reports graph retrieval latency. A deterministic synthetic
+corpus is indexed into a temporary directory, then a fixed query set is run
+through ``LazyGraphRAG.retrieve`` with the subgraph cache cleared so every
+query pays for search, traversal and chunk building.
+
+HOW TO USE:
+  python scripts/benchmark_lazy_graph_rag.py                  # 10k docs, 500 queries
+  python scripts/benchmark_lazy_graph_rag.py --docs 1000 --queries 200
+  python scripts/benchmark_lazy_graph_rag.py --workers 1          # in-process extraction
+  python scripts/benchmark_lazy_graph_rag.py --json           # machine-readable
+
+Exit status is 1 when indexing misses the target time (``--target-seconds``).
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from deepr.experts.lazy_graph_rag import LazyGraphRAG
+
+# Target from the lazy_graph_rag module docstring.
+DEFAULT_TARGET_SECONDS = 300.0
+
+_TOPICS = [
+    "quantum error correction",
+    "surface code",
+    "neural network pruning",
+    "gradient descent",
+    "retrieval augmented generation",
+    "vector database",
+    "graph traversal",
+    "knowledge graph",
+    "battery chemistry",
+    "solid state electrolyte",
+    "supply chain risk",
+    "inventory forecasting",
+    "protein folding",
+    "molecular dynamics",
+    "carbon capture",
+    "grid storage",
+]
+_FILLER = [
+    "Recent work explains how {a} interacts with {b} in production systems.",
+    "The relationship between {a} and {b} depends on measurement quality.",
+    "Teams comparing {a} with {b} report different failure modes.",
+    "A careful survey of {a} shows why {b} remains an open problem.",
+]
+
+
+def synthetic_document(index: int, rng: random.Random) -> dict[str, str]:
+    """One markdown document with headings and topic co-occurrences."""
+    sections = []
+    for section in range(3):
+        a, b = rng.sample(_TOPICS, 2)
+        sentences = [rng.choice(_FILLER).format(a=a, b=b) for _ in range(4)]
+        sections.append(f"## {a.title()} notes {section}\n\n" + " ".join(sentences))
+    return {"id": f"doc-{index:05d}", "content": f"# Document {index}\n\n" + "\n\n".join(sections)}
+
+
+def synthetic_queries(count: int, rng: random.Random) -> list[str]:
+    return [f"how does {a} affect {b}" for a, b in (rng.sample(_TOPICS, 2) for _ in range(count))]
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+async def run_benchmark(
+    docs: int, queries: int, seed: int, storage_dir: Path, workers: int | None = None
+) -> dict[str, float]:
+    rng = random.Random(seed)
+    rag = LazyGraphRAG(expert_name="benchmark", storage_dir=storage_dir)
+    corpus = [synthetic_document(i, rng) for i in range(docs)]
+
+    started = time.perf_counter()
+    stats = await rag.index_documents(corpus, workers=workers)
+    index_seconds = time.perf_counter() - started
+
+    latencies_ms = []
+    for query in synthetic_queries(queries, rng):
+        rag.cache.clear()
+        started = time.perf_counter()
+        await rag.retrieve(query, top_k=5)
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    graph = rag.graph.get_stats()
+    return {
+        "documents": docs,
+        "concepts": graph["concept_count"],
+        "edges": graph["edge_count"],
+        "index_seconds": index_seconds,
+        "docs_per_second": stats["docs_per_second"],
+        "retrieve_p50_ms": statistics.median(latencies_ms) if latencies_ms else 0.0,
+        "retrieve_p95_ms": _percentile(latencies_ms, 95) if latencies_ms else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=10_000, help="Documents to index (default: 10000)")
+    parser.add_argument("--queries", type=int, default=500, help="Retrieve calls to time (default: 500)")
+    parser.add_argument("--seed", type=int, default=7, help="Corpus and query seed")
+    parser.add_argument("--workers", type=int, default=None, help="Extraction processes (default: CPU count)")
+    parser.add_argument(
+        "--target-seconds", type=float, default=DEFAULT_TARGET_SECONDS, help="Indexing time budget (default: 300)"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="deepr-graph-bench-") as tmp:
+        results = asyncio.run(run_benchmark(args.docs, args.queries, args.seed, Path(tmp), args.workers))
+    results["target_seconds"] = args.target_seconds
+    met = results["index_seconds"] <= args.target_seconds
+
+    if args.json:
+        print(json.dumps({**results, "target_met": met}, indent=2))
+    else:
+        verdict = "met" if met else "MISSED"
+        print(f"Indexed {results['documents']} docs in {results['index_seconds']:.1f}s")
+        print(f"  ({results['docs_per_second']:.1f} docs/s; target {args.target_seconds:.0f}s: {verdict})")
+        print(f"Graph: {results['concepts']} concepts, {results['edges']} edges")
+        print(f"retrieve p50 {results['retrieve_p50_ms']:.2f} ms, p95 {results['retrieve_p95_ms']:.2f} ms")
+    return 0 if met else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""SQLiteQueue dequeue and list latency benchmark ($0, no network).
+
+Seeds a temporary queue database with ``--rows`` jobs (a fraction still
+queued, the rest completed, spread over priorities and submission times),
+then times ``dequeue`` claims, ``list_jobs`` pages (including a keyset page
+halfway through the completed results and a prompt search) and ``get_job``
+against it. The synchronous queue methods are called directly so the
+numbers measure the database work rather than ``asyncio.to_thread``
+scheduling.
+
+HOW TO USE:
+  python scripts/benchmark_queue.py                        # 100k rows
+  python scripts/benchmark_queue.py --rows 20000 --ops 200
+  python scripts/benchmark_queue.py --json                 # machine-readable
+"""
+
+import argparse
+import json
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from deepr.queue.base import JobStatus, ResearchJob, encode_job_cursor
+from deepr.queue.local_queue import SQLiteQueue
+from deepr.queue.sqlite_listing import build_list_query
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+def seed(queue: SQLiteQueue, rows: int, queued_fraction: float) -> None:
+    """Bulk-insert ``rows`` jobs through the queue's own row mapping."""
+    started = datetime(2025, 1, 1, tzinfo=UTC)
+    queued_every = max(1, round(1 / queued_fraction)) if queued_fraction > 0 else rows + 1
+    batch = []
+    for n in range(rows):
+        status = JobStatus.QUEUED if n % queued_every == 0 else JobStatus.COMPLETED
+        job = ResearchJob(
+            id=f"job-{n:07d}",
+            prompt=f"benchmark prompt {n}",
+            status=status,
+            priority=1 + n % 10,
+            submitted_at=started + timedelta(seconds=n),
+            tenant_id=f"tenant-{n % 8}",
+        )
+        batch.append(queue._job_to_dict(job))
+    columns = list(batch[0])
+    conn = sqlite3.connect(queue.db_path)
+    try:
+        conn.executemany(
+            f"INSERT INTO research_queue ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            [tuple(row[column] for column in columns) for row in batch],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _time(operation: Callable[[], object], ops: int) -> dict[str, float]:
+    latencies = []
+    for _ in range(ops):
+        started = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - started)
+    return {
+        "ops": ops,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+
+def _list(queue: SQLiteQueue, status: JobStatus | None = None, **options: str) -> list[ResearchJob]:
+    page = {"search": None, "sort_by": "submitted_at", "cursor": None, **options}
+    query, params = build_list_query(status, None, 50, 0, fts=queue._prompt_search, **page)
+    return queue._list_jobs_sync(query, params)
+
+
+def run(rows: int, ops: int, queued_fraction: float) -> dict[str, dict[str, float]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = SQLiteQueue(Path(tmp) / "queue.db")
+        seed(queue, rows, queued_fraction)
+        middle = queue._get_job_sync(f"job-{rows // 2 + 1:07d}")
+        deep_cursor = encode_job_cursor(middle, "completed_at") if middle else None
+        results = {
+            "dequeue": _time(lambda: queue._dequeue_sync("bench-worker"), ops),
+            "list_recent": _time(lambda: _list(queue), ops),
+            "list_queued": _time(lambda: _list(queue, JobStatus.QUEUED), ops),
+            "results_deep": _time(
+                lambda: _list(queue, JobStatus.COMPLETED, sort_by="completed_at", cursor=deep_cursor), ops
+            ),
+            "results_search": _time(lambda: _list(queue, JobStatus.COMPLETED, search="prompt 4242"), ops),
+            "get_job": _time(lambda: queue._get_job_sync(f"job-{rows // 2:07d}"), ops),
+        }
+        queue.close()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="Jobs to seed (default: 100000)")
+    parser.add_argument("--ops", type=int, default=500, help="Timed calls per operation (default: 500)")
+    parser.add_argument(
+        "--queued-fraction", type=float, default=0.1, help="Share of seeded jobs left queued (default: 0.1)"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.ops, args.queued_fraction)
+    if args.json:
+        print(json.dumps({"rows": args.rows, **results}, indent=2))
+        return 0
+
+    print(f"{args.rows} rows, {args.ops} calls per operation")
+    for name, row in results.items():
+        print(f"  {name:<14} p50 {row['p50_ms']:7.3f} ms  p95 {row['p95_ms']:7.3f} ms  max {row['max_ms']:7.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
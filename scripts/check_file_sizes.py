@@ -27,15 +27,14 @@ GRANDFATHERED: dict[str, int] = {
     "deepr/web/app.py": 3930,  # ratcheted after browser-chat REST extraction, 2026-07-11
     "deepr/cli/commands/semantic/experts.py": 3338,
     "deepr/experts/chat.py": 2628,  # ratcheted after live-session operation extraction, 2026-07-11
-    "deepr/experts/lazy_graph_rag.py": 2040,
+    "deepr/experts/lazy_graph_rag.py": 1751,  # ratcheted after batched extraction, 2026-10-16
     "deepr/mcp/server.py": 2000,  # +63: deepr_consult_experts MCP tool (native team consultation, 2026-06-21)
-    "deepr/experts/beliefs.py": 1448,  # +7: security fix (path containment, 2026-06-16); +33: source-independence trust floor (2026-06-21)
+    "deepr/experts/beliefs.py": 1358,  # ratcheted after journal persistence + token index extraction, 2026-10-16
     "deepr/cli/commands/run.py": 1363,
     "deepr/experts/curriculum.py": 1340,
     "deepr/experts/memory.py": 1291,
     "deepr/experts/learner.py": 1287,
     "deepr/providers/registry.py": 1303,  # +24: grok-4.5 + claude-opus-5 registration (2026-07-25); the pricing registry must grow when providers launch billable models
-    "deepr/observability/costs.py": 1156,  # +10: cost-integrity fix (dashboard reads canonical ledger, 2026-06-21)
     "deepr/core/settings.py": 1120,
     "deepr/cli/commands/prep.py": 1094,
     "deepr/cli/commands/research.py": 1049,
@@ -106,9 +106,7 @@ def _ledger_month_spend() -> float | None:
 
         now = datetime.now(UTC)
         month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        return CostLedger().with_locked_accounting_events(
-            lambda events: sum(event.cost_usd for event in events if event.timestamp >= month_start)
-        )
+        return CostLedger().with_locked_rollup(lambda rollup: rollup.total_since(month_start))
     except Exception:
         return None
 
@@ -19,6 +19,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from deepr.cli.commands.costs_ledger_segments import register_ledger_segment_commands
 from deepr.cli.commands.costs_spend_dispositions import (
     disposition_log_path_for_ledger,
     register_spend_disposition_commands,
@@ -144,6 +145,7 @@ def costs():
 
 costs.add_command(reconcile_billing_command)
 register_spend_disposition_commands(costs)
+register_ledger_segment_commands(costs)
 
 
 @costs.command()
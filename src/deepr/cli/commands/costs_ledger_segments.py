@@ -0,0 +1,82 @@
+"""CLI command for the cost ledger's monthly segment index (costs verify-ledger)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from deepr.observability.cost_ledger import CostLedger
+from deepr.observability.cost_segments import LedgerSegment
+
+console = Console()
+
+
+def _segment_row(segment: LedgerSegment) -> dict[str, object]:
+    def iso(value: float) -> str | None:
+        return datetime.fromtimestamp(value, UTC).isoformat() if segment.event_count else None
+
+    return {
+        "month": f"{segment.month // 100:04d}-{segment.month % 100:02d}" if segment.month else None,
+        "start_byte": segment.start,
+        "end_byte": segment.end,
+        "event_count": segment.event_count,
+        "first_timestamp": iso(segment.first_ts),
+        "last_timestamp": iso(segment.last_ts),
+        "sha256": segment.sha256.hex(),
+    }
+
+
+@click.command("verify-ledger")
+@click.option("--rebuild", is_flag=True, help="Rebuild the segment index from the ledger (migrates older ledgers).")
+@click.option("--json", "json_output", is_flag=True, help="Machine-readable output.")
+@click.option("--ledger-path", default=None, hidden=True, help="Override ledger path (tests).")
+def verify_ledger(rebuild: bool, json_output: bool, ledger_path: str | None) -> None:
+    """Verify every monthly ledger segment's hash and the segment hash chain."""
+    ledger = CostLedger(ledger_path=Path(ledger_path) if ledger_path else None)
+    segments, problems = ledger.verify_segment_index(rebuild=rebuild)
+    rows = [_segment_row(segment) for segment in segments]
+    if json_output:
+        click.echo(
+            json.dumps(
+                {
+                    "path": str(ledger.ledger_path),
+                    "ok": not problems,
+                    "segments": rows,
+                    "problems": problems,
+                },
+                indent=2,
+            )
+        )
+    else:
+        table = Table(title="Cost Ledger Segments")
+        table.add_column("Month", style="cyan")
+        table.add_column("Events", justify="right")
+        table.add_column("Bytes", justify="right")
+        table.add_column("First", style="dim")
+        table.add_column("Last", style="dim")
+        for row in rows:
+            table.add_row(
+                str(row["month"] or "undated"),
+                str(row["event_count"]),
+                f"{row['start_byte']}-{row['end_byte']}",
+                str(row["first_timestamp"] or "")[:19],
+                str(row["last_timestamp"] or "")[:19],
+            )
+        console.print(table)
+        for problem in problems:
+            console.print(f"[red]{problem}[/red]")
+        if not problems:
+            console.print(f"[green]Ledger segments verified ({len(rows)} segments).[/green]")
+    if problems:
+        sys.exit(1)
+
+
+def register_ledger_segment_commands(group: click.Group) -> None:
+    """Attach ledger segment commands to the costs group."""
+    group.add_command(verify_ledger)
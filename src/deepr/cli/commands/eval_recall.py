@@ -137,6 +137,12 @@ def _render_recall_report(report: dict[str, Any], name: str, top_k: int) -> None
         click.echo("  Winners: " + ", ".join(f"{metric}={winner}" for metric, winner in winners.items()))
     else:
         click.echo(f"  Vector route skipped: {comparison['skip_reason']}")
+    ann_recall = report.get("ann_recall", {})
+    if ann_recall.get("ann_active") is True:
+        click.echo(
+            f"  ANN recall@{ann_recall['top_k']}: {ann_recall['recall_at_k']:.3f} "
+            f"over {ann_recall['query_count']} stored vector(s) ({ann_recall['status']})"
+        )
     scheduler_preference = report.get("scheduler_preference", {})
     if scheduler_preference.get("eligible") is True:
         click.echo(f"  Scheduler preference: {scheduler_preference['preferred_route']} eligible")
@@ -395,6 +395,7 @@ async def handle_immediate_job(
         report_url=str(report_metadata.url),
         cost=actual_cost,
         tokens=tokens,
+        report_text=content,
     )
     if submit_op:
         submit_op.set_cost(actual_cost)
@@ -418,7 +419,7 @@ async def handle_immediate_job(
 
 
 async def _persist_immediate_completion(
-    *, queue: SQLiteQueue, job_id: str, report_url: str, cost: float, tokens: int
+    *, queue: SQLiteQueue, job_id: str, report_url: str, cost: float, tokens: int, report_text: str | None = None
 ) -> None:
     """Persist immediate results and require both queue transitions."""
     results_updated = await queue.update_results(
@@ -426,6 +427,7 @@ async def _persist_immediate_completion(
         report_paths={"markdown": report_url},
         cost=cost,
         tokens_used=tokens,
+        report_text=report_text,
     )
     if not results_updated:
         raise RuntimeError("queue rejected immediate provider result update")
@@ -27,6 +27,7 @@ import click
 
 from deepr.cli.colors import console, print_success, print_warning
 from deepr.cli.commands.semantic.experts import expert
+from deepr.experts.belief_journal import journal_has_records
 from deepr.experts.paths import canonical_expert_dir, expert_slug
 
 
@@ -70,6 +71,13 @@ def _belief_count(expert_dir: Path) -> int:
     bf = expert_dir / "beliefs" / "beliefs.json"
     if not bf.exists():
         return 0
+    if journal_has_records(bf.parent):
+        # Journaled deltas not yet compacted into the snapshot are data too.
+        return max(1, _snapshot_belief_count(bf))
+    return _snapshot_belief_count(bf)
+
+
+def _snapshot_belief_count(bf: Path) -> int:
     try:
         data = json.loads(bf.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError):
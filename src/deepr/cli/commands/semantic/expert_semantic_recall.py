@@ -21,6 +21,7 @@ from deepr.experts.expert_semantic_recall import (
     parse_query_embedding_json,
 )
 from deepr.experts.profile import ExpertStore
+from deepr.services.query_embedding_cache import QueryEmbeddingCache
 
 # Contract label for a query vector computed on local owned hardware. The
 # recall itself still never generates embeddings; only the query side does,
@@ -32,13 +33,19 @@ def _embed_query_locally(local_embedding_model: str, query: str) -> tuple[float,
     """Compute one query embedding through the local $0 Ollama endpoint.
 
     Raises ``ValueError`` with an operator-facing message on any failure;
-    there is no metered fallback on this path.
+    there is no metered fallback on this path. A query already embedded by
+    this model is served from the shared query-embedding cache.
     """
+    query_cache = QueryEmbeddingCache()
+    cached = query_cache.get(local_embedding_model, query)
+    if cached is not None:
+        return cached
     embedder = make_local_embedder(local_embedding_model)
     try:
         vectors = asyncio.run(embedder([query]))
     except Exception as exc:
         raise ValueError(_local_embedding_failure(local_embedding_model, exc)) from exc
+    query_cache.put(local_embedding_model, query, vectors[0])
     return vectors[0]
 
 
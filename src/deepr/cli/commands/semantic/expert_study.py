@@ -479,6 +479,7 @@ def expert_study(
                 on_progress=None if as_json else _echo_progress,
                 checkpoint=_checkpoint_study(profile.name),
                 resume_from=_resume_source(profile.name, rebuild=rebuild),
+                concurrency=backend.concurrency,
             )
         finally:
             # Pin weights during the run, release at the end. Leaving a large
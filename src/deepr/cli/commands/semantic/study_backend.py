@@ -64,6 +64,11 @@ class StudyBackend:
     picks for itself and Deepr sees the process rather than that decision.
     Recorded so an artifact can say which model read the corpus - the single
     largest determinant of what a study pass finds, and previously discarded."""
+    concurrency: int = 1
+    """Model calls this tier can serve at once.
+
+    One for a single plan CLI or local model, where parallel calls only queue
+    at the same vendor or GPU; one per member for a pool."""
 
 
 def _completion_from_chat_client(client: Any, model: str, *, max_tokens: int) -> StudyCompletion:
@@ -216,6 +221,7 @@ def _build_pooled_backend(*, profile: Any, plans: list[str], max_tokens: int) ->
         model="",
         cost_note=note,
         chunk_chars=pool.chunk_chars or _PLAN_CHUNK_CHARS,
+        concurrency=pool.size,
     )
 
 
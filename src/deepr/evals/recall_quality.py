@@ -17,6 +17,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from deepr.config import runtime_data_path
 from deepr.evals.retrieval_metrics import (
     BOOTSTRAP_CONFIDENCE_LEVEL as RECALL_PREFERENCE_CONFIDENCE_LEVEL,
@@ -28,6 +30,7 @@ from deepr.evals.retrieval_metrics import compare_retrieval_routes
 from deepr.evals.retrieval_metrics import paired_vector_bootstrap_comparison as _paired_bootstrap_comparison
 from deepr.evals.retrieval_metrics import ranked_binary_retrieval_metrics as _case_metrics
 from deepr.evals.retrieval_metrics import summarize_retrieval_route as _route_summary
+from deepr.experts.ann_index import IvfIndex, ann_recall_at_k
 from deepr.experts.paths import expert_slug
 from deepr.experts.recall_preference import belief_index_coverage as recall_index_coverage
 from deepr.experts.recall_preference import recall_retrieval_contract
@@ -42,6 +45,10 @@ RECALL_LIBRARY_INVENTORY_SCHEMA_VERSION = "deepr-recall-library-inventory-v1"
 RECALL_LIBRARY_INVENTORY_KIND = "deepr.eval.recall_library_inventory"
 RECALL_LIBRARY_VALIDATION_PLAN_SCHEMA_VERSION = "deepr-recall-library-validation-plan-v1"
 RECALL_LIBRARY_VALIDATION_PLAN_KIND = "deepr.eval.recall_library_validation_plan"
+ANN_RECALL_SELF_CHECK_SCHEMA_VERSION = "deepr-ann-recall-self-check-v1"
+ANN_RECALL_SELF_CHECK_KIND = "deepr.eval.ann_recall_self_check"
+# Recall@k the ANN probe must keep against the exact scan to pass the check.
+MIN_ANN_RECALL_AT_K = 0.9
 LEXICAL_ROUTE = "lexical_router"
 VECTOR_ROUTE = "vector_similarity"
 MIN_SCHEDULER_PREFERENCE_CASES = 30
@@ -762,7 +769,8 @@ async def run_recall_quality_eval(
     The lexical route always runs. The vector route runs when query embeddings
     are available, either precomputed per case or computed in one batch through
     an injected local embedder; without either it is skipped with a recorded
-    reason instead of silently reporting a hollow comparison.
+    reason instead of silently reporting a hollow comparison. Stores that
+    expose their belief vector matrix also get an ``ann_recall`` self-check.
     """
     if top_k <= 0:
         raise ValueError("top_k must be positive")
@@ -838,7 +846,7 @@ async def run_recall_quality_eval(
         comparison["skip_reason"] = vector_route_skip_reason
     scheduler_preference = _scheduler_preference(routes, comparison, index_coverage, retrieval_contract)
 
-    return {
+    report: dict[str, Any] = {
         "schema_version": RECALL_EVAL_REPORT_SCHEMA_VERSION,
         "kind": "deepr.eval.recall_quality",
         "expert": {"name": expert_name},
@@ -865,6 +873,65 @@ async def run_recall_quality_eval(
         "cases": case_payloads,
         "generated_at": datetime.now(UTC).isoformat(),
     }
+    snapshot_fn = getattr(belief_store, "belief_vector_ann_snapshot", None)
+    if callable(snapshot_fn):
+        matrix, ann = snapshot_fn()
+        report["ann_recall"] = build_ann_recall_self_check(matrix, ann, source="belief_vectors", top_k=top_k)
+    return report
+
+
+def build_ann_recall_self_check(
+    matrix: np.ndarray,
+    ann: IvfIndex | None,
+    *,
+    source: str,
+    top_k: int = 10,
+    sample_size: int = 100,
+    nprobe: int | None = None,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Measure ANN recall@k against the exact scan over stored vectors.
+
+    Queries are a seeded sample of the matrix's own rows, so the check costs
+    nothing and needs no labels. It measures only how faithfully the ANN probe
+    reproduces the exact cosine top-k; whether that top-k is relevant is the
+    job of :func:`run_recall_quality_eval`. With no ANN index (small matrices)
+    recall is exact by construction.
+    """
+    row_count = len(matrix)
+    query_count = min(max(0, sample_size), row_count)
+    recall_at_k = 1.0
+    if ann is not None and query_count:
+        rng = np.random.default_rng(seed)
+        queries = np.asarray(matrix[np.sort(rng.choice(row_count, query_count, replace=False))], dtype=np.float32)
+        recall_at_k = ann_recall_at_k(matrix, ann, queries, top_k=top_k, nprobe=nprobe)
+    if ann is None:
+        status = "exact_scan"
+    else:
+        status = "pass" if recall_at_k >= MIN_ANN_RECALL_AT_K else "below_threshold"
+    return {
+        "schema_version": ANN_RECALL_SELF_CHECK_SCHEMA_VERSION,
+        "kind": ANN_RECALL_SELF_CHECK_KIND,
+        "source": source,
+        "contract": {
+            "cost_usd": 0.0,
+            "writes_graph": False,
+            "writes_beliefs": False,
+            "writes_belief_vectors": False,
+            "semantic_verdict": False,
+            "routing_evidence_only": True,
+        },
+        "row_count": row_count,
+        "ann_active": ann is not None,
+        "list_count": len(ann.centroids) if ann is not None else 0,
+        "nprobe": (nprobe or ann.default_nprobe) if ann is not None else 0,
+        "top_k": top_k,
+        "query_count": query_count if ann is not None else 0,
+        "recall_at_k": round(recall_at_k, 6),
+        "min_recall_at_k": MIN_ANN_RECALL_AT_K,
+        "status": status,
+        "generated_at": datetime.now(UTC).isoformat(),
+    }
 
 
 def write_recall_eval_report(report: Mapping[str, Any], *, output_dir: Path | None = None) -> Path:
@@ -878,7 +945,10 @@ def write_recall_eval_report(report: Mapping[str, Any], *, output_dir: Path | No
 
 
 __all__ = [
+    "ANN_RECALL_SELF_CHECK_KIND",
+    "ANN_RECALL_SELF_CHECK_SCHEMA_VERSION",
     "LEXICAL_ROUTE",
+    "MIN_ANN_RECALL_AT_K",
     "MIN_SCHEDULER_PREFERENCE_CASES",
     "RECALL_EVAL_CASE_LIBRARY_SCHEMA_VERSION",
     "RECALL_EVAL_REPORT_SCHEMA_VERSION",
@@ -891,6 +961,7 @@ __all__ = [
     "SCHEDULER_REQUIRED_VECTOR_WIN_METRICS",
     "VECTOR_ROUTE",
     "RecallEvalCase",
+    "build_ann_recall_self_check",
     "build_recall_eval_case",
     "build_recall_library_inventory",
     "build_recall_library_validation_plan",
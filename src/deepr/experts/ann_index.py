@@ -0,0 +1,277 @@
+"""Inverted-file approximate nearest-neighbour index over embedding matrices.
+
+``BeliefVectorIndex``, ``EmbeddingCache`` and ``ContextIndex`` all rank rows of
+a float matrix by cosine to a query vector. An exact scan is one matrix-vector
+product, which is linear in the row count. Past ``ANN_MIN_ROWS`` rows those
+callers consult an :class:`IvfIndex` instead: rows are clustered around
+spherical k-means centroids, a query probes its nearest lists, and only the
+rows in those lists are scored exactly. Below the threshold, or when the probe
+cannot supply enough eligible rows, ranking falls back to the exact scan.
+
+The index is derived state. It never owns vectors (the caller's matrix does),
+is rebuilt whenever its saved shape disagrees with the matrix, and is updated
+incrementally: new or rewritten rows are assigned to their nearest centroid,
+and the centroids are retrained once the matrix has doubled since training.
+:func:`ann_recall_at_k` measures how often the probe keeps the exact top-k.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import math
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+from deepr.utils.atomic_io import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+# Exact scans stay faster (and exact) below this many rows.
+ANN_MIN_ROWS = 4096
+# Share of inverted lists a query probes by default.
+DEFAULT_PROBE_FRACTION = 0.1
+_MIN_PROBES = 4
+_KMEANS_ITERATIONS = 8
+_KMEANS_SAMPLE_PER_LIST = 64
+_ASSIGN_CHUNK_ROWS = 8192
+
+
+def _normalized(rows: np.ndarray) -> np.ndarray:
+    rows = np.asarray(rows, dtype=np.float32)
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    return np.divide(rows, norms, out=np.zeros_like(rows), where=norms > 0.0)
+
+
+def _train_centroids(sample: np.ndarray, n_lists: int, rng: np.random.Generator) -> np.ndarray:
+    centroids = sample[rng.choice(len(sample), n_lists, replace=False)]
+    for _ in range(_KMEANS_ITERATIONS):
+        labels = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, sample)
+        empty = np.bincount(labels, minlength=n_lists) == 0
+        if empty.any():
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+        centroids = _normalized(sums)
+    return centroids
+
+
+class IvfIndex:
+    """Centroids plus one inverted-list assignment per matrix row.
+
+    Attributes:
+        centroids: ``(n_lists, width)`` unit vectors.
+        assignments: List id for each matrix row, in row order.
+        trained_rows: Row count the centroids were trained on.
+        generation: Opaque tag tying a saved index to one matrix file.
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        assignments: np.ndarray,
+        trained_rows: int,
+        generation: str = "",
+    ):
+        self.centroids = centroids
+        self.assignments = assignments
+        self.trained_rows = trained_rows
+        self.generation = generation
+
+    @property
+    def width(self) -> int:
+        return int(self.centroids.shape[1])
+
+    @property
+    def default_nprobe(self) -> int:
+        n_lists = len(self.centroids)
+        return min(n_lists, max(_MIN_PROBES, math.ceil(n_lists * DEFAULT_PROBE_FRACTION)))
+
+    @classmethod
+    def build(cls, matrix: np.ndarray, *, generation: str = "") -> IvfIndex:
+        """Train centroids on a sample of ``matrix`` and assign every row."""
+        rows = len(matrix)
+        n_lists = max(1, min(rows, round(math.sqrt(rows))))
+        rng = np.random.default_rng(0)
+        sample_size = min(rows, n_lists * _KMEANS_SAMPLE_PER_LIST)
+        sample = _normalized(matrix[np.sort(rng.choice(rows, sample_size, replace=False))])
+        index = cls(_train_centroids(sample, n_lists, rng), np.zeros(rows, dtype=np.int32), rows, generation)
+        index._assign(matrix, np.arange(rows))
+        return index
+
+    def _assign(self, matrix: np.ndarray, rows: np.ndarray) -> None:
+        for start in range(0, len(rows), _ASSIGN_CHUNK_ROWS):
+            chunk = rows[start : start + _ASSIGN_CHUNK_ROWS]
+            scores = _normalized(matrix[chunk]) @ self.centroids.T
+            self.assignments[chunk] = np.argmax(scores, axis=1)
+
+    def update(self, matrix: np.ndarray, rows: Iterable[int] = ()) -> IvfIndex:
+        """Assign rewritten ``rows`` and any rows appended since the last update.
+
+        Returns a retrained index instead once the matrix has doubled since
+        training or its width changed.
+        """
+        total = len(matrix)
+        if matrix.shape[1] != self.width or total > 2 * self.trained_rows or total < len(self.assignments):
+            return IvfIndex.build(matrix, generation=self.generation)
+        known = len(self.assignments)
+        if total > known:
+            self.assignments = np.concatenate([self.assignments, np.zeros(total - known, dtype=np.int32)])
+        pending = sorted({int(row) for row in rows if 0 <= int(row) < known} | set(range(known, total)))
+        if pending:
+            self._assign(matrix, np.asarray(pending, dtype=np.intp))
+        return self
+
+    def keep_rows(self, kept: np.ndarray) -> None:
+        """Follow a matrix compaction that kept rows ``kept``, in that order."""
+        self.assignments = self.assignments[np.asarray(kept, dtype=np.intp)]
+
+    def candidates(self, query: np.ndarray, nprobe: int | None = None) -> np.ndarray:
+        """Row ids in the ``nprobe`` lists nearest to ``query``."""
+        nprobe = min(max(1, self.default_nprobe if nprobe is None else nprobe), len(self.centroids))
+        padded = np.zeros(self.width, dtype=np.float32)
+        padded[: min(len(query), self.width)] = query[: self.width]
+        scores = self.centroids @ padded
+        probed = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        return np.flatnonzero(np.isin(self.assignments, probed))
+
+    @classmethod
+    def load(cls, path: Path, *, rows: int, width: int, generation: str = "") -> IvfIndex | None:
+        """Load a saved index, or ``None`` when it is missing or describes another matrix."""
+        try:
+            with np.load(path, allow_pickle=False) as payload:
+                index = cls(
+                    payload["centroids"].astype(np.float32),
+                    payload["assignments"].astype(np.int32),
+                    int(payload["trained_rows"]),
+                    str(payload["generation"]),
+                )
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, ValueError) as exc:
+            logger.warning("Ignoring unreadable ANN index %s: %s", path, exc)
+            return None
+        if index.generation != generation or index.width != width or len(index.assignments) > rows:
+            return None
+        return index
+
+    def save(self, path: Path) -> None:
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            centroids=self.centroids,
+            assignments=self.assignments,
+            trained_rows=np.int64(self.trained_rows),
+            generation=np.str_(self.generation),
+        )
+        atomic_write_bytes(path, buffer.getvalue())
+
+
+def maintained_ann(
+    ann: IvfIndex | None,
+    matrix: np.ndarray,
+    path: Path,
+    *,
+    generation: str = "",
+    rows: Iterable[int] = (),
+    persist: bool = True,
+) -> IvfIndex | None:
+    """Bring the ANN index for ``matrix`` up to date, loading or building it as needed.
+
+    Returns ``None`` (and removes any saved index) while the matrix is below
+    ``ANN_MIN_ROWS``. Saves the index whenever it changed; with ``persist``
+    false an incremental update stays in memory (a fresh build is still saved).
+    """
+    if matrix.ndim != 2 or len(matrix) < ANN_MIN_ROWS:
+        path.unlink(missing_ok=True)
+        return None
+    rows = list(rows)
+    if ann is None:
+        ann = IvfIndex.load(path, rows=len(matrix), width=matrix.shape[1], generation=generation)
+    if ann is None:
+        ann = IvfIndex.build(matrix, generation=generation)
+    elif rows or len(ann.assignments) != len(matrix) or ann.width != matrix.shape[1] or ann.generation != generation:
+        ann = ann.update(matrix, rows)
+        if not persist:
+            ann.generation = generation
+            return ann
+    else:
+        return ann
+    ann.generation = generation
+    ann.save(path)
+    return ann
+
+
+def rank_by_cosine(
+    matrix: np.ndarray,
+    query: np.ndarray,
+    *,
+    limit: int | None = None,
+    rows: np.ndarray | None = None,
+    norms: np.ndarray | None = None,
+    ann: IvfIndex | None = None,
+    nprobe: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(row_ids, cosines)`` for ``matrix`` rows, best first.
+
+    ``rows`` restricts ranking to eligible rows. With ``ann`` only the probed
+    rows are scored, unless they hold fewer than ``limit`` eligible rows.
+    ``norms`` may supply precomputed row norms. Zero-norm rows are skipped.
+    """
+    query = np.asarray(query, dtype=np.float32)
+    query_norm = float(np.linalg.norm(query))
+    if query_norm == 0.0 or len(matrix) == 0 or len(query) > matrix.shape[1]:
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.float32)
+    pool = np.arange(len(matrix)) if rows is None else np.asarray(rows, dtype=np.intp)
+    if ann is not None:
+        probed = ann.candidates(query, nprobe)
+        narrowed = probed if rows is None else np.intersect1d(pool, probed, assume_unique=True)
+        if len(narrowed) >= (limit or 1):
+            pool = narrowed
+    if pool.size == len(matrix) and rows is None:
+        products = matrix[:, : len(query)] @ query
+    else:
+        products = matrix[pool, : len(query)] @ query
+    pool_norms = norms[pool] if norms is not None else np.linalg.norm(matrix[pool], axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(pool_norms > 0.0, products / (pool_norms * query_norm), -np.inf)
+    if limit is not None and limit < len(pool):
+        top = np.argpartition(-scores, max(0, limit - 1))[:limit]
+    else:
+        top = np.arange(len(pool))
+    top = top[np.isfinite(scores[top])]
+    order = top[np.lexsort((pool[top], -scores[top]))]
+    return pool[order], np.clip(scores[order], -1.0, 1.0)
+
+
+def ann_recall_at_k(
+    matrix: np.ndarray,
+    ann: IvfIndex,
+    queries: np.ndarray,
+    *,
+    top_k: int = 10,
+    nprobe: int | None = None,
+) -> float:
+    """Mean share of each query's exact top-k that the ANN probe also returns."""
+    if len(queries) == 0 or top_k <= 0:
+        return 1.0
+    norms = np.linalg.norm(matrix, axis=1)
+    hits = 0
+    expected_total = 0
+    for query in queries:
+        exact, _ = rank_by_cosine(matrix, query, limit=top_k, norms=norms)
+        approx, _ = rank_by_cosine(matrix, query, limit=top_k, norms=norms, ann=ann, nprobe=nprobe)
+        hits += len(np.intersect1d(exact, approx))
+        expected_total += len(exact)
+    return hits / expected_total if expected_total else 1.0
+
+
+__all__ = [
+    "ANN_MIN_ROWS",
+    "IvfIndex",
+    "ann_recall_at_k",
+    "maintained_ann",
+    "rank_by_cosine",
+]
@@ -1,7 +1,8 @@
 """Fail-closed consistency checks for the belief event log.
 
-``events.jsonl`` is fsynced before ``beliefs.json``. A crash between those
-writes leaves durable events that ``_load`` would otherwise ignore. Events
+``events.jsonl`` is fsynced before the ``beliefs.journal.jsonl`` delta (or the
+``beliefs.json`` snapshot). A crash between those writes leaves durable events
+that ``_load`` would otherwise ignore. Events
 do not always carry a full ``Belief`` snapshot, so this module refuses writes
 when the log is ahead of or unreadable relative to the snapshot instead of
 replaying a partial graph.
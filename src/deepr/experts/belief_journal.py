@@ -0,0 +1,336 @@
+"""Snapshot plus append-only journal persistence for ``BeliefStore``.
+
+``beliefs.json`` used to be rewritten and fsynced in full on every mutation,
+so absorbing one claim cost O(store) serialization and disk I/O, and a report
+cost O(n^2). A save now appends one small durable delta line (the beliefs and
+edges it touched plus the new change records) to ``beliefs.journal.jsonl``.
+The snapshot is only rebuilt once the journal outgrows it, which keeps the
+amortized cost of a mutation proportional to its delta.
+
+Every journal record names the snapshot ``generation`` it extends and carries
+a monotonically increasing ``seq``. The snapshot stores its generation and the
+last sequence folded into it, so replay skips records that a compaction
+already absorbed (a crash between the snapshot write and the journal reset)
+and records written against a snapshot that was since replaced wholesale.
+
+Ordering against ``events.jsonl`` is unchanged: the event is fsynced first,
+then the journal line. A crash between the two leaves the event log ahead of
+the replayed change window, which ``event_log_conflicts_with_snapshot`` still
+turns into a fail-closed load.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from pathlib import Path
+from typing import Any
+
+from deepr.experts.belief_edges import Edge
+from deepr.experts.belief_event_wal import event_log_conflicts_with_snapshot
+from deepr.utils.atomic_io import append_jsonl_durable, atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "beliefs.journal.jsonl"
+
+# The snapshot is rewritten once the journal is larger than both this floor and
+# the snapshot itself. Small stores compact rarely; large stores pay one O(n)
+# rewrite per O(n) bytes of appended deltas.
+_COMPACT_MIN_BYTES = 1024 * 1024
+
+# Same refusal ceiling the snapshot loader has always applied.
+_MAX_SNAPSHOT_BYTES = 50 * 1024 * 1024
+
+# Provenance for edges migrated from contradictions_with lists.
+_MIGRATED_PROVENANCE = "migrated:contradictions_with"
+
+# Size of the change window kept inside the snapshot (the legacy ``changes``).
+_SNAPSHOT_CHANGE_WINDOW = 100
+
+
+class BeliefJournalError(ValueError):
+    """A journal line is malformed somewhere other than a torn final append."""
+
+
+class BeliefJournal:
+    """Dirty tracking and delta log for one belief store.
+
+    Attributes:
+        path: The journal file beside the snapshot.
+        generation: Snapshot generation journal records must extend. ``None``
+            means the snapshot predates the journal (or is missing), so the
+            next save compacts.
+        seq: Last sequence number applied or appended.
+        size_bytes: Current journal size, for the compaction trigger.
+        snapshot_bytes: Size of the last snapshot written or loaded.
+        needs_compaction: Force the next save to rewrite the snapshot (after a
+            torn tail or a one-time migration).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.generation: str | None = None
+        self.seq = 0
+        self.size_bytes = 0
+        self.snapshot_bytes = 0
+        self.needs_compaction = False
+        self.persisted_changes = 0
+        self._dirty_beliefs: set[str] = set()
+        self._dirty_edges: set[tuple[str, str, str]] = set()
+
+    def mark_belief(self, *belief_ids: str) -> None:
+        """Record that these beliefs changed (or were removed) since the last save."""
+        self._dirty_beliefs.update(belief_ids)
+
+    def mark_edge(self, key: tuple[str, str, str]) -> None:
+        """Record that this edge was added or re-asserted since the last save."""
+        self._dirty_edges.add(key)
+
+    def delta_record(self, store: Any) -> dict[str, Any] | None:
+        """Build the next journal record, or ``None`` when nothing is dirty."""
+        beliefs = {bid: store.beliefs[bid].to_dict() for bid in sorted(self._dirty_beliefs) if bid in store.beliefs}
+        archived = sorted(bid for bid in self._dirty_beliefs if bid not in store.beliefs)
+        edges = [store.edges[key].to_dict() for key in sorted(self._dirty_edges) if key in store.edges]
+        changes = [change.to_dict() for change in store.changes[self.persisted_changes :]]
+        if not (beliefs or archived or edges or changes):
+            return None
+        return {
+            "generation": self.generation,
+            "seq": self.seq + 1,
+            "beliefs": beliefs,
+            "archived": archived,
+            "edges": edges,
+            "changes": changes,
+        }
+
+    def append(self, record: dict[str, Any], change_count: int) -> None:
+        """Durably append one delta record and clear the dirty sets."""
+        append_jsonl_durable(self.path, record, fsync=True)
+        self.size_bytes += len(json.dumps(record).encode("utf-8")) + 1
+        self.seq = int(record["seq"])
+        self.persisted_changes = change_count
+        self._clear_dirty()
+
+    def should_compact(self) -> bool:
+        return self.size_bytes > max(_COMPACT_MIN_BYTES, self.snapshot_bytes)
+
+    def snapshot_written(self, generation: str, snapshot_bytes: int, change_count: int) -> None:
+        """Adopt a freshly written snapshot and drop the journal it absorbed."""
+        self.generation = generation
+        self.snapshot_bytes = snapshot_bytes
+        self.persisted_changes = change_count
+        self.needs_compaction = False
+        self._clear_dirty()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        self.size_bytes = 0
+
+    def read_records(self) -> list[dict[str, Any]]:
+        """Records that extend the loaded snapshot, oldest first.
+
+        A final line without its newline is a torn append whose fsync never
+        completed, so nothing acknowledged it: it is dropped and the next save
+        compacts so later appends never land on the fragment. Any other
+        malformed line raises :class:`BeliefJournalError`.
+        """
+        if self.path.is_symlink():
+            raise BeliefJournalError(f"refusing to follow a symlinked belief journal: {self.path}")
+        try:
+            raw = self.path.read_bytes()
+        except FileNotFoundError:
+            return []
+        self.size_bytes = len(raw)
+        lines = raw.split(b"\n")
+        if lines[-1].strip():
+            logger.warning("Dropping torn final record in %s", self.path)
+            self.needs_compaction = True
+        records: list[dict[str, Any]] = []
+        for line_no, line in enumerate(lines[:-1], 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise BeliefJournalError(f"{self.path}:{line_no}: {exc}") from exc
+            if not isinstance(record, dict):
+                raise BeliefJournalError(f"{self.path}:{line_no}: record is not an object")
+            if self.generation is None or record.get("generation") != self.generation:
+                continue  # written against a snapshot that has since been replaced
+            if not isinstance(record.get("seq"), int) or record["seq"] <= self.seq:
+                continue  # already folded into the snapshot
+            records.append(record)
+        return records
+
+    def _clear_dirty(self) -> None:
+        self._dirty_beliefs.clear()
+        self._dirty_edges.clear()
+
+
+def _apply_record(store: Any, record: dict[str, Any]) -> None:
+    # Local import: beliefs.py imports this module, so a top-level import
+    # would be circular.
+    from deepr.experts.beliefs import Belief, BeliefChange
+
+    for bid, data in record.get("beliefs", {}).items():
+        prior = store.beliefs.get(bid)
+        if prior is not None:
+            store._unindex_belief(prior)
+        belief = Belief.from_dict(data)
+        store.beliefs[bid] = belief
+        store._index_belief(belief)
+    for bid in record.get("archived", []):
+        prior = store.beliefs.pop(bid, None)
+        if prior is not None:
+            store._unindex_belief(prior)
+    for edata in record.get("edges", []):
+        edge = Edge.from_dict(edata)
+        store.edges[edge.key()] = edge
+    for cdata in record.get("changes", []):
+        store.changes.append(BeliefChange.from_dict(cdata))
+
+
+def compact_belief_store(store: Any) -> None:
+    """Rewrite ``beliefs.json`` from memory and reset the journal."""
+    journal: BeliefJournal = store._journal
+    generation = uuid.uuid4().hex[:12]
+    text = json.dumps(
+        {
+            "edges": [e.to_dict() for e in store.edges.values()],
+            "beliefs": {bid: b.to_dict() for bid, b in store.beliefs.items()},
+            "changes": [c.to_dict() for c in store.changes[-_SNAPSHOT_CHANGE_WINDOW:]],
+            "journal": {"generation": generation, "seq": journal.seq},
+        },
+        indent=2,
+    )
+    atomic_write_text(store.storage_path, text, fsync=True)
+    journal.snapshot_written(generation, len(text.encode("utf-8")), len(store.changes))
+
+
+def save_belief_store(store: Any) -> None:
+    """Persist pending mutations as one journal append, compacting when due."""
+    journal: BeliefJournal = store._journal
+    if journal.generation is None or journal.needs_compaction or not store.storage_path.exists():
+        compact_belief_store(store)
+        return
+    record = journal.delta_record(store)
+    if record is None:
+        return
+    journal.append(record, len(store.changes))
+    if journal.should_compact():
+        compact_belief_store(store)
+
+
+def _read_snapshot(store: Any) -> dict[str, Any] | None:
+    try:
+        size = store.storage_path.stat().st_size
+        if size > _MAX_SNAPSHOT_BYTES:
+            logger.error("Belief store at %s exceeds 50 MB; refusing to load.", store.storage_path)
+            return None
+        with open(store.storage_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError) as exc:
+        logger.error("Failed to load beliefs from %s: %s. Refusing writes.", store.storage_path, exc)
+        return None
+    store._journal.snapshot_bytes = size
+    return data if isinstance(data, dict) else {}
+
+
+def _load_snapshot_state(store: Any, data: dict[str, Any]) -> bool:
+    from deepr.experts.beliefs import Belief, BeliefChange
+
+    store.beliefs = {bid: Belief.from_dict(bdata) for bid, bdata in data.get("beliefs", {}).items()}
+    for belief in store.beliefs.values():
+        store._index_belief(belief)
+    for edata in data.get("edges", []):
+        try:
+            edge = Edge.from_dict(edata)
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.error("Malformed edge in %s: %s. Refusing writes.", store.storage_path, exc)
+            return False
+        store.edges[edge.key()] = edge
+    for cdata in data.get("changes", []):
+        try:
+            store.changes.append(BeliefChange.from_dict(cdata))
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.error("Malformed change record in %s: %s. Refusing writes.", store.storage_path, exc)
+            return False
+    return True
+
+
+def _replay_journal(store: Any, marker: Any) -> bool:
+    journal: BeliefJournal = store._journal
+    if isinstance(marker, dict) and isinstance(marker.get("generation"), str):
+        journal.generation = marker["generation"]
+        journal.seq = int(marker.get("seq", 0) or 0)
+    try:
+        for record in journal.read_records():
+            _apply_record(store, record)
+            journal.seq = record["seq"]
+    except (BeliefJournalError, KeyError, TypeError, ValueError, OSError) as exc:
+        logger.error("Unreadable belief journal %s: %s. Refusing writes.", journal.path, exc)
+        return False
+    # Keep the in-memory window the snapshot-only loader produced.
+    del store.changes[:-_SNAPSHOT_CHANGE_WINDOW]
+    journal.persisted_changes = len(store.changes)
+    return True
+
+
+def _migrate_contradiction_lists(store: Any) -> int:
+    """Migrate legacy contradictions_with lists to typed contradicts edges."""
+    migrated = 0
+    for belief in store.beliefs.values():
+        for other_id in belief.contradictions_with:
+            probe = Edge(src_id=belief.id, dst_id=other_id, edge_type="contradicts")
+            if probe.key() not in store.edges:
+                probe.provenance.append(_MIGRATED_PROVENANCE)
+                store.edges[probe.key()] = probe
+                migrated += 1
+    return migrated
+
+
+def load_belief_store(store: Any) -> None:
+    """Load the snapshot, replay its journal, and apply the fail-closed checks."""
+    store._unreadable = False
+    if not store.storage_path.exists():
+        if event_log_conflicts_with_snapshot(store.events_path, snapshot_exists=False, latest_change=None):
+            store._unreadable = True
+        return
+    data = _read_snapshot(store)
+    if data is None or not _load_snapshot_state(store, data) or not _replay_journal(store, data.get("journal")):
+        store._unreadable = True
+        return
+    migrated = _migrate_contradiction_lists(store)
+    latest = store.changes[-1].timestamp if store.changes else None
+    if event_log_conflicts_with_snapshot(store.events_path, snapshot_exists=True, latest_change=latest):
+        store._unreadable = True
+        return
+    if store.read_only:
+        return
+    if migrated:
+        logger.info("Migrated %d contradictions_with pair(s) to typed edges for %s", migrated, store.expert_name)
+        compact_belief_store(store)
+    elif store._journal.needs_compaction:
+        compact_belief_store(store)
+
+
+def journal_has_records(storage_dir: Path) -> bool:
+    """True when an expert's belief journal holds any appended delta."""
+    try:
+        return (storage_dir / JOURNAL_FILENAME).stat().st_size > 0
+    except OSError:
+        return False
+
+
+__all__ = [
+    "JOURNAL_FILENAME",
+    "BeliefJournal",
+    "BeliefJournalError",
+    "compact_belief_store",
+    "journal_has_records",
+    "load_belief_store",
+    "save_belief_store",
+]
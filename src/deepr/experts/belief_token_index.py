@@ -0,0 +1,207 @@
+"""Per-domain inverted token index behind the BeliefStore lexical routers.
+
+``find_similar_with_score``, ``_find_related`` and ``_find_contradictions``
+used to scan every belief in the domain and re-split and re-lowercase both
+claims for each comparison, so absorbing a report into a large expert built
+millions of throwaway sets. This index tokenizes each belief once, keeps
+token -> belief-id postings per domain, and narrows candidates by prefix
+filtering: a pair that must share at least ``t`` tokens has to share one of the
+query's ``len(tokens) - t + 1`` rarest tokens, so the most common words are
+never walked. Scores are then computed exactly on the cached token sets, so a
+candidate passes or fails exactly as it did in the full scan.
+
+Two vocabularies are indexed because the routers use two: whitespace tokens
+for the overlap score, and ``ConflictResolver`` router words (stopwords and
+negations removed) for the contradiction heuristic.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# Polarity guard for the lexical similarity routers. Word overlap cannot see
+# negation, so opposite-polarity claims score near-identical. This filters
+# pairs out of the merge and supports-edge routers; it never concludes that a
+# contradiction exists (that stays a model verdict).
+_NEGATION_WORDS = frozenset({"not", "no", "never", "false", "incorrect", "wrong"})
+
+# Whitespace splitting leaves punctuation attached, so "is not, in fact, current"
+# yields the token "not," and slips past the guard - re-enabling exactly the
+# opposite-polarity merge the guard exists to block. Tokenize on word characters
+# for the polarity test only; the overlap score keeps using whitespace splitting
+# so similarity semantics elsewhere are unchanged.
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+# Router thresholds documented on the BeliefStore router methods.
+SIMILAR_THRESHOLD = 0.7
+RELATED_FLOOR = 0.35
+_CONTRADICTION_MIN_OVERLAP = 3
+
+
+def has_negation(claim: str) -> bool:
+    """True when a claim carries a negation marker, punctuation notwithstanding."""
+    return bool(set(_WORD_RE.findall(claim.lower())) & _NEGATION_WORDS)
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimTokens:
+    """Tokenization of one claim, computed once per claim text."""
+
+    claim: str
+    domain: str
+    words: frozenset[str]
+    negated: bool
+    router_words: frozenset[str]
+    router_negated: bool
+
+    @classmethod
+    def of(cls, claim: str, domain: str) -> ClaimTokens:
+        # Local import: conflict_resolver imports Belief from beliefs.py, which
+        # imports this module, so a top-level import would be circular.
+        from deepr.experts.conflict_resolver import ConflictResolver
+
+        router_words, router_negated = ConflictResolver._router_words(claim)
+        return cls(
+            claim=claim,
+            domain=domain,
+            words=frozenset(claim.lower().split()),
+            negated=has_negation(claim),
+            router_words=frozenset(router_words),
+            router_negated=router_negated,
+        )
+
+    def similarity(self, other: ClaimTokens) -> float:
+        overlap = len(self.words & other.words)
+        return overlap / max(len(self.words), len(other.words), 1)
+
+
+def _prefix(tokens: Iterable[str], postings: dict[str, set[str]], min_overlap: int) -> list[str]:
+    """Rarest tokens a candidate sharing ``min_overlap`` tokens must touch."""
+    present = sorted((t for t in tokens if t in postings), key=lambda t: (len(postings[t]), t))
+    return present[: max(0, len(present) - max(min_overlap, 1) + 1)]
+
+
+class BeliefTokenIndex:
+    """Token postings and cached token sets for the beliefs of one store."""
+
+    def __init__(self) -> None:
+        self._tokens: dict[str, ClaimTokens] = {}
+        # Insertion position per id, so the similarity router can return the
+        # first match in store order, as the full scan did.
+        self._order: dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._postings: dict[str, dict[str, set[str]]] = {}
+        self._router_postings: dict[str, dict[str, set[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def tokens_for(self, belief: Any) -> ClaimTokens:
+        """Cached tokens for an indexed belief, fresh tokens for anything else."""
+        cached = self._tokens.get(belief.id)
+        if cached is not None and cached.claim == belief.claim and cached.domain == belief.domain:
+            return cached
+        return ClaimTokens.of(belief.claim, belief.domain)
+
+    def add(self, belief: Any) -> None:
+        """Index a belief, re-posting it if its claim or domain changed."""
+        cached = self._tokens.get(belief.id)
+        if cached is not None:
+            if cached.claim == belief.claim and cached.domain == belief.domain:
+                return
+            # A revised claim keeps its place, as it does in the store's dict.
+            position = self._order[belief.id]
+            self.remove(belief.id)
+        else:
+            position = next(self._sequence)
+        tokens = ClaimTokens.of(belief.claim, belief.domain)
+        self._tokens[belief.id] = tokens
+        self._order[belief.id] = position
+        postings = self._postings.setdefault(tokens.domain, {})
+        for word in tokens.words:
+            postings.setdefault(word, set()).add(belief.id)
+        router_postings = self._router_postings.setdefault(tokens.domain, {})
+        for word in tokens.router_words:
+            router_postings.setdefault(word, set()).add(belief.id)
+
+    def remove(self, belief_id: str) -> None:
+        tokens = self._tokens.pop(belief_id, None)
+        if tokens is None:
+            return
+        del self._order[belief_id]
+        _discard(self._postings.get(tokens.domain, {}), tokens.words, belief_id)
+        _discard(self._router_postings.get(tokens.domain, {}), tokens.router_words, belief_id)
+
+    def _overlap_candidates(self, query: ClaimTokens, min_fraction: float) -> set[str]:
+        postings = self._postings.get(query.domain, {})
+        # similarity >= f needs overlap >= f * max(|A|, |B|) >= f * |A|. The
+        # floor keeps this a lower bound, so the filter can only over-include.
+        min_overlap = math.floor(min_fraction * len(query.words))
+        candidates: set[str] = set()
+        for token in _prefix(query.words, postings, min_overlap):
+            candidates.update(postings[token])
+        return candidates
+
+    def similar(self, belief: Any) -> tuple[str, float] | None:
+        """First same-polarity match above the merge threshold, in insertion order.
+
+        Candidates are walked in the order the beliefs were indexed, so the
+        result is the one a linear scan of the store would stop at, not
+        necessarily the strongest.
+        """
+        query = self.tokens_for(belief)
+        candidates = self._overlap_candidates(query, SIMILAR_THRESHOLD)
+        for candidate_id in sorted(candidates, key=self._order.__getitem__):
+            tokens = self._tokens[candidate_id]
+            if tokens.negated != query.negated:
+                continue
+            similarity = query.similarity(tokens)
+            if similarity > SIMILAR_THRESHOLD:
+                return candidate_id, similarity
+        return None
+
+    def related(self, belief: Any, limit: int = 3) -> list[str]:
+        """Same-polarity ids in the related-but-distinct band, strongest first."""
+        query = self.tokens_for(belief)
+        scored: list[tuple[float, str]] = []
+        for candidate_id in self._overlap_candidates(query, RELATED_FLOOR):
+            if candidate_id == belief.id:
+                continue
+            tokens = self._tokens[candidate_id]
+            if tokens.negated != query.negated:
+                continue
+            similarity = query.similarity(tokens)
+            if RELATED_FLOOR <= similarity < SIMILAR_THRESHOLD:
+                scored.append((similarity, candidate_id))
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+        return [candidate_id for _, candidate_id in scored[:limit]]
+
+    def contradiction_candidates(self, belief: Any) -> list[str]:
+        """Ids the ``ConflictResolver.beliefs_contradict`` heuristic would route."""
+        query = self.tokens_for(belief)
+        postings = self._router_postings.get(query.domain, {})
+        candidates: set[str] = set()
+        for token in _prefix(query.router_words, postings, _CONTRADICTION_MIN_OVERLAP):
+            candidates.update(postings[token])
+        candidates.discard(belief.id)
+        return sorted(
+            candidate_id
+            for candidate_id in candidates
+            if self._tokens[candidate_id].router_negated != query.router_negated
+            and len(query.router_words & self._tokens[candidate_id].router_words) >= _CONTRADICTION_MIN_OVERLAP
+        )
+
+
+def _discard(postings: dict[str, set[str]], tokens: Iterable[str], belief_id: str) -> None:
+    for token in tokens:
+        ids = postings.get(token)
+        if ids is None:
+            continue
+        ids.discard(belief_id)
+        if not ids:
+            del postings[token]
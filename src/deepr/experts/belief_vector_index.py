@@ -2,29 +2,72 @@
 
 The index stores vectors supplied by an already-gated embedding path. It never
 computes embeddings, calls a provider, or decides belief meaning.
+
+Vectors live in a float32 matrix (``belief_vectors.index.<generation>.npy``),
+one row per belief, zero-padded to the widest vector and memory-mapped on
+load. A compact sidecar (``belief_vectors.index.json``) maps rows to belief
+ids, claim hashes, models and true dimensions, and names the matrix generation
+it describes. The sidecar is written last, so it is the commit point: a crash
+between the two writes leaves the previous pair intact. Matrix files are never
+overwritten in place, which also keeps a mapped matrix from blocking the
+replace on Windows.
+
+Upserts do not rewrite the matrix. Each one appends the row's sidecar columns
+and vector to ``belief_vectors.index.journal.jsonl``, tagged with the matrix
+generation it extends and an increasing ``seq`` (the scheme ``belief_journal``
+uses), and fills spare capacity in an in-memory copy of the matrix. Loads
+replay the journal over the mapped matrix. Only compaction writes a new matrix
+generation: once the journal outgrows the matrix, and on every removal.
+
+Past ``ANN_MIN_ROWS`` rows, :meth:`BeliefVectorIndex.search` probes an
+inverted-file ANN index (``belief_vectors.index.ivf.npz``) that is updated on
+each write and tagged with the matrix generation it describes. Reads only
+load the saved index; a matrix without a current one is scanned exactly
+until the next write rebuilds it.
+
+Indexes written by earlier releases as ``belief_vectors.json`` (vectors as
+JSON float lists) are still read, and are rewritten in the binary format on
+the next change.
 """
 
 from __future__ import annotations
 
 import hashlib
+import io
 import json
 import logging
 import math
+import re
+import uuid
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from deepr.utils.atomic_io import atomic_write_json
+import numpy as np
+
+from deepr.experts.ann_index import ANN_MIN_ROWS, IvfIndex, maintained_ann, rank_by_cosine
+from deepr.utils.atomic_io import append_jsonl_durable, atomic_write_bytes, atomic_write_json
 
 logger = logging.getLogger(__name__)
 
-BELIEF_VECTOR_INDEX_SCHEMA_VERSION = "deepr-belief-vector-index-v1"
-DEFAULT_BELIEF_VECTOR_INDEX_FILENAME = "belief_vectors.json"
+BELIEF_VECTOR_INDEX_SCHEMA_VERSION = "deepr-belief-vector-index-v2"
+DEFAULT_BELIEF_VECTOR_INDEX_FILENAME = "belief_vectors.index.json"
+LEGACY_BELIEF_VECTOR_INDEX_FILENAME = "belief_vectors.json"
+# Refusal ceiling for the legacy JSON format only; the binary matrix is mapped,
+# not parsed, so it has no equivalent limit.
 MAX_INDEX_BYTES = 50 * 1024 * 1024
 MAX_VECTOR_DIMENSIONS = 8192
+# Same amortization rule as the belief journal: compact once the journal is
+# larger than both this floor and the matrix itself.
+_COMPACT_MIN_BYTES = 1024 * 1024
 
+_SIDECAR_COLUMNS = ("belief_id", "claim_hash", "model", "dimensions", "embedded_at", "metadata")
+_GENERATION_RE = re.compile(r"[0-9a-f]{12}")
 
+
+@lru_cache(maxsize=65536)
 def belief_claim_hash(claim: str) -> str:
     """Return a stable hash for the exact claim text that was embedded."""
     return hashlib.sha256(claim.encode("utf-8")).hexdigest()
@@ -53,59 +96,263 @@ def _record_embedding(record: Mapping[str, Any]) -> tuple[float, ...] | None:
         return None
 
 
+def _empty_matrix() -> np.ndarray:
+    return np.zeros((0, 0), dtype=np.float32)
+
+
 class BeliefVectorIndex:
     """Local persisted belief vectors keyed by belief id.
 
     Records are valid only while the current belief claim hash matches the hash
     stored with the embedding. A revised claim therefore cannot accidentally use
     a stale vector.
+
+    Attributes:
+        path: The sidecar file; its matrix sits beside it.
+        records: Per-belief metadata (claim hash, model, dimensions,
+            ``embedded_at``, metadata). Vectors stay in the matrix.
     """
 
     def __init__(self, path: Path):
         self.path = path
-        self.records: dict[str, dict[str, Any]] = {}
+        self._reset()
         self._load()
 
+    def _reset(self) -> None:
+        self.records: dict[str, dict[str, Any]] = {}
+        self._rows: dict[str, int] = {}
+        self._matrix = _empty_matrix()
+        # Writable matrix with spare rows once a journal append touched it;
+        # ``_matrix`` is then a view of its first rows.
+        self._buffer: np.ndarray | None = None
+        self._norms: np.ndarray | None = None
+        self._generation: str | None = None
+        self._seq = 0
+        self._journal_bytes = 0
+        self._needs_compaction = False
+        self._ann: IvfIndex | None = None
+        # Matrix generation whose saved ANN index a read already tried to load.
+        self._ann_loaded_for: str | None = None
+
     @classmethod
     def for_belief_store(cls, storage_dir: Path) -> BeliefVectorIndex:
         return cls(storage_dir / DEFAULT_BELIEF_VECTOR_INDEX_FILENAME)
 
+    @property
+    def legacy_path(self) -> Path:
+        return self.path.with_name(LEGACY_BELIEF_VECTOR_INDEX_FILENAME)
+
+    def _matrix_path(self, generation: str) -> Path:
+        return self.path.with_name(f"{self.path.stem}.{generation}.npy")
+
+    @property
+    def journal_path(self) -> Path:
+        return self.path.with_name(f"{self.path.stem}.journal.jsonl")
+
+    @property
+    def ann_path(self) -> Path:
+        return self.path.with_name(f"{self.path.stem}.ivf.npz")
+
     def _load(self) -> None:
-        if not self.path.exists():
+        if self.path.exists():
+            self._load_binary()
+        elif self.legacy_path.exists():
+            self._load_legacy()
+
+    def _load_binary(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+            if tuple(payload["columns"]) != _SIDECAR_COLUMNS:
+                raise ValueError(f"unexpected columns {payload['columns']!r}")
+            rows = payload["rows"]
+            generation = payload["generation"]
+            if generation is None:
+                matrix = _empty_matrix()
+            elif not isinstance(generation, str) or not _GENERATION_RE.fullmatch(generation):
+                raise ValueError(f"invalid matrix generation {generation!r}")
+            else:
+                matrix = np.load(self._matrix_path(generation), mmap_mode="r", allow_pickle=False)
+            if matrix.dtype != np.float32 or matrix.ndim != 2 or matrix.shape[0] != len(rows):
+                raise ValueError(f"matrix shape {matrix.shape} does not match {len(rows)} sidecar rows")
+            records = {}
+            for row in rows:
+                record = dict(zip(_SIDECAR_COLUMNS, row, strict=True))
+                if not 0 < int(record["dimensions"]) <= matrix.shape[1]:
+                    raise ValueError(f"row for {record['belief_id']!r} has invalid dimensions")
+                records[str(record["belief_id"])] = record
+            seq = int((payload.get("journal") or {}).get("seq", 0) or 0)
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError) as exc:
+            logger.error("Failed to load belief vector index from %s: %s", self.path, exc)
             return
+        self.records = records
+        self._rows = {belief_id: row for row, belief_id in enumerate(records)}
+        self._matrix = matrix
+        self._generation = generation
+        self._seq = seq
+        try:
+            self._replay_journal()
+        except (OSError, KeyError, TypeError, ValueError) as exc:
+            # Vectors are derived state: start empty and let the next write
+            # compact rather than serve rows that may not match their sidecar.
+            logger.error("Failed to replay belief vector journal %s: %s", self.journal_path, exc)
+            self._reset()
+
+    def _replay_journal(self) -> None:
+        """Apply journal records that extend the loaded matrix generation.
+
+        A final line without its newline is a torn append that was never
+        acknowledged: it is dropped and the next write compacts, so later
+        appends never land on the fragment.
+        """
+        try:
+            raw = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            return
+        self._journal_bytes = len(raw)
+        lines = raw.split(b"\n")
+        if lines[-1].strip():
+            logger.warning("Dropping torn final record in %s", self.journal_path)
+            self._needs_compaction = True
+        for line in lines[:-1]:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if not isinstance(record, dict) or self._generation is None or record.get("generation") != self._generation:
+                continue  # written against a matrix that has since been compacted
+            if not isinstance(record.get("seq"), int) or record["seq"] <= self._seq:
+                continue
+            row = dict(zip(_SIDECAR_COLUMNS, record["row"], strict=True))
+            vector = np.asarray(_coerce_embedding(record["vector"]), dtype=np.float32)
+            if int(row["dimensions"]) != len(vector):
+                raise ValueError(f"journal record {record['seq']} has mismatched dimensions")
+            self._set_row(row, vector)
+            self._seq = record["seq"]
+
+    def _load_legacy(self) -> None:
+        path = self.legacy_path
         try:
-            if self.path.stat().st_size > MAX_INDEX_BYTES:
+            if path.stat().st_size > MAX_INDEX_BYTES:
                 logger.error(
                     "Belief vector index at %s exceeds 50 MB; ignoring until it is rebuilt.",
-                    self.path,
+                    path,
                 )
                 return
-            with open(self.path, encoding="utf-8") as handle:
+            with open(path, encoding="utf-8") as handle:
                 payload = json.load(handle)
         except (json.JSONDecodeError, OSError) as exc:
-            logger.error("Failed to load belief vector index from %s: %s", self.path, exc)
+            logger.error("Failed to load belief vector index from %s: %s", path, exc)
             return
 
         raw_records = payload.get("records", {}) if isinstance(payload, Mapping) else {}
         if not isinstance(raw_records, Mapping):
             return
-        self.records = {
-            str(belief_id): dict(record)
-            for belief_id, record in raw_records.items()
-            if isinstance(record, Mapping) and _record_embedding(record) is not None
-        }
+        vectors: list[tuple[float, ...]] = []
+        for belief_id, record in raw_records.items():
+            if not isinstance(record, Mapping) or (embedding := _record_embedding(record)) is None:
+                continue
+            self.records[str(belief_id)] = {
+                "belief_id": str(belief_id),
+                "claim_hash": str(record.get("claim_hash", "")),
+                "model": str(record.get("model", "")),
+                "dimensions": len(embedding),
+                "embedded_at": str(record.get("embedded_at", "")),
+                "metadata": dict(record.get("metadata") or {}),
+            }
+            vectors.append(embedding)
+        self._rows = {belief_id: row for row, belief_id in enumerate(self.records)}
+        width = max((len(vector) for vector in vectors), default=0)
+        self._matrix = np.zeros((len(vectors), width), dtype=np.float32)
+        for row, vector in enumerate(vectors):
+            self._matrix[row, : len(vector)] = vector
+
+    def _commit(self, records: dict[str, dict[str, Any]], matrix: np.ndarray) -> None:
+        """Write a new matrix generation, then the sidecar that points at it.
 
-    def _save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
+        The sidecar records the journal position it absorbed, and the journal
+        is removed once the sidecar is in place.
+        """
+        generation = uuid.uuid4().hex[:12] if records else None
+        if generation is not None:
+            buffer = io.BytesIO()
+            np.save(buffer, matrix, allow_pickle=False)
+            atomic_write_bytes(self._matrix_path(generation), buffer.getvalue())
         atomic_write_json(
             self.path,
             {
                 "schema_version": BELIEF_VECTOR_INDEX_SCHEMA_VERSION,
                 "updated_at": datetime.now(UTC).isoformat(),
-                "record_count": len(self.records),
-                "records": self.records,
+                "record_count": len(records),
+                "generation": generation,
+                "width": int(matrix.shape[1]) if records else 0,
+                "columns": list(_SIDECAR_COLUMNS),
+                "rows": [[record[column] for column in _SIDECAR_COLUMNS] for record in records.values()],
+                "journal": {"seq": self._seq},
             },
         )
+        self.records = records
+        self._rows = {belief_id: row for row, belief_id in enumerate(records)}
+        self._matrix = matrix if records else _empty_matrix()
+        self._buffer = None
+        self._norms = None
+        self._generation = generation
+        self._journal_bytes = 0
+        self._needs_compaction = False
+        current = self._matrix_path(generation).name if generation else None
+        stale = [p for p in self.path.parent.glob(f"{self.path.stem}.*.npy") if p.name != current]
+        for old in [*stale, self.legacy_path, self.journal_path]:
+            try:
+                old.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                # Another reader may still have the old matrix mapped (Windows
+                # refuses to delete it); the next commit retries.
+                logger.debug("Could not remove superseded belief vectors %s: %s", old, exc)
+
+    def compact(self) -> None:
+        """Fold the journal into a new matrix generation."""
+        self._commit(dict(self.records), np.array(self._matrix, dtype=np.float32))
+        self._refresh_ann()
+
+    def _should_compact(self) -> bool:
+        return (
+            self._generation is None
+            or self._needs_compaction
+            or self._journal_bytes > max(_COMPACT_MIN_BYTES, self._matrix.nbytes)
+        )
+
+    def _set_row(self, record: dict[str, Any], vector: np.ndarray) -> int:
+        """Store ``record`` and its vector in memory, appending a row for a new belief."""
+        belief_id = str(record["belief_id"])
+        row = self._rows.setdefault(belief_id, len(self._rows))
+        self._place_row(row, vector)
+        self.records[belief_id] = record
+        return row
+
+    def _place_row(self, row: int, vector: np.ndarray) -> None:
+        """Write ``vector`` into matrix row ``row``, growing capacity geometrically.
+
+        The first write after a load or compaction copies the mapped matrix
+        into a writable buffer; later appends fill its spare rows, so adding a
+        belief costs O(width) amortized rather than a full matrix copy.
+        """
+        rows, width = self._matrix.shape
+        total = max(rows, row + 1)
+        if self._buffer is None or total > len(self._buffer) or len(vector) > self._buffer.shape[1]:
+            buffer = np.zeros((max(total, 2 * rows, 16), max(width, len(vector))), dtype=np.float32)
+            buffer[:rows, :width] = self._matrix
+            norms = np.zeros(len(buffer), dtype=np.float32)
+            norms[:rows] = self._row_norms()
+            self._buffer, self._norms = buffer, norms
+        self._buffer[row] = 0.0
+        self._buffer[row, : len(vector)] = vector
+        self._norms[row] = np.linalg.norm(vector)
+        self._matrix = self._buffer[:total]
+
+    def _row_values(self, belief_id: str) -> tuple[float, ...]:
+        dimensions = int(self.records[belief_id]["dimensions"])
+        return tuple(self._matrix[self._rows[belief_id], :dimensions].tolist())
 
     def upsert_belief(
         self,
@@ -118,7 +365,9 @@ class BeliefVectorIndex:
     ) -> bool:
         """Persist a vector for a belief claim.
 
-        Returns True when the stored index changed.
+        Appends one journal record; the matrix is only rewritten when the
+        journal is due for compaction. Returns True when the stored index
+        changed.
         """
         belief_id = str(getattr(belief, "id", "") or "")
         claim = str(getattr(belief, "claim", "") or "")
@@ -126,29 +375,81 @@ class BeliefVectorIndex:
             raise ValueError("belief id is required")
         if not claim:
             raise ValueError("belief claim is required")
-        vector = _coerce_embedding(embedding)
+        vector = np.asarray(_coerce_embedding(embedding), dtype=np.float32)
         record = {
             "belief_id": belief_id,
             "claim_hash": belief_claim_hash(claim),
             "model": str(model or ""),
             "dimensions": len(vector),
-            "embedding": list(vector),
             "embedded_at": embedded_at or datetime.now(UTC).isoformat(),
             "metadata": dict(metadata or {}),
         }
-        if self.records.get(belief_id) == record:
+        if self.records.get(belief_id) == record and self._row_values(belief_id) == tuple(vector.tolist()):
             return False
-        self.records[belief_id] = record
-        self._save()
+        if self._should_compact():
+            rows, width = self._matrix.shape
+            row = self._rows.get(belief_id, rows)
+            matrix = np.zeros((max(rows, row + 1), max(width, len(vector))), dtype=np.float32)
+            matrix[:rows, :width] = self._matrix
+            matrix[row, : len(vector)] = vector
+            self._commit({**self.records, belief_id: record}, matrix)
+        else:
+            entry = {
+                "generation": self._generation,
+                "seq": self._seq + 1,
+                "row": [record[column] for column in _SIDECAR_COLUMNS],
+                "vector": vector.tolist(),
+            }
+            append_jsonl_durable(self.journal_path, entry, fsync=True)
+            self._journal_bytes += len(json.dumps(entry).encode("utf-8")) + 1
+            self._seq = entry["seq"]
+            row = self._set_row(record, vector)
+        self._refresh_ann(rows=[row])
         return True
 
+    def _keep_only(self, belief_ids: set[str]) -> None:
+        kept = [belief_id for belief_id in self.records if belief_id in belief_ids]
+        kept_rows = np.asarray([self._rows[belief_id] for belief_id in kept], dtype=np.intp)
+        matrix = np.asarray(self._matrix[kept_rows], dtype=np.float32)
+        if self._ann is not None:
+            self._ann.keep_rows(kept_rows)
+        self._commit({belief_id: self.records[belief_id] for belief_id in kept}, matrix)
+        self._refresh_ann()
+
+    def _refresh_ann(self, rows: Sequence[int] = ()) -> IvfIndex | None:
+        """Keep the derived ANN index in step with the committed matrix after a write."""
+        if len(self._matrix) < ANN_MIN_ROWS and self._ann is None and not self.ann_path.exists():
+            return None
+        try:
+            self._ann = maintained_ann(
+                self._ann, self._matrix, self.ann_path, generation=self._generation or "", rows=rows
+            )
+        except OSError as exc:
+            # Derived state: search falls back to the exact scan.
+            logger.warning("Could not update belief ANN index %s: %s", self.ann_path, exc)
+            self._ann = None
+        return self._ann
+
+    def _current_ann(self) -> IvfIndex | None:
+        """Return the ANN index for the committed matrix, loading the saved one; never builds."""
+        rows, width = self._matrix.shape
+        generation = self._generation or ""
+        if rows < ANN_MIN_ROWS:
+            return None
+        if self._ann is None and self._ann_loaded_for != generation:
+            self._ann_loaded_for = generation
+            self._ann = IvfIndex.load(self.ann_path, rows=rows, width=width, generation=generation)
+        ann = self._ann
+        if ann is None or ann.generation != generation or ann.width != width or len(ann.assignments) != rows:
+            return None
+        return ann
+
     def remove(self, belief_id: str) -> bool:
         """Remove a belief vector if present."""
         key = str(belief_id)
         if key not in self.records:
             return False
-        del self.records[key]
-        self._save()
+        self._keep_only(set(self.records) - {key})
         return True
 
     def prune(self, current_belief_ids: Iterable[str]) -> int:
@@ -157,19 +458,18 @@ class BeliefVectorIndex:
         stale = [belief_id for belief_id in self.records if belief_id not in current]
         if not stale:
             return 0
-        for belief_id in stale:
-            del self.records[belief_id]
-        self._save()
+        self._keep_only(set(self.records) - set(stale))
         return len(stale)
 
-    def vectors_for(
+    def searchable_ids(
         self,
         beliefs: Iterable[Any],
         *,
         model: str | None = None,
-    ) -> dict[str, tuple[float, ...]]:
-        """Return non-stale vectors for current belief claims."""
-        vectors: dict[str, tuple[float, ...]] = {}
+        dimensions: int | None = None,
+    ) -> dict[str, int]:
+        """Map current belief ids with a non-stale vector to their matrix rows."""
+        rows: dict[str, int] = {}
         for belief in beliefs:
             belief_id = str(getattr(belief, "id", "") or "")
             claim = str(getattr(belief, "claim", "") or "")
@@ -178,12 +478,79 @@ class BeliefVectorIndex:
                 continue
             if model is not None and str(record.get("model", "")) != model:
                 continue
+            if dimensions is not None and int(record["dimensions"]) != dimensions:
+                continue
             if str(record.get("claim_hash", "")) != belief_claim_hash(claim):
                 continue
-            embedding = _record_embedding(record)
-            if embedding is not None:
-                vectors[belief_id] = embedding
-        return vectors
+            rows[belief_id] = self._rows[belief_id]
+        return rows
+
+    def vectors_for(
+        self,
+        beliefs: Iterable[Any],
+        *,
+        model: str | None = None,
+    ) -> dict[str, tuple[float, ...]]:
+        """Return non-stale vectors for current belief claims."""
+        return {belief_id: self._row_values(belief_id) for belief_id in self.searchable_ids(beliefs, model=model)}
+
+    def search(
+        self,
+        query_vector: Sequence[float],
+        top_k: int = 5,
+        *,
+        beliefs: Iterable[Any] | None = None,
+        model: str | None = None,
+        exact: bool = False,
+    ) -> list[tuple[str, float]]:
+        """Return up to ``top_k`` ``(belief_id, cosine)`` pairs, best first.
+
+        Scores eligible rows with one matrix-vector product over the mapped
+        matrix and selects the top rows with ``argpartition``; past
+        ``ANN_MIN_ROWS`` rows only the ANN probe is scored unless ``exact``.
+        Only rows whose vector has the query's dimensions (and ``model``, when
+        given) are eligible. When ``beliefs`` is supplied, rows must also match
+        a current claim hash; without it, staleness is the caller's
+        responsibility.
+        """
+        if top_k <= 0 or not self._rows:
+            return []
+        query = np.asarray(_coerce_embedding(query_vector), dtype=np.float32)
+        if beliefs is not None:
+            eligible = self.searchable_ids(beliefs, model=model, dimensions=len(query))
+        else:
+            eligible = {
+                belief_id: row
+                for belief_id, row in self._rows.items()
+                if int(self.records[belief_id]["dimensions"]) == len(query)
+                and (model is None or str(self.records[belief_id].get("model", "")) == model)
+            }
+        if not eligible:
+            return []
+        ids_by_row = {row: belief_id for belief_id, row in eligible.items()}
+        rows, scores = rank_by_cosine(
+            self._matrix,
+            query,
+            limit=top_k,
+            rows=np.fromiter(sorted(ids_by_row), dtype=np.intp, count=len(ids_by_row)),
+            norms=self._row_norms(),
+            ann=None if exact else self._current_ann(),
+        )
+        ranked = sorted((-float(score), ids_by_row[int(row)]) for row, score in zip(rows, scores, strict=True))
+        return [(belief_id, -negated) for negated, belief_id in ranked]
+
+    def ann_snapshot(self) -> tuple[np.ndarray, IvfIndex | None]:
+        """Return the vector matrix and its current ANN index.
+
+        The index is ``None`` below ``ANN_MIN_ROWS`` and until a write saves one.
+        """
+        return self._matrix, self._current_ann()
+
+    def _row_norms(self) -> np.ndarray:
+        rows = len(self._matrix)
+        if self._norms is None or len(self._norms) < rows:
+            self._norms = np.linalg.norm(self._matrix, axis=1)
+        return self._norms[:rows]
 
     def missing_or_stale_ids(
         self,
@@ -193,7 +560,7 @@ class BeliefVectorIndex:
     ) -> list[str]:
         """Return current belief ids whose vectors are absent or stale."""
         belief_list = list(beliefs)
-        available = self.vectors_for(belief_list, model=model)
+        available = self.searchable_ids(belief_list, model=model)
         return [
             belief_id
             for belief in belief_list
@@ -14,9 +14,10 @@ from urllib.parse import urlsplit
 
 from deepr.experts import mutation_audit as audit
 from deepr.experts.belief_edges import EDGE_TYPES, Edge, normalized_edge_temporal_context
-from deepr.experts.belief_event_wal import event_log_conflicts_with_snapshot
+from deepr.experts.belief_journal import JOURNAL_FILENAME, BeliefJournal, load_belief_store, save_belief_store
+from deepr.experts.belief_token_index import BeliefTokenIndex
 from deepr.experts.maker_checker import strongest_grounding_event
-from deepr.utils.atomic_io import append_jsonl_durable, atomic_write_json
+from deepr.utils.atomic_io import append_jsonl_durable
 
 logger = logging.getLogger(__name__)
 
@@ -24,24 +25,6 @@ logger = logging.getLogger(__name__)
 # Free-text evidence excerpts ground one source but are not independent origins.
 _URL_SCHEME_RE = re.compile(r"^[a-z][a-z0-9+.\-]*://", re.IGNORECASE)
 
-# Polarity guard for the lexical similarity routers. Word overlap cannot see
-# negation, so opposite-polarity claims score near-identical. This filters
-# pairs out of the merge and supports-edge routers; it never concludes that a
-# contradiction exists (that stays a model verdict).
-_NEGATION_WORDS = frozenset({"not", "no", "never", "false", "incorrect", "wrong"})
-
-# Whitespace splitting leaves punctuation attached, so "is not, in fact, current"
-# yields the token "not," and slips past the guard - re-enabling exactly the
-# opposite-polarity merge the guard exists to block. Tokenize on word characters
-# for the polarity test only; the overlap score keeps using whitespace splitting
-# so similarity semantics elsewhere are unchanged.
-_WORD_RE = re.compile(r"[a-z0-9']+")
-
-
-def _has_negation(claim: str) -> bool:
-    """True when a claim carries a negation marker, punctuation notwithstanding."""
-    return bool(set(_WORD_RE.findall(claim.lower())) & _NEGATION_WORDS)
-
 
 def _canonical_url_source_key(token: str) -> str | None:
     """Return one conservative source identity for an absolute URL.
@@ -424,10 +407,6 @@ class BeliefChange:
         )
 
 
-# Provenance for edges migrated from contradictions_with lists.
-_MIGRATED_PROVENANCE = "migrated:contradictions_with"
-
-
 class BeliefStoreError(RuntimeError): ...
 
 
@@ -480,6 +459,8 @@ class BeliefStore:
             self.storage_dir.mkdir(parents=True, exist_ok=True)
         # Exact read path passed only after containment validation.
         self.storage_path = read_path or self.storage_dir / "beliefs.json"
+        # Per-save deltas land here; beliefs.json is a periodically compacted snapshot.
+        self.journal_path = self.storage_path.with_name(JOURNAL_FILENAME)
         self.changes_path = self.storage_dir / "changes.json"
         # Append-only belief event log (TKG step 1): every change is kept here
         # while changes.json remains a capped legacy window.
@@ -494,6 +475,7 @@ class BeliefStore:
 
     def _store_edge(self, edge: Edge, provenance: str, temporal_context: dict[str, str] | None) -> Edge:
         stored = self.edges.setdefault(edge.key(), edge)
+        self._journal.mark_edge(stored.key())
         if provenance and provenance not in stored.provenance:
             stored.provenance.append(provenance)
         normalized_temporal_context = normalized_edge_temporal_context(temporal_context)
@@ -532,6 +514,7 @@ class BeliefStore:
                 a.add_contradiction(dst_id)
             if b is not None:
                 b.add_contradiction(src_id)
+            self._journal.mark_belief(src_id, dst_id)
 
         if save:
             self._save()
@@ -570,6 +553,7 @@ class BeliefStore:
             change.timestamp = max(change.timestamp, latest + timedelta(microseconds=1))
 
         self.changes.append(change)
+        self._journal.mark_belief(change.belief_id)
         with self._lock:
             append_jsonl_durable(self.events_path, change.to_dict(), fsync=True)
             audit_entry = audit.build_mutation_audit_entry(
@@ -816,6 +800,7 @@ class BeliefStore:
             belief.grounding_assurance = "unverified"
             belief.grounding_verified_at = None
         belief.claim = new_claim
+        self._index_belief(belief)
         belief.update_confidence(new_confidence, reason)
         if evidence:
             belief.add_evidence(evidence)
@@ -954,6 +939,7 @@ class BeliefStore:
                 continue
             belief.retrieval_count += 1
             belief.last_retrieved_at = now
+            self._journal.mark_belief(bid)
             touched += 1
         if touched:
             logger.debug("Recorded retrieval of %d belief(s)%s", touched, f" ({context})" if context else "")
@@ -1099,17 +1085,9 @@ class BeliefStore:
         independent corroboration. Excluding the pair here routes it to the
         contradiction path instead; it still concludes nothing on its own.
         """
-        belief_words = set(belief.claim.lower().split())
-        has_negation = _has_negation(belief.claim)
-        for existing in self.get_beliefs_by_domain(belief.domain):
-            existing_words = set(existing.claim.lower().split())
-            if _has_negation(existing.claim) != has_negation:
-                continue
-            overlap = len(belief_words & existing_words)
-            similarity = overlap / max(len(belief_words), len(existing_words), 1)
-            if similarity > 0.7:
-                return existing, similarity
-        return None
+        match = self._token_index.similar(belief)
+        existing = self.beliefs.get(match[0]) if match else None
+        return (existing, match[1]) if existing is not None and match else None
 
     def _find_similar(self, belief: Belief) -> Belief | None:
         """Lexical router; see :meth:`find_similar_with_score` for the caveat."""
@@ -1129,23 +1107,7 @@ class BeliefStore:
 
         Returns at most the 3 strongest matches to keep the graph sparse.
         """
-        belief_words = set(belief.claim.lower().split())
-        has_negation = _has_negation(belief.claim)
-
-        scored: list[tuple[float, Belief]] = []
-        for existing in self.get_beliefs_by_domain(belief.domain):
-            if existing.id == belief.id:
-                continue
-            existing_words = set(existing.claim.lower().split())
-            if _has_negation(existing.claim) != has_negation:
-                continue
-            overlap = len(belief_words & existing_words)
-            similarity = overlap / max(len(belief_words), len(existing_words), 1)
-            if 0.35 <= similarity < 0.7:
-                scored.append((similarity, existing))
-
-        scored.sort(key=lambda pair: pair[0], reverse=True)
-        return [b for _, b in scored[:3]]
+        return [self.beliefs[bid] for bid in self._token_index.related(belief) if bid in self.beliefs]
 
     def _find_contradictions(self, belief: Belief) -> list[Belief]:
         """Find same-domain beliefs that may contradict the given one.
@@ -1153,8 +1115,8 @@ class BeliefStore:
         This is a high-recall *router*, not a verdict: it routes candidate
         pairs into the model-based contradiction check, and must never be
         treated as a confirmed contradiction on its own (see
-        docs/design/checks-deterministic-vs-agentic.md). It delegates the
-        single-pair test to the canonical
+        docs/design/checks-deterministic-vs-agentic.md). The token index only
+        narrows candidates; each pair is still decided by the canonical
         :meth:`ConflictResolver.beliefs_contradict` predicate so there is one
         lexical heuristic, not a drifting second copy.
 
@@ -1168,11 +1130,10 @@ class BeliefStore:
         # top-level import would be circular.
         from deepr.experts.conflict_resolver import ConflictResolver
 
-        return [
-            existing
-            for existing in self.get_beliefs_by_domain(belief.domain)
-            if existing.id != belief.id and ConflictResolver.beliefs_contradict(belief, existing)
+        candidates = [
+            self.beliefs[bid] for bid in self._token_index.contradiction_candidates(belief) if bid in self.beliefs
         ]
+        return [existing for existing in candidates if ConflictResolver.beliefs_contradict(belief, existing)]
 
     def _resolve_conflict(self, existing: Belief, new: Belief) -> tuple[Belief, BeliefChange | None]:
         """Resolve conflict between beliefs.
@@ -1268,6 +1229,7 @@ class BeliefStore:
         claim_revised = bool(prefer_new_claim and new.claim.strip() and new.claim != existing.claim)
         if claim_revised:
             existing.claim = new.claim
+            self._index_belief(existing)
             existing.source_type = new.source_type
             existing.grounding_assurance = new.grounding_assurance
             existing.grounding_verified_at = new.grounding_verified_at
@@ -1339,6 +1301,7 @@ class BeliefStore:
             }
         )
         existing.claim = new.claim
+        self._index_belief(existing)
         existing.confidence = new.confidence
         existing.evidence_refs = merged_refs or list(new.evidence_refs)
         existing.source_type = new.source_type
@@ -1363,81 +1326,28 @@ class BeliefStore:
         return change
 
     def _index_belief(self, belief: Belief):
-        """Add belief to domain index."""
-        if belief.domain not in self.domain_index:
-            self.domain_index[belief.domain] = set()
-        self.domain_index[belief.domain].add(belief.id)
+        """Add belief to the domain and token indexes (re-posting a changed claim)."""
+        self.domain_index.setdefault(belief.domain, set()).add(belief.id)
+        self._token_index.add(belief)
 
     def _unindex_belief(self, belief: Belief):
-        """Remove belief from domain index."""
+        """Remove belief from the domain and token indexes."""
         if belief.domain in self.domain_index:
             self.domain_index[belief.domain].discard(belief.id)
+        self._token_index.remove(belief.id)
 
     def _save(self):
         if self.read_only:
             raise BeliefStoreError("read-only belief store cannot be saved")
         if self._unreadable:
             raise BeliefStoreError("refusing to overwrite unreadable belief store")
-        atomic_write_json(
-            self.storage_path,
-            {
-                "edges": [e.to_dict() for e in self.edges.values()],
-                "beliefs": {bid: b.to_dict() for bid, b in self.beliefs.items()},
-                "changes": [c.to_dict() for c in self.changes[-100:]],
-            },
-            fsync=True,
-        )
+        save_belief_store(self)
 
     def _load(self):
-        self._unreadable = False
-        if not self.storage_path.exists():
-            if event_log_conflicts_with_snapshot(self.events_path, snapshot_exists=False, latest_change=None):
-                self._unreadable = True
-            return
-        try:
-            if self.storage_path.stat().st_size > 50 * 1024 * 1024:
-                self._unreadable = True
-                logger.error("Belief store at %s exceeds 50 MB; refusing to load.", self.storage_path)
-                return
-            with open(self.storage_path, encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError) as exc:
-            self._unreadable = True
-            logger.error("Failed to load beliefs from %s: %s. Refusing writes.", self.storage_path, exc)
-            return
-        self.beliefs = {bid: Belief.from_dict(bdata) for bid, bdata in data.get("beliefs", {}).items()}
-        for belief in self.beliefs.values():
-            self._index_belief(belief)
-        for edata in data.get("edges", []):
-            try:
-                edge = Edge.from_dict(edata)
-            except (KeyError, TypeError, ValueError) as exc:
-                self._unreadable = True
-                logger.error("Malformed edge in %s: %s. Refusing writes.", self.storage_path, exc)
-                return
-            self.edges[edge.key()] = edge
-        # Migrate legacy contradictions_with lists to typed contradicts edges.
-        migrated = 0
-        for belief in self.beliefs.values():
-            for other_id in belief.contradictions_with:
-                probe = Edge(src_id=belief.id, dst_id=other_id, edge_type="contradicts")
-                if probe.key() not in self.edges:
-                    probe.provenance.append(_MIGRATED_PROVENANCE)
-                    self.edges[probe.key()] = probe
-                    migrated += 1
-        if migrated and not self.read_only:
-            logger.info("Migrated %d contradictions_with pair(s) to typed edges for %s", migrated, self.expert_name)
-            self._save()
-        for cdata in data.get("changes", []):
-            try:
-                self.changes.append(BeliefChange.from_dict(cdata))
-            except (KeyError, TypeError, ValueError) as exc:
-                self._unreadable = True
-                logger.error("Malformed change record in %s: %s. Refusing writes.", self.storage_path, exc)
-                return
-        latest = self.changes[-1].timestamp if self.changes else None
-        if event_log_conflicts_with_snapshot(self.events_path, snapshot_exists=True, latest_change=latest):
-            self._unreadable = True
+        self._journal = BeliefJournal(self.journal_path)
+        # Router candidate generation; maintained by _index_belief/_unindex_belief.
+        self._token_index = BeliefTokenIndex()
+        load_belief_store(self)
 
 
 from deepr.experts.semantic_recall import install_belief_store_recall_methods as _install_recall_methods
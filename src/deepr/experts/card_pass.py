@@ -4,7 +4,9 @@ The pass is deliberately per-source and idempotent by content hash. A corpus
 that gains one document costs one model call, not a re-read of everything,
 which is what makes an expert something you grow rather than something you
 rebuild. Cards for sources that have not changed are loaded from disk and not
-re-derived, so a run over an unchanged corpus costs nothing at all.
+re-derived, so a run over an unchanged corpus costs nothing at all. The cards
+that do need building have no order between them, so over a backend pool they
+are built concurrently, one plan per call.
 
 Failure is per-source too. A source that fails to read leaves an error card
 and the other forty-nine still get read, because a partial set of cards is
@@ -19,6 +21,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from deepr.experts.backend_pool import BackendPool, map_pooled
 from deepr.experts.corpus_store import CorpusEntry, CorpusStore
 from deepr.experts.source_card import (
     _MAX_CLAIMS,
@@ -184,34 +187,71 @@ async def build_one_card(
     return assemble_card(parsed, entry, shown, truncated)
 
 
+def _partition_cached(
+    entries: list[CorpusEntry], expert_dir: Path, *, rebuild: bool
+) -> tuple[list[SourceCard | None], list[tuple[int, CorpusEntry]]]:
+    """Card slots in corpus order, and the (slot, entry) pairs still to build."""
+    cards: list[SourceCard | None] = []
+    pending: list[tuple[int, CorpusEntry]] = []
+    for entry in entries:
+        # The card is checked before the text is read: on an unchanged corpus
+        # nearly every card is reused, and reading its source would be waste.
+        if not rebuild and (existing := load_card(expert_dir, entry.sha256)) is not None:
+            cards.append(existing)
+        else:
+            pending.append((len(cards), entry))
+            cards.append(None)
+    return cards, pending
+
+
 async def run_card_pass(
     *,
     expert_name: str,
     corpus: CorpusStore,
     expert_dir: Path,
-    completion: CardCompletion,
+    completion: CardCompletion | None = None,
+    pool: BackendPool | None = None,
+    concurrency: int = 0,
     source_budget: int = _DEFAULT_SOURCE_BUDGET,
     rebuild: bool = False,
     on_progress: ProgressCallback | None = None,
 ) -> CardPassResult:
-    """One card per active source, reusing cards whose source has not changed."""
-    result = CardPassResult(expert_name=expert_name)
-    material = corpus.load_study_material()
-
-    for index, (entry, text) in enumerate(material, 1):
-        if not rebuild and (existing := load_card(expert_dir, entry.sha256)) is not None:
-            result.cards.append(existing)
-            result.reused += 1
-            continue
+    """One card per active source, reusing cards whose source has not changed.
 
+    With a ``pool``, the sources that need a card are read concurrently
+    across it (``concurrency`` in flight, the pool size by default); with a
+    plain ``completion`` they are read one at a time. Either way each card is
+    saved as soon as it is built, so an interrupted pass keeps what finished,
+    and the result lists cards in corpus order however the calls completed.
+    """
+    if completion is None and pool is None:
+        raise ValueError("run_card_pass needs a completion or a backend pool")
+    result = CardPassResult(expert_name=expert_name)
+    entries = corpus.study_entries()
+    cards, pending = _partition_cached(entries, expert_dir, rebuild=rebuild)
+    result.reused = len(cards) - len(pending)
+
+    async def build(item: tuple[int, CorpusEntry], complete: CardCompletion) -> None:
+        position, entry = item
+        # Read here rather than up front, so only sources in flight are held.
+        text = corpus.read(entry.sha256)
+        if text is None:
+            return
         if on_progress:
-            on_progress(f"reading source {index}/{len(material)} ({entry.origin_key})")
-        card = await build_one_card(entry, text, completion, source_budget=source_budget)
+            on_progress(f"reading source {position + 1}/{len(entries)} ({entry.origin_key})")
+        card = await build_one_card(entry, text, complete, source_budget=source_budget)
         save_card(expert_dir, card)
-        result.cards.append(card)
+        cards[position] = card
         if card.error or not card.is_read:
             result.failed += 1
         else:
             result.built += 1
 
+    if pool is not None:
+        await map_pooled(pool, pending, build, concurrency=concurrency)
+    elif completion is not None:
+        for item in pending:
+            await build(item, completion)
+
+    result.cards = [card for card in cards if card is not None]
     return result
@@ -20,6 +20,8 @@ Costs network only. No model call, no metered surface.
 
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -33,6 +35,13 @@ _MIN_USEFUL_CHARS = 200
 
 _MAX_SOURCE_CHARS = 400_000
 
+_MAX_CONCURRENT_FETCHES = 8
+"""Fetches in flight at once across all origins."""
+
+_ORIGIN_FETCHES_PER_SECOND = 1.0
+_ORIGIN_BURST = 2
+"""Per-origin pacing: two fetches straight away, then one a second."""
+
 
 @dataclass
 class AcquiredSource:
@@ -120,6 +129,71 @@ def _as_source_text(page: Any, url: str) -> str:
     return (getattr(page, "text", "") or "").strip()
 
 
+class _OriginBuckets:
+    """One token bucket per origin: ``burst`` fetches at once, then ``rate`` per second.
+
+    The global concurrency limit keeps the run bounded; this keeps any single
+    publisher from taking all of it. Sixty URLs from one site at eight at a
+    time is a burst that site may answer with a block or a soft error page,
+    and a soft error page is retained as a source that says nothing.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens: dict[str, tuple[float, float]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def take(self, origin: str) -> None:
+        if self.rate <= 0:
+            return
+        async with self._locks.setdefault(origin, asyncio.Lock()):
+            now = time.monotonic()
+            tokens, stamp = self._tokens.get(origin, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - stamp) * self.rate)
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / self.rate)
+                now, tokens = time.monotonic(), 1.0
+            self._tokens[origin] = (tokens - 1, now)
+
+
+@dataclass
+class _Fetched:
+    """A fetch that produced retainable text, waiting for the corpus commit."""
+
+    url: str
+    text: str
+    title: str
+    fetched_at: str
+
+
+async def _fetch_one(url: str, fetch_page: Any) -> _Fetched | AcquiredSource:
+    """Fetch and screen one URL. Failures come back as their final record."""
+    try:
+        page = await fetch_page(url)
+    except Exception as exc:
+        return AcquiredSource(url=url, status="fetch_failed", detail=str(exc)[:300])
+    fetched_at = datetime.now(UTC).isoformat()
+
+    status_code = int(getattr(page, "status_code", 200) or 200)
+    if status_code >= 400:
+        return AcquiredSource(url=url, status="fetch_failed", detail=f"HTTP {status_code}")
+
+    text = _as_source_text(page, url)
+    body_len = len((getattr(page, "text", "") or "").strip())
+    if body_len < _MIN_USEFUL_CHARS:
+        # A near-empty fetch is a nav shell or a soft error page. Retaining
+        # it would add an origin that carries nothing and inflate coverage.
+        return AcquiredSource(
+            url=url,
+            status="too_short",
+            detail=f"{body_len} chars of body; likely a nav shell or error page",
+        )
+    if len(text) > _MAX_SOURCE_CHARS:
+        return AcquiredSource(url=url, status="too_large", detail=f"{len(text)} chars")
+    return _Fetched(url=url, text=text, title=(getattr(page, "title", "") or url)[:200], fetched_at=fetched_at)
+
+
 async def acquire_sources(
     *,
     expert_name: str,
@@ -127,70 +201,70 @@ async def acquire_sources(
     corpus: CorpusStore,
     fetch_page: Any,
     trust_class: str = "secondary",
+    concurrency: int = _MAX_CONCURRENT_FETCHES,
+    origin_rate: float = _ORIGIN_FETCHES_PER_SECOND,
+    origin_burst: int = _ORIGIN_BURST,
 ) -> AcquireResult:
     """Fetch each URL and retain what came back.
 
     ``fetch_page`` is injected (an awaitable url -> page) so this is unit
     testable with no network. One failed URL never aborts the run: a partial
     corpus is more useful than none, and the failures are reported.
+
+    Up to ``concurrency`` fetches run at once, and each origin is paced by
+    its own token bucket (``origin_burst`` fetches at once, then
+    ``origin_rate`` per second; a rate of 0 disables pacing), so a run takes
+    about as long as its slowest origin rather than the sum of every fetch.
+    Retention happens afterwards in input order under one corpus batch, so
+    the report and the content-identity outcomes match a one-at-a-time run.
     """
     result = AcquireResult(expert_name=expert_name)
+    ordered: list[str] = []
     seen: set[str] = set()
-
     for raw_url in urls:
         url = str(raw_url).strip()
-        if not url or url in seen:
-            continue
-        seen.add(url)
-
-        try:
-            page = await fetch_page(url)
-        except Exception as exc:
-            result.sources.append(AcquiredSource(url=url, status="fetch_failed", detail=str(exc)[:300]))
-            continue
-
-        status_code = int(getattr(page, "status_code", 200) or 200)
-        if status_code >= 400:
-            result.sources.append(AcquiredSource(url=url, status="fetch_failed", detail=f"HTTP {status_code}"))
-            continue
-
-        text = _as_source_text(page, url)
-        body_len = len((getattr(page, "text", "") or "").strip())
-        if body_len < _MIN_USEFUL_CHARS:
-            # A near-empty fetch is a nav shell or a soft error page. Retaining
-            # it would add an origin that carries nothing and inflate coverage.
+        if url and url not in seen:
+            seen.add(url)
+            ordered.append(url)
+
+    slots = asyncio.Semaphore(max(1, concurrency))
+    buckets = _OriginBuckets(origin_rate, origin_burst)
+
+    async def fetch(url: str) -> _Fetched | AcquiredSource:
+        # Wait for the origin's token before taking a slot, so a throttled
+        # publisher never holds a slot another origin could be using.
+        await buckets.take(_origin_key_for(url))
+        async with slots:
+            return await _fetch_one(url, fetch_page)
+
+    outcomes = await asyncio.gather(*(fetch(url) for url in ordered))
+
+    with corpus.batch():
+        for outcome in outcomes:
+            if isinstance(outcome, AcquiredSource):
+                result.sources.append(outcome)
+                continue
+            origin_key = _origin_key_for(outcome.url)
+            entry, was_new = corpus.add(
+                outcome.text,
+                origin_key=origin_key,
+                title=outcome.title,
+                url=outcome.url,
+                publisher=origin_key.removeprefix("url:"),
+                kind="web_page",
+                trust_class=trust_class,
+                fetched_at=outcome.fetched_at,
+            )
             result.sources.append(
                 AcquiredSource(
-                    url=url,
-                    status="too_short",
-                    detail=f"{body_len} chars of body; likely a nav shell or error page",
+                    url=outcome.url,
+                    status="retained" if was_new else "unchanged",
+                    sha256=entry.sha256,
+                    origin_key=entry.origin_key,
+                    title=entry.title,
+                    byte_len=entry.byte_len,
                 )
             )
-            continue
-        if len(text) > _MAX_SOURCE_CHARS:
-            result.sources.append(AcquiredSource(url=url, status="too_large", detail=f"{len(text)} chars"))
-            continue
-
-        entry, was_new = corpus.add(
-            text,
-            origin_key=_origin_key_for(url),
-            title=(getattr(page, "title", "") or url)[:200],
-            url=url,
-            publisher=_origin_key_for(url).removeprefix("url:"),
-            kind="web_page",
-            trust_class=trust_class,
-            fetched_at=datetime.now(UTC).isoformat(),
-        )
-        result.sources.append(
-            AcquiredSource(
-                url=url,
-                status="retained" if was_new else "unchanged",
-                sha256=entry.sha256,
-                origin_key=entry.origin_key,
-                title=entry.title,
-                byte_len=entry.byte_len,
-            )
-        )
 
     origins = {s.origin_key for s in result.sources if s.origin_key}
     if len(origins) == 1 and len(result.retained) > 1:
@@ -21,12 +21,19 @@ Design notes:
   honest; see :func:`deepr.experts.beliefs.Belief._independent_source_count`.
 - **Containment.** Every write resolves under the expert directory. Corpus text
   is untrusted input and a path in its metadata must never escape.
+- **Append-only index.** ``add`` and ``supersede`` append one line to
+  ``index.jsonl`` instead of rewriting it, so retaining N sources is not
+  O(N^2). Readers replay it with the last line per sha256 winning (see
+  :func:`index_records`). The file is rewritten in its sorted canonical form
+  once the appended tail outgrows the corpus, or after a torn final line.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -39,6 +46,9 @@ CORPUS_SCHEMA_VERSION = "deepr-expert-corpus-v1"
 
 _TRUST_CLASSES = ("primary", "secondary", "tertiary")
 
+_COMPACT_MIN_LINES = 256
+"""Appended index lines tolerated before a rewrite, when the corpus is smaller."""
+
 
 def _utc_now_iso() -> str:
     return datetime.now(UTC).isoformat()
@@ -89,15 +99,8 @@ class CorpusStats:
         return asdict(self)
 
 
-def active_source_count(index_text: str) -> int:
-    """How many currently active sources a corpus index describes.
-
-    The index is jsonl: a schema header plus one line per retained source,
-    including superseded revisions. Status and stage-contract readers used to
-    count every non-empty line, so a header-only file or a fully superseded
-    corpus looked like something to study.
-    """
-    entries: dict[str, CorpusEntry] = {}
+def _parse_index(index_text: str) -> Iterator[dict[str, Any] | None]:
+    """Source records in file order; None for a line that does not parse."""
     for line in index_text.splitlines():
         line = line.strip()
         if not line:
@@ -105,13 +108,38 @@ def active_source_count(index_text: str) -> int:
         try:
             payload = json.loads(line)
         except json.JSONDecodeError:
+            yield None
             continue
-        if not isinstance(payload, dict) or payload.get("schema_version") == CORPUS_SCHEMA_VERSION:
-            continue
-        entry = CorpusEntry.from_dict(payload)
-        if entry.sha256:
-            entries[entry.sha256] = entry
-    return sum(1 for entry in entries.values() if entry.is_active)
+        if not isinstance(payload, dict):
+            yield None
+        elif payload.get("schema_version") != CORPUS_SCHEMA_VERSION and payload.get("sha256"):
+            yield payload
+
+
+def index_records(index_text: str) -> dict[str, dict[str, Any]]:
+    """Replay a corpus index into one record per source, keyed by sha256.
+
+    Between compactions the index is a log: a source that was superseded
+    appears once as added and again with ``superseded_by`` set, and the
+    last line wins. The schema header and malformed lines (a torn final
+    append) are skipped rather than hiding the rest of the corpus.
+    """
+    records: dict[str, dict[str, Any]] = {}
+    for payload in _parse_index(index_text):
+        if payload is not None:
+            records[payload["sha256"]] = payload
+    return records
+
+
+def active_source_count(index_text: str) -> int:
+    """How many currently active sources a corpus index describes.
+
+    The index is jsonl: a schema header plus one line per retained source,
+    including superseded revisions. Status and stage-contract readers used to
+    count every non-empty line, so a header-only file or a fully superseded
+    corpus looked like something to study.
+    """
+    return sum(1 for record in index_records(index_text).values() if not record.get("superseded_by"))
 
 
 def content_hash(text: str) -> str:
@@ -135,6 +163,12 @@ class CorpusStore:
         self.sources_dir = self.root / "sources"
         self.index_path = self.root / "index.jsonl"
         self.entries: dict[str, CorpusEntry] = {}
+        self._batch_depth = 0
+        self._pending: list[str] = []
+        # Lines after the sorted canonical part, and whether the next write
+        # must rewrite the whole index (it is missing a newline or has junk).
+        self._appended = 0
+        self._rewrite = False
         self._load()
 
     # -- persistence ----------------------------------------------------- #
@@ -142,27 +176,71 @@ class CorpusStore:
     def _load(self) -> None:
         if not self.index_path.exists():
             return
-        for line in self.index_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
-                # A torn line must not make the whole corpus unreadable.
-                continue
-            if payload.get("schema_version") == CORPUS_SCHEMA_VERSION:
+        text = self.index_path.read_text(encoding="utf-8")
+        # The canonical form is sorted by sha256 with one line per source;
+        # anything after the first out-of-order line was appended since.
+        previous = ""
+        in_order = 0
+        lines = 0
+        for payload in _parse_index(text):
+            if payload is None:
+                # A torn line must not make the whole corpus unreadable, but
+                # the next write rewrites the index rather than append after it.
+                self._rewrite = True
                 continue
             entry = CorpusEntry.from_dict(payload)
-            if entry.sha256:
-                self.entries[entry.sha256] = entry
+            self.entries[entry.sha256] = entry
+            lines += 1
+            if in_order == lines - 1 and entry.sha256 > previous:
+                in_order = lines
+            previous = entry.sha256
+        self._appended = lines - in_order
+        if text and not text.endswith("\n"):
+            self._rewrite = True
 
     def _save(self) -> None:
+        """Rewrite the index in canonical form: header, then one line per source by sha256."""
         self.root.mkdir(parents=True, exist_ok=True)
         header = json.dumps({"schema_version": CORPUS_SCHEMA_VERSION, "expert": self.expert_name})
         lines = [header]
         lines.extend(json.dumps(entry.to_dict(), sort_keys=True) for _, entry in sorted(self.entries.items()))
         atomic_write_text(self.index_path, "\n".join(lines) + "\n")
+        self._appended = 0
+        self._rewrite = False
+
+    def _commit(self, entry: CorpusEntry) -> None:
+        self._pending.append(json.dumps(entry.to_dict(), sort_keys=True))
+        if not self._batch_depth:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Append pending lines, or compact once the appended tail outgrows the corpus."""
+        if not self._pending:
+            return
+        lines, self._pending = self._pending, []
+        appended = self._appended + len(lines)
+        if self._rewrite or not self.index_path.exists() or appended > max(_COMPACT_MIN_LINES, len(self.entries)):
+            self._save()
+            return
+        with open(self.index_path, "a", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+        self._appended = appended
+
+    @contextmanager
+    def batch(self) -> Iterator[CorpusStore]:
+        """Defer index writes to the end of the block: one write for many adds.
+
+        Source files are still written as they are added. The index is
+        written on exit even when the block raises, so it never lags sources
+        that are already on disk.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush()
 
     def _source_path(self, sha: str) -> Path:
         # Two-level fan-out keeps directory listings usable at fleet scale.
@@ -218,7 +296,7 @@ class CorpusStore:
             added_at=_utc_now_iso(),
         )
         self.entries[sha] = entry
-        self._save()
+        self._commit(entry)
         return entry, True
 
     def supersede(self, old_sha: str, new_sha: str) -> bool:
@@ -232,7 +310,7 @@ class CorpusStore:
         if old is None or new_sha not in self.entries:
             return False
         old.superseded_by = new_sha
-        self._save()
+        self._commit(old)
         return True
 
     # -- reads ----------------------------------------------------------- #
@@ -267,11 +345,19 @@ class CorpusStore:
             publishers=publishers,
         )
 
-    def load_study_material(self, *, max_chars: int = 0) -> list[tuple[CorpusEntry, str]]:
-        """Active sources with their text, ordered deterministically.
+    def study_entries(self) -> list[CorpusEntry]:
+        """Active entries in study order, without reading any text.
 
         Ordering is by (origin_key, sha) so two study runs over an unchanged
         corpus see identical material and stay comparable.
+        """
+        return sorted(self.active_entries(), key=lambda e: (e.origin_key, e.sha256))
+
+    def iter_study_material(self, *, max_chars: int = 0) -> Iterator[tuple[CorpusEntry, str]]:
+        """Active sources with their text, in study order, read one at a time.
+
+        Each source is read only when the consumer asks for it, so a caller
+        that stops early or keeps only a window never holds the corpus.
 
         ``max_chars`` is a hard ceiling on the total returned, including within a
         single source. An earlier version refused to split a source, reasoning
@@ -282,60 +368,61 @@ class CorpusStore:
         prose instead. Splitting is handled by the caller, which chunks and
         merges; this method's job is to respect the number it was given.
         """
-        ordered = sorted(self.active_entries(), key=lambda e: (e.origin_key, e.sha256))
-        out: list[tuple[CorpusEntry, str]] = []
         used = 0
-        for entry in ordered:
+        for entry in self.study_entries():
+            if max_chars and used >= max_chars:
+                return
             text = self.read(entry.sha256)
             if text is None:
                 continue
-            if max_chars:
-                remaining = max_chars - used
-                if remaining <= 0:
-                    break
-                if len(text) > remaining:
-                    text = text[:remaining]
-            out.append((entry, text))
+            if max_chars and len(text) > max_chars - used:
+                text = text[: max_chars - used]
+            yield entry, text
             used += len(text)
-        return out
 
-    def iter_study_chunks(self, *, chunk_chars: int, max_chars: int = 0) -> list[list[tuple[CorpusEntry, str]]]:
-        """Group the corpus into slices small enough for one model call.
-
-        A lens given more than its capacity can hold stops following its output
-        contract, so the corpus is sliced. But a slice holding a single source
-        is a lens that cannot compare sources: cross-source disagreement becomes
-        impossible rather than rare, and a contention lens then reports
-        documents contradicting themselves.
-
-        So sources are packed together up to the budget, and a source is split
-        only when it exceeds the budget on its own. On a capacity tier with room
-        for the whole corpus this yields one chunk, which is what makes
-        comparison possible at all.
-        """
-        chunks: list[list[tuple[CorpusEntry, str]]] = []
-        current: list[tuple[CorpusEntry, str]] = []
-        used = 0
-
-        def flush() -> None:
-            nonlocal current, used
+    def load_study_material(self, *, max_chars: int = 0) -> list[tuple[CorpusEntry, str]]:
+        """All of :meth:`iter_study_material` at once, for callers that need every text."""
+        return list(self.iter_study_material(max_chars=max_chars))
+
+    def iter_study_chunks(self, *, chunk_chars: int, max_chars: int = 0) -> Iterator[list[tuple[CorpusEntry, str]]]:
+        """Read the corpus lazily and pack it with :func:`pack_study_chunks`."""
+        return pack_study_chunks(self.iter_study_material(max_chars=max_chars), chunk_chars=chunk_chars)
+
+
+def pack_study_chunks(
+    material: Iterable[tuple[CorpusEntry, str]], *, chunk_chars: int
+) -> Iterator[list[tuple[CorpusEntry, str]]]:
+    """Group study material into slices small enough for one model call.
+
+    A lens given more than its capacity can hold stops following its output
+    contract, so the corpus is sliced. But a slice holding a single source
+    is a lens that cannot compare sources: cross-source disagreement becomes
+    impossible rather than rare, and a contention lens then reports
+    documents contradicting themselves.
+
+    So sources are packed together up to the budget, and a source is split
+    only when it exceeds the budget on its own. On a capacity tier with room
+    for the whole corpus this yields one chunk, which is what makes
+    comparison possible at all. Chunks are yielded as they fill, so only the
+    one being packed is held here.
+    """
+    current: list[tuple[CorpusEntry, str]] = []
+    used = 0
+    for entry, text in material:
+        if chunk_chars > 0 and len(text) > chunk_chars:
+            # Too big to share a slice with anything; split it alone.
             if current:
-                chunks.append(current)
+                yield current
                 current, used = [], 0
-
-        for entry, text in self.load_study_material(max_chars=max_chars):
-            if chunk_chars > 0 and len(text) > chunk_chars:
-                # Too big to share a slice with anything; split it alone.
-                flush()
-                for start in range(0, len(text), chunk_chars):
-                    piece = text[start : start + chunk_chars]
-                    if piece.strip():
-                        chunks.append([(entry, piece)])
-                continue
-            if chunk_chars > 0 and current and used + len(text) > chunk_chars:
-                flush()
-            current.append((entry, text))
-            used += len(text)
-
-        flush()
-        return chunks
+            for start in range(0, len(text), chunk_chars):
+                piece = text[start : start + chunk_chars]
+                if piece.strip():
+                    yield [(entry, piece)]
+            continue
+        if chunk_chars > 0 and current and used + len(text) > chunk_chars:
+            yield current
+            current, used = [], 0
+        current.append((entry, text))
+        used += len(text)
+    if current:
+        yield current
@@ -33,6 +33,7 @@ from deepr.experts.cost_safety_ledger import (
     DurableCostReservationError,
     append_cost_record,
     initial_spend_authority,
+    ledger_group_commit_window_ms,
 )
 from deepr.experts.cost_safety_messages import (
     estimate_curriculum_cost as estimate_curriculum_cost,
@@ -366,7 +367,7 @@ class CostSafetyManager:
         self._circuit_breaker = circuit_breaker or create_default_circuit_breaker()
         self._session_costs: dict[str, float] = {}
         self._sessions: dict[str, CostSession] = {}
-        self._ledger = CostLedger(lock_timeout_seconds=5.0)
+        self._ledger = CostLedger(lock_timeout_seconds=5.0, group_commit_window_ms=ledger_group_commit_window_ms())
         seeded, caps = initial_spend_authority(self._ledger)
         self.daily_cost, self.weekly_cost, self.monthly_cost = seeded
         self.max_per_operation = min(caps["per_job"], self.ABSOLUTE_MAX_PER_OPERATION)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from math import isfinite
 from typing import Any
 
 from deepr.observability.cost_ledger import (
@@ -11,6 +13,7 @@ from deepr.observability.cost_ledger import (
     CostLedgerLockTimeout,
     CostLedgerReadError,
 )
+from deepr.observability.cost_rollup import CostRollup
 
 REQUIRED_COST_LEDGER_LOCK_TIMEOUT_SECONDS = 5.0
 
@@ -132,6 +135,7 @@ __all__ = [
     "append_cost_event",
     "append_cost_record",
     "initial_spend_authority",
+    "ledger_group_commit_window_ms",
     "seed_window_costs",
 ]
 
@@ -154,15 +158,15 @@ def seed_window_costs(
     day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     week_start = day_start - timedelta(days=day_start.weekday())
 
-    def totals(events: list[Any]) -> tuple[float, float, float]:
+    def totals(rollup: CostRollup) -> tuple[float, float, float]:
         calendar = (
-            float(sum(event.cost_usd for event in events if event.timestamp >= day_start)),
-            float(sum(event.cost_usd for event in events if event.timestamp >= week_start)),
-            float(sum(event.cost_usd for event in events if event.timestamp >= month_start)),
+            rollup.total_since(day_start),
+            rollup.total_since(week_start),
+            rollup.total_since(month_start),
         )
         if wallet_settled_baseline_usd is None:
             return calendar
-        total = float(sum(event.cost_usd for event in events))
+        total = float(rollup.total_usd)
         if total < wallet_settled_baseline_usd:
             raise ValueError("canonical settled cost is below the spend wallet baseline")
         wallet_consumed = total - wallet_settled_baseline_usd
@@ -171,7 +175,7 @@ def seed_window_costs(
             for index, period in enumerate(("daily", "weekly", "monthly"))
         )
 
-    return ledger.with_locked_accounting_events(totals)
+    return ledger.with_locked_rollup(totals)
 
 
 def initial_spend_authority(ledger: CostLedger) -> tuple[tuple[float, float, float], dict[str, float]]:
@@ -187,3 +191,17 @@ def initial_spend_authority(ledger: CostLedger) -> tuple[tuple[float, float, flo
         calendar_periods=policy.calendar_periods,
     )
     return seeded, dict(policy.caps)
+
+
+def ledger_group_commit_window_ms() -> float | None:
+    """Return the shared ledger's group-commit window from ``DEEPR_COST_LEDGER_GROUP_COMMIT_MS``.
+
+    Council members and fleet sync admit spend through the cost safety
+    manager's ledger from parallel threads, so concurrent appends can share one
+    fsync. Unset, malformed or non-positive values leave group commit off.
+    """
+    try:
+        window_ms = float(os.getenv("DEEPR_COST_LEDGER_GROUP_COMMIT_MS", "").strip() or 0)
+    except ValueError:
+        return None
+    return window_ms if isfinite(window_ms) and window_ms > 0 else None
@@ -8,7 +8,6 @@ similarity search without re-embedding documents on every query.
 """
 
 import hashlib
-import json
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
@@ -16,6 +15,9 @@ from typing import Any
 
 import numpy as np
 
+from deepr.experts.ann_index import ANN_MIN_ROWS, IvfIndex, maintained_ann, rank_by_cosine
+from deepr.experts.embedding_segments import EmbeddingSegments
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,10 +27,12 @@ class EmbeddingCache:
     Instead of re-embedding every document on every search (O(n) API calls),
     this cache stores embeddings once and performs local similarity search.
 
-    Storage format:
+    Storage format (see ``embedding_segments``):
         {expert_name}/embeddings/
-            index.json - metadata about cached documents
-            embeddings.npy - numpy array of all embeddings
+            index.json - snapshot of document metadata, row map and segments
+            index.journal.jsonl - documents added or removed since the snapshot
+            segments/seg-*.npy - immutable L2-normalized float32 row segments
+            embeddings.ivf.npz - ANN index over those rows (large caches only)
     """
 
     def __init__(self, expert_name: str, cache_dir: Path | None = None):
@@ -51,44 +55,96 @@ class EmbeddingCache:
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        self.index_path = self.cache_dir / "index.json"
-        self.embeddings_path = self.cache_dir / "embeddings.npy"
-
-        # Load existing cache
-        self.index: dict[str, dict] = {}  # content_hash -> metadata
-        self.embeddings: np.ndarray | None = None
-        self.hash_to_idx: dict[str, int] = {}  # content_hash -> array index
+        self._segments = EmbeddingSegments(self.cache_dir)
+        self.index_path = self._segments.snapshot_path
+        self.embeddings_path = self._segments.legacy_path
+        self.ann_path = self.cache_dir / "embeddings.ivf.npz"
+        self._ann: IvfIndex | None = None
+        self._ann_loaded_for: str | None = None
 
         self._load_cache()
 
+    @property
+    def index(self) -> dict[str, dict]:
+        """content_hash -> metadata for every cached document."""
+        return self._segments.documents
+
+    @index.setter
+    def index(self, documents: dict[str, dict]) -> None:
+        self._segments.replace_documents(documents)
+
+    @property
+    def embeddings(self) -> np.ndarray | None:
+        """Normalized embedding rows (tombstoned rows included), or ``None``."""
+        return self._segments.matrix
+
+    @embeddings.setter
+    def embeddings(self, matrix: np.ndarray | None) -> None:
+        self._segments.replace_matrix(matrix)
+        self._ann = None
+        self._ann_loaded_for = None
+
+    @property
+    def hash_to_idx(self) -> dict[str, int]:
+        """content_hash -> matrix row, for documents that have a vector."""
+        return self._segments.row_of
+
     def _load_cache(self):
         """Load existing cache from disk."""
-        if self.index_path.exists():
-            with open(self.index_path, encoding="utf-8") as f:
-                data = json.load(f)
-                self.index = data.get("documents", {})
-                self.hash_to_idx = {h: i for i, h in enumerate(self.index.keys())}
-
-        if self.embeddings_path.exists():
-            self.embeddings = np.load(self.embeddings_path)
+        self._segments.load()
 
     def _save_cache(self):
-        """Save cache to disk (atomic write)."""
-        from deepr.utils.atomic_io import atomic_write_json
-
-        atomic_write_json(
-            self.index_path,
-            {
-                "expert_name": self.expert_name,
-                "updated_at": datetime.now(UTC).isoformat(),
-                "document_count": len(self.index),
-                "documents": self.index,
-            },
-        )
-
-        # Save embeddings
-        if self.embeddings is not None:
-            np.save(self.embeddings_path, self.embeddings)
+        """Rewrite the snapshot from memory (atomic write) and reset the journal."""
+        generation = self._segments.generation
+        self._segments.compact()
+        self._after_write(generation)
+
+    def _after_write(self, generation: str | None) -> None:
+        """Bring the ANN index up to date after a write; persist it when the snapshot was rewritten."""
+        rewritten = self._segments.generation != generation
+        kept = self._segments.renumbered_rows
+        if rewritten and self._ann is not None and kept is not None:
+            self._ann.keep_rows(kept)
+        self._refresh_ann(persist=rewritten)
+
+    def _refresh_ann(self, *, persist: bool = False) -> IvfIndex | None:
+        """Keep the derived ANN index in step with the embedding matrix.
+
+        Appends only update it in memory; it is saved when the snapshot is
+        rewritten, tagged with the snapshot generation. Only writes call this;
+        building the index trains centroids and saves it.
+        """
+        if self.embeddings is None:
+            return None
+        try:
+            self._ann = maintained_ann(
+                self._ann,
+                self.embeddings,
+                self.ann_path,
+                generation=self._segments.generation or "",
+                persist=persist,
+            )
+        except OSError as e:
+            # Derived state: search falls back to the exact scan.
+            logger.warning("Could not update ANN index for %s: %s", self.expert_name, e)
+            self._ann = None
+        return self._ann
+
+    def _current_ann(self) -> IvfIndex | None:
+        """Return the ANN index for the current rows, loading the saved one; never builds or writes."""
+        matrix = self.embeddings
+        if matrix is None or matrix.ndim != 2 or len(matrix) < ANN_MIN_ROWS:
+            return None
+        rows, width = matrix.shape
+        generation = self._segments.generation or ""
+        if self._ann is None and self._ann_loaded_for != generation:
+            self._ann_loaded_for = generation
+            self._ann = IvfIndex.load(self.ann_path, rows=rows, width=width, generation=generation)
+        ann = self._ann
+        if ann is None or ann.generation != generation or ann.width != width or len(ann.assignments) != rows:
+            # Missing or behind the journal: the exact scan stays correct.
+            return None
+        return ann
 
     @staticmethod
     def _content_hash(content: str) -> str:
@@ -185,9 +241,14 @@ class EmbeddingCache:
 
         new_embeddings = []
         new_metadata = []
+        seen: set[str] = set()
         for doc in uncached:
             content = doc.get("content", "")
             filename = doc.get("filename", "unknown")
+            content_hash = self._content_hash(content)
+            if content_hash in seen:
+                continue
+            seen.add(content_hash)
             embedded = await self._embed_document(
                 content=content,
                 filename=filename,
@@ -197,43 +258,47 @@ class EmbeddingCache:
             if embedded is None:
                 continue
             embedding, metadata = embedded
+            if new_embeddings and len(embedding) != len(new_embeddings[0]):
+                logger.error("Skipping %s: embedding width %d differs from batch", filename, len(embedding))
+                continue
             new_embeddings.append(embedding)
             new_metadata.append(metadata)
 
         if not new_embeddings:
             return 0
 
-        new_embeddings_array = np.array(new_embeddings)
-        if self.embeddings is None:
-            self.embeddings = new_embeddings_array
-        else:
-            self.embeddings = np.vstack([self.embeddings, new_embeddings_array])
-
-        for meta in new_metadata:
-            content_hash = meta["hash"]
-            self.index[content_hash] = meta
-            self.hash_to_idx[content_hash] = len(self.hash_to_idx)
-
-        self._save_cache()
+        generation = self._segments.generation
+        try:
+            self._segments.append(np.array(new_embeddings), new_metadata)
+        except ValueError as e:
+            logger.error("Could not cache embeddings for %s: %s", self.expert_name, e)
+            return 0
+        self._after_write(generation)
         return len(new_embeddings)
 
-    async def search(self, query: str, client, top_k: int = 5, model: str = "text-embedding-3-small") -> list[dict]:
-        """Search cached documents by similarity.
+    def remove_documents(self, content_hashes: list[str]) -> int:
+        """Drop documents from the cache by content hash.
 
-        Args:
-            query: Search query
-            client: AsyncOpenAI client for query embedding
-            top_k: Number of results to return
-            model: Embedding model (must match cached embeddings)
+        Their rows become tombstones and are reclaimed when the snapshot is
+        next rewritten.
 
         Returns:
-            List of documents with id, content, filename, and score
+            Number of documents removed
         """
-        if self.embeddings is None or len(self.embeddings) == 0:
-            return []
-        if not isinstance(query, str) or not query.strip() or len(query) > 8_000:
-            logger.warning("Query embedding blocked: query must contain 1 to 8,000 characters")
-            return []
+        generation = self._segments.generation
+        removed = self._segments.remove(content_hashes)
+        if removed:
+            self._after_write(generation)
+        return removed
+
+    async def _embed_query(self, query: str, client: Any, model: str) -> np.ndarray | None:
+        """Embed ``query``, reusing the shared query-embedding cache when it can."""
+        from deepr.services.query_embedding_cache import QueryEmbeddingCache
+
+        query_cache = QueryEmbeddingCache()
+        cached = query_cache.get(model, query)
+        if cached is not None:
+            return np.array(cached)
 
         from deepr.experts.chat_capacity import (
             MeteredExpertChatDisabledError,
@@ -244,7 +309,7 @@ class EmbeddingCache:
             require_expert_chat_dispatch(None, "expert_chat_embed_query", metered=True)
         except MeteredExpertChatDisabledError as blocked:
             logger.warning("Query embedding blocked by metered chat gate: %s", blocked)
-            return []
+            return None
 
         # Embed query (single API call) under durable admission.
         try:
@@ -264,36 +329,58 @@ class EmbeddingCache:
             query_embedding = np.array(response.data[0].embedding)
         except Exception as e:
             logger.error("Error embedding query: %s", e)
-            return []
+            return None
+        query_cache.put(model, query, query_embedding)
+        return query_embedding
+
+    async def search(self, query: str, client, top_k: int = 5, model: str = "text-embedding-3-small") -> list[dict]:
+        """Search cached documents by similarity.
+
+        Args:
+            query: Search query
+            client: AsyncOpenAI client for query embedding
+            top_k: Number of results to return
+            model: Embedding model (must match cached embeddings)
 
-        # Compute cosine similarity with all cached embeddings (vectorized)
-        # Normalize embeddings
-        query_norm = query_embedding / np.linalg.norm(query_embedding)
-        doc_norms = self.embeddings / np.linalg.norm(self.embeddings, axis=1, keepdims=True)
+        Returns:
+            List of documents with id, content, filename, and score
+        """
+        if self.embeddings is None or len(self.embeddings) == 0:
+            return []
+        if not isinstance(query, str) or not query.strip() or len(query) > 8_000:
+            logger.warning("Query embedding blocked: query must contain 1 to 8,000 characters")
+            return []
 
-        # Cosine similarity = dot product of normalized vectors
-        similarities = np.dot(doc_norms, query_norm)
+        query_embedding = await self._embed_query(query, client, model)
+        if query_embedding is None:
+            return []
 
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        # Rows are stored normalized and tombstones carry a zero norm, so this
+        # is one dot product (over probed lists only on large caches).
+        top_indices, similarities = rank_by_cosine(
+            self.embeddings,
+            query_embedding,
+            limit=top_k,
+            norms=self._segments.norms,
+            ann=self._current_ann(),
+        )
 
         # Build results
         results = []
-        hash_list = list(self.index.keys())
+        row_ids = self._segments.row_ids
 
-        for idx in top_indices:
-            if idx >= len(hash_list):
+        for idx, similarity in zip(top_indices.tolist(), similarities.tolist(), strict=True):
+            content_hash = row_ids[idx] if idx < len(row_ids) else None
+            meta = self.index.get(content_hash) if content_hash is not None else None
+            if meta is None:
                 continue
 
-            content_hash = hash_list[idx]
-            meta = self.index[content_hash]
-
             results.append(
                 {
                     "id": content_hash,
                     "filename": meta.get("filename", "unknown"),
                     "content": meta.get("full_content", meta.get("content_preview", "")),
-                    "score": float(similarities[idx]),
+                    "score": similarity,
                     "char_count": meta.get("char_count", 0),
                 }
             )
@@ -306,16 +393,12 @@ class EmbeddingCache:
             "expert_name": self.expert_name,
             "document_count": len(self.index),
             "embedding_dimensions": self.embeddings.shape[1] if self.embeddings is not None else 0,
-            "cache_size_bytes": self.embeddings_path.stat().st_size if self.embeddings_path.exists() else 0,
+            "cache_size_bytes": self._segments.size_bytes(),
         }
 
     def clear(self):
         """Clear the cache."""
-        self.index = {}
-        self.embeddings = None
-        self.hash_to_idx = {}
-
-        if self.index_path.exists():
-            self.index_path.unlink()
-        if self.embeddings_path.exists():
-            self.embeddings_path.unlink()
+        self._segments.clear()
+        self._ann = None
+        self._ann_loaded_for = None
+        self.ann_path.unlink(missing_ok=True)
@@ -0,0 +1,474 @@
+"""Append-only segment persistence for ``EmbeddingCache``.
+
+``EmbeddingCache`` used to rewrite ``index.json`` and the whole
+``embeddings.npy`` on every ``add_documents``, so embedding ten new documents
+for a large expert rewrote every vector it already had. Vectors now live in
+immutable ``segments/seg-*.npy`` files of L2-normalized float32 rows, one per
+write, and document metadata changes are appended to ``index.journal.jsonl``.
+
+``index.json`` is a snapshot: documents, the row map (content hash per matrix
+row, ``None`` for a tombstoned row), the segment list and the journal position
+it absorbed. Journal records name the snapshot ``generation`` they extend and
+carry an increasing ``seq``, the same scheme ``belief_journal`` uses. Three
+record kinds exist:
+
+* ``add`` - a new segment and the documents for its rows, in row order.
+* ``remove`` - content hashes whose rows become tombstones.
+* ``merge`` - trailing segments replaced by one segment holding the same rows.
+
+Trailing segments are merged while the newest is at least half the size of its
+predecessor, so the segment count stays logarithmic and each row is rewritten
+O(log n) times. Merges keep tombstoned rows, so row numbers only change when
+the snapshot is rewritten: once the journal outgrows the snapshot, or once a
+quarter of the rows are tombstones. Only that compaction drops dead rows.
+
+Caches written before segments existed (``index.json`` plus
+``embeddings.npy``) are read as-is and converted on the next write.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from deepr.utils.atomic_io import append_jsonl_durable, atomic_write_bytes, atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILENAME = "index.json"
+JOURNAL_FILENAME = "index.journal.jsonl"
+SEGMENTS_DIRNAME = "segments"
+LEGACY_MATRIX_FILENAME = "embeddings.npy"
+
+_FORMAT_VERSION = 2
+# Same amortization rule as the belief journal: rewrite the snapshot once the
+# journal is larger than both this floor and the snapshot itself.
+_COMPACT_MIN_BYTES = 1024 * 1024
+# Reclaim tombstoned rows once they are this share of the matrix.
+_MAX_TOMBSTONE_SHARE = 0.25
+
+
+class EmbeddingJournalError(ValueError):
+    """A journal line or segment is malformed somewhere other than a torn final append."""
+
+
+def normalized_rows(rows: np.ndarray) -> np.ndarray:
+    """Return ``rows`` as float32 unit vectors; zero rows stay zero."""
+    rows = np.atleast_2d(np.asarray(rows, dtype=np.float32))
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    return np.divide(rows, norms, out=np.zeros_like(rows), where=norms > 0.0)
+
+
+def _segment_bytes(rows: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, np.ascontiguousarray(rows, dtype=np.float32), allow_pickle=False)
+    return buffer.getvalue()
+
+
+class EmbeddingSegments:
+    """Documents, row map and normalized vector matrix for one cache directory.
+
+    The matrix is held in one growable float32 buffer so a query is a single
+    matrix-vector product. ``norms`` is 1.0 for live rows, 0.0 for zero rows
+    and tombstones, which ranking treats as ineligible.
+
+    Attributes:
+        documents: content hash -> metadata, for live documents.
+        generation: Snapshot generation journal records must extend. ``None``
+            means there is no segment snapshot yet, so the next write compacts.
+        needs_compaction: Force the next write to rewrite the snapshot (legacy
+            layout, torn journal tail, or a wholesale replacement in memory).
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.snapshot_path = cache_dir / SNAPSHOT_FILENAME
+        self.journal_path = cache_dir / JOURNAL_FILENAME
+        self.segments_dir = cache_dir / SEGMENTS_DIRNAME
+        self.legacy_path = cache_dir / LEGACY_MATRIX_FILENAME
+        self._reset()
+
+    def _reset(self) -> None:
+        self.documents: dict[str, dict[str, Any]] = {}
+        self.segments: list[dict[str, Any]] = []
+        self.generation: str | None = None
+        self.seq = 0
+        self.journal_bytes = 0
+        self.snapshot_bytes = 0
+        self.needs_compaction = False
+        self.tombstones = 0
+        self.renumbered_rows: np.ndarray | None = None
+        self._row_ids: list[str | None] | None = []
+        self._row_of: dict[str, int] | None = None
+        self._buffer: np.ndarray | None = None
+        self._norms = np.zeros(0, dtype=np.float32)
+        self.rows = 0
+
+    # ------------------------------------------------------------------ state
+
+    @property
+    def matrix(self) -> np.ndarray | None:
+        """View of the live matrix rows (tombstones included), or ``None`` when empty."""
+        if self._buffer is None:
+            return None
+        return self._buffer[: self.rows]
+
+    @property
+    def norms(self) -> np.ndarray:
+        return self._norms[: self.rows]
+
+    @property
+    def row_ids(self) -> list[str | None]:
+        """Content hash for each matrix row; ``None`` marks a tombstone."""
+        if self._row_ids is None:
+            # Documents assigned wholesale: rows follow insertion order, as in
+            # the legacy layout.
+            self._row_ids = list(self.documents)
+            self._row_of = None
+        return self._row_ids
+
+    @property
+    def row_of(self) -> dict[str, int]:
+        if self._row_of is None:
+            self._row_of = {h: row for row, h in enumerate(self.row_ids) if h is not None}
+        return self._row_of
+
+    def replace_documents(self, documents: dict[str, dict[str, Any]]) -> None:
+        """Adopt ``documents`` wholesale; rows follow their insertion order."""
+        self.documents = documents
+        self._row_ids = None
+        self._row_of = None
+        self.tombstones = 0
+        self.needs_compaction = True
+        self._refresh_norms()
+
+    def replace_matrix(self, matrix: np.ndarray | None) -> None:
+        """Adopt ``matrix`` wholesale (normalized on the way in)."""
+        self._buffer = None if matrix is None else normalized_rows(matrix)
+        self.rows = 0 if matrix is None else len(self._buffer)
+        self.needs_compaction = True
+        self._refresh_norms()
+
+    def _refresh_norms(self) -> None:
+        if self._buffer is None:
+            self._norms = np.zeros(0, dtype=np.float32)
+            return
+        norms = np.zeros(len(self._buffer), dtype=np.float32)
+        norms[: self.rows] = np.linalg.norm(self._buffer[: self.rows], axis=1)
+        if self._row_ids is not None:
+            for row, content_hash in enumerate(self._row_ids[: self.rows]):
+                if content_hash is None:
+                    norms[row] = 0.0
+        self._norms = norms
+
+    def _extend_matrix(self, rows: np.ndarray) -> None:
+        """Append normalized ``rows``, doubling buffer capacity when full."""
+        needed = self.rows + len(rows)
+        if self._buffer is None or self.rows == 0:
+            self._buffer = np.empty((max(needed, 16), rows.shape[1]), dtype=np.float32)
+            self._norms = np.zeros(len(self._buffer), dtype=np.float32)
+        elif needed > len(self._buffer):
+            capacity = max(needed, 2 * len(self._buffer))
+            grown = np.empty((capacity, self._buffer.shape[1]), dtype=np.float32)
+            grown[: self.rows] = self._buffer[: self.rows]
+            self._buffer = grown
+            norms = np.zeros(capacity, dtype=np.float32)
+            norms[: self.rows] = self._norms[: self.rows]
+            self._norms = norms
+        self._buffer[self.rows : needed] = rows
+        self._norms[self.rows : needed] = np.linalg.norm(rows, axis=1)
+        self.rows = needed
+
+    # ---------------------------------------------------------------- writes
+
+    def append(self, vectors: np.ndarray, metadata: list[dict[str, Any]]) -> None:
+        """Persist new documents as one segment plus one journal record."""
+        rows = normalized_rows(vectors)
+        if self.rows and self._buffer is not None and rows.shape[1] != self._buffer.shape[1]:
+            raise ValueError(f"embedding width {rows.shape[1]} does not match cache width {self._buffer.shape[1]}")
+        row_ids = self.row_ids
+        start = self.rows
+        self._extend_matrix(rows)
+        for offset, meta in enumerate(metadata):
+            content_hash = meta["hash"]
+            self._drop_row(content_hash)
+            self.documents[content_hash] = meta
+            row_ids.append(content_hash)
+            self.row_of[content_hash] = start + offset
+        if self.generation is None or self.needs_compaction:
+            self.compact()
+            return
+        name = self._write_segment(rows)
+        self.segments.append({"name": name, "rows": len(rows)})
+        self._append_record({"op": "add", "segment": name, "documents": {m["hash"]: m for m in metadata}})
+        self._merge_tail()
+        self._maybe_compact()
+
+    def remove(self, content_hashes: list[str]) -> int:
+        """Tombstone the rows of ``content_hashes``; returns how many were cached."""
+        removed = [h for h in dict.fromkeys(content_hashes) if h in self.documents]
+        if not removed:
+            return 0
+        for content_hash in removed:
+            self.documents.pop(content_hash, None)
+            self._drop_row(content_hash)
+        if self.generation is None or self.needs_compaction:
+            self.compact()
+        else:
+            self._append_record({"op": "remove", "hashes": removed})
+            self._maybe_compact()
+        return len(removed)
+
+    def _drop_row(self, content_hash: str) -> None:
+        row = self.row_of.pop(content_hash, None)
+        if row is None:
+            return
+        self.row_ids[row] = None
+        if row < self.rows:
+            self._norms[row] = 0.0
+        self.tombstones += 1
+
+    def _write_segment(self, rows: np.ndarray) -> str:
+        name = f"seg-{uuid.uuid4().hex[:12]}.npy"
+        atomic_write_bytes(self.segments_dir / name, _segment_bytes(rows), fsync=True)
+        return name
+
+    def _append_record(self, record: dict[str, Any]) -> None:
+        record = {"generation": self.generation, "seq": self.seq + 1, **record}
+        append_jsonl_durable(self.journal_path, record, fsync=True)
+        self.journal_bytes += len(json.dumps(record).encode("utf-8")) + 1
+        self.seq = record["seq"]
+
+    def _merge_tail(self) -> None:
+        """Merge trailing segments while the newest is at least half its predecessor."""
+        count = 1
+        while count < len(self.segments):
+            merged_rows = sum(seg["rows"] for seg in self.segments[-count:])
+            if self.segments[-count - 1]["rows"] > 2 * merged_rows:
+                break
+            count += 1
+        if count == 1:
+            return
+        replaced = self.segments[-count:]
+        total = sum(seg["rows"] for seg in replaced)
+        name = self._write_segment(self._buffer[self.rows - total : self.rows])
+        self.segments[-count:] = [{"name": name, "rows": total}]
+        self._append_record({"op": "merge", "replaces": [seg["name"] for seg in replaced], "segment": name})
+        for seg in replaced:
+            (self.segments_dir / seg["name"]).unlink(missing_ok=True)
+
+    def _maybe_compact(self) -> None:
+        if self.journal_bytes > max(_COMPACT_MIN_BYTES, self.snapshot_bytes) or (
+            self.tombstones and self.tombstones > _MAX_TOMBSTONE_SHARE * self.rows
+        ):
+            self.compact()
+
+    def compact(self) -> np.ndarray | None:
+        """Rewrite the snapshot and reset the journal.
+
+        Tombstoned rows (and a legacy or replaced matrix) are folded into one
+        fresh segment. Returns the kept row numbers when rows were renumbered,
+        else ``None``; the same value is left in ``renumbered_rows``.
+        """
+        self._align_row_ids()
+        kept: np.ndarray | None = None
+        if self.matrix is None:
+            self.segments = []
+        elif self.needs_compaction or self.tombstones or sum(s["rows"] for s in self.segments) != self.rows:
+            kept = self._drop_tombstones()
+            self.segments = [{"name": self._write_segment(self.matrix), "rows": self.rows}] if self.rows else []
+        generation = uuid.uuid4().hex[:12]
+        text = json.dumps(
+            {
+                "format": _FORMAT_VERSION,
+                "updated_at": datetime.now(UTC).isoformat(),
+                "document_count": len(self.documents),
+                "documents": self.documents,
+                "rows": self.row_ids,
+                "segments": self.segments,
+                "journal": {"generation": generation, "seq": self.seq},
+            }
+        )
+        atomic_write_text(self.snapshot_path, text, fsync=True)
+        self.generation = generation
+        self.snapshot_bytes = len(text.encode("utf-8"))
+        self.needs_compaction = False
+        self.journal_path.unlink(missing_ok=True)
+        self.journal_bytes = 0
+        self.renumbered_rows = kept
+        self._remove_unreferenced_files()
+        return kept
+
+    def _align_row_ids(self) -> None:
+        """Fit the row map to the matrix after a wholesale assignment.
+
+        Documents past the end of the matrix keep no row, and rows without a
+        document are dead.
+        """
+        row_ids = self.row_ids
+        del row_ids[self.rows :]
+        row_ids.extend([None] * (self.rows - len(row_ids)))
+        self._row_of = None
+        self.tombstones = row_ids.count(None)
+
+    def _drop_tombstones(self) -> np.ndarray | None:
+        """Compact the in-memory matrix to its live rows; returns the kept rows."""
+        if not self.tombstones or self.matrix is None:
+            return None
+        kept = np.asarray([row for row, h in enumerate(self.row_ids) if h is not None], dtype=np.intp)
+        self._row_ids = [self.row_ids[row] for row in kept]
+        self._row_of = None
+        self._buffer = np.array(self.matrix[kept], dtype=np.float32)
+        self.rows = len(kept)
+        self.tombstones = 0
+        self._refresh_norms()
+        return kept
+
+    def _remove_unreferenced_files(self) -> None:
+        self.legacy_path.unlink(missing_ok=True)
+        referenced = {seg["name"] for seg in self.segments}
+        if not self.segments_dir.is_dir():
+            return
+        for path in self.segments_dir.glob("seg-*.npy"):
+            if path.name not in referenced:
+                path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Delete every persisted file and forget all state."""
+        for seg in self.segments_dir.glob("seg-*.npy") if self.segments_dir.is_dir() else ():
+            seg.unlink(missing_ok=True)
+        for path in (self.snapshot_path, self.journal_path, self.legacy_path):
+            path.unlink(missing_ok=True)
+        self._reset()
+
+    def size_bytes(self) -> int:
+        """Bytes of vector data on disk."""
+        total = sum(self._file_size(self.segments_dir / seg["name"]) for seg in self.segments)
+        return total + self._file_size(self.legacy_path)
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    # ----------------------------------------------------------------- loads
+
+    def load(self) -> None:
+        """Load the snapshot, replay the journal and map every live segment."""
+        self._reset()
+        try:
+            raw = self.snapshot_path.read_bytes()
+        except FileNotFoundError:
+            return
+        try:
+            data = json.loads(raw)
+            self.snapshot_bytes = len(raw)
+            self.documents = data.get("documents", {})
+            if data.get("format") != _FORMAT_VERSION:
+                self._load_legacy()
+                return
+            marker = data.get("journal") or {}
+            self.generation = marker.get("generation")
+            self.seq = int(marker.get("seq", 0) or 0)
+            self._row_ids = list(data.get("rows", []))
+            self.segments = list(data.get("segments", []))
+            for record in self._read_records():
+                self._apply_record(record)
+                self.seq = record["seq"]
+            self._load_matrix()
+        except (EmbeddingJournalError, KeyError, TypeError, ValueError, OSError) as exc:
+            # Vectors are derived state: start empty and let the next write
+            # re-embed rather than serve rows that no longer match documents.
+            logger.error("Unreadable embedding cache in %s: %s. Starting empty.", self.cache_dir, exc)
+            self._reset()
+            self.needs_compaction = True
+            return
+        self.tombstones = sum(1 for h in self.row_ids if h is None)
+
+    def _load_legacy(self) -> None:
+        self._row_ids = None
+        if self.legacy_path.exists():
+            self._buffer = normalized_rows(np.load(self.legacy_path, allow_pickle=False))
+            self.rows = len(self._buffer)
+        self._refresh_norms()
+        self.needs_compaction = True
+
+    def _load_matrix(self) -> None:
+        parts = [np.load(self.segments_dir / seg["name"], mmap_mode="r", allow_pickle=False) for seg in self.segments]
+        for seg, part in zip(self.segments, parts, strict=True):
+            if part.ndim != 2 or len(part) != seg["rows"]:
+                raise EmbeddingJournalError(f"segment {seg['name']} does not hold {seg['rows']} rows")
+        if parts:
+            self._buffer = np.concatenate(parts).astype(np.float32, copy=False)
+            self.rows = len(self._buffer)
+        if len(self.row_ids) != self.rows:
+            raise EmbeddingJournalError(f"row map has {len(self.row_ids)} entries for {self.rows} rows")
+        self._refresh_norms()
+
+    def _apply_record(self, record: dict[str, Any]) -> None:
+        op = record.get("op")
+        if op == "add":
+            documents = record["documents"]
+            for content_hash in documents:
+                self._drop_row(content_hash)
+            self.documents.update(documents)
+            start = len(self.row_ids)
+            self.row_ids.extend(documents)
+            self.row_of.update({h: start + offset for offset, h in enumerate(documents)})
+            self.segments.append({"name": record["segment"], "rows": len(documents)})
+        elif op == "remove":
+            for content_hash in record["hashes"]:
+                self.documents.pop(content_hash, None)
+                self._drop_row(content_hash)
+        elif op == "merge":
+            replaced = record["replaces"]
+            if [seg["name"] for seg in self.segments[-len(replaced) :]] != replaced:
+                raise EmbeddingJournalError(f"merge record {record['seq']} does not match the segment tail")
+            total = sum(seg["rows"] for seg in self.segments[-len(replaced) :])
+            self.segments[-len(replaced) :] = [{"name": record["segment"], "rows": total}]
+        else:
+            raise EmbeddingJournalError(f"unknown journal op {op!r}")
+
+    def _read_records(self) -> list[dict[str, Any]]:
+        """Records extending the loaded snapshot; a torn final line is dropped."""
+        try:
+            raw = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            return []
+        self.journal_bytes = len(raw)
+        lines = raw.split(b"\n")
+        if lines[-1].strip():
+            logger.warning("Dropping torn final record in %s", self.journal_path)
+            self.needs_compaction = True
+        records: list[dict[str, Any]] = []
+        for line_no, line in enumerate(lines[:-1], 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise EmbeddingJournalError(f"{self.journal_path}:{line_no}: {exc}") from exc
+            if not isinstance(record, dict) or record.get("generation") != self.generation:
+                continue
+            if not isinstance(record.get("seq"), int) or record["seq"] <= self.seq:
+                continue
+            records.append(record)
+        return records
+
+
+__all__ = [
+    "JOURNAL_FILENAME",
+    "SEGMENTS_DIRNAME",
+    "EmbeddingJournalError",
+    "EmbeddingSegments",
+    "normalized_rows",
+]
@@ -0,0 +1,135 @@
+"""Per-document extraction for LazyGraphRAG indexing.
+
+Extraction (sections, concepts, edges) is pure CPU work on one document, so
+``LazyGraphRAG.index_documents`` can fan a large call out to worker processes
+before merging the results into the graph. Everything here is module-level and
+picklable so it runs the same in a worker as in the calling process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import Any
+
+from deepr.experts.lazy_graph_rag import Concept, ConceptExtractor, DocumentSection, Edge, EdgeBuilder
+
+# Below this many documents, spawning workers (each re-imports deepr) costs
+# more than it saves, so extraction stays in-process unless asked otherwise.
+# Chat indexes a handful of uncached documents mid-turn and must not pay it.
+POOL_MIN_DOCUMENTS = 200
+
+# One extractor/builder per process; both are stateless after construction.
+# Worker processes receive the caller's pair through ``_init_worker``.
+_extractor: ConceptExtractor | None = None
+_edge_builder: EdgeBuilder | None = None
+
+
+@dataclass
+class DocumentExtraction:
+    """Everything one document contributes to the graph.
+
+    Attributes:
+        document_id: Document identifier
+        sections: Sections found in the document
+        concepts: Concepts per section (the same concept may repeat across sections)
+        edges: Edges built from the concepts
+    """
+
+    document_id: str
+    sections: list[DocumentSection]
+    concepts: list[Concept]
+    edges: list[Edge]
+
+    def touched_node_ids(self) -> set[str]:
+        """Concept ids this document adds or updates, including edge endpoints."""
+        touched = {concept.id for concept in self.concepts}
+        touched.update(node_id for edge in self.edges for node_id in (edge.source_id, edge.target_id))
+        return touched
+
+
+def _init_worker(extractor: ConceptExtractor | None, edge_builder: EdgeBuilder | None) -> None:
+    global _extractor, _edge_builder
+    _extractor, _edge_builder = extractor, edge_builder
+
+
+def extract_document(
+    document_id: str,
+    content: str,
+    extractor: ConceptExtractor | None = None,
+    edge_builder: EdgeBuilder | None = None,
+) -> DocumentExtraction:
+    """Extract sections, concepts and edges from one document.
+
+    Args:
+        document_id: Document identifier
+        content: Document content
+        extractor: Concept extractor (default: one shared per process)
+        edge_builder: Edge builder (default: one shared per process)
+
+    Returns:
+        The document's extraction, ready to merge into a graph
+    """
+    global _extractor, _edge_builder
+    if extractor is None:
+        _extractor = extractor = _extractor or ConceptExtractor()
+    if edge_builder is None:
+        _edge_builder = edge_builder = _edge_builder or EdgeBuilder()
+
+    sections = extractor.extract_sections(content, document_id)
+    concepts: list[Concept] = []
+    for section in sections:
+        concepts.extend(extractor.extract_concepts(section.content, document_id, section.id))
+    edges = edge_builder.build_edges(concepts, sections, document_id)
+    return DocumentExtraction(document_id=document_id, sections=sections, concepts=concepts, edges=edges)
+
+
+def _pool_workers(document_count: int, workers: int | None) -> int:
+    """Worker processes for a call: as asked, else CPU count only for large calls."""
+    if workers is not None:
+        return max(1, workers)
+    if document_count < POOL_MIN_DOCUMENTS:
+        return 1
+    return os.cpu_count() or 1
+
+
+async def extract_corpus(
+    documents: list[dict[str, Any]],
+    workers: int | None = None,
+    extractor: ConceptExtractor | None = None,
+    edge_builder: EdgeBuilder | None = None,
+) -> list[DocumentExtraction]:
+    """Extract every document, in worker processes when the call is large.
+
+    Extractions come back in ``documents`` order. Document-frequency weighting
+    happens when they merge into the graph (``KnowledgeGraph.add_concept``).
+
+    Args:
+        documents: List of {id, content, metadata} dicts
+        workers: Extraction processes. None extracts in-process below
+            ``POOL_MIN_DOCUMENTS`` documents and uses the CPU count above it;
+            1 always extracts in-process
+        extractor: Concept extractor (default: ``ConceptExtractor()``)
+        edge_builder: Edge builder (default: ``EdgeBuilder()``)
+    """
+    jobs = [(doc.get("id", doc.get("filename", str(i))), doc.get("content", "")) for i, doc in enumerate(documents)]
+    workers = _pool_workers(len(jobs), workers)
+    if workers == 1:
+        extractions = [extract_document(doc_id, content, extractor, edge_builder) for doc_id, content in jobs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(extractor, edge_builder),
+        ) as pool:
+            loop = asyncio.get_running_loop()
+            futures = [loop.run_in_executor(pool, extract_document, *job) for job in jobs]
+            extractions = list(await asyncio.gather(*futures))
+    return extractions
+
+
+__all__ = ["POOL_MIN_DOCUMENTS", "DocumentExtraction", "extract_corpus", "extract_document"]
@@ -0,0 +1,117 @@
+"""Lookup structures behind the LazyGraphRAG ``KnowledgeGraph``.
+
+``KnowledgeGraph.search`` used to split every concept's text and score it on
+every query, and ``get_neighbors`` re-sorted a node's whole adjacency list on
+every expansion. :class:`ConceptWordIndex` keeps word -> concept postings so a
+query only scores concepts that share at least one word with it, and the
+adjacency helpers keep each node's neighbour list ordered by descending edge
+weight as edges are added or re-weighted.
+
+Scores and orderings match the previous full scans: Jaccard overlap between
+the query's words and the concept's whitespace-split words, boosted by
+``1 + tf_idf_score``, with ties broken by concept insertion order; neighbour
+ties keep edge insertion order.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+class ConceptWordIndex:
+    """Word -> concept-id postings plus each concept's distinct word count."""
+
+    def __init__(self) -> None:
+        self._postings: dict[str, set[str]] = {}
+        self._word_counts: dict[str, int] = {}
+        self._rank: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rank)
+
+    def add(self, concept_id: str, text: str) -> None:
+        """Post a concept under each of its words; re-adding is a no-op."""
+        if concept_id in self._rank:
+            return
+        words = set(text.lower().split())
+        self._rank[concept_id] = len(self._rank)
+        self._word_counts[concept_id] = len(words)
+        for word in words:
+            self._postings.setdefault(word, set()).add(concept_id)
+
+    def search(self, query_words: Iterable[str], boost: Callable[[str], float | None], top_k: int) -> list[str]:
+        """Ids of the best ``top_k`` concepts by boosted Jaccard overlap with ``query_words``.
+
+        ``boost(concept_id)`` returns the concept's TF-IDF score, or ``None``
+        to skip a concept that is no longer in the graph.
+        """
+        query = set(query_words)
+        overlap: dict[str, int] = {}
+        for word in query:
+            for concept_id in self._postings.get(word, ()):
+                overlap[concept_id] = overlap.get(concept_id, 0) + 1
+        scored: list[tuple[float, int, str]] = []
+        for concept_id, shared in overlap.items():
+            tf_idf = boost(concept_id)
+            if tf_idf is None:
+                continue
+            score = shared / (len(query) + self._word_counts[concept_id] - shared)
+            score *= 1 + tf_idf
+            scored.append((score, -self._rank[concept_id], concept_id))
+        best = heapq.nlargest(top_k, scored, key=lambda item: (item[0], item[1]))
+        return [concept_id for _, _, concept_id in best]
+
+
+def _adjacency_key(entry: tuple[str, Any]) -> float:
+    return -entry[1].weight
+
+
+def insert_neighbor(neighbors: list[tuple[str, Any]], neighbor_id: str, edge: Any) -> None:
+    """Insert ``(neighbor_id, edge)`` keeping ``neighbors`` sorted by descending weight."""
+    bisect.insort_right(neighbors, (neighbor_id, edge), key=_adjacency_key)
+
+
+def remove_neighbor(neighbors: list[tuple[str, Any]], edge: Any) -> None:
+    """Remove the entry holding ``edge`` (by identity), if present."""
+    start = bisect.bisect_left(neighbors, -edge.weight, key=_adjacency_key)
+    for position in range(start, len(neighbors)):
+        if neighbors[position][1] is edge:
+            del neighbors[position]
+            return
+    for position, (_neighbor_id, candidate) in enumerate(neighbors):
+        if candidate is edge:
+            del neighbors[position]
+            return
+
+
+def sort_neighbors(adjacency: Mapping[str, list[tuple[str, Any]]]) -> None:
+    """Order every neighbour list by descending weight (stable for ties)."""
+    for neighbors in adjacency.values():
+        neighbors.sort(key=_adjacency_key)
+
+
+def document_frequency_weight(concept_type: str, document_count: int) -> float:
+    """Return the TF-IDF multiplier for a concept found in ``document_count`` graph documents.
+
+    ``1 / (1 + ln df)``: exactly 1 in one document, shrinking as the concept
+    spreads. It depends only on the concept's own documents, so a merge
+    reweights only the concepts it touches and the result does not depend on
+    indexing order or batching. Heading scores are 1/level, not term
+    statistics, and stay unweighted.
+    """
+    if concept_type == "heading" or document_count <= 1:
+        return 1.0
+    return 1.0 / (1.0 + math.log(document_count))
+
+
+__all__ = [
+    "ConceptWordIndex",
+    "document_frequency_weight",
+    "insert_neighbor",
+    "remove_neighbor",
+    "sort_neighbors",
+]
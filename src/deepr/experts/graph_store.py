@@ -0,0 +1,400 @@
+"""Sharded, lazily loaded storage for the LazyGraphRAG ``KnowledgeGraph``.
+
+The graph used to live in ``concepts.json`` and ``edges.json``, parsed in full
+whenever a chat session built a ``LazyGraphRAG`` and rewritten in full on
+every save. Concepts are now grouped into 256 shards by a hash prefix of their
+id::
+
+    graph/
+        manifest.json              shard table, per-shard counts, generation stamp
+        shards/<kk>.catalog.json   [id, text, concept_type, tf_idf_score, ordinal] rows
+        shards/<kk>.json           full concepts plus every edge touching them
+
+Construction reads only the manifest. The catalog, which concept search and
+text lookup need, is read on first use. A shard body is read the first time one
+of its concepts is fetched or expanded, so a retrieval that visits a few
+hundred nodes reads only their shards. Each edge is stored in the shards of
+both endpoints, so a loaded shard has complete adjacency for its concepts.
+``save`` rewrites only the shards changed since the last save, then the
+manifest with a new ``generation`` stamp (the graph version caches key on).
+
+Legacy ``concepts.json``/``edges.json`` graphs are read in full and converted
+on the next save. Unreadable files fail closed: the store serves what it could
+read, but ``save`` refuses to overwrite anything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import uuid
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from deepr.experts.graph_index import ConceptWordIndex, insert_neighbor, sort_neighbors
+from deepr.utils.atomic_io import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT = 1
+SHARD_KEY_CHARS = 2
+LEGACY_FILES = ("concepts.json", "edges.json")
+
+
+def shard_key(concept_id: str) -> str:
+    """Shard holding ``concept_id``: a two-hex-digit hash prefix of the id."""
+    return hashlib.sha256(concept_id.encode("utf-8")).hexdigest()[:SHARD_KEY_CHARS]
+
+
+class GraphShardStore:
+    """In-memory graph state backed by lazily read shards.
+
+    ``concepts``, ``edges`` and ``adjacency`` hold what has been read so far;
+    ``catalog`` (once read) lists every concept as ``(text, concept_type,
+    tf_idf_score, ordinal)``, where ordinal is the concept's insertion order.
+    """
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        *,
+        concept_from_dict: Callable[[dict[str, Any]], Any],
+        edge_from_dict: Callable[[dict[str, Any]], Any],
+        label: str = "",
+    ):
+        self.storage_dir = storage_dir
+        self.manifest_path = storage_dir / "manifest.json"
+        self.shards_dir = storage_dir / "shards"
+        self.label = label
+        self.unreadable = False
+        self.generation = ""
+        self._concept_from_dict = concept_from_dict
+        self._edge_from_dict = edge_from_dict
+
+        self.concepts: dict[str, Any] = {}
+        self.edges: dict[str, Any] = {}
+        self.adjacency: defaultdict[str, list[tuple[str, Any]]] = defaultdict(list)
+        self.edge_count = 0
+
+        self.catalog: dict[str, tuple[str, str, float, int]] | None = None
+        self.text_index: dict[str, str] = {}
+        self.word_index = ConceptWordIndex()
+
+        self._shards: dict[str, dict[str, Any]] = {}
+        self._members: defaultdict[str, set[str]] = defaultdict(set)
+        self._shard_edges: defaultdict[str, dict[str, Any]] = defaultdict(dict)
+        self._loaded: set[str] = set()
+        self._dirty: set[str] = set()
+        self._next_ordinal = 0
+        self._legacy = False
+
+    # -- reading -------------------------------------------------------------
+
+    def load(self) -> None:
+        """Read the manifest, or a legacy two-file graph in full."""
+        if self.manifest_path.exists():
+            self._load_manifest()
+        elif any((self.storage_dir / name).exists() for name in LEGACY_FILES):
+            self._load_legacy()
+
+    def _read_json(self, path: Path) -> Any:
+        try:
+            with open(path, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (json.JSONDecodeError, OSError, MemoryError) as exc:
+            logger.error("Failed to load %s for %s: %s", path.name, self.label, exc)
+            self.unreadable = True
+            return None
+
+    def _load_manifest(self) -> None:
+        manifest = self._read_json(self.manifest_path)
+        shards = manifest.get("shards") if isinstance(manifest, dict) else None
+        if not isinstance(shards, dict) or manifest.get("format") != MANIFEST_FORMAT:
+            self.unreadable = True
+            return
+        self._shards = shards
+        self.generation = str(manifest.get("generation", ""))
+        self.edge_count = sum(int(entry.get("edges", 0)) for entry in shards.values())
+
+    def _load_legacy(self) -> None:
+        loaded: dict[str, list] = {}
+        for name in LEGACY_FILES:
+            path = self.storage_dir / name
+            payload = self._read_json(path) if path.exists() else []
+            if not isinstance(payload, list):
+                self.unreadable = True
+                return
+            loaded[name] = payload
+        self._legacy = True
+        self.catalog = {}
+        for data in loaded["concepts.json"]:
+            self._place_concept(self._concept_from_dict(data))
+        self._adopt_edges(self._edge_from_dict(data) for data in loaded["edges.json"])
+        self.edge_count = len(self.edges)
+        self._loaded.update(self._members)
+        self._dirty.update(self._members, self._shard_edges)
+
+    def ensure_catalog(self) -> dict[str, tuple[str, str, float, int]]:
+        """Read every shard's catalog (once) and build the text and word indexes."""
+        if self.catalog is not None:
+            return self.catalog
+        rows: list[tuple[int, str, str, str, float]] = []
+        for key in sorted(self._shards):
+            payload = self._read_json(self.shards_dir / f"{key}.catalog.json")
+            try:
+                rows.extend((int(o), str(cid), str(text), str(kind), float(s)) for cid, text, kind, s, o in payload)
+            except (TypeError, ValueError):
+                logger.error("Malformed graph catalog shard %s for %s", key, self.label)
+                self.unreadable = True
+        self.catalog = {}
+        for ordinal, concept_id, text, concept_type, score in sorted(rows):
+            self._catalog_add(concept_id, text, concept_type, score, ordinal)
+        return self.catalog
+
+    def load_shard(self, key: str) -> None:
+        """Read one shard body if it has not been read yet."""
+        if key in self._loaded:
+            return
+        self._loaded.add(key)
+        if key not in self._shards:
+            return
+        payload = self._read_json(self.shards_dir / f"{key}.json")
+        concepts = payload.get("concepts") if isinstance(payload, dict) else None
+        edges = payload.get("edges") if isinstance(payload, dict) else None
+        if not isinstance(concepts, list) or not isinstance(edges, list):
+            self.unreadable = True
+            return
+        for data in concepts:
+            concept = self._concept_from_dict(data)
+            self.concepts.setdefault(concept.id, concept)
+            self._members[key].add(concept.id)
+        self._adopt_edges(self._edge_from_dict(data) for data in edges)
+
+    def load_all(self) -> None:
+        """Read every shard body (full scans only)."""
+        for key in sorted(self._shards):
+            self.load_shard(key)
+
+    def get_concept(self, concept_id: str) -> Any | None:
+        concept = self.concepts.get(concept_id)
+        if concept is not None or (self.catalog is not None and concept_id not in self.catalog):
+            return concept
+        self.load_shard(shard_key(concept_id))
+        return self.concepts.get(concept_id)
+
+    def neighbors(self, concept_id: str) -> list[tuple[str, Any]]:
+        """Complete, weight-sorted adjacency of ``concept_id``."""
+        self.load_shard(shard_key(concept_id))
+        return self.adjacency.get(concept_id, [])
+
+    def boost(self, concept_id: str) -> float | None:
+        """TF-IDF score used by search, without reading the concept's shard."""
+        concept = self.concepts.get(concept_id)
+        if concept is not None:
+            return concept.tf_idf_score
+        entry = self.ensure_catalog().get(concept_id)
+        return entry[2] if entry is not None else None
+
+    # -- writing -------------------------------------------------------------
+
+    def put_concept(self, concept: Any) -> None:
+        """Add a concept that is not in the graph yet."""
+        self.load_shard(shard_key(concept.id))
+        self.ensure_catalog()
+        self._place_concept(concept)
+        self._dirty.add(shard_key(concept.id))
+
+    def concept_changed(self, concept: Any) -> None:
+        """Record an in-place update to a loaded concept."""
+        catalog = self.ensure_catalog()
+        entry = catalog.get(concept.id)
+        if entry is not None:
+            catalog[concept.id] = (entry[0], entry[1], concept.tf_idf_score, entry[3])
+        self._dirty.add(shard_key(concept.id))
+
+    def load_endpoints(self, edge: Any) -> None:
+        """Read both endpoint shards so ``edges`` is authoritative for ``edge``."""
+        self.load_shard(shard_key(edge.source_id))
+        self.load_shard(shard_key(edge.target_id))
+
+    def put_edge(self, edge: Any) -> None:
+        """Add a new edge; endpoint shards must already be loaded."""
+        self.edges[edge.id] = edge
+        self.edge_count += 1
+        for key in {shard_key(edge.source_id), shard_key(edge.target_id)}:
+            self._shard_edges[key][edge.id] = edge
+            self._dirty.add(key)
+        insert_neighbor(self.adjacency[edge.source_id], edge.target_id, edge)
+        insert_neighbor(self.adjacency[edge.target_id], edge.source_id, edge)
+
+    def edge_changed(self, edge: Any) -> None:
+        """Record an in-place update to a loaded edge."""
+        self._dirty.update({shard_key(edge.source_id), shard_key(edge.target_id)})
+
+    def save(self) -> None:
+        """Rewrite dirty shards, then the manifest; drop converted legacy files."""
+        if not self._dirty and self.manifest_path.exists():
+            return
+        catalog = self.ensure_catalog()
+        for key in sorted(self._dirty):
+            self._write_shard(key, catalog)
+        self.generation = uuid.uuid4().hex[:12]
+        manifest = {
+            "format": MANIFEST_FORMAT,
+            "generation": self.generation,
+            "shard_key_chars": SHARD_KEY_CHARS,
+            "shards": dict(sorted(self._shards.items())),
+        }
+        atomic_write_json(self.manifest_path, manifest)
+        self._dirty.clear()
+        if self._legacy:
+            for name in LEGACY_FILES:
+                (self.storage_dir / name).unlink(missing_ok=True)
+            self._legacy = False
+
+    def _write_shard(self, key: str, catalog: Mapping[str, tuple[str, str, float, int]]) -> None:
+        concepts = sorted(
+            (self.concepts[cid] for cid in self._members[key] if cid in self.concepts),
+            key=lambda concept: catalog.get(concept.id, ("", "", 0.0, 0))[3],
+        )
+        edges = list(self._shard_edges[key].values())
+        atomic_write_json(
+            self.shards_dir / f"{key}.json",
+            {"concepts": [c.to_dict() for c in concepts], "edges": [e.to_dict() for e in edges]},
+            indent=None,
+        )
+        atomic_write_json(
+            self.shards_dir / f"{key}.catalog.json",
+            [[c.id, c.text, c.concept_type, c.tf_idf_score, catalog[c.id][3]] for c in concepts if c.id in catalog],
+            indent=None,
+        )
+        owned = [edge for edge in edges if shard_key(edge.source_id) == key]
+        self._shards[key] = {
+            "concepts": len(concepts),
+            "edges": len(owned),
+            "edge_types": dict(Counter(edge.edge_type.value for edge in owned)),
+        }
+
+    # -- stats ---------------------------------------------------------------
+
+    def concept_type_counts(self) -> dict[str, int]:
+        return dict(Counter(entry[1] for entry in self.ensure_catalog().values()))
+
+    def edge_type_counts(self) -> dict[str, int]:
+        """Per-type edge counts from the manifest, recounted for unsaved shards."""
+        counts: Counter[str] = Counter()
+        for key, entry in self._shards.items():
+            if key not in self._dirty:
+                counts.update(entry.get("edge_types", {}))
+        for key in self._dirty:
+            counts.update(e.edge_type.value for e in self._shard_edges[key].values() if shard_key(e.source_id) == key)
+        return dict(counts)
+
+    # -- internals -----------------------------------------------------------
+
+    def _catalog_add(self, concept_id: str, text: str, concept_type: str, score: float, ordinal: int) -> None:
+        if self.catalog is None:
+            self.catalog = {}
+        self.catalog[concept_id] = (text, concept_type, score, ordinal)
+        self._next_ordinal = max(self._next_ordinal, ordinal + 1)
+        self.text_index[text.lower()] = concept_id
+        self.word_index.add(concept_id, text)
+
+    def _place_concept(self, concept: Any) -> None:
+        self.concepts[concept.id] = concept
+        self._members[shard_key(concept.id)].add(concept.id)
+        self._catalog_add(concept.id, concept.text, concept.concept_type, concept.tf_idf_score, self._next_ordinal)
+
+    def _adopt_edges(self, edges: Iterable[Any]) -> None:
+        touched: dict[str, list[tuple[str, Any]]] = {}
+        for edge in edges:
+            if edge.id in self.edges:
+                continue
+            self.edges[edge.id] = edge
+            for key in {shard_key(edge.source_id), shard_key(edge.target_id)}:
+                self._shard_edges[key][edge.id] = edge
+            self.adjacency[edge.source_id].append((edge.target_id, edge))
+            self.adjacency[edge.target_id].append((edge.source_id, edge))
+            touched[edge.source_id] = self.adjacency[edge.source_id]
+            touched[edge.target_id] = self.adjacency[edge.target_id]
+        sort_neighbors(touched)
+
+
+class ConceptsView(Mapping[str, Any]):
+    """``concept_id -> Concept`` over every concept, reading shards on access."""
+
+    def __init__(self, store: GraphShardStore):
+        self._store = store
+
+    def __getitem__(self, concept_id: str) -> Any:
+        concept = self._store.get_concept(concept_id)
+        if concept is None:
+            raise KeyError(concept_id)
+        return concept
+
+    def __contains__(self, concept_id: object) -> bool:
+        return concept_id in self._store.ensure_catalog()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._store.ensure_catalog()))
+
+    def __len__(self) -> int:
+        return len(self._store.ensure_catalog())
+
+
+class EdgesView(Mapping[str, Any]):
+    """``edge_id -> Edge`` over every edge; iteration reads every shard."""
+
+    def __init__(self, store: GraphShardStore):
+        self._store = store
+
+    def __getitem__(self, edge_id: str) -> Any:
+        edge = self._store.edges.get(edge_id)
+        if edge is None:
+            self._store.load_all()
+            edge = self._store.edges.get(edge_id)
+        if edge is None:
+            raise KeyError(edge_id)
+        return edge
+
+    def __iter__(self) -> Iterator[str]:
+        self._store.load_all()
+        return iter(list(self._store.edges))
+
+    def __len__(self) -> int:
+        return self._store.edge_count
+
+
+class AdjacencyView(Mapping[str, list[tuple[str, Any]]]):
+    """``concept_id -> [(neighbor_id, edge), ...]``, heaviest edge first."""
+
+    def __init__(self, store: GraphShardStore):
+        self._store = store
+
+    def __getitem__(self, concept_id: str) -> list[tuple[str, Any]]:
+        return self._store.neighbors(concept_id)
+
+    def get(self, concept_id: str, default: Any = None) -> Any:
+        return self._store.neighbors(concept_id) or default
+
+    def __iter__(self) -> Iterator[str]:
+        self._store.load_all()
+        return iter(list(self._store.adjacency))
+
+    def __len__(self) -> int:
+        self._store.load_all()
+        return len(self._store.adjacency)
+
+
+__all__ = [
+    "LEGACY_FILES",
+    "MANIFEST_FORMAT",
+    "AdjacencyView",
+    "ConceptsView",
+    "EdgesView",
+    "GraphShardStore",
+    "shard_key",
+]
@@ -244,6 +244,7 @@ def _file_snapshot(path: Path | None) -> list[tuple[Path, bytes | None]]:
 def _expert_apply_snapshot(item: dict[str, Any], profile_store: ExpertStore) -> list[tuple[Path, bytes | None]]:
     store = item["belief_store"]
     snapshots = _file_snapshot(getattr(store, "storage_path", None))
+    snapshots.extend(_file_snapshot(getattr(store, "journal_path", None)))
     snapshots.extend(_file_snapshot(getattr(store, "events_path", None)))
     snapshots.extend(_file_snapshot(getattr(store, "mutation_audit_path", None)))
     snapshots.extend(_file_snapshot(getattr(item.get("tracker"), "meta_file", None)))
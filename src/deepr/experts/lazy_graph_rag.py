@@ -25,11 +25,10 @@ Usage:
     results = await rag.retrieve(query, top_k=5)
 """
 
-import json
 import logging
 import math
 import re
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -42,10 +41,22 @@ def _utc_now() -> datetime:
 
 import hashlib
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from deepr.experts.graph_index import document_frequency_weight, insert_neighbor, remove_neighbor
+from deepr.experts.graph_store import AdjacencyView, ConceptsView, EdgesView, GraphShardStore
+
+# CachedSubgraph is re-exported here for backwards compatibility.
+from deepr.experts.subgraph_cache import CachedSubgraph, SubgraphCache  # noqa: F401
+
+if TYPE_CHECKING:
+    from deepr.experts.graph_extraction import DocumentExtraction
 
 logger = logging.getLogger(__name__)
 
+# Near-duplicate queries must share nearly all content words to reuse a subgraph.
+DEFAULT_CACHE_SIMILARITY_THRESHOLD = 0.85
+
 
 class EdgeType(Enum):
     """Types of edges in the knowledge graph."""
@@ -70,7 +81,8 @@ class Concept:
         document_ids: Documents containing this concept
         section_ids: Sections containing this concept
         frequency: Total occurrence count
-        tf_idf_score: TF-IDF importance score
+        tf_idf_score: TF-IDF importance score, weighted by document frequency
+        document_score: Highest single-document TF-IDF score, before that weighting
         created_at: When concept was first extracted
     """
 
@@ -83,6 +95,7 @@ class Concept:
     tf_idf_score: float = 0.0
     created_at: datetime = field(default_factory=_utc_now)
     id: str = field(default="")
+    document_score: float = 0.0
 
     def __post_init__(self):
         if not self.id:
@@ -104,6 +117,7 @@ class Concept:
             "section_ids": list(self.section_ids),
             "frequency": self.frequency,
             "tf_idf_score": self.tf_idf_score,
+            "document_score": self.document_score,
             "created_at": self.created_at.isoformat(),
         }
 
@@ -118,6 +132,7 @@ class Concept:
             section_ids=set(data.get("section_ids", [])),
             frequency=data.get("frequency", 0),
             tf_idf_score=data.get("tf_idf_score", 0.0),
+            document_score=data.get("document_score", data.get("tf_idf_score", 0.0)),
             created_at=datetime.fromisoformat(data["created_at"]) if "created_at" in data else datetime.now(UTC),
         )
 
@@ -1099,291 +1114,21 @@ class SufficiencyScorer:
         return min(1.0, negation_rate * 20)
 
 
-@dataclass
-class CachedSubgraph:
-    """A cached subgraph for a query cluster.
-
-    Attributes:
-        query_hash: Hash of the query cluster
-        node_ids: Selected node IDs
-        node_summaries: Lazy summaries for nodes
-        prompt_blocks: Rendered prompt blocks
-        created_at: When cache entry was created
-        last_accessed: When cache was last accessed
-        access_count: Number of accesses
-    """
-
-    query_hash: str
-    node_ids: set[str] = field(default_factory=set)
-    node_summaries: dict[str, str] = field(default_factory=dict)
-    prompt_blocks: list[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=_utc_now)
-    last_accessed: datetime = field(default_factory=_utc_now)
-    access_count: int = 0
-
-    def __post_init__(self):
-        if isinstance(self.node_ids, list):
-            self.node_ids = set(self.node_ids)
-
-    def touch(self):
-        """Update access time and count."""
-        self.last_accessed = datetime.now(UTC)
-        self.access_count += 1
-
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "query_hash": self.query_hash,
-            "node_ids": list(self.node_ids),
-            "node_summaries": self.node_summaries,
-            "prompt_blocks": self.prompt_blocks,
-            "created_at": self.created_at.isoformat(),
-            "last_accessed": self.last_accessed.isoformat(),
-            "access_count": self.access_count,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "CachedSubgraph":
-        return cls(
-            query_hash=data["query_hash"],
-            node_ids=set(data.get("node_ids", [])),
-            node_summaries=data.get("node_summaries", {}),
-            prompt_blocks=data.get("prompt_blocks", []),
-            created_at=datetime.fromisoformat(data["created_at"]) if "created_at" in data else datetime.now(UTC),
-            last_accessed=datetime.fromisoformat(data["last_accessed"])
-            if "last_accessed" in data
-            else datetime.now(UTC),
-            access_count=data.get("access_count", 0),
-        )
-
-
-class SubgraphCache:
-    """LRU cache for materialized subgraphs.
-
-    Caches:
-    - Node IDs selected for query clusters
-    - Computed node summaries (lazy summaries)
-    - Rendered prompt blocks (structured context)
-
-    NOTE: This is NOT KV tensor caching (requires self-hosting).
-    This caches the graph traversal results and summaries.
-
-    Attributes:
-        max_size: Maximum cache entries
-        cache: Query hash -> CachedSubgraph
-        storage_path: Path for persistence
-    """
-
-    def __init__(self, max_size: int = 100, storage_path: Path | None = None):
-        """Initialize subgraph cache.
-
-        Args:
-            max_size: Maximum cache entries
-            storage_path: Path for persistence
-        """
-        self.max_size = max_size
-        self.cache: dict[str, CachedSubgraph] = {}
-        self.storage_path = storage_path
-
-        if storage_path:
-            self._load()
-
-    def get(self, query: str) -> CachedSubgraph | None:
-        """Get cached subgraph for query.
-
-        Args:
-            query: Query string
-
-        Returns:
-            CachedSubgraph or None
-        """
-        query_hash = self._hash_query(query)
-
-        if query_hash in self.cache:
-            subgraph = self.cache[query_hash]
-            subgraph.touch()
-            return subgraph
-
-        return None
-
-    def put(
-        self,
-        query: str,
-        node_ids: set[str],
-        node_summaries: dict[str, str] | None = None,
-        prompt_blocks: list[str] | None = None,
-    ) -> CachedSubgraph:
-        """Cache a subgraph for query.
-
-        Args:
-            query: Query string
-            node_ids: Selected node IDs
-            node_summaries: Optional node summaries
-            prompt_blocks: Optional prompt blocks
-
-        Returns:
-            Created CachedSubgraph
-        """
-        query_hash = self._hash_query(query)
-
-        # Evict if at capacity
-        if len(self.cache) >= self.max_size:
-            self._evict_lru()
-
-        subgraph = CachedSubgraph(
-            query_hash=query_hash,
-            node_ids=node_ids,
-            node_summaries=node_summaries or {},
-            prompt_blocks=prompt_blocks or [],
-        )
-
-        self.cache[query_hash] = subgraph
-
-        # Persist
-        if self.storage_path:
-            self._save()
-
-        return subgraph
-
-    def update_summaries(self, query: str, summaries: dict[str, str]):
-        """Update node summaries for cached query.
-
-        Args:
-            query: Query string
-            summaries: Node ID -> summary mapping
-        """
-        query_hash = self._hash_query(query)
-
-        if query_hash in self.cache:
-            self.cache[query_hash].node_summaries.update(summaries)
-            self.cache[query_hash].touch()
-
-            if self.storage_path:
-                self._save()
-
-    def update_prompt_blocks(self, query: str, blocks: list[str]):
-        """Update prompt blocks for cached query.
-
-        Args:
-            query: Query string
-            blocks: Prompt blocks
-        """
-        query_hash = self._hash_query(query)
-
-        if query_hash in self.cache:
-            self.cache[query_hash].prompt_blocks = blocks
-            self.cache[query_hash].touch()
-
-            if self.storage_path:
-                self._save()
-
-    def invalidate(self, query: str):
-        """Invalidate cache entry for query.
-
-        Args:
-            query: Query string
-        """
-        query_hash = self._hash_query(query)
-
-        if query_hash in self.cache:
-            del self.cache[query_hash]
-
-            if self.storage_path:
-                self._save()
-
-    def clear(self):
-        """Clear all cache entries."""
-        self.cache.clear()
-
-        if self.storage_path:
-            self._save()
-
-    def get_stats(self) -> dict[str, Any]:
-        """Get cache statistics.
-
-        Returns:
-            Dictionary with cache stats
-        """
-        if not self.cache:
-            return {"size": 0, "max_size": self.max_size, "hit_rate": 0.0}
-
-        total_accesses = sum(s.access_count for s in self.cache.values())
-
-        return {
-            "size": len(self.cache),
-            "max_size": self.max_size,
-            "total_accesses": total_accesses,
-            "avg_accesses": total_accesses / len(self.cache),
-            "oldest_entry": min(s.created_at for s in self.cache.values()).isoformat(),
-            "newest_entry": max(s.created_at for s in self.cache.values()).isoformat(),
-        }
-
-    def _hash_query(self, query: str) -> str:
-        """Hash query for cache key.
-
-        Normalizes query before hashing.
-
-        Args:
-            query: Query string
-
-        Returns:
-            Query hash
-        """
-        # Normalize: lowercase, remove extra whitespace
-        normalized = " ".join(query.lower().split())
-        return hashlib.sha256(normalized.encode()).hexdigest()[:16]
-
-    def _evict_lru(self):
-        """Evict least recently used entry."""
-        if not self.cache:
-            return
-
-        # Find LRU entry
-        lru_hash = min(self.cache.keys(), key=lambda h: self.cache[h].last_accessed)
-
-        del self.cache[lru_hash]
-
-    def _save(self):
-        """Persist cache to disk."""
-        if not self.storage_path:
-            return
-
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-
-        data = {"max_size": self.max_size, "entries": {h: s.to_dict() for h, s in self.cache.items()}}
-
-        from deepr.utils.atomic_io import atomic_write_json
-
-        atomic_write_json(self.storage_path, data)
-
-    def _load(self):
-        """Load cache from disk."""
-        if not self.storage_path or not self.storage_path.exists():
-            return
-
-        try:
-            with open(self.storage_path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            self.max_size = data.get("max_size", self.max_size)
-
-            for hash_key, entry_data in data.get("entries", {}).items():
-                self.cache[hash_key] = CachedSubgraph.from_dict(entry_data)
-        except Exception as e:
-            logger.warning("Corrupted cache at %s, starting fresh: %s", self.storage_path, e)
-            self.cache.clear()
-
-
 class KnowledgeGraph:
     """Knowledge graph for LazyGraphRAG.
 
     Stores concepts and edges with efficient retrieval.
     Supports lazy construction and incremental updates.
 
+    Persisted as hash-prefix shards (see ``graph_store``): construction reads
+    only a small manifest, and a shard is read the first time one of its
+    concepts is fetched or expanded.
+
     Attributes:
         expert_name: Name of the expert
-        concepts: Concept ID -> Concept
-        edges: Edge ID -> Edge
-        adjacency: Concept ID -> List of (neighbor_id, edge)
+        concepts: Concept ID -> Concept (reads shards on access)
+        edges: Edge ID -> Edge (iteration reads every shard)
+        adjacency: Concept ID -> List of (neighbor_id, edge), heaviest edge first
         storage_dir: Directory for persistence
     """
 
@@ -1398,7 +1143,6 @@ class KnowledgeGraph:
         self.expert_name = expert_name
         self.max_edges = max_edges
         self._edge_cap_warned = False
-        self._unreadable = False
 
         if storage_dir is None:
             from deepr.experts.paths import canonical_expert_dir
@@ -1407,13 +1151,16 @@ class KnowledgeGraph:
         self.storage_dir = storage_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
-        # Graph data
-        self.concepts: dict[str, Concept] = {}
-        self.edges: dict[str, Edge] = {}
-        self.adjacency: dict[str, list[tuple[str, Edge]]] = defaultdict(list)
-
-        # Reverse index: text -> concept_id
-        self._text_index: dict[str, str] = {}
+        # Graph data, read from shards on demand
+        self._store = GraphShardStore(
+            self.storage_dir,
+            concept_from_dict=Concept.from_dict,
+            edge_from_dict=Edge.from_dict,
+            label=expert_name,
+        )
+        self.concepts = ConceptsView(self._store)
+        self.edges = EdgesView(self._store)
+        self.adjacency = AdjacencyView(self._store)
 
         # Load persisted graph
         self._load()
@@ -1422,22 +1169,25 @@ class KnowledgeGraph:
         """Add concept to graph.
 
         Args:
-            concept: Concept to add
+            concept: One document's concept; its ``tf_idf_score`` is not yet weighted
 
         Returns:
             Concept ID
         """
-        if concept.id in self.concepts:
+        existing = self._store.get_concept(concept.id)
+        if existing is not None:
             # Merge with existing
-            existing = self.concepts[concept.id]
             existing.frequency += concept.frequency
             existing.original_forms.update(concept.original_forms)
             existing.document_ids.update(concept.document_ids)
             existing.section_ids.update(concept.section_ids)
-            existing.tf_idf_score = max(existing.tf_idf_score, concept.tf_idf_score)
+            existing.document_score = max(existing.document_score, concept.tf_idf_score)
+            weight = document_frequency_weight(existing.concept_type, len(existing.document_ids))
+            existing.tf_idf_score = existing.document_score * weight
+            self._store.concept_changed(existing)
         else:
-            self.concepts[concept.id] = concept
-            self._text_index[concept.text.lower()] = concept.id
+            concept.document_score = concept.tf_idf_score
+            self._store.put_concept(concept)
 
         return concept.id
 
@@ -1451,16 +1201,24 @@ class KnowledgeGraph:
             Edge ID
         """
         edge_id = edge.id
+        self._store.load_endpoints(edge)
 
-        if edge_id in self.edges:
+        existing = self._store.edges.get(edge_id)
+        if existing is not None:
             # Merge with existing
-            existing = self.edges[edge_id]
-            existing.weight = max(existing.weight, edge.weight)
+            if edge.weight > existing.weight:
+                # Re-slot both adjacency entries so the lists stay weight-ordered.
+                remove_neighbor(self._store.adjacency[existing.source_id], existing)
+                remove_neighbor(self._store.adjacency[existing.target_id], existing)
+                existing.weight = edge.weight
+                insert_neighbor(self._store.adjacency[existing.source_id], existing.target_id, existing)
+                insert_neighbor(self._store.adjacency[existing.target_id], existing.source_id, existing)
             existing.document_ids.update(edge.document_ids)
+            self._store.edge_changed(existing)
         else:
             # Safety valve: refuse to grow past the hard cap (backstop against
             # runaway co-occurrence growth). Existing edges still merge above.
-            if len(self.edges) >= self.max_edges:
+            if self._store.edge_count >= self.max_edges:
                 if not self._edge_cap_warned:
                     logger.warning(
                         "Knowledge graph for %s hit the %d-edge cap; dropping further new edges. "
@@ -1471,11 +1229,7 @@ class KnowledgeGraph:
                     self._edge_cap_warned = True
                 return edge_id
 
-            self.edges[edge_id] = edge
-
-            # Update adjacency
-            self.adjacency[edge.source_id].append((edge.target_id, edge))
-            self.adjacency[edge.target_id].append((edge.source_id, edge))
+            self._store.put_edge(edge)
 
         return edge_id
 
@@ -1488,7 +1242,7 @@ class KnowledgeGraph:
         Returns:
             Concept or None
         """
-        return self.concepts.get(concept_id)
+        return self._store.get_concept(concept_id)
 
     def get_concept_by_text(self, text: str) -> Concept | None:
         """Get concept by text.
@@ -1499,13 +1253,18 @@ class KnowledgeGraph:
         Returns:
             Concept or None
         """
-        concept_id = self._text_index.get(text.lower())
+        self._store.ensure_catalog()
+        concept_id = self._store.text_index.get(text.lower())
         if concept_id:
-            return self.concepts.get(concept_id)
+            return self._store.get_concept(concept_id)
         return None
 
     def get_neighbors(
-        self, concept_id: str, edge_types: list[EdgeType] | None = None, min_weight: float = 0.0
+        self,
+        concept_id: str,
+        edge_types: list[EdgeType] | None = None,
+        min_weight: float = 0.0,
+        limit: int | None = None,
     ) -> list[tuple[Concept, Edge]]:
         """Get neighboring concepts.
 
@@ -1513,28 +1272,26 @@ class KnowledgeGraph:
             concept_id: Source concept ID
             edge_types: Filter by edge types
             min_weight: Minimum edge weight
+            limit: Stop after this many neighbors
 
         Returns:
-            List of (neighbor_concept, edge) tuples
+            List of (neighbor_concept, edge) tuples, heaviest edge first
         """
         neighbors = []
 
-        for neighbor_id, edge in self.adjacency.get(concept_id, []):
+        # Adjacency lists are kept sorted by weight, so the walk can stop early.
+        for neighbor_id, edge in self._store.neighbors(concept_id):
+            if edge.weight < min_weight or (limit is not None and len(neighbors) >= limit):
+                break
+
             # Filter by edge type
             if edge_types and edge.edge_type not in edge_types:
                 continue
 
-            # Filter by weight
-            if edge.weight < min_weight:
-                continue
-
-            neighbor = self.concepts.get(neighbor_id)
+            neighbor = self._store.get_concept(neighbor_id)
             if neighbor:
                 neighbors.append((neighbor, edge))
 
-        # Sort by edge weight
-        neighbors.sort(key=lambda x: x[1].weight, reverse=True)
-
         return neighbors
 
     def traverse(
@@ -1547,7 +1304,8 @@ class KnowledgeGraph:
     ) -> set[str]:
         """Traverse graph from starting nodes.
 
-        BFS traversal with depth and node limits.
+        BFS traversal with depth and node limits. Only the shards of visited
+        nodes are read; neighbours are checked against the concept catalog.
 
         Args:
             start_ids: Starting concept IDs
@@ -1559,11 +1317,12 @@ class KnowledgeGraph:
         Returns:
             Set of visited concept IDs
         """
+        catalog = self._store.ensure_catalog()
         visited: set[str] = set()
-        queue: list[tuple[str, int]] = [(cid, 0) for cid in start_ids if cid in self.concepts]
+        queue: deque[tuple[str, int]] = deque((cid, 0) for cid in start_ids if cid in catalog)
 
         while queue and len(visited) < max_nodes:
-            concept_id, depth = queue.pop(0)
+            concept_id, depth = queue.popleft()
 
             if concept_id in visited:
                 continue
@@ -1573,10 +1332,14 @@ class KnowledgeGraph:
             if depth >= max_depth:
                 continue
 
-            # Add neighbors to queue
-            for neighbor, _edge in self.get_neighbors(concept_id, edge_types, min_weight):
-                if neighbor.id not in visited:
-                    queue.append((neighbor.id, depth + 1))
+            # Add neighbors to queue (adjacency is weight-sorted)
+            for neighbor_id, edge in self._store.neighbors(concept_id):
+                if edge.weight < min_weight:
+                    break
+                if edge_types and edge.edge_type not in edge_types:
+                    continue
+                if neighbor_id in catalog and neighbor_id not in visited:
+                    queue.append((neighbor_id, depth + 1))
 
         return visited
 
@@ -1595,65 +1358,25 @@ class KnowledgeGraph:
         if not query_words:
             return []
 
-        # Score concepts by keyword overlap
-        scored: list[tuple[float, Concept]] = []
-
-        for concept in self.concepts.values():
-            concept_words = set(concept.text.lower().split())
-
-            # Jaccard similarity
-            intersection = len(query_words & concept_words)
-            union = len(query_words | concept_words)
-
-            if union > 0 and intersection > 0:
-                score = intersection / union
-                # Boost by TF-IDF
-                score *= 1 + concept.tf_idf_score
-                scored.append((score, concept))
+        # Jaccard overlap boosted by TF-IDF, scored only for concepts sharing a word
+        self._store.ensure_catalog()
+        concept_ids = self._store.word_index.search(query_words, self._store.boost, top_k)
+        return [c for c in (self._store.get_concept(cid) for cid in concept_ids) if c is not None]
 
-        # Sort by score
-        scored.sort(key=lambda x: x[0], reverse=True)
-
-        return [concept for _, concept in scored[:top_k]]
+    @property
+    def version(self) -> str:
+        """Stamp of the persisted graph state; changes on every save that writes."""
+        return self._store.generation
 
     def save(self):
-        """Persist graph to disk (atomic writes). Unreadable loads refuse."""
-        if self._unreadable:
+        """Persist changed shards (atomic writes). Unreadable loads refuse."""
+        if self._store.unreadable:
             raise RuntimeError(f"refusing to overwrite unreadable graph for {self.expert_name}")
-        from deepr.utils.atomic_io import atomic_write_json
-
-        atomic_write_json(self.storage_dir / "concepts.json", [c.to_dict() for c in self.concepts.values()])
-        atomic_write_json(self.storage_dir / "edges.json", [e.to_dict() for e in self.edges.values()])
+        self._store.save()
 
     def _load(self):
-        """Load graph from disk. Unreadable files fail closed; save cannot clobber them."""
-        self._unreadable = False
-        loaded: dict[str, list] = {}
-        for name in ("concepts.json", "edges.json"):
-            path = self.storage_dir / name
-            if not path.exists():
-                loaded[name] = []
-                continue
-            try:
-                with open(path, encoding="utf-8") as handle:
-                    payload = json.load(handle)
-            except (json.JSONDecodeError, OSError, MemoryError) as exc:
-                logger.error("Failed to load %s for %s: %s", name, self.expert_name, exc)
-                self._unreadable = True
-                return
-            if not isinstance(payload, list):
-                self._unreadable = True
-                return
-            loaded[name] = payload
-        for data in loaded["concepts.json"]:
-            concept = Concept.from_dict(data)
-            self.concepts[concept.id] = concept
-            self._text_index[concept.text.lower()] = concept.id
-        for data in loaded["edges.json"]:
-            edge = Edge.from_dict(data)
-            self.edges[edge.id] = edge
-            self.adjacency[edge.source_id].append((edge.target_id, edge))
-            self.adjacency[edge.target_id].append((edge.source_id, edge))
+        """Read the manifest (or a legacy graph). Unreadable files fail closed; save cannot clobber them."""
+        self._store.load()
 
     def get_stats(self) -> dict[str, Any]:
         """Get graph statistics.
@@ -1661,27 +1384,23 @@ class KnowledgeGraph:
         Returns:
             Dictionary with graph stats
         """
+        concept_count = len(self.concepts)
+        edge_count = len(self.edges)
         return {
-            "concept_count": len(self.concepts),
-            "edge_count": len(self.edges),
-            "avg_degree": len(self.edges) * 2 / len(self.concepts) if self.concepts else 0,
+            "concept_count": concept_count,
+            "edge_count": edge_count,
+            "avg_degree": edge_count * 2 / concept_count if concept_count else 0,
             "concept_types": self._count_concept_types(),
             "edge_types": self._count_edge_types(),
         }
 
     def _count_concept_types(self) -> dict[str, int]:
         """Count concepts by type."""
-        counts: dict[str, int] = defaultdict(int)
-        for concept in self.concepts.values():
-            counts[concept.concept_type] += 1
-        return dict(counts)
+        return self._store.concept_type_counts()
 
     def _count_edge_types(self) -> dict[str, int]:
         """Count edges by type."""
-        counts: dict[str, int] = defaultdict(int)
-        for edge in self.edges.values():
-            counts[edge.edge_type.value] += 1
-        return dict(counts)
+        return self._store.edge_type_counts()
 
 
 class LazyGraphRAG:
@@ -1715,6 +1434,7 @@ class LazyGraphRAG:
         storage_dir: Path | None = None,
         cache_size: int = 100,
         sufficiency_threshold: float = 0.6,
+        cache_similarity_threshold: float | None = DEFAULT_CACHE_SIMILARITY_THRESHOLD,
     ):
         """Initialize LazyGraphRAG.
 
@@ -1723,6 +1443,8 @@ class LazyGraphRAG:
             storage_dir: Directory for persistence
             cache_size: Maximum cache entries
             sufficiency_threshold: Threshold for graph expansion
+            cache_similarity_threshold: Token-set Jaccard at which a paraphrased
+                query reuses a cached subgraph (``None`` for exact matches only)
         """
         self.expert_name = expert_name
         self.sufficiency_threshold = sufficiency_threshold
@@ -1736,7 +1458,13 @@ class LazyGraphRAG:
         # Initialize components
         self.graph = KnowledgeGraph(expert_name=expert_name, storage_dir=storage_dir / "graph")
 
-        self.cache = SubgraphCache(max_size=cache_size, storage_path=storage_dir / "cache" / "subgraph_cache.json")
+        self.cache = SubgraphCache(
+            max_size=cache_size,
+            storage_path=storage_dir / "cache" / "subgraph_cache.json",
+            similarity_threshold=cache_similarity_threshold,
+        )
+        # Drop cached subgraphs built against a different graph state.
+        self.cache.bind_version(self.graph.version)
 
         self.extractor = ConceptExtractor()
         self.edge_builder = EdgeBuilder()
@@ -1761,84 +1489,72 @@ class LazyGraphRAG:
         Returns:
             Indexing statistics
         """
-        start_time = datetime.now(UTC)
-
-        # Extract sections
-        sections = self.extractor.extract_sections(content, document_id)
-
-        # Extract concepts from each section
-        all_concepts: list[Concept] = []
-        for section in sections:
-            concepts = self.extractor.extract_concepts(section.content, document_id, section.id)
-            all_concepts.extend(concepts)
-
-        # Add concepts to graph
-        for concept in all_concepts:
-            self.graph.add_concept(concept)
-
-        # Build edges
-        edges = self.edge_builder.build_edges(all_concepts, sections, document_id)
-        for edge in edges:
-            self.graph.add_edge(edge)
-
-        # Track indexed document
-        self._indexed_docs.add(document_id)
-        self._last_index_time = datetime.now(UTC)
-
-        # Persist graph
-        self.graph.save()
+        from deepr.experts.graph_extraction import extract_document
 
+        start_time = datetime.now(UTC)
+        extraction = extract_document(document_id, content, self.extractor, self.edge_builder)
+        self._merge_extractions([extraction])
         elapsed = (datetime.now(UTC) - start_time).total_seconds()
 
         return {
             "document_id": document_id,
-            "sections": len(sections),
-            "concepts": len(all_concepts),
-            "edges": len(edges),
+            "sections": len(extraction.sections),
+            "concepts": len(extraction.concepts),
+            "edges": len(extraction.edges),
             "elapsed_seconds": elapsed,
         }
 
-    async def index_documents(self, documents: list[dict[str, Any]], batch_size: int = 100) -> dict[str, Any]:
+    async def index_documents(
+        self, documents: list[dict[str, Any]], batch_size: int = 100, workers: int | None = None
+    ) -> dict[str, Any]:
         """Index multiple documents.
 
+        Documents are extracted and IDF-weighted over the whole call, then
+        merged ``batch_size`` at a time, with one save per batch.
+
         Args:
             documents: List of {id, content, metadata} dicts
-            batch_size: Documents per batch
+            batch_size: Documents per batch (one graph save per batch)
+            workers: Extraction processes (default: see ``extract_corpus``)
 
         Returns:
             Indexing statistics
         """
-        start_time = datetime.now(UTC)
-
-        total_concepts = 0
-        total_edges = 0
-        total_sections = 0
-
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
+        from deepr.experts.graph_extraction import extract_corpus
 
-            for doc in batch:
-                result = await self.index_document(
-                    document_id=doc.get("id", doc.get("filename", str(i))),
-                    content=doc.get("content", ""),
-                    metadata=doc.get("metadata"),
-                )
+        start_time = datetime.now(UTC)
 
-                total_concepts += result["concepts"]
-                total_edges += result["edges"]
-                total_sections += result["sections"]
+        extracted = await extract_corpus(documents, workers, self.extractor, self.edge_builder)
+        for i in range(0, len(extracted), batch_size):
+            self._merge_extractions(extracted[i : i + batch_size])
 
         elapsed = (datetime.now(UTC) - start_time).total_seconds()
 
         return {
             "documents": len(documents),
-            "sections": total_sections,
-            "concepts": total_concepts,
-            "edges": total_edges,
+            "sections": sum(len(extraction.sections) for extraction in extracted),
+            "concepts": sum(len(extraction.concepts) for extraction in extracted),
+            "edges": sum(len(extraction.edges) for extraction in extracted),
             "elapsed_seconds": elapsed,
             "docs_per_second": len(documents) / elapsed if elapsed > 0 else 0,
         }
 
+    def _merge_extractions(self, extractions: list["DocumentExtraction"]) -> None:
+        """Add extracted concepts and edges, save once, and invalidate touched cache entries."""
+        touched: set[str] = set()
+        for extraction in extractions:
+            for concept in extraction.concepts:
+                self.graph.add_concept(concept)
+            for edge in extraction.edges:
+                self.graph.add_edge(edge)
+            touched.update(extraction.touched_node_ids())
+            self._indexed_docs.add(extraction.document_id)
+        self._last_index_time = datetime.now(UTC)
+
+        # Persist graph, then drop cached subgraphs that include touched concepts
+        self.graph.save()
+        self.cache.invalidate_nodes(touched, graph_version=self.graph.version)
+
     async def retrieve(
         self, query: str, top_k: int = 5, use_graph: bool = True, expand_if_insufficient: bool = True
     ) -> dict[str, Any]:
@@ -1925,7 +1641,7 @@ class LazyGraphRAG:
             content = f"**{concept.text}**\n"
 
             # Add related concepts
-            neighbors = self.graph.get_neighbors(concept_id, min_weight=0.3)
+            neighbors = self.graph.get_neighbors(concept_id, min_weight=0.3, limit=5)
             if neighbors:
                 related = [n.text for n, _ in neighbors[:5]]
                 content += f"Related: {', '.join(related)}\n"
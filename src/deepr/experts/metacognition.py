@@ -163,6 +163,20 @@ def _original_idea_candidate_log(original_idea: "ExpertOriginalIdea") -> dict[st
     }
 
 
+def _expert_dir_name(expert_name: str) -> str:
+    safe_name = "".join(c for c in expert_name if c.isalnum() or c in (" ", "-", "_")).strip()
+    return safe_name.replace(" ", "_").lower()
+
+
+def meta_knowledge_path(expert_name: str, base_path: Path | None = None) -> Path:
+    """Where ``MetaCognitionTracker`` keeps an expert's meta-knowledge, without loading it."""
+    if base_path is None:
+        from deepr.config import experts_root
+
+        base_path = experts_root()
+    return base_path / _expert_dir_name(expert_name) / "meta_knowledge.json"
+
+
 class MetaCognitionTracker:
     """Tracks expert's awareness of what it knows and doesn't know."""
 
@@ -187,9 +201,7 @@ class MetaCognitionTracker:
 
     def _get_expert_dir(self) -> Path:
         """Get expert directory path."""
-        safe_name = "".join(c for c in self.expert_name if c.isalnum() or c in (" ", "-", "_")).strip()
-        safe_name = safe_name.replace(" ", "_").lower()
-        return self.base_path / safe_name
+        return self.base_path / _expert_dir_name(self.expert_name)
 
     def _load(self):
         """Load meta-knowledge from disk."""
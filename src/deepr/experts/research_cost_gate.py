@@ -43,13 +43,9 @@ def _configure_manager(
             day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
             month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-            def settled_totals(events: list[Any]) -> tuple[float, float]:
-                return (
-                    float(sum(event.cost_usd for event in events if event.timestamp >= day_start)),
-                    float(sum(event.cost_usd for event in events if event.timestamp >= month_start)),
-                )
-
-            daily_settled, monthly_settled = ledger.with_locked_accounting_events(settled_totals)
+            daily_settled, monthly_settled = ledger.with_locked_rollup(
+                lambda rollup: (rollup.total_since(day_start), rollup.total_since(month_start))
+            )
             manager.daily_cost = max(
                 manager.daily_cost,
                 daily_settled,
@@ -0,0 +1,189 @@
+"""Cached per-expert counters for roster listings ($0, no model).
+
+Listing the fleet used to build every expert's full manifest - parsing its
+belief snapshot and journal, its worldview and its metacognition file - only
+to print a handful of counters, and the web roster parsed the belief store a
+second time for its finding count. At forty-odd experts the roster took
+seconds.
+
+``read_roster_summary`` keeps those counters in ``roster_summary.json`` in the
+expert directory, stamped with the size and mtime of every file they are
+derived from. A read stats those files and returns the stored record while
+the stamps match. Any belief, worldview or gap mutation changes a stamp, so
+the next read rebuilds the record. Keying on the files rather than hooking
+the writers also covers writers that bypass ``BeliefStore``: synthesis,
+metacognition and other processes sharing the experts root.
+
+Document counts live on the profile, which the roster has already loaded, so
+they are read from it on every call rather than cached.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from deepr.utils.atomic_io import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FILENAME = "roster_summary.json"
+
+# Bump when the record's fields or their derivation change.
+_SUMMARY_VERSION = 1
+
+
+@dataclass(frozen=True)
+class RosterSummary:
+    """Structural counters for one expert. Carries no judgment about quality.
+
+    Attributes:
+        claim_count: Manifest claims (beliefs plus worldview, deduplicated).
+        avg_confidence: Mean claim confidence, or None when unknown.
+        belief_count: Beliefs in the belief store.
+        gap_count: Manifest gaps, filled or not.
+        open_gap_count: Manifest gaps not yet filled.
+        document_count: Documents recorded on the profile.
+        last_changed: ISO time of the newest source file, or None without any.
+        manifest_available: False when the manifest could not be read, so
+            callers can tell unknown from empty.
+    """
+
+    claim_count: int = 0
+    avg_confidence: float | None = None
+    belief_count: int = 0
+    gap_count: int = 0
+    open_gap_count: int = 0
+    document_count: int = 0
+    last_changed: str | None = None
+    manifest_available: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        """True only when the manifest was read and reported no claims."""
+        return self.manifest_available and self.claim_count == 0
+
+
+def _source_files(expert_name: str) -> tuple[Path, dict[str, Path]]:
+    """The expert directory and every file the cached counters derive from."""
+    from deepr.experts.belief_journal import JOURNAL_FILENAME
+    from deepr.experts.metacognition import meta_knowledge_path
+    from deepr.experts.paths import canonical_expert_dir
+
+    directory = canonical_expert_dir(expert_name)
+    beliefs = directory / "beliefs"
+    return directory, {
+        "beliefs": beliefs / "beliefs.json",
+        "belief_journal": beliefs / JOURNAL_FILENAME,
+        # A conflicting event log makes the belief store fail closed on load.
+        "belief_events": beliefs / "events.jsonl",
+        "worldview": directory / "knowledge" / "worldview.json",
+        "metacognition": meta_knowledge_path(expert_name),
+    }
+
+
+def _stamps(sources: dict[str, Path]) -> dict[str, list[int] | None]:
+    stamps: dict[str, list[int] | None] = {}
+    for key, path in sources.items():
+        try:
+            stat = path.stat()
+        except OSError:
+            stamps[key] = None
+        else:
+            stamps[key] = [stat.st_size, stat.st_mtime_ns]
+    return stamps
+
+
+def _last_changed(stamps: dict[str, list[int] | None]) -> str | None:
+    newest = max((stamp[1] for stamp in stamps.values() if stamp), default=None)
+    if newest is None:
+        return None
+    return datetime.fromtimestamp(newest / 1e9, tz=UTC).isoformat()
+
+
+def _document_count(expert: Any) -> int:
+    return max(
+        int(getattr(expert, "total_documents", 0) or 0),
+        len(getattr(expert, "source_files", []) or []),
+    )
+
+
+def _load_cached(path: Path, stamps: dict[str, list[int] | None]) -> RosterSummary | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _SUMMARY_VERSION or data.get("sources") != stamps:
+            return None
+        return RosterSummary(**data["summary"])
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+
+def _build(expert: Any) -> RosterSummary:
+    """Read the counters from the expert's manifest and belief store."""
+    get_manifest = getattr(expert, "get_manifest", None)
+    if not callable(get_manifest):
+        return RosterSummary()
+    try:
+        manifest = get_manifest()
+    except Exception as exc:
+        logger.debug("Could not read expert manifest for %s: %s", getattr(expert, "name", "?"), exc, exc_info=exc)
+        return RosterSummary()
+
+    belief_count = 0
+    try:
+        from deepr.experts.beliefs import BeliefStore
+
+        belief_count = len(BeliefStore(expert.name).beliefs)
+    except Exception as exc:
+        logger.debug("Could not read belief store for %s: %s", expert.name, exc, exc_info=exc)
+
+    gaps = list(getattr(manifest, "gaps", []) or [])
+    avg_confidence = getattr(manifest, "avg_confidence", None)
+    return RosterSummary(
+        claim_count=int(getattr(manifest, "claim_count", 0) or 0),
+        avg_confidence=float(avg_confidence) if avg_confidence is not None else None,
+        belief_count=belief_count,
+        gap_count=len(gaps),
+        open_gap_count=int(getattr(manifest, "open_gap_count", 0) or 0),
+        manifest_available=True,
+    )
+
+
+def read_roster_summary(expert: Any) -> RosterSummary:
+    """Return an expert's roster counters, rebuilding them only when stale.
+
+    Never raises: an expert whose state cannot be read yields
+    ``manifest_available`` False, and a cache that cannot be written is
+    simply rebuilt on the next read.
+    """
+    try:
+        directory, sources = _source_files(expert.name)
+    except Exception as exc:
+        logger.debug("No canonical directory for expert %r: %s", getattr(expert, "name", None), exc)
+        return replace(_build(expert), document_count=_document_count(expert))
+
+    # Stamps are taken before the build, so a write that lands during it
+    # leaves a stale stamp behind and the next read rebuilds again.
+    stamps = _stamps(sources)
+    existed = directory.is_dir()
+    cache_path = directory / SUMMARY_FILENAME
+    summary = _load_cached(cache_path, stamps)
+    if summary is None:
+        summary = replace(_build(expert), last_changed=_last_changed(stamps))
+        # Never cache unknown: the next read retries the manifest. Nor for an
+        # expert with no directory of its own before this read.
+        if summary.manifest_available and existed:
+            try:
+                atomic_write_json(
+                    cache_path,
+                    {"version": _SUMMARY_VERSION, "sources": stamps, "summary": asdict(summary)},
+                    indent=None,
+                )
+            except (OSError, TypeError, ValueError) as exc:
+                logger.debug("Could not write roster summary for %s: %s", expert.name, exc)
+    return replace(summary, document_count=_document_count(expert))
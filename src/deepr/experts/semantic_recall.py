@@ -398,15 +398,20 @@ def _store_recall_belief_candidates(
     include_lexical_fallback: bool = True,
 ) -> list[RecallCandidate]:
     """BeliefStore-compatible wrapper for local recall routing."""
+    beliefs: Iterable[Any] = self.beliefs.values()
     resolved_embeddings = belief_embeddings
     if resolved_embeddings is None and query_embedding is not None:
-        resolved_embeddings = _store_belief_vector_index(self).vectors_for(
-            self.beliefs.values(),
+        beliefs, resolved_embeddings = _index_recall_pool(
+            _store_belief_vector_index(self),
+            [belief for belief in beliefs if domain is None or str(getattr(belief, "domain", "")) == domain],
+            query_embedding,
+            top_k=top_k,
             model=embedding_model,
+            include_lexical_fallback=include_lexical_fallback,
         )
     return recall_belief_candidates(
         query,
-        self.beliefs.values(),
+        beliefs,
         top_k=top_k,
         min_score=min_score,
         domain=domain,
@@ -416,6 +421,30 @@ def _store_recall_belief_candidates(
     )
 
 
+def _index_recall_pool(
+    index: BeliefVectorIndex,
+    beliefs: list[Any],
+    query_embedding: Sequence[float],
+    *,
+    top_k: int,
+    model: str | None,
+    include_lexical_fallback: bool,
+) -> tuple[list[Any], dict[str, tuple[float, ...]]]:
+    """Narrow recall to the index's vector top-k plus beliefs it cannot score.
+
+    A vector-scored belief outside the index top-k is outranked by ``top_k``
+    others, so it can never reach the recall top-k; only the hits are read out
+    of the matrix. Beliefs without a usable vector still go to the lexical
+    fallback when it is enabled.
+    """
+    hits = {belief_id for belief_id, _ in index.search(query_embedding, top_k, beliefs=beliefs, model=model)}
+    scorable = index.searchable_ids(beliefs, model=model, dimensions=len(query_embedding))
+    pool = [
+        belief for belief in beliefs if belief.id in hits or (include_lexical_fallback and belief.id not in scorable)
+    ]
+    return pool, index.vectors_for([belief for belief in pool if belief.id in hits], model=model)
+
+
 def _store_recall_contradiction_candidates(
     self: Any,
     belief: Any,
@@ -494,6 +523,11 @@ def _store_belief_embedding_stats(self: Any, *, embedding_model: str | None = No
     )
 
 
+def _store_belief_vector_ann_snapshot(self: Any) -> tuple[Any, Any]:
+    """Return the belief vector matrix and its saved ANN index, if any."""
+    return _store_belief_vector_index(self).ann_snapshot()
+
+
 def install_belief_store_recall_methods(store_cls: Any) -> None:
     """Attach recall convenience methods without growing the store module."""
     store_cls.recall_belief_candidates = _store_recall_belief_candidates
@@ -502,6 +536,7 @@ def install_belief_store_recall_methods(store_cls: Any) -> None:
     store_cls.missing_belief_embedding_ids = _store_missing_belief_embedding_ids
     store_cls.prune_belief_embeddings = _store_prune_belief_embeddings
     store_cls.belief_embedding_stats = _store_belief_embedding_stats
+    store_cls.belief_vector_ann_snapshot = _store_belief_vector_ann_snapshot
 
 
 def _tracker_recall_original_idea_candidates(
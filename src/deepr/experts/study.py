@@ -28,15 +28,17 @@ Boundaries, which are the whole reason this can be trusted:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import time
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
 from deepr.experts.corpus_independence import measure_independence
-from deepr.experts.corpus_store import CorpusEntry, CorpusStore
+from deepr.experts.corpus_store import CorpusEntry, CorpusStore, pack_study_chunks
 from deepr.experts.record_identity import finding_thread_id
 from deepr.experts.study_contracts import LensOutcome, StudyFinding, StudyResult
 from deepr.experts.study_coverage import build_coverage_report
@@ -79,6 +81,7 @@ def _note_capacity_stop(
     lens: StudyLens,
     index: int,
     total: int,
+    unread: int,
     on_progress: ProgressCallback | None,
 ) -> None:
     """Record that the pass stopped short, and why, where a machine can see it.
@@ -87,10 +90,9 @@ def _note_capacity_stop(
     out. What must not happen is the result reading as though the remaining
     lenses were asked and found nothing.
     """
-    remaining = total - index + 1
     result.limitations.append(
         f"Capacity ran out during lens {index}/{total} ({lens.key}): {str(exc)[:160]}. "
-        f"{remaining} lens(es) were never read, so this study is incomplete rather than thin. "
+        f"{unread} lens(es) were never read to the end, so this study is incomplete rather than thin. "
         "Resume once capacity returns; completed lenses will be reused."
     )
     if on_progress:
@@ -129,18 +131,6 @@ def corpus_fingerprint(material: list[tuple[CorpusEntry, str]]) -> str:
     return hashlib.sha256("|".join(shas).encode("utf-8")).hexdigest()[:16]
 
 
-def _lens_progress(
-    on_progress: ProgressCallback | None,
-    lens_key: str,
-    index: int,
-    total: int,
-) -> ProgressCallback | None:
-    """Label a lens's chunk progress with where the whole run has got to."""
-    if on_progress is None:
-        return None
-    return lambda note: on_progress(f"lens {index}/{total} {lens_key}: {note}")
-
-
 _MAX_ANCHOR_PROBE = 400
 """Anchors longer than this are prefix-matched: models paraphrase tails."""
 
@@ -422,18 +412,12 @@ def build_findings(
     return findings
 
 
-async def _run_lenses(
+def _reusable_outcomes(
     result: StudyResult,
-    *,
-    lenses: Any,
-    chunks: list[list[tuple[CorpusEntry, str]]],
     material: list[tuple[CorpusEntry, str]],
-    completion: StudyCompletion,
     resume_from: list[LensOutcome] | None,
-    on_progress: ProgressCallback | None,
-    checkpoint: CheckpointCallback | None,
-) -> None:
-    """Run each lens, reusing any an earlier pass already completed.
+) -> tuple[str, dict[str, LensOutcome]]:
+    """The corpus fingerprint, and the earlier outcomes that read exactly it.
 
     Only ``ok`` and ``partial`` outcomes are reused. Reusing a parse failure
     would make one bad interruption permanent, which is the opposite of what
@@ -456,41 +440,130 @@ async def _run_lenses(
             "shown to have read this corpus. Reusing them would have carried findings that never "
             "saw the new sources."
         )
-
-    for index, lens in enumerate(lenses, 1):
-        if (earlier := done.get(lens.key)) is not None:
-            result.outcomes.append(earlier)
-            if on_progress:
-                on_progress(f"lens {index}/{len(lenses)} {lens.key}: reused from an earlier run")
-            continue
-
-        started = time.monotonic()
-        try:
-            outcome = await _run_lens_over_chunks(
-                lens,
-                chunks,
-                material,
-                completion,
-                on_progress=_lens_progress(on_progress, lens.key, index, len(lenses)),
-            )
-        except Exception as exc:
-            if not _is_capacity_failure(exc):
-                raise
-            _note_capacity_stop(result, exc, lens=lens, index=index, total=len(lenses), on_progress=on_progress)
-            break
-        outcome.elapsed_s = time.monotonic() - started
-        outcome.corpus_fingerprint = fingerprint
-        result.outcomes.append(outcome)
-        if on_progress:
+    return fingerprint, done
+
+
+@dataclass
+class _LensSchedule:
+    """Every lens x chunk call of one pass, and the outcomes finished so far."""
+
+    result: StudyResult
+    lenses: Any
+    chunks: list[list[tuple[CorpusEntry, str]]]
+    completion: StudyCompletion
+    fingerprint: str
+    on_progress: ProgressCallback | None
+    checkpoint: CheckpointCallback | None
+    slots: dict[str, LensOutcome] = field(default_factory=dict)
+    stopped: list[tuple[_LensRun, Exception]] = field(default_factory=list)
+    """The failures that ended the pass, first one first."""
+
+    def publish(self) -> None:
+        """Show finished outcomes in lens order, whatever order they finished in."""
+        self.result.outcomes = [self.slots[lens.key] for lens in self.lenses if lens.key in self.slots]
+
+    async def run(self, runs: list[_LensRun], concurrency: int) -> None:
+        # Every unit shares one gate, lens-major, so at concurrency 1 the order
+        # of calls is exactly the old one-lens-at-a-time pass.
+        gate = asyncio.Semaphore(max(1, concurrency))
+        await asyncio.gather(*(self._unit(gate, run, position) for run in runs for position in range(len(self.chunks))))
+
+    async def _unit(self, gate: asyncio.Semaphore, run: _LensRun, position: int) -> None:
+        async with gate:
+            # Checked after the wait: a unit queued behind the failure must not
+            # call a backend that has already said it cannot be asked.
+            if self.stopped:
+                return
+            if self.on_progress:
+                self.on_progress(
+                    f"lens {run.index}/{len(self.lenses)} {run.lens.key}: chunk {position + 1}/{len(self.chunks)}"
+                )
+            began = time.monotonic()
+            run.started = min(run.started, began)
+            try:
+                run.results[position] = await _read_chunk(
+                    run.lens, self.chunks[position], position + 1, self.completion
+                )
+            except Exception as exc:
+                self.stopped.append((run, exc))
+                return
+            finally:
+                run.chunk_elapsed[position] = time.monotonic() - began
+        if all(item is not None for item in run.results):
+            self._finish(run)
+
+    def _finish(self, run: _LensRun) -> None:
+        outcome = run.outcome(self.fingerprint)
+        self.slots[run.lens.key] = outcome
+        self.publish()
+        if self.on_progress:
             grounded = sum(1 for f in outcome.findings if f.is_grounded)
-            on_progress(
-                f"lens {index}/{len(lenses)} {lens.key}: {len(outcome.findings)} finding(s), "
+            self.on_progress(
+                f"lens {run.index}/{len(self.lenses)} {run.lens.key}: {len(outcome.findings)} finding(s), "
                 f"{grounded} anchored, {outcome.elapsed_s:.0f}s"
             )
-        if checkpoint is not None:
+        if self.checkpoint is not None:
             # Per lens rather than at the end, so an interruption costs one
             # lens instead of the whole pass.
-            checkpoint(result)
+            self.checkpoint(self.result)
+
+
+async def _run_lenses(
+    result: StudyResult,
+    *,
+    lenses: Any,
+    chunks: list[list[tuple[CorpusEntry, str]]],
+    material: list[tuple[CorpusEntry, str]],
+    completion: StudyCompletion,
+    concurrency: int,
+    resume_from: list[LensOutcome] | None,
+    on_progress: ProgressCallback | None,
+    checkpoint: CheckpointCallback | None,
+) -> None:
+    """Run each lens, reusing any an earlier pass already completed.
+
+    Lenses are independent, and so are the chunks within one, so every
+    lens x chunk call is its own unit with up to ``concurrency`` in flight.
+    A lens is checkpointed as soon as its last chunk lands, and outcomes stay
+    in lens order whatever order the calls finished in. A capacity failure
+    stops new calls; lenses that finished are kept and the rest are reported
+    unread, as before.
+    """
+    fingerprint, done = _reusable_outcomes(result, material, resume_from)
+    schedule = _LensSchedule(
+        result=result,
+        lenses=lenses,
+        chunks=chunks,
+        completion=completion,
+        fingerprint=fingerprint,
+        on_progress=on_progress,
+        checkpoint=checkpoint,
+    )
+    runs: list[_LensRun] = []
+    for index, lens in enumerate(lenses, 1):
+        if (earlier := done.get(lens.key)) is not None:
+            schedule.slots[lens.key] = earlier
+            if on_progress:
+                on_progress(f"lens {index}/{len(lenses)} {lens.key}: reused from an earlier run")
+        else:
+            runs.append(_LensRun(lens=lens, index=index, chunk_count=len(chunks)))
+    schedule.publish()
+
+    await schedule.run(runs, concurrency)
+
+    if schedule.stopped:
+        run, exc = schedule.stopped[0]
+        if not _is_capacity_failure(exc):
+            raise exc
+        _note_capacity_stop(
+            result,
+            exc,
+            lens=run.lens,
+            index=run.index,
+            total=len(lenses),
+            unread=len(lenses) - len(schedule.slots),
+            on_progress=on_progress,
+        )
 
 
 async def run_study(
@@ -506,6 +579,7 @@ async def run_study(
     on_progress: ProgressCallback | None = None,
     checkpoint: CheckpointCallback | None = None,
     resume_from: list[LensOutcome] | None = None,
+    concurrency: int = 1,
 ) -> StudyResult:
     """Run every requested lens over the retained corpus.
 
@@ -521,6 +595,10 @@ async def run_study(
     ``on_progress`` is called before each model call. A chunked study over a
     real corpus is tens of calls and runs for many minutes; without it the run
     is silent, and a silent run is indistinguishable from a hung one.
+
+    ``concurrency`` is how many lens x chunk calls may be in flight at once.
+    One, the default, suits a single local model; a pooled completion can
+    serve one call per backend.
     """
     lenses = resolve_lenses(lens_keys)
     material = corpus.load_study_material(max_chars=max_corpus_chars)
@@ -560,7 +638,7 @@ async def run_study(
     # its output contract - measured, a 163k-char prompt produced a prose
     # summary where a 43k-char prompt produced valid structured output from the
     # same model - so the corpus is sliced and findings are merged.
-    chunks = corpus.iter_study_chunks(chunk_chars=chunk_chars, max_chars=max_corpus_chars) or [material]
+    chunks = list(pack_study_chunks(material, chunk_chars=chunk_chars)) or [material]
     if len(chunks) > 1:
         result.limitations.append(
             f"Corpus was read in {len(chunks)} chunk(s) of up to {chunk_chars} chars. "
@@ -573,6 +651,7 @@ async def run_study(
         chunks=chunks,
         material=material,
         completion=completion,
+        concurrency=concurrency,
         resume_from=resume_from,
         on_progress=on_progress,
         checkpoint=checkpoint,
@@ -614,82 +693,117 @@ async def run_study(
     return result
 
 
-async def _run_lens_over_chunks(
+async def _read_chunk(
     lens: StudyLens,
-    chunks: list[list[tuple[CorpusEntry, str]]],
-    material: list[tuple[CorpusEntry, str]],
+    chunk: list[tuple[CorpusEntry, str]],
+    index: int,
     completion: StudyCompletion,
-    on_progress: ProgressCallback | None = None,
-) -> LensOutcome:
-    """Run one lens across every chunk, merging findings.
+) -> tuple[list[StudyFinding], str]:
+    """Run one lens over one chunk: its findings, or why there are none.
 
-    A chunk that fails does not discard the chunks that succeeded: partial
-    findings from a large corpus beat none. The outcome is ``ok`` when any chunk
-    parsed, and carries a note about the ones that did not.
+    A capacity failure raises; any other failure comes back as the reason, so
+    the chunks that succeeded are not discarded with it.
     """
-    findings: list[StudyFinding] = []
-    failures: list[str] = []
-
-    for index, chunk in enumerate(chunks, 1):
-        if on_progress:
-            on_progress(f"chunk {index}/{len(chunks)}")
-        prompt = build_study_prompt(lens, chunk)
-        try:
-            raw = await completion(prompt)
-        except Exception as exc:
-            if _is_capacity_failure(exc):
-                # Stop the whole pass. Catching this as a per-chunk failure kept
-                # calling a dead backend for every remaining chunk and lens and
-                # then wrote a complete-looking study.json whose findings were
-                # thin, with the reason recorded only as prose in `limitations`
-                # that no downstream code reads. `brief` then read it as truth.
-                #
-                # Measured: a study "completed" with 44 findings from two of
-                # eight lenses after the backend exhausted mid-run, and nothing
-                # in the artifact said so in a way a machine could act on.
-                #
-                # "The corpus had nothing to say" and "I could not ask" are
-                # different results, and the difference has to survive into the
-                # artifact rather than being flattened into a failure count.
-                raise
-            failures.append(f"chunk {index}: {str(exc)[:160]}")
-            continue
-
-        parsed, error = extract_json_object(raw)
-        if parsed is None:
-            # Include what actually came back. "no JSON object in response" is
-            # true and useless: it does not distinguish a model that answered in
-            # prose, one that was cut off mid-structure, and one that returned
-            # nothing at all, and those need different fixes.
-            snippet = " ".join((raw or "").split())[:160]
-            failures.append(f"chunk {index}: {error}. Began: {snippet!r}" if snippet else f"chunk {index}: {error}")
-            continue
-
-        # Ground against the chunk the lens was actually shown, not the whole
-        # corpus. Grounding against `material` let an anchor resolve to
-        # whichever source sorted first among those containing the phrase, so
-        # a finding could be credited to a document the lens never read. Shared
-        # boilerplate makes that the common case, not an edge case, and the
-        # coverage report then reports the true source as untouched.
-        _absorb(findings, build_findings(lens, parsed, chunk))
-
-    if findings or not failures:
-        detail = f"{len(failures)} of {len(chunks)} chunk(s) failed: " + "; ".join(failures[:2]) if failures else ""
-        # "ok" with nine of ten chunks failed is what a scheduler reads as a
-        # clean run. Partial is its own status so the exit code can say so.
-        status = "partial" if failures else "ok"
+    prompt = build_study_prompt(lens, chunk)
+    try:
+        raw = await completion(prompt)
+    except Exception as exc:
+        if _is_capacity_failure(exc):
+            # Stop the whole pass. Catching this as a per-chunk failure kept
+            # calling a dead backend for every remaining chunk and lens and
+            # then wrote a complete-looking study.json whose findings were
+            # thin, with the reason recorded only as prose in `limitations`
+            # that no downstream code reads. `brief` then read it as truth.
+            #
+            # Measured: a study "completed" with 44 findings from two of
+            # eight lenses after the backend exhausted mid-run, and nothing
+            # in the artifact said so in a way a machine could act on.
+            #
+            # "The corpus had nothing to say" and "I could not ask" are
+            # different results, and the difference has to survive into the
+            # artifact rather than being flattened into a failure count.
+            raise
+        return [], f"chunk {index}: {str(exc)[:160]}"
+
+    parsed, error = extract_json_object(raw)
+    if parsed is None:
+        # Include what actually came back. "no JSON object in response" is
+        # true and useless: it does not distinguish a model that answered in
+        # prose, one that was cut off mid-structure, and one that returned
+        # nothing at all, and those need different fixes.
+        snippet = " ".join((raw or "").split())[:160]
+        return [], f"chunk {index}: {error}. Began: {snippet!r}" if snippet else f"chunk {index}: {error}"
+
+    # Ground against the chunk the lens was actually shown, not the whole
+    # corpus. Grounding against `material` let an anchor resolve to
+    # whichever source sorted first among those containing the phrase, so
+    # a finding could be credited to a document the lens never read. Shared
+    # boilerplate makes that the common case, not an edge case, and the
+    # coverage report then reports the true source as untouched.
+    return build_findings(lens, parsed, chunk), ""
+
+
+@dataclass
+class _LensRun:
+    """One lens's chunk results as they arrive, merged in chunk order at the end."""
+
+    lens: StudyLens
+    index: int
+    chunk_count: int
+    results: list[tuple[list[StudyFinding], str] | None] = field(default_factory=list)
+    chunk_elapsed: list[float] = field(default_factory=list)
+    started: float = float("inf")
+
+    def __post_init__(self) -> None:
+        self.results = [None] * self.chunk_count
+        self.chunk_elapsed = [0.0] * self.chunk_count
+
+    def outcome(self, fingerprint: str) -> LensOutcome:
+        """Merge every chunk into one outcome.
+
+        A chunk that fails does not discard the chunks that succeeded: partial
+        findings from a large corpus beat none. The outcome is ``ok`` when any
+        chunk parsed, and carries a note about the ones that did not.
+        """
+        findings: list[StudyFinding] = []
+        failures: list[str] = []
+        for item in self.results:
+            if item is None:
+                continue
+            fresh, failure = item
+            if failure:
+                failures.append(failure)
+            else:
+                _absorb(findings, fresh)
+
+        lens = self.lens
+        timing = {
+            # Wall time from the lens's first call to its last, which is what
+            # it cost the run; the per-chunk list says where that time went.
+            "elapsed_s": time.monotonic() - self.started,
+            "chunk_elapsed_s": list(self.chunk_elapsed),
+            "corpus_fingerprint": fingerprint,
+        }
+        if findings or not failures:
+            total = self.chunk_count
+            detail = f"{len(failures)} of {total} chunk(s) failed: " + "; ".join(failures[:2]) if failures else ""
+            # "ok" with nine of ten chunks failed is what a scheduler reads as a
+            # clean run. Partial is its own status so the exit code can say so.
+            status = "partial" if failures else "ok"
+            return LensOutcome(
+                lens=lens.key,
+                axis=lens.axis,
+                status=status,
+                findings=findings,
+                detail=detail,
+                chunks_total=total,
+                chunks_failed=len(failures),
+                **timing,
+            )
         return LensOutcome(
             lens=lens.key,
             axis=lens.axis,
-            status=status,
-            findings=findings,
-            detail=detail,
-            chunks_total=len(chunks),
-            chunks_failed=len(failures),
+            status="parse_failed",
+            detail="; ".join(failures[:3]),
+            **timing,
         )
-    return LensOutcome(
-        lens=lens.key,
-        axis=lens.axis,
-        status="parse_failed",
-        detail="; ".join(failures[:3]),
-    )
@@ -100,6 +100,11 @@ class LensOutcome:
     cost_usd: float = 0.0
     chunks_total: int = 0
     chunks_failed: int = 0
+    chunk_elapsed_s: list[float] = field(default_factory=list)
+    """Seconds each chunk's call took, in chunk order.
+
+    ``elapsed_s`` is the lens's wall time, which overlaps other lenses when
+    calls run concurrently; this is where that time went."""
     corpus_fingerprint: str = ""
     """Which sources this lens read, so a stale reuse is detectable.
 
@@ -123,6 +128,7 @@ class LensOutcome:
             "cost_usd": self.cost_usd,
             "chunks_total": self.chunks_total,
             "chunks_failed": self.chunks_failed,
+            "chunk_elapsed_s": [round(seconds, 2) for seconds in self.chunk_elapsed_s],
             "corpus_fingerprint": self.corpus_fingerprint,
             "finding_count": len(self.findings),
             "grounded_count": sum(1 for f in self.findings if f.is_grounded),
@@ -140,6 +146,7 @@ class LensOutcome:
             elapsed_s=float(data.get("elapsed_s", 0.0) or 0.0),
             chunks_total=int(data.get("chunks_total", 0) or 0),
             chunks_failed=int(data.get("chunks_failed", 0) or 0),
+            chunk_elapsed_s=[float(seconds) for seconds in (data.get("chunk_elapsed_s") or [])],
             corpus_fingerprint=data.get("corpus_fingerprint", ""),
         )
 
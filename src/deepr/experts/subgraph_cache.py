@@ -0,0 +1,435 @@
+"""Subgraph materialization cache for LazyGraphRAG.
+
+Caches, per query, the concept ids a retrieval selected and the prompt blocks
+rendered from them, so a repeated question skips search, traversal and chunk
+building. This is NOT KV tensor caching (that requires self-hosting).
+
+Entries are keyed by the normalized query (lowercase word tokens) and stamped
+with the graph version that produced them. ``LazyGraphRAG`` binds the cache to
+the graph's version on startup, which drops entries written against another
+graph state. After indexing a document it calls ``invalidate_nodes`` to drop
+exactly the entries whose node ids the document touched and re-stamp the rest.
+
+With ``similarity_threshold`` set, an exact-key miss falls back to the entry
+whose query has the highest token-set Jaccard similarity at or above the
+threshold, so a paraphrased follow-up hits the cache. Hits, misses,
+near-duplicate hits, invalidations and evictions are counted for ``get_stats``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Function words ignored when comparing paraphrased queries.
+_QUERY_STOPWORDS = frozenset(
+    "a an and are as at be been but by can could did do does for from had has have how if in is it of on or "
+    "should that the this to was were what when which who why will with would".split()
+)
+
+
+def _utc_now() -> datetime:
+    """Return current UTC time (timezone-aware)."""
+    return datetime.now(UTC)
+
+
+def normalize_query(query: str) -> str:
+    """Cache key text: lowercase word tokens joined by single spaces."""
+    return " ".join(re.findall(r"\w+", query.lower()))
+
+
+def query_tokens(query: str) -> frozenset[str]:
+    """Content tokens used for near-duplicate matching (light plural folding)."""
+    tokens = set()
+    for word in re.findall(r"\w+", query.lower()):
+        if word in _QUERY_STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.add(word)
+    return frozenset(tokens)
+
+
+@dataclass
+class CachedSubgraph:
+    """A cached subgraph for a query cluster.
+
+    Attributes:
+        query_hash: Hash of the query cluster
+        node_ids: Selected node IDs
+        node_summaries: Lazy summaries for nodes
+        prompt_blocks: Rendered prompt blocks
+        created_at: When cache entry was created
+        last_accessed: When cache was last accessed
+        access_count: Number of accesses
+        query_tokens: Content tokens of the query (near-duplicate matching)
+        graph_version: Graph version the entry is valid for
+    """
+
+    query_hash: str
+    node_ids: set[str] = field(default_factory=set)
+    node_summaries: dict[str, str] = field(default_factory=dict)
+    prompt_blocks: list[str] = field(default_factory=list)
+    created_at: datetime = field(default_factory=_utc_now)
+    last_accessed: datetime = field(default_factory=_utc_now)
+    access_count: int = 0
+    query_tokens: frozenset[str] = field(default_factory=frozenset)
+    graph_version: str | None = None
+
+    def __post_init__(self):
+        if isinstance(self.node_ids, list):
+            self.node_ids = set(self.node_ids)
+        if not isinstance(self.query_tokens, frozenset):
+            self.query_tokens = frozenset(self.query_tokens)
+
+    def touch(self):
+        """Update access time and count."""
+        self.last_accessed = datetime.now(UTC)
+        self.access_count += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "query_hash": self.query_hash,
+            "node_ids": list(self.node_ids),
+            "node_summaries": self.node_summaries,
+            "prompt_blocks": self.prompt_blocks,
+            "created_at": self.created_at.isoformat(),
+            "last_accessed": self.last_accessed.isoformat(),
+            "access_count": self.access_count,
+            "query_tokens": sorted(self.query_tokens),
+            "graph_version": self.graph_version,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedSubgraph:
+        return cls(
+            query_hash=data["query_hash"],
+            node_ids=set(data.get("node_ids", [])),
+            node_summaries=data.get("node_summaries", {}),
+            prompt_blocks=data.get("prompt_blocks", []),
+            created_at=datetime.fromisoformat(data["created_at"]) if "created_at" in data else datetime.now(UTC),
+            last_accessed=datetime.fromisoformat(data["last_accessed"])
+            if "last_accessed" in data
+            else datetime.now(UTC),
+            access_count=data.get("access_count", 0),
+            query_tokens=frozenset(data.get("query_tokens", [])),
+            graph_version=data.get("graph_version"),
+        )
+
+
+class SubgraphCache:
+    """LRU cache for materialized subgraphs.
+
+    Caches:
+    - Node IDs selected for query clusters
+    - Computed node summaries (lazy summaries)
+    - Rendered prompt blocks (structured context)
+
+    Attributes:
+        max_size: Maximum cache entries
+        cache: Query hash -> CachedSubgraph
+        storage_path: Path for persistence
+        similarity_threshold: Minimum token-set Jaccard for a near-duplicate hit
+            (``None`` disables near-duplicate lookup)
+        graph_version: Graph version entries must carry to be served
+    """
+
+    def __init__(
+        self,
+        max_size: int = 100,
+        storage_path: Path | None = None,
+        similarity_threshold: float | None = None,
+    ):
+        """Initialize subgraph cache.
+
+        Args:
+            max_size: Maximum cache entries
+            storage_path: Path for persistence
+            similarity_threshold: Enable near-duplicate lookup at this Jaccard similarity
+        """
+        self.max_size = max_size
+        self.cache: dict[str, CachedSubgraph] = {}
+        self.storage_path = storage_path
+        self.similarity_threshold = similarity_threshold
+        self.graph_version: str | None = None
+        self._counters = {"hits": 0, "near_hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+
+        if storage_path:
+            self._load()
+
+    def bind_version(self, graph_version: str) -> int:
+        """Serve only entries for ``graph_version``; drop the rest.
+
+        Returns:
+            Number of entries dropped
+        """
+        stale = [h for h, s in self.cache.items() if s.graph_version != graph_version]
+        for query_hash in stale:
+            del self.cache[query_hash]
+        self._counters["invalidations"] += len(stale)
+        self.graph_version = graph_version
+        if stale and self.storage_path:
+            self._save()
+        return len(stale)
+
+    def invalidate_nodes(self, node_ids: Iterable[str], graph_version: str | None = None) -> int:
+        """Drop entries that include any of ``node_ids``.
+
+        Surviving entries are re-stamped with ``graph_version`` (when given),
+        since the change did not touch anything they were built from.
+
+        Returns:
+            Number of entries dropped
+        """
+        touched = set(node_ids)
+        stale = [h for h, s in self.cache.items() if not s.node_ids.isdisjoint(touched)]
+        for query_hash in stale:
+            del self.cache[query_hash]
+        self._counters["invalidations"] += len(stale)
+        if graph_version is not None:
+            self.graph_version = graph_version
+            for subgraph in self.cache.values():
+                subgraph.graph_version = graph_version
+        if self.storage_path and (stale or graph_version is not None):
+            self._save()
+        return len(stale)
+
+    def get(self, query: str) -> CachedSubgraph | None:
+        """Get cached subgraph for query.
+
+        Args:
+            query: Query string
+
+        Returns:
+            CachedSubgraph or None
+        """
+        subgraph = self.cache.get(self._hash_query(query))
+        if subgraph is None or subgraph.graph_version != self.graph_version:
+            subgraph = self._nearest(query)
+            if subgraph is not None:
+                self._counters["near_hits"] += 1
+
+        if subgraph is None:
+            self._counters["misses"] += 1
+            return None
+
+        self._counters["hits"] += 1
+        subgraph.touch()
+        return subgraph
+
+    def _nearest(self, query: str) -> CachedSubgraph | None:
+        """Most similar current entry at or above the similarity threshold."""
+        if self.similarity_threshold is None:
+            return None
+        tokens = query_tokens(query)
+        if not tokens:
+            return None
+        best: CachedSubgraph | None = None
+        best_score = self.similarity_threshold
+        for subgraph in self.cache.values():
+            if subgraph.graph_version != self.graph_version or not subgraph.query_tokens:
+                continue
+            score = len(tokens & subgraph.query_tokens) / len(tokens | subgraph.query_tokens)
+            if score >= best_score and (best is None or score > best_score):
+                best, best_score = subgraph, score
+        return best
+
+    def put(
+        self,
+        query: str,
+        node_ids: set[str],
+        node_summaries: dict[str, str] | None = None,
+        prompt_blocks: list[str] | None = None,
+    ) -> CachedSubgraph:
+        """Cache a subgraph for query.
+
+        Args:
+            query: Query string
+            node_ids: Selected node IDs
+            node_summaries: Optional node summaries
+            prompt_blocks: Optional prompt blocks
+
+        Returns:
+            Created CachedSubgraph
+        """
+        query_hash = self._hash_query(query)
+
+        # Evict if at capacity
+        if query_hash not in self.cache and len(self.cache) >= self.max_size:
+            self._evict_lru()
+
+        subgraph = CachedSubgraph(
+            query_hash=query_hash,
+            node_ids=node_ids,
+            node_summaries=node_summaries or {},
+            prompt_blocks=prompt_blocks or [],
+            query_tokens=query_tokens(query),
+            graph_version=self.graph_version,
+        )
+
+        self.cache[query_hash] = subgraph
+
+        # Persist
+        if self.storage_path:
+            self._save()
+
+        return subgraph
+
+    def update_summaries(self, query: str, summaries: dict[str, str]):
+        """Update node summaries for cached query.
+
+        Args:
+            query: Query string
+            summaries: Node ID -> summary mapping
+        """
+        query_hash = self._hash_query(query)
+
+        if query_hash in self.cache:
+            self.cache[query_hash].node_summaries.update(summaries)
+            self.cache[query_hash].touch()
+
+            if self.storage_path:
+                self._save()
+
+    def update_prompt_blocks(self, query: str, blocks: list[str]):
+        """Update prompt blocks for cached query.
+
+        Args:
+            query: Query string
+            blocks: Prompt blocks
+        """
+        query_hash = self._hash_query(query)
+
+        if query_hash in self.cache:
+            self.cache[query_hash].prompt_blocks = blocks
+            self.cache[query_hash].touch()
+
+            if self.storage_path:
+                self._save()
+
+    def invalidate(self, query: str):
+        """Invalidate cache entry for query.
+
+        Args:
+            query: Query string
+        """
+        query_hash = self._hash_query(query)
+
+        if query_hash in self.cache:
+            del self.cache[query_hash]
+            self._counters["invalidations"] += 1
+
+            if self.storage_path:
+                self._save()
+
+    def clear(self):
+        """Clear all cache entries."""
+        self.cache.clear()
+
+        if self.storage_path:
+            self._save()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Counters cover lookups since this cache object was created.
+
+        Returns:
+            Dictionary with cache stats
+        """
+        lookups = self._counters["hits"] + self._counters["misses"]
+        stats: dict[str, Any] = {
+            "size": len(self.cache),
+            "max_size": self.max_size,
+            **self._counters,
+            "hit_rate": self._counters["hits"] / lookups if lookups else 0.0,
+        }
+        if not self.cache:
+            return stats
+
+        total_accesses = sum(s.access_count for s in self.cache.values())
+
+        return {
+            **stats,
+            "total_accesses": total_accesses,
+            "avg_accesses": total_accesses / len(self.cache),
+            "oldest_entry": min(s.created_at for s in self.cache.values()).isoformat(),
+            "newest_entry": max(s.created_at for s in self.cache.values()).isoformat(),
+        }
+
+    def _hash_query(self, query: str) -> str:
+        """Hash query for cache key.
+
+        Normalizes query before hashing (lowercase word tokens, so case,
+        spacing and punctuation do not matter).
+
+        Args:
+            query: Query string
+
+        Returns:
+            Query hash
+        """
+        return hashlib.sha256(normalize_query(query).encode()).hexdigest()[:16]
+
+    def _evict_lru(self):
+        """Evict least recently used entry."""
+        if not self.cache:
+            return
+
+        # Find LRU entry
+        lru_hash = min(self.cache.keys(), key=lambda h: self.cache[h].last_accessed)
+
+        del self.cache[lru_hash]
+        self._counters["evictions"] += 1
+
+    def _save(self):
+        """Persist cache to disk."""
+        if not self.storage_path:
+            return
+
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "max_size": self.max_size,
+            "graph_version": self.graph_version,
+            "entries": {h: s.to_dict() for h, s in self.cache.items()},
+        }
+
+        from deepr.utils.atomic_io import atomic_write_json
+
+        atomic_write_json(self.storage_path, data)
+
+    def _load(self):
+        """Load cache from disk."""
+        if not self.storage_path or not self.storage_path.exists():
+            return
+
+        try:
+            with open(self.storage_path, encoding="utf-8") as f:
+                data = json.load(f)
+
+            self.max_size = data.get("max_size", self.max_size)
+            self.graph_version = data.get("graph_version")
+
+            for hash_key, entry_data in data.get("entries", {}).items():
+                self.cache[hash_key] = CachedSubgraph.from_dict(entry_data)
+        except Exception as e:
+            logger.warning("Corrupted cache at %s, starting fresh: %s", self.storage_path, e)
+            self.cache.clear()
+
+
+__all__ = [
+    "CachedSubgraph",
+    "SubgraphCache",
+    "normalize_query",
+    "query_tokens",
+]
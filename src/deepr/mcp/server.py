@@ -72,6 +72,7 @@ from deepr.experts.chat import ExpertChatSession
 from deepr.experts.claim_inventory import read_claim_inventory
 from deepr.experts.consult_transaction import DEFAULT_CONSULT_MAX_ELAPSED_SECONDS
 from deepr.experts.profile import ExpertStore
+from deepr.experts.roster_summary import read_roster_summary
 from deepr.mcp.consult_tool import consult_experts_tool
 from deepr.mcp.cost_status import current_cost_status
 from deepr.mcp.expert_reads import get_expert_handoff, get_expert_loop_status, get_semantic_recall, get_temporal_edges
@@ -361,7 +362,9 @@ class DeeprMCPServer:
             experts = self.store.list_all()
             rows: list[dict[str, Any]] = []
             for expert in experts:
-                inventory = read_claim_inventory(expert)
+                # Cached per expert and rebuilt only when its state files
+                # change, so listing the fleet does not build every manifest.
+                summary = read_roster_summary(expert)
                 # An unreadable manifest is unknown, not empty. Hosts skip
                 # consults on knowledge_empty, so defaulting it True would tell
                 # an agent a populated expert has nothing to say.
@@ -371,14 +374,13 @@ class DeeprMCPServer:
                     "description": expert.description,
                     "documents": expert.total_documents,
                     "conversations": expert.activity_tracker.conversations,
-                    "claim_count": inventory.claim_count,
-                    "claim_count_known": inventory.manifest_available,
-                    "knowledge_empty": inventory.is_empty and expert.total_documents == 0,
+                    "claim_count": summary.claim_count,
+                    "claim_count_known": summary.manifest_available,
+                    "knowledge_empty": summary.is_empty and expert.total_documents == 0,
                 }
-                with suppress(Exception):
-                    manifest = expert.get_manifest()
-                    row["open_gap_count"] = int(getattr(manifest, "open_gap_count", 0) or 0)
-                    row["avg_confidence"] = inventory.avg_confidence
+                if summary.manifest_available:
+                    row["open_gap_count"] = summary.open_gap_count
+                    row["avg_confidence"] = summary.avg_confidence
                 rows.append(row)
             return rows
         except (OSError, KeyError, ValueError) as e:
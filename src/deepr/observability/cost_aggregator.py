@@ -0,0 +1,309 @@
+"""Pre-bucketed cost aggregation for the cost dashboard.
+
+``CostAggregator`` keeps per-UTC-day buckets (total plus provider, operation
+and model sub-totals) and per-UTC-month totals, updated as entries are
+appended. Daily and monthly totals are bucket lookups, and breakdowns sum
+whole-day buckets, so history, trend and breakdown queries scale with the
+number of days rather than the number of entries. Only the two boundary days
+of a datetime-bounded breakdown are filtered entry by entry.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from deepr.observability.costs import CostEntry
+
+
+def _as_utc(value: datetime) -> datetime:
+    return (value if value.tzinfo else value.replace(tzinfo=UTC)).astimezone(UTC)
+
+
+_BREAKDOWN_KEYS: dict[str, Callable[[CostEntry], str]] = {
+    "by_provider": lambda entry: entry.provider,
+    "by_operation": lambda entry: entry.operation,
+    "by_model": lambda entry: entry.model or "unknown",
+}
+
+
+@dataclass
+class _DayBucket:
+    """One UTC day's entries and running totals."""
+
+    entries: list[CostEntry] = field(default_factory=list)
+    total: float = 0.0
+    breakdowns: dict[str, dict[str, float]] = field(default_factory=lambda: {name: {} for name in _BREAKDOWN_KEYS})
+
+    def add(self, entry: CostEntry) -> None:
+        self.entries.append(entry)
+        self.total += entry.cost
+        for name, key_func in _BREAKDOWN_KEYS.items():
+            breakdown = self.breakdowns[name]
+            key = key_func(entry)
+            breakdown[key] = breakdown.get(key, 0.0) + entry.cost
+
+
+class CostAggregator:
+    """Handles cost aggregation and breakdown calculations.
+
+    Shares the dashboard's entries list and buckets entries appended to it,
+    whether through ``add`` or directly. The list is treated as append-only;
+    if it shrinks, the buckets are rebuilt.
+    """
+
+    def __init__(self, entries: list[CostEntry]):
+        """Initialize aggregator with entries reference.
+
+        Args:
+            entries: List of cost entries to aggregate
+        """
+        self._entries = entries
+        self._lock = threading.Lock()
+        self._days: dict[date, _DayBucket] = {}
+        self._months: dict[tuple[int, int], float] = {}
+        self._indexed = 0
+        with self._lock:
+            self._sync()
+
+    def add(self, entry: CostEntry) -> None:
+        """Append an entry to the shared list and bucket it."""
+        with self._lock:
+            self._entries.append(entry)
+            self._sync()
+
+    def get_daily_total(self, target_date: date | None = None) -> float:
+        """Get total cost for a day.
+
+        Args:
+            target_date: Date to check (default: today in UTC)
+
+        Returns:
+            Total cost for the day
+        """
+        if target_date is None:
+            target_date = datetime.now(UTC).date()
+
+        with self._lock:
+            bucket = self._sync().get(target_date)
+            return bucket.total if bucket else 0.0
+
+    def get_daily_totals(self, start: date, end: date) -> dict[date, float]:
+        """Get the total for every UTC day from ``start`` to ``end`` inclusive.
+
+        Args:
+            start: First day
+            end: Last day
+
+        Returns:
+            Dictionary mapping each day in the range to its total (0.0 when empty)
+        """
+        totals: dict[date, float] = {}
+        with self._lock:
+            days = self._sync()
+            day = start
+            while day <= end:
+                bucket = days.get(day)
+                totals[day] = bucket.total if bucket else 0.0
+                day += timedelta(days=1)
+        return totals
+
+    def get_monthly_total(self, year: int | None = None, month: int | None = None) -> float:
+        """Get total cost for a month.
+
+        Args:
+            year: Year (default: current)
+            month: Month (default: current)
+
+        Returns:
+            Total cost for the month
+        """
+        now = datetime.now(UTC)
+        if year is None:
+            year = now.year
+        if month is None:
+            month = now.month
+
+        with self._lock:
+            self._sync()
+            return self._months.get((year, month), 0.0)
+
+    def get_breakdown_by_provider(
+        self, start_date: datetime | None = None, end_date: datetime | None = None
+    ) -> dict[str, float]:
+        """Get cost breakdown by provider.
+
+        Args:
+            start_date: Start of period
+            end_date: End of period
+
+        Returns:
+            Dictionary mapping provider to total cost
+        """
+        return self.get_all_breakdowns(start_date, end_date)["by_provider"]
+
+    def get_breakdown_by_operation(
+        self, start_date: datetime | None = None, end_date: datetime | None = None
+    ) -> dict[str, float]:
+        """Get cost breakdown by operation type.
+
+        Args:
+            start_date: Start of period
+            end_date: End of period
+
+        Returns:
+            Dictionary mapping operation to total cost
+        """
+        return self.get_all_breakdowns(start_date, end_date)["by_operation"]
+
+    def get_breakdown_by_model(
+        self, start_date: datetime | None = None, end_date: datetime | None = None
+    ) -> dict[str, float]:
+        """Get cost breakdown by model.
+
+        Args:
+            start_date: Start of period
+            end_date: End of period
+
+        Returns:
+            Dictionary mapping model to total cost
+        """
+        return self.get_all_breakdowns(start_date, end_date)["by_model"]
+
+    def get_all_breakdowns(
+        self, start_date: datetime | None = None, end_date: datetime | None = None
+    ) -> dict[str, dict[str, float]]:
+        """Get all breakdowns from the day buckets.
+
+        Days wholly inside the period contribute their bucket sub-totals;
+        a partially covered boundary day is filtered entry by entry.
+
+        Args:
+            start_date: Start of period (inclusive)
+            end_date: End of period (inclusive)
+
+        Returns:
+            Dictionary with 'by_provider', 'by_operation', 'by_model' keys
+        """
+        start = _as_utc(start_date) if start_date else None
+        end = _as_utc(end_date) if end_date else None
+        result: dict[str, dict[str, float]] = {name: {} for name in _BREAKDOWN_KEYS}
+
+        with self._lock:
+            days = sorted(self._sync().items())
+            for day, bucket in days:
+                self._add_day(result, day, bucket, start, end)
+        return result
+
+    @staticmethod
+    def _add_day(
+        result: dict[str, dict[str, float]],
+        day: date,
+        bucket: _DayBucket,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> None:
+        """Add one day's share of the period to ``result``."""
+        day_start = datetime.combine(day, time.min, UTC)
+        day_last = day_start + timedelta(days=1, microseconds=-1)
+        if (start and start > day_last) or (end and end < day_start):
+            return
+        if (start is None or start <= day_start) and (end is None or end >= day_last):
+            for name, breakdown in bucket.breakdowns.items():
+                merged = result[name]
+                for key, cost in breakdown.items():
+                    merged[key] = merged.get(key, 0.0) + cost
+            return
+        for entry in bucket.entries:
+            timestamp = _as_utc(entry.timestamp)
+            if (start and timestamp < start) or (end and timestamp > end):
+                continue
+            for name, key_func in _BREAKDOWN_KEYS.items():
+                merged = result[name]
+                key = key_func(entry)
+                merged[key] = merged.get(key, 0.0) + entry.cost
+
+    def _filter_by_date(self, start_date: datetime | None, end_date: datetime | None) -> list[CostEntry]:
+        """Filter entries by date range.
+
+        Args:
+            start_date: Start of period (inclusive)
+            end_date: End of period (inclusive)
+
+        Returns:
+            Filtered entries
+        """
+        entries = self._entries
+
+        if start_date:
+            start_date = _as_utc(start_date)
+            entries = [e for e in entries if _as_utc(e.timestamp) >= start_date]
+
+        if end_date:
+            end_date = _as_utc(end_date)
+            entries = [e for e in entries if _as_utc(e.timestamp) <= end_date]
+
+        return entries
+
+    def get_entries_by_expert(self, expert_name: str) -> list[CostEntry]:
+        """Get all cost entries for a specific expert.
+
+        Args:
+            expert_name: Name of the expert to filter by
+
+        Returns:
+            List of matching cost entries
+        """
+        return [e for e in self._entries if e.metadata.get("expert") == expert_name]
+
+    def get_expert_breakdown(self, expert_name: str) -> dict[str, float]:
+        """Get cost breakdown by operation type for a specific expert.
+
+        Args:
+            expert_name: Name of the expert
+
+        Returns:
+            Dictionary mapping operation type to total cost
+        """
+        entries = self.get_entries_by_expert(expert_name)
+        return self._aggregate_by_field(entries, lambda e: e.operation)
+
+    def _aggregate_by_field(self, entries: list[CostEntry], key_func) -> dict[str, float]:
+        """Aggregate costs by a field extracted via key function.
+
+        Args:
+            entries: Entries to aggregate
+            key_func: Function to extract grouping key from entry
+
+        Returns:
+            Dictionary mapping key to total cost
+        """
+        breakdown: dict[str, float] = {}
+        for entry in entries:
+            key = key_func(entry)
+            if key not in breakdown:
+                breakdown[key] = 0.0
+            breakdown[key] += entry.cost
+        return breakdown
+
+    def _sync(self) -> dict[date, _DayBucket]:
+        """Bucket entries appended since the last call (caller holds the lock).
+
+        Rebuilds when the list shrank.
+        """
+        if len(self._entries) < self._indexed:
+            self._days, self._months, self._indexed = {}, {}, 0
+        for entry in self._entries[self._indexed :]:
+            day = entry.date
+            self._days.setdefault(day, _DayBucket()).add(entry)
+            month = (day.year, day.month)
+            self._months[month] = self._months.get(month, 0.0) + entry.cost
+        self._indexed = len(self._entries)
+        return self._days
+
+
+__all__ = ["CostAggregator"]
@@ -0,0 +1,123 @@
+"""Group commit for concurrent cost ledger appends.
+
+With group commit enabled, ``CostLedger.record_event`` queues its event
+instead of taking the ledger locks itself. The first caller to find no
+active leader becomes the leader: it waits up to the commit window for
+other callers to join, takes every queued append, and commits them under
+one lock acquisition with one write and one fsync. Every caller blocks until
+its own append has been committed (or has failed), so an acknowledgement
+still means the event is durable.
+
+Leadership is released as soon as the leader has taken its batch, so the
+next batch gathers while the current one is being written.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Long enough for parallel writers to meet, short next to a typical fsync.
+DEFAULT_WINDOW_SECONDS = 0.002
+# A batch this large commits without waiting out the rest of the window.
+DEFAULT_MAX_BATCH = 256
+
+
+@dataclass
+class PendingAppend:
+    """One queued ``record_event`` call and its outcome.
+
+    Attributes:
+        event: Validated ``CostLedgerEvent`` to append
+        require_fsync: Whether the caller requires a confirmed fsync
+        deadline: ``time.monotonic()`` lock deadline, or None to wait
+        result: ``(event, created)`` once committed
+        error: Exception to raise in the caller instead of a result
+    """
+
+    event: Any
+    require_fsync: bool
+    deadline: float | None
+    result: tuple[Any, bool] | None = None
+    error: BaseException | None = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def resolved(self) -> bool:
+        return self.result is not None or self.error is not None
+
+    def outcome(self) -> tuple[Any, bool]:
+        """Return the result, or raise the error the commit recorded."""
+        if self.error is not None:
+            raise self.error
+        if self.result is None:
+            raise RuntimeError("cost ledger commit finished without a result")
+        return self.result
+
+
+def batch_deadline(batch: list[PendingAppend]) -> float | None:
+    """The earliest caller deadline: nobody waits longer than they asked."""
+    deadlines = [append.deadline for append in batch if append.deadline is not None]
+    return min(deadlines) if deadlines else None
+
+
+class GroupCommitter:
+    """Gathers concurrent appends into batches for one commit callback.
+
+    ``commit`` receives a batch and resolves each append, either by setting
+    ``result`` or by setting ``error``. An exception raised by ``commit``
+    fails every append in the batch that it left unresolved.
+    """
+
+    def __init__(
+        self,
+        commit: Callable[[list[PendingAppend]], None],
+        *,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        self._commit = commit
+        self._window_seconds = window_seconds
+        self._max_batch = max_batch
+        self._condition = threading.Condition()
+        self._pending: list[PendingAppend] = []
+        self._leader_active = False
+
+    def submit(self, event: Any, *, require_fsync: bool, deadline: float | None) -> tuple[Any, bool]:
+        """Queue one append and block until its batch has been committed."""
+        append = PendingAppend(event=event, require_fsync=require_fsync, deadline=deadline)
+        with self._condition:
+            self._pending.append(append)
+            lead = not self._leader_active
+            if lead:
+                self._leader_active = True
+            elif len(self._pending) >= self._max_batch:
+                self._condition.notify_all()
+        if lead:
+            self._lead()
+        append.done.wait()
+        return append.outcome()
+
+    def _lead(self) -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._pending) >= self._max_batch, timeout=self._window_seconds)
+            batch, self._pending = self._pending, []
+            self._leader_active = False
+        try:
+            self._commit(batch)
+        except BaseException as exc:
+            for append in batch:
+                if not append.resolved:
+                    append.error = exc
+            if not isinstance(exc, Exception):
+                raise
+        finally:
+            for append in batch:
+                if not append.resolved:
+                    append.error = RuntimeError("cost ledger group commit left an append unresolved")
+                append.done.set()
+
+
+__all__ = ["DEFAULT_MAX_BATCH", "DEFAULT_WINDOW_SECONDS", "GroupCommitter", "PendingAppend", "batch_deadline"]
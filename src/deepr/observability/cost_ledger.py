@@ -6,7 +6,7 @@ import logging
 import os
 import threading
 import time
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -50,6 +50,9 @@ from deepr.observability.cost_authority import (
 from deepr.observability.cost_authority import (
     well_known_spend_cap_env_paths as well_known_spend_cap_env_paths,
 )
+from deepr.observability.cost_group_commit import GroupCommitter, PendingAppend, batch_deadline
+from deepr.observability.cost_rollup import CostRollup, RollupStore
+from deepr.observability.cost_segments import LedgerSegment, SegmentIndex, StaleSegmentIndex, read_segment_index
 from deepr.observability.strict_json import loads_strict_json_object as _loads_strict_json
 
 logger = logging.getLogger(__name__)
@@ -151,13 +154,19 @@ class CostLedgerEvent:
 
 
 class CostLedger:
-    """Append-only cost ledger with idempotency support."""
+    """Append-only cost ledger with idempotency support.
+
+    With ``group_commit_window_ms`` set, concurrent ``record_event`` callers
+    arriving within that window share one lock acquisition, write and fsync
+    (see ``deepr.observability.cost_group_commit``). Off by default.
+    """
 
     def __init__(
         self,
         ledger_path: Path | None = None,
         *,
         lock_timeout_seconds: float | None = None,
+        group_commit_window_ms: float | None = None,
     ):
         using_default_path = ledger_path is None and uses_canonical_home_cost_data_dir()
         self._using_default_path = using_default_path
@@ -166,9 +175,17 @@ class CostLedger:
         self.cost_state_id = current_cost_state_id() if ledger_path is None else ""
         self._lock = threading.Lock()
         self._lock_timeout_seconds = _validated_lock_timeout(lock_timeout_seconds)
-        self._idempotency_keys: set[str] = set()
-        self._idempotency_events: dict[str, CostLedgerEvent] = {}
-        self._idempotency_conflicts: set[str] = set()
+        self._rollups = RollupStore(
+            self.ledger_path.with_name(f"{self.ledger_path.name}.rollup.json"),
+            parse_line=_parse_ledger_line,
+            same_event=_same_idempotent_cost_event,
+        )
+        self._segments = SegmentIndex(self.ledger_path, parse_line=_parse_ledger_line)
+        self._idempotency_key_count = 0
+        self._group_commit: GroupCommitter | None = None
+        if group_commit_window_ms is not None:
+            window_ms = _validated_cost(group_commit_window_ms, field_name="group_commit_window_ms")
+            self._group_commit = GroupCommitter(self._commit_batch, window_seconds=window_ms / 1000)
         with self._interprocess_lock():
             self._load_idempotency_index()
 
@@ -304,50 +321,18 @@ class CostLedger:
         *,
         paths: tuple[Path, ...] | None = None,
         fail_closed: bool = False,
-    ) -> None:
-        for path in paths or (self.ledger_path,):
-            if not path.exists():
-                continue
-            try:
-                with open(path, encoding="utf-8") as f:
-                    for line_no, line in enumerate(f, start=1):
-                        line = line.strip()
-                        if not line:
-                            continue
-                        event = self._parse_index_event(line, line_no=line_no, fail_closed=fail_closed)
-                        if event is not None:
-                            self._index_idempotent_event(event)
-            except OSError as error:
-                logger.warning("Failed loading cost ledger index (%s)", type(error).__name__)
-                if fail_closed:
-                    raise CostLedgerReadError("cost ledger idempotency index could not be read") from error
-
-    @staticmethod
-    def _parse_index_event(
-        line: str,
-        *,
-        line_no: int,
-        fail_closed: bool,
-    ) -> CostLedgerEvent | None:
+        checkpoint: bool = True,
+    ) -> CostRollup | None:
+        """Advance the checkpointed rollup, which carries the idempotency index."""
         try:
-            return CostLedgerEvent.from_dict(_loads_strict_json(line))
-        except (AttributeError, json.JSONDecodeError, TypeError, ValueError) as exc:
-            logger.error("Corrupted cost ledger line %d (%s)", line_no, type(exc).__name__)
+            rollup = self._rollups.refresh(paths or (self.ledger_path,), checkpoint=checkpoint)
+        except CostLedgerReadError as error:
+            logger.warning("Failed loading cost ledger index (%s)", type(error.__cause__ or error).__name__)
             if fail_closed:
-                raise CostLedgerReadError("cost ledger contains a malformed event") from exc
+                raise
             return None
-
-    def _index_idempotent_event(self, event: CostLedgerEvent) -> None:
-        key = event.idempotency_key
-        if not key:
-            return
-        self._idempotency_keys.add(key)
-        existing = self._idempotency_events.get(key)
-        if existing is None:
-            self._idempotency_events[key] = event
-        elif not _same_idempotent_cost_event(existing, event):
-            self._idempotency_conflicts.add(key)
-            logger.error("Conflicting cost ledger events reuse one idempotency key")
+        self._idempotency_key_count = rollup.idempotency_key_count
+        return rollup
 
     def record_event(
         self,
@@ -391,60 +376,104 @@ class CostLedger:
             agent_id=_validated_text_value(agent_id, field_name="agent_id"),
         )
 
+        if self._group_commit is not None:
+            return self._group_commit.submit(event, require_fsync=require_fsync, deadline=deadline)
+        append = PendingAppend(event=event, require_fsync=require_fsync, deadline=deadline)
+        self._commit_batch([append])
+        return append.outcome()
+
+    def _commit_batch(self, batch: list[PendingAppend]) -> None:
+        deadline = batch_deadline(batch)
         with self._thread_lock(deadline=deadline):
             with self._accounting_locks(deadline=deadline) as paths:
-                return self._record_event_locked(
-                    event,
-                    require_fsync=require_fsync,
-                    accounting_paths=paths,
-                )
+                self._record_events_locked(batch, accounting_paths=paths)
 
-    def _record_event_locked(
-        self,
-        event: CostLedgerEvent,
-        *,
-        require_fsync: bool,
-        accounting_paths: tuple[Path, ...],
-    ) -> tuple[CostLedgerEvent, bool]:
-        self._idempotency_keys.clear()
-        self._idempotency_events.clear()
-        self._idempotency_conflicts.clear()
-        self._load_idempotency_index(paths=accounting_paths, fail_closed=True)
-        if self._idempotency_conflicts:
+    def _record_events_locked(self, batch: list[PendingAppend], *, accounting_paths: tuple[Path, ...]) -> None:
+        """Resolve each append as a replay, a conflict or a new event, then append the new ones together."""
+        rollup = self._load_idempotency_index(paths=accounting_paths, fail_closed=True)
+        if rollup is None or rollup.conflicts:
             raise CostLedgerIdempotencyConflict("cost ledger contains conflicting idempotency events")
-        existing = self._matching_idempotent_event(event)
-        if existing is not None:
-            if require_fsync:
-                for path in accounting_paths:
-                    if path.exists():
-                        self._require_durable_file(path)
-            return existing, False
-        self._append_event(event, require_fsync=require_fsync)
+        new = self._resolve_replays(batch, rollup, accounting_paths)
+        if not new:
+            return
+        durable = self._append_events([append.event for append in new])
+        for append in new:
+            if append.require_fsync and not durable:
+                append.error = CostLedgerDurabilityError("cost ledger durability could not be confirmed")
+            else:
+                append.result = (append.event, True)
         if self._using_default_path:
             observe_cost_artifact(self.ledger_path)
-        self._index_idempotent_event(event)
-        return event, True
+        self._load_idempotency_index(paths=accounting_paths)
 
-    def _matching_idempotent_event(self, event: CostLedgerEvent) -> CostLedgerEvent | None:
+    def _resolve_replays(
+        self,
+        batch: list[PendingAppend],
+        rollup: CostRollup,
+        accounting_paths: tuple[Path, ...],
+    ) -> list[PendingAppend]:
+        """Settle replays and conflicts (earlier appends in the batch count); return the new appends."""
+        batch_keys: dict[str, CostLedgerEvent] = {}
+        new: list[PendingAppend] = []
+        durable_replays: list[PendingAppend] = []
+        for append in batch:
+            event = append.event
+            try:
+                existing = batch_keys.get(event.idempotency_key) if event.idempotency_key else None
+                if existing is None:
+                    existing = self._matching_idempotent_event(event, rollup, accounting_paths)
+                elif not _same_idempotent_cost_event(existing, event):
+                    raise CostLedgerIdempotencyConflict("idempotency key conflicts with an existing cost event")
+            except CostLedgerIdempotencyConflict as exc:
+                append.error = exc
+                continue
+            if existing is not None:
+                append.result = (existing, False)
+                durable_replays.extend([append] if append.require_fsync else [])
+                continue
+            if event.idempotency_key:
+                batch_keys[event.idempotency_key] = event
+            new.append(append)
+        if durable_replays:
+            self._confirm_replays_durable(durable_replays, accounting_paths)
+        return new
+
+    def _confirm_replays_durable(self, replays: list[PendingAppend], accounting_paths: tuple[Path, ...]) -> None:
+        """Reconfirm durability once for every replay that required an fsync."""
+        try:
+            for path in accounting_paths:
+                if path.exists():
+                    self._require_durable_file(path)
+        except CostLedgerDurabilityError as exc:
+            for append in replays:
+                append.error = exc
+
+    def _matching_idempotent_event(
+        self,
+        event: CostLedgerEvent,
+        rollup: CostRollup,
+        accounting_paths: tuple[Path, ...],
+    ) -> CostLedgerEvent | None:
         key = event.idempotency_key
-        if not key or key not in self._idempotency_keys:
+        if not rollup.has_idempotency_key(key):
             return None
-        existing = self._idempotency_events[key]
+        existing = next(found for path in accounting_paths if (found := self._rollups.event_at(path, key)) is not None)
         if not _same_idempotent_cost_event(existing, event):
             raise CostLedgerIdempotencyConflict("idempotency key conflicts with an existing cost event")
         return existing
 
-    def _append_event(self, event: CostLedgerEvent, *, require_fsync: bool) -> None:
-        line = json.dumps(event.to_dict(), ensure_ascii=True, allow_nan=False)
+    def _append_events(self, events: list[CostLedgerEvent]) -> bool:
+        """Append events with one write and one fsync; return whether the fsync succeeded."""
+        lines = "".join(json.dumps(event.to_dict(), ensure_ascii=True, allow_nan=False) + "\n" for event in events)
         with open(self.ledger_path, "a", encoding="utf-8") as ledger_file:
-            ledger_file.write(line + "\n")
+            ledger_file.write(lines)
             ledger_file.flush()
             try:
                 os.fsync(ledger_file.fileno())
             except OSError as exc:
-                if require_fsync:
-                    raise CostLedgerDurabilityError("cost ledger durability could not be confirmed") from exc
                 logger.debug("Cost ledger fsync unavailable: %s", type(exc).__name__)
+                return False
+        return True
 
     def _require_durable_file(self, path: Path | None = None) -> None:
         """Reconfirm durability when a required append replays an existing key."""
@@ -504,7 +533,11 @@ class CostLedger:
     ) -> list[CostLedgerEvent]:
         events: list[CostLedgerEvent] = []
         for path in paths:
-            events.extend(self._read_ledger_file(path, start_date=start_date, end_date=end_date, source=source))
+            # Only the canonical ledger is indexed; sibling roots stay read-only.
+            segments = self._segments if path == self.ledger_path and (start_date or end_date) else None
+            events.extend(
+                self._read_ledger_file(path, start_date=start_date, end_date=end_date, source=source, segments=segments)
+            )
         if len(paths) > 1:
             events.sort(key=lambda e: e.timestamp)
         return events
@@ -550,30 +583,27 @@ class CostLedger:
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         source: str | None = None,
+        segments: SegmentIndex | None = None,
     ) -> list[CostLedgerEvent]:
         events: list[CostLedgerEvent] = []
         if not path.exists():
             return events
 
-        with open(path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = _loads_strict_json(line)
-                    event = CostLedgerEvent.from_dict(data)
-                except (json.JSONDecodeError, TypeError, ValueError):
-                    # Intent: one corrupted cost ledger line must not prevent loading the rest of the billing history; partial results still allow usage queries and caps.
-                    continue
-
-                if source and event.source != source:
-                    continue
-                if start_date and event.timestamp < start_date:
-                    continue
-                if end_date and event.timestamp > end_date:
-                    continue
-                events.append(event)
+        for line in _ledger_lines(path, start_date, end_date, segments):
+            try:
+                data = _loads_strict_json(line.decode("utf-8"))
+                event = CostLedgerEvent.from_dict(data)
+            except (json.JSONDecodeError, TypeError, ValueError):
+                # Intent: one corrupted cost ledger line must not prevent loading the rest of the billing history; partial results still allow usage queries and caps.
+                continue
+
+            if source and event.source != source:
+                continue
+            if start_date and event.timestamp < start_date:
+                continue
+            if end_date and event.timestamp > end_date:
+                continue
+            events.append(event)
 
         return events
 
@@ -607,16 +637,48 @@ class CostLedger:
         deadline = None if timeout is None else time.monotonic() + timeout
         with self._thread_lock(deadline=deadline):
             with self._accounting_locks(deadline=deadline) as paths:
-                self._idempotency_keys.clear()
-                self._idempotency_events.clear()
-                self._idempotency_conflicts.clear()
                 for path in paths:
                     if path.exists():
                         self._require_durable_file(path)
-                events = self._get_accounting_events_unlocked(paths=paths)
-                for event in events:
-                    self._index_idempotent_event(event)
-                return operation(events)
+                return operation(self._get_accounting_events_unlocked(paths=paths))
+
+    def with_locked_rollup(
+        self,
+        operation: Callable[[CostRollup], T],
+        *,
+        lock_timeout_seconds: float | None = 5.0,
+    ) -> T:
+        """Run a spend decision against the strict, locked checkpointed rollup.
+
+        Same authority as ``with_locked_accounting_events`` (every accounting
+        root, durable, fail-closed, replays counted once) but only events
+        appended since the last checkpoint are parsed.
+        """
+        timeout = _validated_lock_timeout(lock_timeout_seconds)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._thread_lock(deadline=deadline):
+            with self._accounting_locks(deadline=deadline) as paths:
+                for path in paths:
+                    if path.exists():
+                        self._require_durable_file(path)
+                rollup = self._load_idempotency_index(paths=paths, fail_closed=True)
+                if rollup is None or rollup.conflicts:
+                    raise CostLedgerIdempotencyConflict("cost ledger contains conflicting idempotency events")
+                return operation(rollup)
+
+    def _with_reporting_rollup(self, operation: Callable[[CostRollup], T]) -> T:
+        """Run a totals query against the locked rollup without confirming durability.
+
+        Reporting is not a spend decision: it skips the fsync that
+        ``with_locked_rollup`` requires and never writes the checkpoint, so a
+        read-only ledger still reports its totals.
+        """
+        with self._thread_lock():
+            with self._accounting_locks() as paths:
+                rollup = self._load_idempotency_index(paths=paths, fail_closed=True, checkpoint=False)
+                if rollup is None or rollup.conflicts:
+                    raise CostLedgerIdempotencyConflict("cost ledger contains conflicting idempotency events")
+                return operation(rollup)
 
     def get_total_cost(
         self,
@@ -624,15 +686,42 @@ class CostLedger:
         end_date: datetime | None = None,
         source: str | None = None,
     ) -> float:
-        return sum(e.cost_usd for e in self.get_events(start_date=start_date, end_date=end_date, source=source))
+        source = source or None
+        if end_date is None and (start_date is None or source is None) and _is_utc_midnight(start_date):
+
+            def rollup_total(rollup: CostRollup) -> float:
+                if start_date is not None:
+                    return rollup.total_since(start_date)
+                return rollup.total_usd if source is None else rollup.by_source.get(source, 0.0)
+
+            try:
+                return self._with_reporting_rollup(rollup_total)
+            except (CostLedgerIdempotencyConflict, CostLedgerReadError):
+                pass  # The lenient scan below skips corrupt lines instead of failing.
+        return _total_once_per_key(self.get_events(start_date=start_date, end_date=end_date, source=source))
 
     def has_idempotency_key(self, idempotency_key: str) -> bool:
         """Check an event key across every strict canonical accounting root."""
         if not idempotency_key:
             return False
-        return self.with_locked_accounting_events(
-            lambda events: any(event.idempotency_key == idempotency_key for event in events)
-        )
+        return self.with_locked_rollup(lambda rollup: rollup.has_idempotency_key(idempotency_key))
+
+    def verify_segment_index(self, *, rebuild: bool = False) -> tuple[list[LedgerSegment], list[str]]:
+        """Index new appends, then recheck every segment hash and the hash chain.
+
+        Returns the segments and a list of problems (empty when intact). With
+        ``rebuild`` the index is discarded and rebuilt from the ledger first,
+        which is also how an existing ledger is migrated.
+        """
+        with self._thread_lock():
+            with self._interprocess_lock():
+                if not self.ledger_path.exists():
+                    return [], []
+                try:
+                    segments = self._segments.rebuild() if rebuild else self._segments.refresh()
+                except StaleSegmentIndex as exc:
+                    return read_segment_index(self._segments.index_path), [str(exc)]
+                return segments, self._segments.verify()
 
     def get_health(self) -> dict[str, Any]:
         writable = False
@@ -698,7 +787,7 @@ class CostLedger:
             "event_count": len(events),
             "total_cost_usd": sum(e.cost_usd for e in events),
             "latest_timestamp": events[-1].timestamp.isoformat() if events else None,
-            "idempotency_keys_loaded": len(self._idempotency_keys),
+            "idempotency_keys_loaded": self._idempotency_key_count,
             "error": error,
         }
 
@@ -761,6 +850,50 @@ def _validated_timestamp(value: object) -> datetime:
     return timestamp
 
 
+def _ledger_lines(
+    path: Path,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    segments: SegmentIndex | None,
+) -> list[bytes]:
+    """Lines of ``path``, limited to overlapping monthly segments when indexed."""
+    if segments is not None:
+        try:
+            return list(segments.read_window(start_date, end_date))
+        except (OSError, StaleSegmentIndex) as exc:
+            logger.warning("Cost ledger segment index unusable (%s); rebuilding", type(exc).__name__)
+            try:
+                segments.rebuild()
+            except (OSError, StaleSegmentIndex) as rebuild_error:
+                logger.warning("Cost ledger segment index rebuild failed (%s)", type(rebuild_error).__name__)
+    with open(path, "rb") as ledger_file:
+        return [line for line in (raw.strip() for raw in ledger_file) if line]
+
+
+def _parse_ledger_line(line: bytes) -> CostLedgerEvent:
+    return CostLedgerEvent.from_dict(_loads_strict_json(line.decode("utf-8")))
+
+
+def _total_once_per_key(events: Iterable[CostLedgerEvent]) -> float:
+    """Sum ``events``, counting an idempotency key replayed across ledgers once, as the rollup does."""
+    seen: set[str] = set()
+    total = 0.0
+    for event in events:
+        key = event.idempotency_key
+        if key:
+            if key in seen:
+                continue
+            seen.add(key)
+        total += event.cost_usd
+    return total
+
+
+def _is_utc_midnight(value: datetime | None) -> bool:
+    if value is None:
+        return True
+    return value.tzinfo is not None and value.astimezone(UTC).time() == datetime.min.time()
+
+
 def _same_idempotent_cost_event(existing: CostLedgerEvent, proposed: CostLedgerEvent) -> bool:
     """Compare event identity while ignoring only the append timestamp."""
     return (
@@ -0,0 +1,402 @@
+"""Byte-offset checkpointed rollups of the append-only cost ledger.
+
+Spend admission needs per-day totals and the idempotency key set, not every
+event. A rollup records how far into each ledger file it has read together
+with the totals of everything before that offset, so a refresh parses only
+appended lines. The persisted checkpoint is a cache: it is anchored to the
+file by identity, size and head/tail hashes, and any mismatch discards it for
+a full strict rebuild from byte zero.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time
+from pathlib import Path
+from typing import Any
+
+from deepr.observability.cost_authority import CostLedgerReadError
+from deepr.utils.atomic_io import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_SCHEMA_VERSION = 1
+# Bytes hashed at each end of the consumed prefix to detect rewrites.
+_ANCHOR_BYTES = 64 * 1024
+# Persisting a rollup is O(history); amortize it over this many new events.
+CHECKPOINT_EVERY_EVENTS = 256
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+# key -> [identity_sha256, line_offset, cost_usd, day, source, provider]
+KeyedEntry = list[Any]
+
+
+def identity_sha256(event: Any) -> str:
+    """Digest of the fields an idempotent replay must repeat exactly."""
+    identity = event.to_dict()
+    identity.pop("timestamp", None)
+    identity.pop("idempotency_key", None)
+    payload = json.dumps(identity, sort_keys=True, ensure_ascii=True, separators=(",", ":"), allow_nan=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _utc_day(timestamp: datetime) -> str:
+    return timestamp.astimezone(UTC).date().isoformat()
+
+
+@dataclass
+class LedgerFileRollup:
+    """Totals for one ledger file up to ``offset`` bytes."""
+
+    offset: int = 0
+    device: int = 0
+    inode: int = 0
+    head_sha256: str = _EMPTY_SHA256
+    tail_sha256: str = _EMPTY_SHA256
+    event_count: int = 0
+    total_usd: float = 0.0
+    daily: dict[str, float] = field(default_factory=dict)
+    by_source: dict[str, float] = field(default_factory=dict)
+    by_provider: dict[str, float] = field(default_factory=dict)
+    keyed: dict[str, KeyedEntry] = field(default_factory=dict)
+    conflicts: set[str] = field(default_factory=set)
+
+    def add(self, event: Any) -> None:
+        self._add(event.cost_usd, _utc_day(event.timestamp), event.source, event.provider, 1)
+
+    def _add(self, cost: float, day: str, source: str, provider: str, sign: int) -> None:
+        self.event_count += sign
+        self.total_usd += cost
+        self.daily[day] = self.daily.get(day, 0.0) + cost
+        self.by_source[source] = self.by_source.get(source, 0.0) + cost
+        self.by_provider[provider] = self.by_provider.get(provider, 0.0) + cost
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "offset": self.offset,
+            "device": self.device,
+            "inode": self.inode,
+            "head_sha256": self.head_sha256,
+            "tail_sha256": self.tail_sha256,
+            "event_count": self.event_count,
+            "total_usd": self.total_usd,
+            "daily": self.daily,
+            "by_source": self.by_source,
+            "by_provider": self.by_provider,
+            "keyed": self.keyed,
+            "conflicts": sorted(self.conflicts),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LedgerFileRollup:
+        return cls(
+            offset=int(data["offset"]),
+            device=int(data["device"]),
+            inode=int(data["inode"]),
+            head_sha256=str(data["head_sha256"]),
+            tail_sha256=str(data["tail_sha256"]),
+            event_count=int(data["event_count"]),
+            total_usd=float(data["total_usd"]),
+            daily={str(k): float(v) for k, v in data["daily"].items()},
+            by_source={str(k): float(v) for k, v in data["by_source"].items()},
+            by_provider={str(k): float(v) for k, v in data["by_provider"].items()},
+            keyed={str(k): list(v) for k, v in data["keyed"].items()},
+            conflicts={str(key) for key in data["conflicts"]},
+        )
+
+
+@dataclass(frozen=True)
+class CostRollup:
+    """Deduplicated spend totals across every accounting ledger file.
+
+    Attributes:
+        event_count: Events counted (idempotent replays once)
+        total_usd: Spend across all time
+        daily: UTC day (``YYYY-MM-DD``) -> spend
+        by_source: Event source -> spend
+        by_provider: Provider -> spend
+        conflicts: Idempotency keys reused for materially different events
+    """
+
+    event_count: int
+    total_usd: float
+    daily: Mapping[str, float]
+    by_source: Mapping[str, float]
+    by_provider: Mapping[str, float]
+    conflicts: frozenset[str]
+    _keyed: tuple[Mapping[str, KeyedEntry], ...] = ()
+
+    @property
+    def monthly(self) -> dict[str, float]:
+        """UTC month (``YYYY-MM``) -> spend."""
+        months: dict[str, float] = {}
+        for day, cost in self.daily.items():
+            months[day[:7]] = months.get(day[:7], 0.0) + cost
+        return months
+
+    @property
+    def idempotency_key_count(self) -> int:
+        return len(set().union(*self._keyed)) if len(self._keyed) > 1 else sum(map(len, self._keyed))
+
+    def has_idempotency_key(self, key: str) -> bool:
+        return bool(key) and any(key in keyed for keyed in self._keyed)
+
+    def total_since(self, start: datetime | date) -> float:
+        """Spend on or after ``start``, a date or a UTC-midnight datetime."""
+        if isinstance(start, datetime):
+            if start.tzinfo is None or start.astimezone(UTC).time() != time(0):
+                raise ValueError("rollup totals start at a UTC midnight")
+            start = start.astimezone(UTC).date()
+        first = start.isoformat()
+        return float(sum(cost for day, cost in self.daily.items() if day >= first))
+
+
+def combine_rollups(
+    rollups: list[LedgerFileRollup],
+    same_event: Callable[[int, KeyedEntry, int, KeyedEntry], bool],
+) -> CostRollup:
+    """Merge per-file rollups, counting a key repeated across files once.
+
+    Earlier files win, as in the strict accounting read. ``same_event`` gets
+    ``(file_index, entry, other_file_index, other_entry)`` for keys whose
+    identity digests differ and decides whether they still match.
+    """
+    if len(rollups) == 1:
+        only = rollups[0]
+        return CostRollup(
+            event_count=only.event_count,
+            total_usd=only.total_usd,
+            daily=only.daily,
+            by_source=only.by_source,
+            by_provider=only.by_provider,
+            conflicts=frozenset(only.conflicts),
+            _keyed=(only.keyed,),
+        )
+
+    merged = LedgerFileRollup()
+    conflicts: set[str] = set()
+    for rollup in rollups:
+        merged.event_count += rollup.event_count
+        merged.total_usd += rollup.total_usd
+        for target, source in (
+            (merged.daily, rollup.daily),
+            (merged.by_source, rollup.by_source),
+            (merged.by_provider, rollup.by_provider),
+        ):
+            for name, cost in source.items():
+                target[name] = target.get(name, 0.0) + cost
+        conflicts.update(rollup.conflicts)
+
+    for later_index, later in enumerate(rollups[1:], start=1):
+        for key, entry in later.keyed.items():
+            for earlier_index, earlier in enumerate(rollups[:later_index]):
+                first = earlier.keyed.get(key)
+                if first is None:
+                    continue
+                if first[0] != entry[0] and not same_event(earlier_index, first, later_index, entry):
+                    conflicts.add(key)
+                _digest, _offset, cost, day, source, provider = entry
+                merged._add(-cost, day, source, provider, -1)
+                break
+
+    return CostRollup(
+        event_count=merged.event_count,
+        total_usd=merged.total_usd,
+        daily=merged.daily,
+        by_source=merged.by_source,
+        by_provider=merged.by_provider,
+        conflicts=frozenset(conflicts),
+        _keyed=tuple(rollup.keyed for rollup in rollups),
+    )
+
+
+class RollupStore:
+    """Per-file rollups for one ledger, persisted in one checkpoint file.
+
+    Callers hold the ledger locks for every refresh; the store itself does no
+    locking. A failed refresh drops that file's in-memory rollup so the next
+    refresh starts again from the persisted checkpoint or from byte zero.
+    """
+
+    def __init__(
+        self,
+        checkpoint_path: Path,
+        *,
+        parse_line: Callable[[bytes], Any],
+        same_event: Callable[[Any, Any], bool],
+    ):
+        self.checkpoint_path = checkpoint_path
+        self._parse_line = parse_line
+        self._same_event = same_event
+        self._files: dict[str, LedgerFileRollup] | None = None
+        self._unsaved_events = 0
+
+    def refresh(self, paths: tuple[Path, ...], *, checkpoint: bool = True) -> CostRollup:
+        """Advance each file's rollup to its end and return the merged view.
+
+        With ``checkpoint`` false the advance stays in memory; a later refresh
+        saves it.
+
+        Raises:
+            CostLedgerReadError: A file cannot be read or holds a malformed event
+        """
+        files = self._load()
+        rollups: list[LedgerFileRollup] = []
+        for path in paths:
+            name = str(path.resolve())
+            try:
+                rollup = self._refresh_file(path, files.get(name))
+            except BaseException:
+                files.pop(name, None)
+                raise
+            files[name] = rollup
+            rollups.append(rollup)
+
+        if checkpoint and self._unsaved_events >= CHECKPOINT_EVERY_EVENTS:
+            self.save()
+
+        def same(first_index: int, first: KeyedEntry, second_index: int, second: KeyedEntry) -> bool:
+            return self._same_event(
+                self._event_at(paths[first_index], first[1]),
+                self._event_at(paths[second_index], second[1]),
+            )
+
+        return combine_rollups(rollups or [LedgerFileRollup()], same)
+
+    def event_at(self, path: Path, key: str) -> Any | None:
+        """Read the first event recorded for ``key`` in ``path``, if any."""
+        entry = (self._files or {}).get(str(path.resolve()), LedgerFileRollup()).keyed.get(key)
+        return None if entry is None else self._event_at(path, entry[1])
+
+    def save(self) -> None:
+        """Persist the checkpoint; failures only cost a rebuild later."""
+        if self._files is None:
+            return
+        document = {
+            "schema_version": ROLLUP_SCHEMA_VERSION,
+            "files": {name: rollup.to_dict() for name, rollup in self._files.items()},
+        }
+        try:
+            atomic_write_json(self.checkpoint_path, document, indent=None)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("Cost ledger rollup checkpoint not saved (%s)", type(exc).__name__)
+            return
+        self._unsaved_events = 0
+
+    def _load(self) -> dict[str, LedgerFileRollup]:
+        if self._files is not None:
+            return self._files
+        self._files = {}
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as handle:
+                document = json.load(handle)
+            if document.get("schema_version") == ROLLUP_SCHEMA_VERSION:
+                self._files = {str(name): LedgerFileRollup.from_dict(data) for name, data in document["files"].items()}
+        except FileNotFoundError:
+            pass
+        except (OSError, AttributeError, KeyError, TypeError, ValueError) as exc:
+            logger.warning("Ignoring unreadable cost ledger rollup checkpoint (%s)", type(exc).__name__)
+        return self._files
+
+    def _refresh_file(self, path: Path, rollup: LedgerFileRollup | None) -> LedgerFileRollup:
+        try:
+            with open(path, "rb") as handle:
+                stat = os.fstat(handle.fileno())
+                if rollup is None or not _anchored(handle, stat, rollup):
+                    if rollup is not None:
+                        logger.warning("Cost ledger changed below its rollup checkpoint; rebuilding")
+                    rollup = LedgerFileRollup(device=stat.st_dev, inode=stat.st_ino)
+                start = rollup.offset
+                handle.seek(start)
+                appended = handle.read()
+                for line_offset, line in _lines(appended, start):
+                    self._apply(path, rollup, line_offset, line)
+                if appended:
+                    rollup.offset = start + len(appended)
+                    rollup.head_sha256 = _sha256_range(handle, 0, min(rollup.offset, _ANCHOR_BYTES))
+                    rollup.tail_sha256 = _sha256_range(handle, max(0, rollup.offset - _ANCHOR_BYTES), rollup.offset)
+        except FileNotFoundError:
+            return LedgerFileRollup()
+        except OSError as exc:
+            raise CostLedgerReadError("cost ledger could not be read") from exc
+        return rollup
+
+    def _apply(self, path: Path, rollup: LedgerFileRollup, line_offset: int, line: bytes) -> None:
+        try:
+            event = self._parse_line(line)
+        except (AttributeError, UnicodeDecodeError, json.JSONDecodeError, TypeError, ValueError) as exc:
+            logger.error("Corrupted cost ledger line at byte %d (%s)", line_offset, type(exc).__name__)
+            raise CostLedgerReadError("cost ledger contains a malformed event") from exc
+        key = event.idempotency_key
+        if key:
+            digest = identity_sha256(event)
+            existing = rollup.keyed.get(key)
+            if existing is not None:
+                if existing[0] != digest and not self._same_event(self._event_at(path, existing[1]), event):
+                    rollup.conflicts.add(key)
+                    logger.error("Conflicting cost ledger events reuse one idempotency key")
+                return
+            rollup.keyed[key] = [
+                digest,
+                line_offset,
+                event.cost_usd,
+                _utc_day(event.timestamp),
+                event.source,
+                event.provider,
+            ]
+        rollup.add(event)
+        self._unsaved_events += 1
+
+    def _event_at(self, path: Path, offset: int) -> Any:
+        try:
+            with open(path, "rb") as handle:
+                handle.seek(offset)
+                line = handle.readline()
+        except OSError as exc:
+            raise CostLedgerReadError("cost ledger could not be read") from exc
+        try:
+            return self._parse_line(line.strip())
+        except (AttributeError, UnicodeDecodeError, json.JSONDecodeError, TypeError, ValueError) as exc:
+            raise CostLedgerReadError("cost ledger contains a malformed event") from exc
+
+
+def _anchored(handle: Any, stat: os.stat_result, rollup: LedgerFileRollup) -> bool:
+    """Whether the bytes below the checkpoint still look like the ones it summed."""
+    if stat.st_size < rollup.offset:
+        return False
+    if rollup.inode and (stat.st_dev, stat.st_ino) != (rollup.device, rollup.inode):
+        return False
+    head = _sha256_range(handle, 0, min(rollup.offset, _ANCHOR_BYTES))
+    tail = _sha256_range(handle, max(0, rollup.offset - _ANCHOR_BYTES), rollup.offset)
+    return head == rollup.head_sha256 and tail == rollup.tail_sha256
+
+
+def _sha256_range(handle: Any, start: int, end: int) -> str:
+    handle.seek(start)
+    return hashlib.sha256(handle.read(end - start)).hexdigest()
+
+
+def _lines(data: bytes, base_offset: int) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(absolute_offset, stripped_line)`` for each non-blank line."""
+    position = 0
+    for raw in data.splitlines(keepends=True):
+        line = raw.strip()
+        if line:
+            yield base_offset + position, line
+        position += len(raw)
+
+
+__all__ = [
+    "CHECKPOINT_EVERY_EVENTS",
+    "ROLLUP_SCHEMA_VERSION",
+    "CostRollup",
+    "LedgerFileRollup",
+    "RollupStore",
+    "combine_rollups",
+    "identity_sha256",
+]
@@ -0,0 +1,267 @@
+"""Monthly segment index over the append-only cost ledger.
+
+The canonical ledger stays one append-only ``cost_ledger.jsonl``: the cost
+authority pins it by size and prefix hash, so it cannot be split or
+rewritten. This index partitions it instead. Each segment is a contiguous
+byte range holding one UTC month's appends (capped at ``SEGMENT_MAX_BYTES``)
+with its first/last event timestamps, event count, content hash and a hash
+chain over every earlier segment. Date-bounded reads open only the byte
+ranges whose timestamps overlap the window, plus the unindexed tail.
+
+The index is a compact binary sidecar (``cost_ledger.jsonl.segments``) of
+fixed-size records. It is derived data: a segment whose bytes no longer hash
+to its record invalidates the index, and the read falls back to a full scan.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import struct
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from deepr.utils.atomic_io import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"DCLSEG\x00\x01"
+# start, end, first_ts, last_ts, event_count, yyyymm, sha256, chain_sha256
+_RECORD = struct.Struct("<QQddII32s32s")
+_CHAIN_ROOT = bytes(32)
+# Bound the bytes re-hashed when the open segment grows.
+SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+
+
+class StaleSegmentIndex(Exception):
+    """The index no longer describes the ledger bytes it covers."""
+
+
+@dataclass
+class LedgerSegment:
+    """One contiguous byte range of the ledger.
+
+    Attributes:
+        start: First byte offset
+        end: Byte offset after the last line
+        first_ts: Earliest event timestamp (POSIX seconds; ``inf`` if none)
+        last_ts: Latest event timestamp (POSIX seconds; ``-inf`` if none)
+        event_count: Parseable events in the range
+        month: UTC month of the segment's first line as ``YYYYMM``
+        sha256: Digest of the range's bytes
+        chain_sha256: ``sha256(previous chain + sha256)``
+    """
+
+    start: int
+    end: int
+    first_ts: float
+    last_ts: float
+    event_count: int
+    month: int
+    sha256: bytes
+    chain_sha256: bytes
+
+    def overlaps(self, start: datetime | None, end: datetime | None) -> bool:
+        if start is not None and self.last_ts < start.timestamp():
+            return False
+        return not (end is not None and self.first_ts > end.timestamp())
+
+    def to_bytes(self) -> bytes:
+        return _RECORD.pack(
+            self.start,
+            self.end,
+            self.first_ts,
+            self.last_ts,
+            self.event_count,
+            self.month,
+            self.sha256,
+            self.chain_sha256,
+        )
+
+
+def segment_index_path(ledger_path: Path) -> Path:
+    return ledger_path.with_name(f"{ledger_path.name}.segments")
+
+
+def read_segment_index(index_path: Path) -> list[LedgerSegment]:
+    """Read the binary index; a missing or malformed file reads as empty."""
+    try:
+        data = index_path.read_bytes()
+    except FileNotFoundError:
+        return []
+    except OSError as exc:
+        logger.warning("Cost ledger segment index unreadable (%s)", type(exc).__name__)
+        return []
+    body = data[len(_MAGIC) :]
+    if not data.startswith(_MAGIC) or len(body) % _RECORD.size:
+        logger.warning("Ignoring malformed cost ledger segment index")
+        return []
+    return [LedgerSegment(*_RECORD.unpack_from(body, offset)) for offset in range(0, len(body), _RECORD.size)]
+
+
+def write_segment_index(index_path: Path, segments: list[LedgerSegment]) -> None:
+    atomic_write_bytes(index_path, _MAGIC + b"".join(segment.to_bytes() for segment in segments))
+
+
+class SegmentIndex:
+    """Builds, extends and queries the segment index for one ledger file.
+
+    Callers hold the ledger lock. ``parse_line`` turns one ledger line into
+    an event with a ``timestamp``; lines it rejects stay inside their segment
+    but are not counted, matching the lenient read that skips them.
+    """
+
+    def __init__(self, ledger_path: Path, *, parse_line: Callable[[bytes], Any]):
+        self.ledger_path = ledger_path
+        self.index_path = segment_index_path(ledger_path)
+        self._parse_line = parse_line
+
+    def refresh(self) -> list[LedgerSegment]:
+        """Index complete lines appended since the last refresh and persist."""
+        segments = read_segment_index(self.index_path)
+        indexed_end = segments[-1].end if segments else 0
+        with open(self.ledger_path, "rb") as handle:
+            handle.seek(0, 2)
+            size = handle.tell()
+            if size < indexed_end:
+                segments, indexed_end = [], 0
+            handle.seek(indexed_end)
+            appended = handle.read()
+            complete = appended[: appended.rfind(b"\n") + 1]
+            if not complete:
+                return segments
+            open_segment = segments.pop() if segments else None
+            pending = b""
+            if open_segment is not None:
+                handle.seek(open_segment.start)
+                pending = handle.read(open_segment.end - open_segment.start)
+                if hashlib.sha256(pending).digest() != open_segment.sha256:
+                    raise StaleSegmentIndex("cost ledger segment changed under its index")
+        chain = segments[-1].chain_sha256 if segments else _CHAIN_ROOT
+        segments.extend(self._segments_for(complete, indexed_end, open_segment, pending, chain))
+        write_segment_index(self.index_path, segments)
+        return segments
+
+    def rebuild(self) -> list[LedgerSegment]:
+        """Discard the index and rebuild it from byte zero."""
+        self.index_path.unlink(missing_ok=True)
+        return self.refresh()
+
+    def read_window(self, start: datetime | None, end: datetime | None) -> Iterator[bytes]:
+        """Yield stripped lines from segments overlapping ``[start, end]`` and the unindexed tail.
+
+        Raises:
+            StaleSegmentIndex: An overlapping segment no longer matches its hash
+        """
+        segments = self.refresh()
+        indexed_end = segments[-1].end if segments else 0
+        with open(self.ledger_path, "rb") as handle:
+            for segment in segments:
+                if not segment.overlaps(start, end):
+                    continue
+                handle.seek(segment.start)
+                data = handle.read(segment.end - segment.start)
+                if hashlib.sha256(data).digest() != segment.sha256:
+                    raise StaleSegmentIndex("cost ledger segment changed under its index")
+                yield from _stripped_lines(data)
+            handle.seek(indexed_end)
+            yield from _stripped_lines(handle.read())
+
+    def verify(self) -> list[str]:
+        """Recheck every segment hash, the chain and byte coverage; return problems.
+
+        The chain links each record to the one before it, so an edited,
+        dropped or reordered record breaks it even where the bytes still match.
+        """
+        problems: list[str] = []
+        chain = _CHAIN_ROOT
+        expected_start = 0
+        with open(self.ledger_path, "rb") as handle:
+            for number, segment in enumerate(read_segment_index(self.index_path), start=1):
+                if segment.start != expected_start:
+                    problems.append(f"segment {number} starts at byte {segment.start}, expected {expected_start}")
+                handle.seek(segment.start)
+                digest = hashlib.sha256(handle.read(segment.end - segment.start)).digest()
+                if digest != segment.sha256:
+                    problems.append(f"segment {number} ({_month_label(segment.month)}) content hash mismatch")
+                if hashlib.sha256(chain + segment.sha256).digest() != segment.chain_sha256:
+                    problems.append(f"segment {number} ({_month_label(segment.month)}) hash chain mismatch")
+                chain, expected_start = segment.chain_sha256, segment.end
+        return problems
+
+    def _segments_for(
+        self,
+        data: bytes,
+        base: int,
+        open_segment: LedgerSegment | None,
+        pending: bytes,
+        chain: bytes,
+    ) -> list[LedgerSegment]:
+        built: list[LedgerSegment] = []
+        current = open_segment
+        body = bytearray(pending)
+        position = base
+        for raw in data.splitlines(keepends=True):
+            timestamp, month = self._line_time(raw)
+            if current is not None and (
+                (month and current.month and month != current.month) or len(body) + len(raw) > SEGMENT_MAX_BYTES
+            ):
+                chain = _seal(current, body, chain)
+                built.append(current)
+                current, body = None, bytearray()
+            if current is None:
+                current = LedgerSegment(position, position, math.inf, -math.inf, 0, month, b"", b"")
+            body.extend(raw)
+            position += len(raw)
+            current.end = position
+            current.month = current.month or month
+            if timestamp is not None:
+                current.event_count += 1
+                current.first_ts = min(current.first_ts, timestamp)
+                current.last_ts = max(current.last_ts, timestamp)
+        if current is not None:
+            _seal(current, body, chain)
+            built.append(current)
+        return built
+
+    def _line_time(self, raw: bytes) -> tuple[float | None, int]:
+        line = raw.strip()
+        if not line:
+            return None, 0
+        try:
+            timestamp = self._parse_line(line).timestamp.astimezone(UTC)
+        except Exception:  # Intent: the lenient read skips what this rejects.
+            return None, 0
+        return timestamp.timestamp(), timestamp.year * 100 + timestamp.month
+
+
+def _seal(segment: LedgerSegment, body: bytearray, chain: bytes) -> bytes:
+    segment.sha256 = hashlib.sha256(body).digest()
+    segment.chain_sha256 = hashlib.sha256(chain + segment.sha256).digest()
+    return segment.chain_sha256
+
+
+def _stripped_lines(data: bytes) -> Iterator[bytes]:
+    for raw in data.splitlines():
+        line = raw.strip()
+        if line:
+            yield line
+
+
+def _month_label(month: int) -> str:
+    return f"{month // 100:04d}-{month % 100:02d}" if month else "undated"
+
+
+__all__ = [
+    "SEGMENT_MAX_BYTES",
+    "LedgerSegment",
+    "SegmentIndex",
+    "StaleSegmentIndex",
+    "read_segment_index",
+    "segment_index_path",
+    "write_segment_index",
+]
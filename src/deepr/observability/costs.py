@@ -23,6 +23,7 @@ from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from deepr.observability.cost_aggregator import CostAggregator, _as_utc
 from deepr.observability.cost_ledger import CostLedger
 
 logger = logging.getLogger(__name__)
@@ -32,10 +33,6 @@ def _utc_now() -> datetime:
     return datetime.now(UTC)
 
 
-def _as_utc(value: datetime) -> datetime:
-    return (value if value.tzinfo else value.replace(tzinfo=UTC)).astimezone(UTC)
-
-
 # Configuration constants
 MAX_STORED_ENTRIES = 10000  # Maximum cost entries to persist
 MAX_STORED_ALERTS = 100  # Maximum alerts to persist
@@ -290,201 +287,6 @@ class AlertManager:
         return CostAlert(level=level, threshold=threshold, current_value=current_value, limit=limit, period=period)
 
 
-class CostAggregator:
-    """Handles cost aggregation and breakdown calculations.
-
-    Provides efficient single-pass aggregation for multiple breakdown types.
-    """
-
-    def __init__(self, entries: list[CostEntry]):
-        """Initialize aggregator with entries reference.
-
-        Args:
-            entries: List of cost entries to aggregate
-        """
-        self._entries = entries
-
-    def get_daily_total(self, target_date: date | None = None) -> float:
-        """Get total cost for a day.
-
-        Args:
-            target_date: Date to check (default: today in UTC)
-
-        Returns:
-            Total cost for the day
-        """
-        if target_date is None:
-            target_date = datetime.now(UTC).date()
-
-        return sum(e.cost for e in self._entries if e.date == target_date)
-
-    def get_monthly_total(self, year: int | None = None, month: int | None = None) -> float:
-        """Get total cost for a month.
-
-        Args:
-            year: Year (default: current)
-            month: Month (default: current)
-
-        Returns:
-            Total cost for the month
-        """
-        now = datetime.now(UTC)
-        if year is None:
-            year = now.year
-        if month is None:
-            month = now.month
-
-        return sum(e.cost for e in self._entries if e.date.year == year and e.date.month == month)
-
-    def get_breakdown_by_provider(
-        self, start_date: datetime | None = None, end_date: datetime | None = None
-    ) -> dict[str, float]:
-        """Get cost breakdown by provider.
-
-        Args:
-            start_date: Start of period
-            end_date: End of period
-
-        Returns:
-            Dictionary mapping provider to total cost
-        """
-        entries = self._filter_by_date(start_date, end_date)
-        return self._aggregate_by_field(entries, lambda e: e.provider)
-
-    def get_breakdown_by_operation(
-        self, start_date: datetime | None = None, end_date: datetime | None = None
-    ) -> dict[str, float]:
-        """Get cost breakdown by operation type.
-
-        Args:
-            start_date: Start of period
-            end_date: End of period
-
-        Returns:
-            Dictionary mapping operation to total cost
-        """
-        entries = self._filter_by_date(start_date, end_date)
-        return self._aggregate_by_field(entries, lambda e: e.operation)
-
-    def get_breakdown_by_model(
-        self, start_date: datetime | None = None, end_date: datetime | None = None
-    ) -> dict[str, float]:
-        """Get cost breakdown by model.
-
-        Args:
-            start_date: Start of period
-            end_date: End of period
-
-        Returns:
-            Dictionary mapping model to total cost
-        """
-        entries = self._filter_by_date(start_date, end_date)
-        return self._aggregate_by_field(entries, lambda e: e.model or "unknown")
-
-    def get_all_breakdowns(
-        self, start_date: datetime | None = None, end_date: datetime | None = None
-    ) -> dict[str, dict[str, float]]:
-        """Get all breakdowns in a single pass for efficiency.
-
-        This method iterates through entries once to compute all breakdowns,
-        which is more efficient than calling each breakdown method separately.
-
-        Args:
-            start_date: Start of period
-            end_date: End of period
-
-        Returns:
-            Dictionary with 'by_provider', 'by_operation', 'by_model' keys
-        """
-        entries = self._filter_by_date(start_date, end_date)
-
-        by_provider: dict[str, float] = {}
-        by_operation: dict[str, float] = {}
-        by_model: dict[str, float] = {}
-
-        for entry in entries:
-            # Aggregate by provider
-            if entry.provider not in by_provider:
-                by_provider[entry.provider] = 0.0
-            by_provider[entry.provider] += entry.cost
-
-            # Aggregate by operation
-            if entry.operation not in by_operation:
-                by_operation[entry.operation] = 0.0
-            by_operation[entry.operation] += entry.cost
-
-            # Aggregate by model
-            model = entry.model or "unknown"
-            if model not in by_model:
-                by_model[model] = 0.0
-            by_model[model] += entry.cost
-
-        return {"by_provider": by_provider, "by_operation": by_operation, "by_model": by_model}
-
-    def _filter_by_date(self, start_date: datetime | None, end_date: datetime | None) -> list[CostEntry]:
-        """Filter entries by date range.
-
-        Args:
-            start_date: Start of period (inclusive)
-            end_date: End of period (inclusive)
-
-        Returns:
-            Filtered entries
-        """
-        entries = self._entries
-
-        if start_date:
-            start_date = _as_utc(start_date)
-            entries = [e for e in entries if _as_utc(e.timestamp) >= start_date]
-
-        if end_date:
-            end_date = _as_utc(end_date)
-            entries = [e for e in entries if _as_utc(e.timestamp) <= end_date]
-
-        return entries
-
-    def get_entries_by_expert(self, expert_name: str) -> list[CostEntry]:
-        """Get all cost entries for a specific expert.
-
-        Args:
-            expert_name: Name of the expert to filter by
-
-        Returns:
-            List of matching cost entries
-        """
-        return [e for e in self._entries if e.metadata.get("expert") == expert_name]
-
-    def get_expert_breakdown(self, expert_name: str) -> dict[str, float]:
-        """Get cost breakdown by operation type for a specific expert.
-
-        Args:
-            expert_name: Name of the expert
-
-        Returns:
-            Dictionary mapping operation type to total cost
-        """
-        entries = self.get_entries_by_expert(expert_name)
-        return self._aggregate_by_field(entries, lambda e: e.operation)
-
-    def _aggregate_by_field(self, entries: list[CostEntry], key_func) -> dict[str, float]:
-        """Aggregate costs by a field extracted via key function.
-
-        Args:
-            entries: Entries to aggregate
-            key_func: Function to extract grouping key from entry
-
-        Returns:
-            Dictionary mapping key to total cost
-        """
-        breakdown: dict[str, float] = {}
-        for entry in entries:
-            key = key_func(entry)
-            if key not in breakdown:
-                breakdown[key] = 0.0
-            breakdown[key] += entry.cost
-        return breakdown
-
-
 class CostDashboard:
     """Dashboard for cost tracking and alerts.
 
@@ -620,7 +422,7 @@ class CostDashboard:
             metadata=metadata or {},
         )
 
-        self.entries.append(entry)
+        self.aggregator.add(entry)
         self._record_ledger_event(entry)
         self._save()
 
@@ -751,23 +553,20 @@ class CostDashboard:
         Returns:
             List of daily summaries
         """
-        history = []
+        if days <= 0:
+            return []
         today = datetime.now(UTC).date()
+        totals = self.aggregator.get_daily_totals(today - timedelta(days=days - 1), today)
 
-        for i in range(days):
-            target_date = today - timedelta(days=i)
-            total = self.get_daily_total(target_date)
-
-            history.append(
-                {
-                    "date": target_date.isoformat(),
-                    "total": total,
-                    "limit": self.daily_limit,
-                    "utilization": total / self.daily_limit if self.daily_limit > 0 else 0,
-                }
-            )
-
-        return list(reversed(history))
+        return [
+            {
+                "date": target_date.isoformat(),
+                "total": total,
+                "limit": self.daily_limit,
+                "utilization": total / self.daily_limit if self.daily_limit > 0 else 0,
+            }
+            for target_date, total in totals.items()
+        ]
 
     def get_summary(self) -> dict[str, Any]:
         """Get cost summary using efficient single-pass aggregation.
@@ -1064,7 +863,7 @@ class BufferedCostDashboard(CostDashboard):
         with self._lock:
             # Add to buffer and entries list
             self._buffer.append(entry)
-            self.entries.append(entry)
+            self.aggregator.add(entry)
 
             # Check if flush is needed based on buffer size or time interval
             should_flush = len(self._buffer) >= self.buffer_size or self._time_since_flush() >= self.flush_interval
@@ -40,6 +40,7 @@ class ServiceBusQueue(QueueBackend):
         report_paths: dict[str, str],
         cost: float | None = None,
         tokens_used: int | None = None,
+        report_text: str | None = None,
     ) -> bool:
         raise NotImplementedError()
 
@@ -49,9 +50,22 @@ class ServiceBusQueue(QueueBackend):
         tenant_id: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        *,
+        search: str | None = None,
+        sort_by: str = "submitted_at",
+        cursor: str | None = None,
     ) -> list[ResearchJob]:
         raise NotImplementedError()
 
+    async def count_jobs(
+        self,
+        status: JobStatus | None = None,
+        tenant_id: str | None = None,
+        *,
+        search: str | None = None,
+    ) -> int:
+        raise NotImplementedError()
+
     async def cancel_job(self, job_id: str) -> bool:
         raise NotImplementedError()
 
@@ -1,5 +1,8 @@
 """Abstract base classes for queue backends."""
 
+import base64
+import binascii
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
@@ -47,6 +50,54 @@ def public_job_metadata(value: object) -> dict[str, Any]:
     return {key: item for key, item in value.items() if key not in _INTERNAL_JOB_METADATA_KEYS}
 
 
+# Characters of report text kept on the job row for result listings.
+RESULT_PREVIEW_CHARS = 500
+
+# Orders accepted by ``QueueBackend.list_jobs``. ``model`` pages A-Z; the
+# others page newest (or most expensive) first. Ties break on job ID.
+JOB_SORT_KEYS = ("submitted_at", "completed_at", "cost", "model")
+
+
+def summarize_report(content: str) -> tuple[str, int]:
+    """Return the listing preview and a rough citation count (URLs) for a report."""
+    return content[:RESULT_PREVIEW_CHARS], content.count("http")
+
+
+def _job_sort_value(job: "ResearchJob", sort_by: str) -> str | float:
+    if sort_by == "completed_at":
+        return (job.completed_at or job.submitted_at).isoformat()
+    if sort_by == "cost":
+        return float(job.cost or 0)
+    if sort_by == "model":
+        return job.model
+    return job.submitted_at.isoformat()
+
+
+def encode_job_cursor(job: "ResearchJob", sort_by: str = "submitted_at") -> str:
+    """Return the keyset cursor for the page that follows ``job``."""
+    if sort_by not in JOB_SORT_KEYS:
+        raise ValueError(f"Unsupported sort key: {sort_by}")
+    raw = json.dumps([sort_by, _job_sort_value(job, sort_by), job.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_job_cursor(cursor: str, sort_by: str) -> tuple[str | float, str]:
+    """Return the ``(sort value, job ID)`` a cursor resumes after.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort key
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, value, job_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as exc:
+        raise ValueError("Malformed job cursor") from exc
+    expected = (int, float) if sort_by == "cost" else str
+    if cursor_sort != sort_by or not isinstance(job_id, str) or not isinstance(value, expected):
+        raise ValueError("Job cursor does not match the requested sort")
+    return value, job_id
+
+
 def _utc_now() -> datetime:
     """Return current UTC time (timezone-aware)."""
     return datetime.now(UTC)
@@ -94,6 +145,8 @@ class ResearchJob:
     report_paths: dict[str, str] = field(default_factory=dict)
     cost: float | None = None
     tokens_used: int | None = None
+    result_preview: str | None = None  # First RESULT_PREVIEW_CHARS of the report
+    citations_count: int | None = None  # None until a report summary is stored
 
     # Metadata
     tenant_id: str | None = None
@@ -201,6 +254,7 @@ class QueueBackend(ABC):
         report_paths: dict[str, str],
         cost: float | None = None,
         tokens_used: int | None = None,
+        report_text: str | None = None,
     ) -> bool:
         """
         Update job results.
@@ -210,6 +264,8 @@ class QueueBackend(ABC):
             report_paths: Dict mapping format to storage path
             cost: Total cost
             tokens_used: Total tokens consumed
+            report_text: Report content; its preview and citation count are
+                stored on the job so listings never re-read the report
 
         Returns:
             True if update successful
@@ -223,6 +279,10 @@ class QueueBackend(ABC):
         tenant_id: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        *,
+        search: str | None = None,
+        sort_by: str = "submitted_at",
+        cursor: str | None = None,
     ) -> list[ResearchJob]:
         """
         List jobs with optional filtering.
@@ -231,13 +291,58 @@ class QueueBackend(ABC):
             status: Filter by status
             tenant_id: Filter by tenant (for multi-tenancy)
             limit: Maximum results
-            offset: Pagination offset
+            offset: Pagination offset (applied after ``cursor``)
+            search: Case-insensitive substring the prompt must contain
+            sort_by: One of ``JOB_SORT_KEYS``
+            cursor: ``encode_job_cursor`` of the previous page's last job;
+                only jobs after it are returned
 
         Returns:
             List of jobs
+
+        Raises:
+            ValueError: If ``sort_by`` or ``cursor`` is invalid
         """
         pass
 
+    @abstractmethod
+    async def count_jobs(
+        self,
+        status: JobStatus | None = None,
+        tenant_id: str | None = None,
+        *,
+        search: str | None = None,
+    ) -> int:
+        """
+        Count the jobs ``list_jobs`` would page through with these filters.
+
+        Args:
+            status: Filter by status
+            tenant_id: Filter by tenant (for multi-tenancy)
+            search: Case-insensitive substring the prompt must contain
+
+        Returns:
+            Number of matching jobs
+        """
+        pass
+
+    async def store_result_summary(self, job_id: str, report_text: str) -> bool:
+        """
+        Store a report's listing preview and citation count on a job that has none.
+
+        Rows completed before previews were stored call this the first time a
+        listing reads their report. Backends that cannot store the summary
+        keep this default and return False.
+
+        Args:
+            job_id: Job identifier
+            report_text: Report content
+
+        Returns:
+            True if the summary was stored
+        """
+        return False
+
     @abstractmethod
     async def cancel_job(self, job_id: str) -> bool:
         """
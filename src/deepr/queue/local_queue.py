@@ -4,19 +4,26 @@ import asyncio
 import json
 import logging
 import math
+import os
 import sqlite3
+import threading
+import weakref
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, TypeVar, cast
 
 from deepr.observability.costs import CostDashboard
 
-from .base import JobStatus, QueueBackend, ResearchJob
+from .base import JobStatus, QueueBackend, ResearchJob, summarize_report
+from .sqlite_listing import LISTING_INDEXES, build_count_query, build_list_query, ensure_prompt_search
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# UPDATE ... RETURNING lets dequeue claim a job in one statement.
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 
 def _safe_json_loads(data: str | None, default: T, context: str = "") -> T:
     """Safely parse JSON with fallback to default value."""
@@ -41,8 +48,27 @@ def _validate_result_usage(cost: float | None, tokens_used: int | None) -> None:
         raise ValueError("tokens_used must be a non-negative integer or None")
 
 
+def _close_connections(connections: list[tuple[threading.Thread, sqlite3.Connection]], lock: threading.Lock) -> None:
+    """Close and forget every pooled connection.
+
+    Module-level so ``weakref.finalize`` can call it without keeping the queue
+    alive.
+    """
+    with lock:
+        drained = [conn for _, conn in connections]
+        connections.clear()
+    for conn in drained:
+        conn.close()
+
+
 class SQLiteQueue(QueueBackend):
-    """SQLite-based queue implementation for local development."""
+    """SQLite-based queue implementation for local development.
+
+    Connections are pooled per thread. They are released by ``close()``, by
+    leaving a ``with`` block, or when the queue is garbage collected; a
+    connection whose thread has exited is closed the next time another thread
+    opens one.
+    """
 
     def __init__(self, db_path: str | Path | None = None) -> None:
         """
@@ -59,8 +85,53 @@ class SQLiteQueue(QueueBackend):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._cost_dashboard: CostDashboard | None = None
+        # One connection per thread (asyncio.to_thread reuses pool threads),
+        # so PRAGMAs and sqlite3's statement cache survive between calls.
+        self._local = threading.local()
+        self._connections: list[tuple[threading.Thread, sqlite3.Connection]] = []
+        self._connections_lock = threading.Lock()
+        # The CLI and services create queues freely and rarely close them.
+        weakref.finalize(self, _close_connections, self._connections, self._connections_lock)
+        self._prompt_search = False
         self._init_db()
 
+    def _open_conn(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection PRAGMAs applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+        except sqlite3.DatabaseError:
+            pass
+        return conn
+
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's pooled connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = self._open_conn()
+            self._local.conn, self._local.pid = conn, os.getpid()
+            with self._connections_lock:
+                # to_thread workers come and go; their connections outlive them.
+                orphaned = [old for thread, old in self._connections if not thread.is_alive()]
+                self._connections[:] = [(thread, old) for thread, old in self._connections if thread.is_alive()]
+                self._connections.append((threading.current_thread(), conn))
+            for old in orphaned:
+                old.close()
+        return conn
+
+    def close(self) -> None:
+        """Close every pooled connection; later calls open fresh ones."""
+        self._local = threading.local()
+        _close_connections(self._connections, self._connections_lock)
+
+    def __enter__(self) -> "SQLiteQueue":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def _get_cost_dashboard(self) -> CostDashboard:
         """Get or create lazily initialized cost dashboard instance."""
         if self._cost_dashboard is None:
@@ -152,19 +223,17 @@ class SQLiteQueue(QueueBackend):
 
     def _init_db(self) -> None:
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         # Concurrent reader/writer protection. The web app's request
         # handlers and the background poller hit this DB from different
         # threads; without WAL the default rollback-journal mode blocks
         # readers during every write, producing visible UI stalls and
         # "database is locked" errors. ``synchronous=NORMAL`` keeps WAL
         # crash-safe within a power-loss window while halving fsync
-        # overhead. PRAGMAs apply per-connection so they're also set in
-        # ``_open_conn`` below.
+        # overhead. WAL is a property of the database file, so it is set
+        # once here; the per-connection PRAGMAs are set in ``_open_conn``.
         try:
             conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA foreign_keys=ON")
         except sqlite3.DatabaseError:
             pass
         cursor = conn.cursor()
@@ -195,6 +264,8 @@ class SQLiteQueue(QueueBackend):
                 report_paths TEXT,  -- JSON object
                 cost REAL,
                 tokens_used INTEGER,
+                result_preview TEXT,
+                citations_count INTEGER,
 
                 tenant_id TEXT,
                 workspace_id TEXT,
@@ -208,11 +279,18 @@ class SQLiteQueue(QueueBackend):
             )
         """)
 
-        # Indexes for performance
+        # Indexes for performance. The claim index carries ``id`` so the
+        # dequeue subquery is answered from the index alone; it supersedes
+        # the older (status, priority, submitted_at) index.
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_status_priority
-            ON research_queue(status, priority DESC, submitted_at ASC)
+            CREATE INDEX IF NOT EXISTS idx_claim
+            ON research_queue(status, priority DESC, submitted_at ASC, id)
         """)
+        cursor.execute("DROP INDEX IF EXISTS idx_status_priority")
+
+        # One index per list_jobs sort key, so pages walk an index in order.
+        for index_sql in LISTING_INDEXES:
+            cursor.execute(index_sql)
 
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_tenant
@@ -239,6 +317,8 @@ class SQLiteQueue(QueueBackend):
             ("auto_routed", "ALTER TABLE research_queue ADD COLUMN auto_routed INTEGER DEFAULT 0"),
             ("routing_decision", "ALTER TABLE research_queue ADD COLUMN routing_decision TEXT"),
             ("batch_id", "ALTER TABLE research_queue ADD COLUMN batch_id TEXT"),
+            ("result_preview", "ALTER TABLE research_queue ADD COLUMN result_preview TEXT"),
+            ("citations_count", "ALTER TABLE research_queue ADD COLUMN citations_count INTEGER"),
         ]
         for col_name, alter_sql in _migrations:
             try:
@@ -248,8 +328,8 @@ class SQLiteQueue(QueueBackend):
                 cursor.execute(alter_sql)
                 conn.commit()
 
+        self._prompt_search = ensure_prompt_search(conn)
         conn.commit()
-        conn.close()
 
     def _job_to_dict(self, job: ResearchJob) -> dict[str, Any]:
         """Convert job to dictionary for storage."""
@@ -274,6 +354,8 @@ class SQLiteQueue(QueueBackend):
             "report_paths": json.dumps(job.report_paths),
             "cost": job.cost,
             "tokens_used": job.tokens_used,
+            "result_preview": job.result_preview,
+            "citations_count": job.citations_count,
             "tenant_id": job.tenant_id,
             "workspace_id": job.workspace_id,
             "submitted_by": job.submitted_by,
@@ -309,6 +391,8 @@ class SQLiteQueue(QueueBackend):
             report_paths=_safe_json_loads(row["report_paths"], {}, f"job {job_id} report_paths"),
             cost=row["cost"],
             tokens_used=row["tokens_used"],
+            result_preview=row.get("result_preview"),
+            citations_count=row.get("citations_count"),
             tenant_id=row["tenant_id"],
             workspace_id=row["workspace_id"],
             submitted_by=row["submitted_by"],
@@ -327,7 +411,7 @@ class SQLiteQueue(QueueBackend):
 
     def _enqueue_sync(self, job: ResearchJob) -> None:
         """Synchronous enqueue operation."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         try:
             cursor = conn.cursor()
 
@@ -345,33 +429,49 @@ class SQLiteQueue(QueueBackend):
         except Exception:
             conn.rollback()
             raise
-        finally:
-            conn.close()
 
     async def dequeue(self, worker_id: str) -> ResearchJob | None:
         """Get next job from queue (highest priority, oldest first)."""
         return await asyncio.to_thread(self._dequeue_sync, worker_id)
 
     def _dequeue_sync(self, worker_id: str) -> ResearchJob | None:
-        """Synchronous dequeue operation."""
-        conn = sqlite3.connect(self.db_path)
+        """Synchronous dequeue: claim the highest-priority, oldest queued job."""
+        conn = self._conn()
+        started_at = datetime.now(UTC).isoformat()
         try:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            if _SUPPORTS_RETURNING:
+                # One statement selects and claims, so two workers can never
+                # both see the same queued row.
+                rows = conn.execute(
+                    """
+                    UPDATE research_queue
+                    SET status = 'processing',
+                        worker_id = ?,
+                        started_at = ?,
+                        attempts = attempts + 1
+                    WHERE id = (
+                        SELECT id FROM research_queue
+                        WHERE status = 'queued'
+                        ORDER BY priority DESC, submitted_at ASC
+                        LIMIT 1
+                    ) AND status = 'queued'
+                    RETURNING *
+                """,
+                    (worker_id, started_at),
+                ).fetchall()
+                conn.commit()
+                return self._dict_to_job(dict(rows[0])) if rows else None
 
-            # Select job with highest priority
+            cursor = conn.cursor()
             cursor.execute("""
-                SELECT * FROM research_queue
+                SELECT id FROM research_queue
                 WHERE status = 'queued'
                 ORDER BY priority DESC, submitted_at ASC
                 LIMIT 1
             """)
-
             row = cursor.fetchone()
-
             if not row:
                 return None
-
             job_id = row["id"]
 
             # Claim the job (atomic update)
@@ -384,25 +484,19 @@ class SQLiteQueue(QueueBackend):
                     attempts = attempts + 1
                 WHERE id = ? AND status = 'queued'
             """,
-                (worker_id, datetime.now(UTC).isoformat(), job_id),
+                (worker_id, started_at, job_id),
             )
-
             if cursor.rowcount == 0:
                 # Job was claimed by another worker
+                conn.rollback()
                 return None
-
             conn.commit()
 
-            # Fetch updated job
             cursor.execute("SELECT * FROM research_queue WHERE id = ?", (job_id,))
-            row = cursor.fetchone()
-
-            return self._dict_to_job(dict(row))
+            return self._dict_to_job(dict(cursor.fetchone()))
         except Exception:
             conn.rollback()
             raise
-        finally:
-            conn.close()
 
     async def get_job(self, job_id: str) -> ResearchJob | None:
         """Get job by ID."""
@@ -410,8 +504,7 @@ class SQLiteQueue(QueueBackend):
 
     def _get_job_sync(self, job_id: str) -> ResearchJob | None:
         """Synchronous get job operation. Supports partial ID matching."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
 
         # Try exact match first
@@ -436,14 +529,11 @@ class SQLiteQueue(QueueBackend):
                 # ``return None`` silently looked identical to a missing
                 # job; cancel / status flows treated it as no-op.
                 matched_ids = [r["id"] for r in rows[:5]]
-                conn.close()
                 raise ValueError(
                     f"Ambiguous job-id prefix {job_id!r} matches {len(rows)} jobs "
                     f"(e.g., {matched_ids}); supply more characters."
                 )
 
-        conn.close()
-
         if not row:
             return None
 
@@ -464,7 +554,7 @@ class SQLiteQueue(QueueBackend):
         return await asyncio.to_thread(self._claim_submission_sync, job_id)
 
     def _claim_submission_sync(self, job_id: str) -> bool:
-        connection = sqlite3.connect(self.db_path)
+        connection = self._conn()
         try:
             cursor = connection.execute(
                 """
@@ -484,15 +574,13 @@ class SQLiteQueue(QueueBackend):
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
 
     async def cancel_queued_submission(self, job_id: str) -> bool:
         """Atomically cancel a job only while provider submission is unclaimed."""
         return await asyncio.to_thread(self._cancel_queued_submission_sync, job_id)
 
     def _cancel_queued_submission_sync(self, job_id: str) -> bool:
-        connection = sqlite3.connect(self.db_path)
+        connection = self._conn()
         try:
             cursor = connection.execute(
                 """
@@ -512,14 +600,12 @@ class SQLiteQueue(QueueBackend):
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
 
     def _update_status_sync(
         self, job_id: str, status: JobStatus, error: str | None, provider_job_id: str | None
     ) -> bool:
         """Synchronous status update. Terminal rows are left unchanged."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         try:
             cursor = conn.cursor()
 
@@ -566,8 +652,6 @@ class SQLiteQueue(QueueBackend):
         except Exception:
             conn.rollback()
             raise
-        finally:
-            conn.close()
 
     async def update_results(
         self,
@@ -575,13 +659,19 @@ class SQLiteQueue(QueueBackend):
         report_paths: dict[str, str],
         cost: float | None = None,
         tokens_used: int | None = None,
+        report_text: str | None = None,
     ) -> bool:
         """Update job results."""
         _validate_result_usage(cost, tokens_used)
-        return await asyncio.to_thread(self._update_results_sync, job_id, report_paths, cost, tokens_used)
+        return await asyncio.to_thread(self._update_results_sync, job_id, report_paths, cost, tokens_used, report_text)
 
     def _update_results_sync(
-        self, job_id: str, report_paths: dict[str, str], cost: float | None, tokens_used: int | None
+        self,
+        job_id: str,
+        report_paths: dict[str, str],
+        cost: float | None,
+        tokens_used: int | None,
+        report_text: str | None = None,
     ) -> bool:
         """Synchronous results update.
 
@@ -594,7 +684,7 @@ class SQLiteQueue(QueueBackend):
         an entry for a row that didn't land - far less harmful than the
         inverse, and idempotency_key prevents a retry from double-billing.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         try:
             cursor = conn.cursor()
             cursor.execute("SELECT provider, model, cost FROM research_queue WHERE id = ?", (job_id,))
@@ -617,13 +707,16 @@ class SQLiteQueue(QueueBackend):
             if ledger_recorded is None:
                 return False
 
+            preview, citations = summarize_report(report_text) if report_text is not None else (None, None)
             cursor.execute(
                 """
                 UPDATE research_queue
-                SET report_paths = ?, cost = ?, tokens_used = ?
+                SET report_paths = ?, cost = ?, tokens_used = ?,
+                    result_preview = COALESCE(?, result_preview),
+                    citations_count = COALESCE(?, citations_count)
                 WHERE id = ?
             """,
-                (json.dumps(report_paths), cost, tokens_used, job_id),
+                (json.dumps(report_paths), cost, tokens_used, preview, citations, job_id),
             )
 
             success = cursor.rowcount > 0
@@ -639,8 +732,6 @@ class SQLiteQueue(QueueBackend):
         except Exception:
             conn.rollback()
             raise
-        finally:
-            conn.close()
 
     async def list_jobs(
         self,
@@ -648,39 +739,36 @@ class SQLiteQueue(QueueBackend):
         tenant_id: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        *,
+        search: str | None = None,
+        sort_by: str = "submitted_at",
+        cursor: str | None = None,
     ) -> list[ResearchJob]:
-        """List jobs with filtering."""
-        return await asyncio.to_thread(self._list_jobs_sync, status, tenant_id, limit, offset)
+        """List jobs with filtering, in ``sort_by`` order, after ``cursor``."""
+        query, params = build_list_query(
+            status, tenant_id, limit, offset, search=search, sort_by=sort_by, cursor=cursor, fts=self._prompt_search
+        )
+        return await asyncio.to_thread(self._list_jobs_sync, query, params)
 
-    def _list_jobs_sync(
-        self, status: JobStatus | None, tenant_id: str | None, limit: int, offset: int
-    ) -> list[ResearchJob]:
+    def _list_jobs_sync(self, query: str, params: list[Any]) -> list[ResearchJob]:
         """Synchronous list jobs."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            query = "SELECT * FROM research_queue WHERE 1=1"
-            params: list[Any] = []
-
-            if status:
-                query += " AND status = ?"
-                params.append(status.value)
-
-            if tenant_id:
-                query += " AND tenant_id = ?"
-                params.append(tenant_id)
-
-            query += " ORDER BY submitted_at DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
+        rows = self._conn().execute(query, params).fetchall()
+        return [self._dict_to_job(dict(row)) for row in rows]
 
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+    async def count_jobs(
+        self,
+        status: JobStatus | None = None,
+        tenant_id: str | None = None,
+        *,
+        search: str | None = None,
+    ) -> int:
+        """Count jobs matching the ``list_jobs`` filters."""
+        query, params = build_count_query(status, tenant_id, search=search, fts=self._prompt_search)
+        return await asyncio.to_thread(self._count_jobs_sync, query, params)
 
-            return [self._dict_to_job(dict(row)) for row in rows]
-        finally:
-            conn.close()
+    def _count_jobs_sync(self, query: str, params: list[Any]) -> int:
+        """Synchronous count jobs."""
+        return int(self._conn().execute(query, params).fetchone()[0])
 
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a job."""
@@ -691,7 +779,7 @@ class SQLiteQueue(QueueBackend):
         return await asyncio.to_thread(self._cancel_active_job_sync, job_id)
 
     def _cancel_active_job_sync(self, job_id: str) -> bool:
-        connection = sqlite3.connect(self.db_path)
+        connection = self._conn()
         try:
             cursor = connection.execute(
                 """
@@ -712,15 +800,34 @@ class SQLiteQueue(QueueBackend):
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
+
+    async def store_result_summary(self, job_id: str, report_text: str) -> bool:
+        """Store a report preview on a row that has none."""
+        return await asyncio.to_thread(self._store_result_summary_sync, job_id, report_text)
+
+    def _store_result_summary_sync(self, job_id: str, report_text: str) -> bool:
+        preview, citations = summarize_report(report_text)
+        connection = self._conn()
+        try:
+            cursor = connection.execute(
+                """
+                UPDATE research_queue SET result_preview = ?, citations_count = ?
+                WHERE id = ? AND result_preview IS NULL
+            """,
+                (preview, citations, job_id),
+            )
+            connection.commit()
+            return cursor.rowcount == 1
+        except Exception:
+            connection.rollback()
+            raise
 
     async def clear_cleanup_metadata(self, job_id: str) -> bool:
         """Atomically clear provider resource IDs after confirmed cleanup."""
         return await asyncio.to_thread(self._clear_cleanup_metadata_sync, job_id)
 
     def _clear_cleanup_metadata_sync(self, job_id: str) -> bool:
-        connection = sqlite3.connect(self.db_path)
+        connection = self._conn()
         try:
             row = connection.execute("SELECT metadata FROM research_queue WHERE id = ?", (job_id,)).fetchone()
             if row is None:
@@ -737,8 +844,6 @@ class SQLiteQueue(QueueBackend):
         except Exception:
             connection.rollback()
             raise
-        finally:
-            connection.close()
 
     async def get_queue_stats(self) -> dict[str, Any]:
         """Get queue statistics."""
@@ -746,31 +851,28 @@ class SQLiteQueue(QueueBackend):
 
     def _get_stats_sync(self) -> dict[str, Any]:
         """Synchronous stats calculation."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
+        conn = self._conn()
+        cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT status, COUNT(*) as count
-                FROM research_queue
-                GROUP BY status
-            """)
+        cursor.execute("""
+            SELECT status, COUNT(*) as count
+            FROM research_queue
+            GROUP BY status
+        """)
 
-            stats = {row[0]: row[1] for row in cursor.fetchall()}
+        stats = {row[0]: row[1] for row in cursor.fetchall()}
 
-            cursor.execute("SELECT COUNT(*) FROM research_queue")
-            total = cursor.fetchone()[0]
+        cursor.execute("SELECT COUNT(*) FROM research_queue")
+        total = cursor.fetchone()[0]
 
-            return {
-                "total": total,
-                "by_status": stats,
-                "queued": stats.get("queued", 0),
-                "processing": stats.get("processing", 0),
-                "completed": stats.get("completed", 0),
-                "failed": stats.get("failed", 0),
-            }
-        finally:
-            conn.close()
+        return {
+            "total": total,
+            "by_status": stats,
+            "queued": stats.get("queued", 0),
+            "processing": stats.get("processing", 0),
+            "completed": stats.get("completed", 0),
+            "failed": stats.get("failed", 0),
+        }
 
     async def cleanup_old_jobs(self, days: int = 30) -> int:
         """Remove old completed/failed jobs."""
@@ -778,7 +880,7 @@ class SQLiteQueue(QueueBackend):
 
     def _cleanup_sync(self, days: int) -> int:
         """Synchronous cleanup."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         try:
             cursor = conn.cursor()
 
@@ -804,5 +906,3 @@ class SQLiteQueue(QueueBackend):
         except Exception:
             conn.rollback()
             raise
-        finally:
-            conn.close()
@@ -0,0 +1,141 @@
+"""Filtered, keyset-paginated job listing for the SQLite queue.
+
+``list_jobs`` filters by status, tenant and prompt text in SQL and pages with
+a keyset cursor: each page starts strictly after the ``(sort value, id)`` of
+the previous page's last row, so the cost of a page does not grow with its
+depth. Every sort key has an index led by ``status``, so listing one status
+walks the index in order and stops after ``limit`` rows.
+
+Prompt search uses an FTS5 table with the trigram tokenizer, kept in step
+with ``research_queue`` by triggers. Trigrams give case-insensitive
+substring matches, the same semantics as the old in-Python filter. A
+search starts from the FTS matches and sorts them. Searches shorter than
+three characters (which trigrams cannot match) and SQLite builds without
+FTS5 fall back to a scan with ``instr``.
+"""
+
+import sqlite3
+from typing import Any
+
+from .base import JobStatus, decode_job_cursor
+
+# Sort key -> (SQL expression, direction). The expressions match the
+# indexes below and the values ``encode_job_cursor`` records.
+_SORT_SQL = {
+    "submitted_at": ("submitted_at", "DESC"),
+    "completed_at": ("COALESCE(completed_at, submitted_at)", "DESC"),
+    "cost": ("COALESCE(cost, 0)", "DESC"),
+    "model": ("model", "ASC"),
+}
+
+LISTING_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_submitted_at ON research_queue(submitted_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_status_submitted_at ON research_queue(status, submitted_at, id)",
+    """CREATE INDEX IF NOT EXISTS idx_status_completed_at
+       ON research_queue(status, COALESCE(completed_at, submitted_at), id)""",
+    "CREATE INDEX IF NOT EXISTS idx_status_cost ON research_queue(status, COALESCE(cost, 0), id)",
+    "CREATE INDEX IF NOT EXISTS idx_status_model ON research_queue(status, model, id)",
+)
+
+_FTS_MIN_CHARS = 3
+_FTS_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS research_queue_fts_ai AFTER INSERT ON research_queue BEGIN
+        INSERT INTO research_queue_fts(rowid, prompt) VALUES (new.rowid, new.prompt);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS research_queue_fts_ad AFTER DELETE ON research_queue BEGIN
+        INSERT INTO research_queue_fts(research_queue_fts, rowid, prompt) VALUES ('delete', old.rowid, old.prompt);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS research_queue_fts_au AFTER UPDATE OF prompt ON research_queue BEGIN
+        INSERT INTO research_queue_fts(research_queue_fts, rowid, prompt) VALUES ('delete', old.rowid, old.prompt);
+        INSERT INTO research_queue_fts(rowid, prompt) VALUES (new.rowid, new.prompt);
+    END""",
+)
+
+
+def ensure_prompt_search(conn: sqlite3.Connection) -> bool:
+    """Create the prompt search table and its triggers; return False without FTS5.
+
+    A newly created table is filled from the existing rows.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", ("research_queue_fts",)
+    ).fetchone()
+    if not exists:
+        try:
+            conn.execute(
+                "CREATE VIRTUAL TABLE research_queue_fts USING fts5("
+                "prompt, content='research_queue', content_rowid='rowid', tokenize='trigram')"
+            )
+        except sqlite3.OperationalError:
+            return False
+        conn.execute("INSERT INTO research_queue_fts(research_queue_fts) VALUES ('rebuild')")
+    for trigger in _FTS_TRIGGERS:
+        conn.execute(trigger)
+    return True
+
+
+def _where(
+    status: JobStatus | None, tenant_id: str | None, search: str | None, fts: bool
+) -> tuple[list[str], list[Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    use_fts = fts and search is not None and len(search) >= _FTS_MIN_CHARS
+    # With a text search, the unary + keeps the planner from walking the
+    # status index and probing every row: it starts from the (usually few)
+    # FTS matches and sorts them instead.
+    unindexed = "+" if use_fts else ""
+    if status:
+        clauses.append(f"{unindexed}status = ?")
+        params.append(status.value)
+    if tenant_id:
+        clauses.append(f"{unindexed}tenant_id = ?")
+        params.append(tenant_id)
+    if use_fts and search is not None:
+        clauses.append("rowid IN (SELECT rowid FROM research_queue_fts WHERE research_queue_fts MATCH ?)")
+        params.append('"' + search.replace('"', '""') + '"')
+    elif search:
+        clauses.append("instr(lower(prompt), ?) > 0")
+        params.append(search.lower())
+    return clauses, params
+
+
+def build_list_query(
+    status: JobStatus | None,
+    tenant_id: str | None,
+    limit: int,
+    offset: int,
+    *,
+    search: str | None,
+    sort_by: str,
+    cursor: str | None,
+    fts: bool,
+) -> tuple[str, list[Any]]:
+    """Return the SELECT and parameters for one ``list_jobs`` page.
+
+    Raises:
+        ValueError: If ``sort_by`` or ``cursor`` is invalid
+    """
+    if sort_by not in _SORT_SQL:
+        raise ValueError(f"Unsupported sort key: {sort_by}")
+    expression, direction = _SORT_SQL[sort_by]
+    clauses, params = _where(status, tenant_id, search, fts)
+    if cursor:
+        value, job_id = decode_job_cursor(cursor, sort_by)
+        # Equivalent to (expression, id) < (value, id), spelled out because
+        # SQLite does not range-scan an expression index on a row value.
+        op = "<" if direction == "DESC" else ">"
+        clauses.append(f"{expression} {op}= ? AND ({expression} {op} ? OR id {op} ?)")
+        params.extend([value, value, job_id])
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    order = f"{expression} {direction}, id {direction}"
+    query = f"SELECT * FROM research_queue{where} ORDER BY {order} LIMIT ? OFFSET ?"  # noqa: S608 - fixed clauses; values stay parameterized
+    return query, [*params, limit, offset]
+
+
+def build_count_query(
+    status: JobStatus | None, tenant_id: str | None, *, search: str | None, fts: bool
+) -> tuple[str, list[Any]]:
+    """Return the COUNT query matching ``build_list_query``'s filters."""
+    clauses, params = _where(status, tenant_id, search, fts)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return f"SELECT COUNT(*) FROM research_queue{where}", params  # noqa: S608 - fixed clauses; values stay parameterized
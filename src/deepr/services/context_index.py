@@ -2,12 +2,25 @@
 
 Provides embedding-based similarity search to find related prior research.
 Uses SQLite for metadata storage and numpy for embedding vectors.
+
+Indexing is a bulk write: reports are embedded ``EMBEDDING_BATCH_SIZE`` at a
+time (one provider call per batch), every row goes in under one write
+transaction, and triggers keep the ``reports_fts`` table in step with
+``reports``. New vectors are appended as one ``.npy`` segment per run
+instead of rewriting the whole matrix. Segments are named by their first
+row and folded back into ``context_embeddings.npy`` once they hold more rows
+than it does. The database runs in WAL mode, and searches use read-only
+connections, so they are not blocked while an index run holds the write
+transaction.
 """
 
 import hashlib
+import io
 import json
 import logging
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from math import isfinite
@@ -16,8 +29,46 @@ from typing import Any, cast
 
 import numpy as np
 
+from deepr.experts.ann_index import IvfIndex, maintained_ann, rank_by_cosine
+from deepr.utils.atomic_io import atomic_write_bytes
+
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Reports embedded per provider call during semantic indexing.
+EMBEDDING_BATCH_SIZE = 64
+# Segments kept beside the base matrix before they are folded into it.
+_MAX_EMBEDDING_SEGMENTS = 16
+
+_FTS_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS reports_fts_ai AFTER INSERT ON reports BEGIN
+        INSERT INTO reports_fts(rowid, report_id, prompt, summary)
+        VALUES (new.rowid, new.report_id, new.prompt, new.summary);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS reports_fts_ad AFTER DELETE ON reports BEGIN
+        INSERT INTO reports_fts(reports_fts, rowid, report_id, prompt, summary)
+        VALUES ('delete', old.rowid, old.report_id, old.prompt, old.summary);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS reports_fts_au AFTER UPDATE ON reports BEGIN
+        INSERT INTO reports_fts(reports_fts, rowid, report_id, prompt, summary)
+        VALUES ('delete', old.rowid, old.report_id, old.prompt, old.summary);
+        INSERT INTO reports_fts(rowid, report_id, prompt, summary)
+        VALUES (new.rowid, new.report_id, new.prompt, new.summary);
+    END""",
+)
+
+# Upsert rather than INSERT OR REPLACE: REPLACE deletes the old row without
+# firing the delete trigger, which would leave a stale FTS entry behind.
+_UPSERT_REPORT = """
+    INSERT INTO reports
+    (report_id, job_id, prompt, model, created_at, report_path, summary, embedding_idx, indexed_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(report_id) DO UPDATE SET
+        job_id = excluded.job_id, prompt = excluded.prompt, model = excluded.model,
+        created_at = excluded.created_at, report_path = excluded.report_path, summary = excluded.summary,
+        embedding_idx = excluded.embedding_idx, indexed_at = excluded.indexed_at
+"""
+
 
 class PaidSemanticOperationError(RuntimeError):
     """A requested semantic operation did not complete under its paid envelope."""
@@ -50,6 +101,93 @@ class SearchResult:
         }
 
 
+def _npy_bytes(matrix: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, matrix, allow_pickle=False)
+    return buffer.getvalue()
+
+
+class _ReportEmbedder:
+    """Paid report embeddings, one provider call per batch, under an aggregate ceiling.
+
+    The running cost is a conservative estimate: a failed call keeps its
+    slice, so retries cannot exceed the caller's ceiling.
+    """
+
+    def __init__(self, max_total_cost_usd: float) -> None:
+        self.max_total_cost_usd = max_total_cost_usd
+        self.spent = 0.0
+        self._client: Any | None = None
+
+    def _affordable(self, texts: list[str]) -> tuple[int, float]:
+        """Return how many leading ``texts`` fit under the ceiling, and their envelope cost."""
+        from deepr.services.metered_envelope import bounded_embedding_envelope
+
+        for count in range(len(texts), 0, -1):
+            cost = bounded_embedding_envelope(model=EMBEDDING_MODEL, inputs=tuple(texts[:count])).cost_usd
+            if self.spent + cost <= self.max_total_cost_usd + 1e-12:
+                return count, cost
+        return 0, 0.0
+
+    async def embed_batch(
+        self, rows: list[tuple[Any, ...]], indexed_count: int
+    ) -> tuple[list[np.ndarray], PaidSemanticOperationError | None]:
+        """Embed the leading ``rows`` that fit under the ceiling in one call.
+
+        Returns one vector per embedded row (possibly fewer than ``rows``)
+        and the error that should stop indexing, if any.
+        """
+        from openai import AsyncOpenAI
+
+        from deepr.providers.dispatch_authority import default_paid_endpoint, require_official_paid_client
+        from deepr.services.metered_call import execute_reserved_async_call
+
+        texts = [f"{row[2]}\n\n{row[6]}"[:8000] for row in rows]
+        count, cost = self._affordable(texts)
+        if count == 0:
+            return [], PaidSemanticOperationError(
+                "Paid semantic indexing stopped before another provider call because the aggregate "
+                f"ceiling of ${self.max_total_cost_usd:.6f} was exhausted. {indexed_count} report(s) were "
+                "preserved; increase the explicit ceiling or rerun local keyword indexing."
+            )
+        # Built once per index run, but guarded here, beside the dispatch,
+        # so every paid call is checked against the official endpoint.
+        if self._client is None:
+            self._client = AsyncOpenAI(base_url=default_paid_endpoint("openai"), max_retries=0)
+        client = self._client
+        require_official_paid_client(client, "openai")
+        self.spent += cost
+        texts = texts[:count]
+
+        async def create_embeddings() -> Any:
+            return await client.embeddings.create(model=EMBEDDING_MODEL, input=texts)
+
+        try:
+            response = await execute_reserved_async_call(
+                operation_prefix="context-index",
+                provider="openai",
+                model=EMBEDDING_MODEL,
+                source="services.context_index.index_reports",
+                max_cost_per_job=cost,
+                call=create_embeddings,
+                request_envelope={"model": EMBEDDING_MODEL, "input": texts},
+            )
+            vectors = [np.array(item.embedding) for item in response.data]
+            if len(vectors) != count:
+                raise ValueError(f"expected {count} embeddings, got {len(vectors)}")
+        except Exception as e:
+            logger.error("Paid embedding failed for %d report(s) (%s)", count, type(e).__name__)
+            failure = PaidSemanticOperationError(
+                "Paid semantic indexing did not complete under the durable metered boundary. "
+                "If provider work may have begun, its cost was settled conservatively or remains held; "
+                f"{indexed_count} earlier report(s) were preserved. Review `deepr budget status` "
+                "before retrying."
+            )
+            failure.__cause__ = e
+            return [], failure
+        return vectors, None
+
+
 class ContextIndex:
     """Index of research reports for semantic similarity search.
 
@@ -59,6 +197,8 @@ class ContextIndex:
     Storage:
         data/context_index.db - SQLite metadata
         data/context_embeddings.npy - Numpy embedding vectors
+        data/context_embeddings.segments/seg-*.npy - vectors appended since the last rewrite
+        data/context_embeddings.ivf.npz - ANN index over those vectors (large indexes only)
     """
 
     def __init__(self, data_dir: Path | None = None, reports_dir: Path | None = None):
@@ -82,6 +222,9 @@ class ContextIndex:
 
         self.db_path = self.data_dir / "context_index.db"
         self.embeddings_path = self.data_dir / "context_embeddings.npy"
+        self.segments_dir = self.data_dir / "context_embeddings.segments"
+        self.ann_path = self.data_dir / "context_embeddings.ivf.npz"
+        self._ann: IvfIndex | None = None
 
         self._init_db()
         self._load_embeddings()
@@ -89,6 +232,7 @@ class ContextIndex:
     def _init_db(self):
         """Initialize SQLite database schema."""
         conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -126,20 +270,89 @@ class ContextIndex:
             )
         """)
 
+        # Indexes written before the triggers inserted FTS rows by hand, with
+        # rowids that need not match ``reports``; rebuild them once.
+        has_triggers = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'reports_fts_ai'"
+        ).fetchone()
+        for trigger in _FTS_TRIGGERS:
+            cursor.execute(trigger)
+        if not has_triggers:
+            cursor.execute("INSERT INTO reports_fts(reports_fts) VALUES ('rebuild')")
+
         conn.commit()
         conn.close()
 
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Open a read-only connection; WAL lets it run beside an index write."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
     def _load_embeddings(self):
-        """Load embeddings from disk."""
-        if self.embeddings_path.exists():
-            self.embeddings = np.load(self.embeddings_path)
-        else:
-            self.embeddings = None
+        """Load the base matrix and every segment appended after it."""
+        parts = [np.load(self.embeddings_path)] if self.embeddings_path.exists() else []
+        rows = len(parts[0]) if parts else 0
+        for path in self._segment_paths():
+            start = int(path.stem.removeprefix("seg-"))
+            if start < rows:
+                # Already folded into the base by a rewrite that stopped
+                # before removing its segments.
+                continue
+            if start > rows:
+                logger.warning("Ignoring context embedding segments from row %d: rows %d+ are missing", start, rows)
+                break
+            part = np.load(path)
+            parts.append(part)
+            rows += len(part)
+        self.embeddings = np.concatenate(parts) if parts else None
+
+    def _segment_paths(self) -> list[Path]:
+        if not self.segments_dir.is_dir():
+            return []
+        return sorted(self.segments_dir.glob("seg-*.npy"))
 
     def _save_embeddings(self):
-        """Save embeddings to disk."""
+        """Rewrite the whole matrix to the base file and drop the segments."""
         if self.embeddings is not None:
-            np.save(self.embeddings_path, self.embeddings)
+            atomic_write_bytes(self.embeddings_path, _npy_bytes(self.embeddings), fsync=True)
+            for path in self._segment_paths():
+                path.unlink(missing_ok=True)
+            self._refresh_ann()
+
+    def _append_embeddings(self, rows: np.ndarray) -> None:
+        """Persist ``rows`` after the current matrix as one new segment."""
+        start = len(self.embeddings) if self.embeddings is not None else 0
+        self.embeddings = rows if self.embeddings is None else np.concatenate([self.embeddings, rows])
+        if start == 0:
+            self._save_embeddings()
+            return
+        atomic_write_bytes(self.segments_dir / f"seg-{start:09d}.npy", _npy_bytes(rows), fsync=True)
+        segments = self._segment_paths()
+        base_rows = int(segments[0].stem.removeprefix("seg-")) if segments else start
+        # Amortized like the other append-only stores: rewrite once the
+        # appended rows outgrow the base, so each row is rewritten O(log n) times.
+        if len(segments) > _MAX_EMBEDDING_SEGMENTS or len(self.embeddings) - base_rows > base_rows:
+            self._save_embeddings()
+        else:
+            self._refresh_ann()
+
+    def _refresh_ann(self) -> IvfIndex | None:
+        """Keep the derived ANN index in step with the embedding matrix."""
+        if self.embeddings is None:
+            return None
+        try:
+            self._ann = maintained_ann(self._ann, self.embeddings, self.ann_path)
+        except OSError as e:
+            # Derived state: semantic search falls back to the exact scan.
+            logger.warning("Could not update context ANN index: %s", e)
+            self._ann = None
+        return self._ann
 
     @staticmethod
     def _generate_report_id(job_id: str, created_at: str) -> str:
@@ -204,12 +417,47 @@ class ContextIndex:
 
     def _is_indexed(self, job_id: str) -> bool:
         """Check if a job is already indexed."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM reports WHERE job_id = ?", (job_id,))
-        result = cursor.fetchone()
-        conn.close()
-        return result is not None
+        with self._reader() as conn:
+            return conn.execute("SELECT 1 FROM reports WHERE job_id = ?", (job_id,)).fetchone() is not None
+
+    def _indexed_job_ids(self) -> set[str]:
+        """Return the job IDs already in the index."""
+        with self._reader() as conn:
+            return {row[0] for row in conn.execute("SELECT job_id FROM reports")}
+
+    @staticmethod
+    def _report_row(report_data: dict[str, Any]) -> tuple[Any, ...] | None:
+        """Build the ``reports`` row for a scanned report, or None without a prompt.
+
+        ``embedding_idx`` (index 7) is left None for the caller to fill.
+        """
+        metadata = report_data["metadata"]
+        report_path = report_data["path"]
+        prompt = metadata.get("prompt", "")
+        if not prompt:
+            return None
+        job_id = metadata.get("job_id", "")
+        created_at = metadata.get("created_at", datetime.now(UTC).isoformat())
+
+        # Summary: the first 500 characters, without reading the whole report.
+        summary = ""
+        try:
+            with open(report_path / "report.md", encoding="utf-8") as report_file:
+                summary = report_file.read(500).replace("\n", " ").strip()
+        except (OSError, UnicodeDecodeError):
+            pass
+
+        return (
+            ContextIndex._generate_report_id(job_id, created_at),
+            job_id,
+            prompt,
+            metadata.get("model", ""),
+            created_at,
+            str(report_path),
+            summary,
+            None,
+            datetime.now(UTC).isoformat(),
+        )
 
     async def index_reports(
         self,
@@ -247,169 +495,84 @@ class ContextIndex:
 
         # Filter to unindexed reports
         if not force:
-            reports = [r for r in reports if not self._is_indexed(r["metadata"].get("job_id", ""))]
+            indexed = self._indexed_job_ids()
+            reports = [r for r in reports if r["metadata"].get("job_id", "") not in indexed]
 
         if not reports:
             logger.info("All reports already indexed")
             return 0
 
         logger.info("Indexing %d reports", len(reports))
-
-        client: Any | None = None
-
-        async def create_embedding(text: str) -> Any:
-            assert client is not None
-            return await client.embeddings.create(model="text-embedding-3-small", input=text)
-
-        new_embeddings: list[Any] = []
-        indexed_count = 0
-        aggregate_embedding_cost = 0.0
-        semantic_failure: PaidSemanticOperationError | None = None
-        semantic_failure_cause: Exception | None = None
+        rows = [row for row in map(self._report_row, reports) if row is not None]
+        embedder = _ReportEmbedder(cast(float, max_total_cost_usd)) if include_semantic else None
 
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        try:
+            indexed_count, failure = await self._write_reports(conn, rows, embedder)
+            conn.commit()
+        finally:
+            conn.close()
 
-        for report_data in reports:
-            metadata = report_data["metadata"]
-            report_path = report_data["path"]
+        if failure is not None:
+            raise failure
+        logger.info("Indexed %d reports", indexed_count)
+        return indexed_count
 
-            job_id = metadata.get("job_id", "")
-            prompt = metadata.get("prompt", "")
-            model = metadata.get("model", "")
-            created_at = metadata.get("created_at", datetime.now(UTC).isoformat())
+    async def _write_reports(
+        self, conn: sqlite3.Connection, rows: list[tuple[Any, ...]], embedder: _ReportEmbedder | None
+    ) -> tuple[int, PaidSemanticOperationError | None]:
+        """Embed and insert ``rows`` in batches inside one write transaction.
 
-            if not prompt:
+        Vectors are appended to the matrix before the caller commits, so a
+        committed ``embedding_idx`` always has its row on disk. Returns the
+        number of reports written and the error that stopped semantic
+        indexing early, if any; reports written before it are kept.
+        """
+        conn.execute("BEGIN")
+        first_row = len(self.embeddings) if self.embeddings is not None else 0
+        vectors: list[np.ndarray] = []
+        indexed_count = 0
+        failure: PaidSemanticOperationError | None = None
+        position = 0
+        while position < len(rows) and failure is None:
+            batch = rows[position : position + EMBEDDING_BATCH_SIZE]
+            if embedder is not None:
+                batch_vectors, failure = await embedder.embed_batch(batch, indexed_count)
+                batch = batch[: len(batch_vectors)]
+                embedding_rows = range(first_row + len(vectors), first_row + len(vectors) + len(batch))
+                batch = [(*row[:7], idx, row[8]) for row, idx in zip(batch, embedding_rows, strict=True)]
+            position += len(batch)
+            if not batch:
                 continue
-
-            report_id = self._generate_report_id(job_id, created_at)
-
-            # Generate summary from report content
-            report_file = report_path / "report.md"
-            summary = ""
-            if report_file.exists():
-                try:
-                    content = report_file.read_text(encoding="utf-8")
-                    # Extract first 500 chars as summary
-                    summary = content[:500].replace("\n", " ").strip()
-                except OSError:
-                    pass
-
-            # Generate an embedding only after the interface explicitly chose
-            # the paid semantic lane. The running estimate is conservative:
-            # failed calls retain their slice so retries cannot exceed the
-            # caller's aggregate ceiling.
-            if include_semantic:
-                embed_text = f"{prompt}\n\n{summary}"[:8000]
-                from openai import AsyncOpenAI
-
-                from deepr.providers.dispatch_authority import default_paid_endpoint, require_official_paid_client
-                from deepr.services.metered_call import execute_reserved_async_call
-                from deepr.services.metered_envelope import bounded_embedding_envelope
-
-                if client is None:
-                    client = AsyncOpenAI(base_url=default_paid_endpoint("openai"), max_retries=0)
-                require_official_paid_client(client, "openai")
-
-                envelope = bounded_embedding_envelope(
-                    model="text-embedding-3-small",
-                    inputs=(embed_text,),
-                )
-                projected_cost = aggregate_embedding_cost + envelope.cost_usd
-                if max_total_cost_usd is not None and projected_cost > max_total_cost_usd + 1e-12:
-                    semantic_failure = PaidSemanticOperationError(
-                        "Paid semantic indexing stopped before another provider call because the aggregate "
-                        f"ceiling of ${max_total_cost_usd:.6f} was exhausted. {indexed_count} report(s) were "
-                        "preserved; increase the explicit ceiling or rerun local keyword indexing."
-                    )
-                    break
-                else:
-                    aggregate_embedding_cost = projected_cost
-                    try:
-
-                        async def create_report_embedding(text: str = embed_text) -> Any:
-                            return await create_embedding(text)
-
-                        response = await execute_reserved_async_call(
-                            operation_prefix="context-index",
-                            provider="openai",
-                            model="text-embedding-3-small",
-                            source="services.context_index.index_reports",
-                            max_cost_per_job=envelope.cost_usd,
-                            call=create_report_embedding,
-                            request_envelope={"model": "text-embedding-3-small", "input": embed_text},
-                        )
-                        embedding = np.array(response.data[0].embedding)
-                        embedding_idx = len(new_embeddings)
-                        if self.embeddings is not None:
-                            embedding_idx += len(self.embeddings)
-                        new_embeddings.append(embedding)
-                    except Exception as e:
-                        logger.error("Paid embedding failed for report %s (%s)", job_id, type(e).__name__)
-                        semantic_failure = PaidSemanticOperationError(
-                            "Paid semantic indexing did not complete under the durable metered boundary. "
-                            "If provider work may have begun, its cost was settled conservatively or remains held; "
-                            f"{indexed_count} earlier report(s) were preserved. Review `deepr budget status` "
-                            "before retrying."
-                        )
-                        semantic_failure_cause = e
-                        break
-            else:
-                embedding_idx = None
-
-            # Insert into database
-            cursor.execute("SAVEPOINT index_report")
             try:
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO reports
-                    (report_id, job_id, prompt, model, created_at, report_path, summary, embedding_idx, indexed_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        report_id,
-                        job_id,
-                        prompt,
-                        model,
-                        created_at,
-                        str(report_path),
-                        summary,
-                        embedding_idx,
-                        datetime.now(UTC).isoformat(),
-                    ),
-                )
-
-                # Update FTS index
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO reports_fts (report_id, prompt, summary)
-                    VALUES (?, ?, ?)
-                """,
-                    (report_id, prompt, summary),
-                )
-
-                cursor.execute("RELEASE SAVEPOINT index_report")
-                indexed_count += 1
+                conn.execute("SAVEPOINT index_batch")
+                conn.executemany(_UPSERT_REPORT, batch)
+                conn.execute("RELEASE SAVEPOINT index_batch")
             except sqlite3.Error as e:
-                cursor.execute("ROLLBACK TO SAVEPOINT index_report")
-                cursor.execute("RELEASE SAVEPOINT index_report")
-                logger.error("Failed to index report %s (%s)", job_id, type(e).__name__)
-                if include_semantic:
-                    if embedding_idx is not None and new_embeddings:
-                        new_embeddings.pop()
-                    semantic_failure = PaidSemanticOperationError(
-                        "Paid semantic indexing could not persist a completed embedding. Its provider cost is "
+                conn.execute("ROLLBACK TO SAVEPOINT index_batch")
+                conn.execute("RELEASE SAVEPOINT index_batch")
+                logger.error("Failed to index %d report(s) (%s)", len(batch), type(e).__name__)
+                if embedder is not None:
+                    failure = PaidSemanticOperationError(
+                        "Paid semantic indexing could not persist completed embeddings. Their provider cost is "
                         "already accounted, earlier reports were preserved, and the run stopped to prevent "
                         "untracked retry waste. Review the index and `deepr budget status` before retrying."
                     )
-                    semantic_failure_cause = e
-                    break
-
-        conn.commit()
-
-        # Verify embedding index consistency
-        embedded_count = cursor.execute("SELECT COUNT(*) FROM reports WHERE embedding_idx IS NOT NULL").fetchone()[0]
-        total_embeddings = len(new_embeddings) + (len(self.embeddings) if self.embeddings is not None else 0)
+                    failure.__cause__ = e
+                continue
+            indexed_count += len(batch)
+            if embedder is not None:
+                vectors.extend(batch_vectors)
+
+        if vectors:
+            self._append_embeddings(np.array(vectors))
+        self._warn_on_embedding_desync(conn)
+        return indexed_count, failure
+
+    def _warn_on_embedding_desync(self, conn: sqlite3.Connection) -> None:
+        """Log when rows with an ``embedding_idx`` and stored vectors disagree."""
+        embedded_count = conn.execute("SELECT COUNT(*) FROM reports WHERE embedding_idx IS NOT NULL").fetchone()[0]
+        total_embeddings = len(self.embeddings) if self.embeddings is not None else 0
         if embedded_count != total_embeddings:
             logger.warning(
                 "Embedding index desync: %d DB entries with embedding_idx vs %d embeddings",
@@ -417,25 +580,6 @@ class ContextIndex:
                 total_embeddings,
             )
 
-        conn.close()
-
-        # Update embeddings
-        if new_embeddings:
-            new_embeddings_array = np.array(new_embeddings)
-            if self.embeddings is None:
-                self.embeddings = new_embeddings_array
-            else:
-                self.embeddings = np.vstack([self.embeddings, new_embeddings_array])
-            self._save_embeddings()
-
-        if semantic_failure is not None:
-            if semantic_failure_cause is not None:
-                raise semantic_failure from semantic_failure_cause
-            raise semantic_failure
-
-        logger.info("Indexed %d reports", indexed_count)
-        return indexed_count
-
     async def search(
         self,
         query: str,
@@ -500,25 +644,19 @@ class ContextIndex:
         sorted_results = sorted(results.values(), key=lambda x: x.similarity, reverse=True)
         return sorted_results[:top_k]
 
-    async def _semantic_search(
-        self,
-        query: str,
-        top_k: int,
-        threshold: float,
-        *,
-        max_total_cost_usd: float,
-    ) -> list[SearchResult]:
-        """Perform semantic similarity search."""
-        if self.embeddings is None or len(self.embeddings) == 0:
-            return []
-
-        # Embed query
+    async def _embed_query(self, bounded_query: str, *, max_total_cost_usd: float) -> np.ndarray:
+        """Embed a search query, consulting the shared query-embedding cache first."""
         from deepr.services.metered_call import execute_reserved_async_call
         from deepr.services.metered_envelope import bounded_embedding_envelope
+        from deepr.services.query_embedding_cache import QueryEmbeddingCache
+
+        query_cache = QueryEmbeddingCache()
+        cached = query_cache.get(EMBEDDING_MODEL, bounded_query)
+        if cached is not None:
+            return np.array(cached)
 
-        bounded_query = query[:8000]
         envelope = bounded_embedding_envelope(
-            model="text-embedding-3-small",
+            model=EMBEDDING_MODEL,
             inputs=(bounded_query,),
         )
         if envelope.cost_usd > max_total_cost_usd + 1e-12:
@@ -532,17 +670,17 @@ class ContextIndex:
         require_official_paid_client(client, "openai")
 
         async def create_embedding() -> Any:
-            return await client.embeddings.create(model="text-embedding-3-small", input=bounded_query)
+            return await client.embeddings.create(model=EMBEDDING_MODEL, input=bounded_query)
 
         try:
             response = await execute_reserved_async_call(
                 operation_prefix="context-query",
                 provider="openai",
-                model="text-embedding-3-small",
+                model=EMBEDDING_MODEL,
                 source="services.context_index.semantic_search",
                 max_cost_per_job=envelope.cost_usd,
                 call=create_embedding,
-                request_envelope={"model": "text-embedding-3-small", "input": bounded_query},
+                request_envelope={"model": EMBEDDING_MODEL, "input": bounded_query},
             )
             query_embedding = np.array(response.data[0].embedding)
         except Exception as e:
@@ -552,86 +690,94 @@ class ContextIndex:
                 "have begun, its cost was settled conservatively or remains held. Review `deepr budget status` "
                 "before retrying."
             ) from e
+        query_cache.put(EMBEDDING_MODEL, bounded_query, query_embedding)
+        return query_embedding
 
-        # Cosine similarity
-        query_norm = query_embedding / (np.linalg.norm(query_embedding) + 1e-8)
-        doc_norms = self.embeddings / (np.linalg.norm(self.embeddings, axis=1, keepdims=True) + 1e-8)
-        similarities = np.dot(doc_norms, query_norm)
-
-        # Get top results above threshold
-        top_indices = np.argsort(similarities)[::-1]
-
-        results: list[SearchResult] = []
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    async def _semantic_search(
+        self,
+        query: str,
+        top_k: int,
+        threshold: float,
+        *,
+        max_total_cost_usd: float,
+    ) -> list[SearchResult]:
+        """Perform semantic similarity search."""
+        if self.embeddings is None or len(self.embeddings) == 0:
+            return []
 
-        for idx in top_indices:
-            if len(results) >= top_k:
-                break
+        bounded_query = query[:8000]
+        query_embedding = await self._embed_query(bounded_query, max_total_cost_usd=max_total_cost_usd)
 
-            similarity = float(similarities[idx])
-            if similarity < threshold:
-                continue
+        # Rows ranked by cosine similarity (probed lists only on large indexes)
+        top_indices, similarities = rank_by_cosine(self.embeddings, query_embedding, ann=self._refresh_ann())
 
-            # Validate idx is within bounds
-            if int(idx) < 0 or int(idx) >= len(self.embeddings):
-                continue
+        results: list[SearchResult] = []
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-            # Find report with this embedding index
-            cursor.execute("SELECT * FROM reports WHERE embedding_idx = ?", (int(idx),))
-            row = cursor.fetchone()
-            if not row:
-                continue
+            for idx, similarity in zip(top_indices.tolist(), similarities.tolist(), strict=True):
+                if len(results) >= top_k:
+                    break
 
-            results.append(
-                SearchResult(
-                    report_id=row["report_id"],
-                    job_id=row["job_id"],
-                    prompt=row["prompt"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    similarity=similarity,
-                    report_path=Path(row["report_path"]),
-                    model=row["model"],
-                    summary=row["summary"],
+                if similarity < threshold:
+                    continue
+
+                # Validate idx is within bounds
+                if int(idx) < 0 or int(idx) >= len(self.embeddings):
+                    continue
+
+                # Find report with this embedding index
+                cursor.execute("SELECT * FROM reports WHERE embedding_idx = ?", (int(idx),))
+                row = cursor.fetchone()
+                if not row:
+                    continue
+
+                results.append(
+                    SearchResult(
+                        report_id=row["report_id"],
+                        job_id=row["job_id"],
+                        prompt=row["prompt"],
+                        created_at=datetime.fromisoformat(row["created_at"]),
+                        similarity=similarity,
+                        report_path=Path(row["report_path"]),
+                        model=row["model"],
+                        summary=row["summary"],
+                    )
                 )
-            )
 
-        conn.close()
         return results
 
     def _keyword_search(self, query: str, top_k: int) -> list[SearchResult]:
         """Perform keyword search using FTS5."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        # FTS5 search
-        try:
-            cursor.execute(
-                """
-                SELECT r.*, bm25(reports_fts) as rank
-                FROM reports_fts fts
-                JOIN reports r ON fts.report_id = r.report_id
-                WHERE reports_fts MATCH ?
-                ORDER BY rank
-                LIMIT ?
-            """,
-                (query, top_k),
-            )
-            rows = cursor.fetchall()
-        except sqlite3.Error:
-            # Fallback to LIKE search if FTS fails
-            cursor.execute(
-                """
-                SELECT * FROM reports
-                WHERE prompt LIKE ? OR summary LIKE ?
-                ORDER BY created_at DESC
-                LIMIT ?
-            """,
-                (f"%{query}%", f"%{query}%", top_k),
-            )
-            rows = cursor.fetchall()
+            # FTS5 search
+            try:
+                cursor.execute(
+                    """
+                    SELECT r.*, bm25(reports_fts) as rank
+                    FROM reports_fts fts
+                    JOIN reports r ON r.rowid = fts.rowid
+                    WHERE reports_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                """,
+                    (query, top_k),
+                )
+                rows = cursor.fetchall()
+            except sqlite3.Error:
+                # Fallback to LIKE search if FTS fails
+                cursor.execute(
+                    """
+                    SELECT * FROM reports
+                    WHERE prompt LIKE ? OR summary LIKE ?
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                """,
+                    (f"%{query}%", f"%{query}%", top_k),
+                )
+                rows = cursor.fetchall()
 
         results = []
         for row in rows:
@@ -648,21 +794,13 @@ class ContextIndex:
                 )
             )
 
-        conn.close()
         return results
 
     def get_stats(self) -> dict[str, Any]:
         """Get index statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM reports")
-        report_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT MIN(created_at), MAX(created_at) FROM reports")
-        date_range = cursor.fetchone()
-
-        conn.close()
+        with self._reader() as conn:
+            report_count = conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+            date_range = conn.execute("SELECT MIN(created_at), MAX(created_at) FROM reports").fetchone()
 
         return {
             "indexed_reports": report_count,
@@ -678,13 +816,17 @@ class ContextIndex:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute("DELETE FROM reports")
-        cursor.execute("DELETE FROM reports_fts")
+        cursor.execute("INSERT INTO reports_fts(reports_fts) VALUES ('delete-all')")
         conn.commit()
         conn.close()
 
         self.embeddings = None
         if self.embeddings_path.exists():
             self.embeddings_path.unlink()
+        for path in self._segment_paths():
+            path.unlink(missing_ok=True)
+        self._ann = None
+        self.ann_path.unlink(missing_ok=True)
 
         logger.info("Context index cleared")
 
@@ -748,31 +890,25 @@ class ContextIndex:
         Returns:
             SearchResult if found, None otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
         # Reject empty/whitespace ids before building a LIKE pattern. An empty
         # prefix becomes LIKE '%' and would resolve to an arbitrary indexed
         # report - the wildcard-selection bug behind deepr_reflect /
         # deepr_expert_absorb. A missing id must mean "no match", not "any".
         if not job_id or not job_id.strip():
-            conn.close()
             return None
 
-        # Escape SQL LIKE wildcards in the caller-controlled prefix so a value
-        # like "%" or "_" is treated literally and cannot match every/any
-        # report. The backslash is the ESCAPE character.
-        if allow_prefix:
-            like_prefix = job_id.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-            cursor.execute(
-                "SELECT * FROM reports WHERE job_id = ? OR job_id LIKE ? ESCAPE '\\'",
-                (job_id, f"{like_prefix}%"),
-            )
-        else:
-            cursor.execute("SELECT * FROM reports WHERE job_id = ?", (job_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._reader() as conn:
+            # Escape SQL LIKE wildcards in the caller-controlled prefix so a value
+            # like "%" or "_" is treated literally and cannot match every/any
+            # report. The backslash is the ESCAPE character.
+            if allow_prefix:
+                like_prefix = job_id.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                row = conn.execute(
+                    "SELECT * FROM reports WHERE job_id = ? OR job_id LIKE ? ESCAPE '\\'",
+                    (job_id, f"{like_prefix}%"),
+                ).fetchone()
+            else:
+                row = conn.execute("SELECT * FROM reports WHERE job_id = ?", (job_id,)).fetchone()
 
         if not row:
             return None
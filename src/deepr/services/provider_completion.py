@@ -280,6 +280,7 @@ async def finalize_provider_completion(
         report_paths={"markdown": report_url} if report_url else {},
         cost=accounted_cost,
         tokens_used=tokens,
+        report_text=_response_content(response) if report_url else None,
     ):
         raise RuntimeError("queue rejected provider result update")
     if not reconcile_research_cost_from_ledger(reservation, job_id=job.id):
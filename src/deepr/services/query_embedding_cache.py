@@ -0,0 +1,205 @@
+"""Persistent cache of query embeddings keyed by model and normalized text.
+
+Expert chat (``EmbeddingCache.search``), report-context search
+(``ContextIndex``) and local semantic recall each embed the query text on
+every call, so a question repeated across sessions or MCP hosts paid for the
+same vector again. This cache maps ``(model, normalized text)`` to the vector
+the provider returned and is consulted before any local or metered embedding
+call. A hit skips the round-trip and its spend entirely.
+
+Entries live in one SQLite database under the runtime data root, so every
+process on the machine shares them (WAL mode, short busy timeout). The schema
+is created once per database per process; each lookup only opens a connection.
+The cache is bounded by stored vector bytes and evicts least-recently-used
+entries once the bound is exceeded. It is an optimization only: any storage
+error is logged and treated as a miss, and callers always fall back to a live
+embedding call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+from deepr.config import runtime_data_path
+
+logger = logging.getLogger(__name__)
+
+# Vectors are stored as float64 so a hit returns exactly what the provider
+# returned. 64 MiB holds roughly 5,000 1536-dimension query vectors.
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_BUSY_TIMEOUT_SECONDS = 2.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_embeddings (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    dims INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_query_embeddings_last_used ON query_embeddings(last_used);
+"""
+
+# Databases whose schema this process has created. Callers build a cache per
+# query, so per-instance setup would still run on every lookup.
+_initialized_paths: set[Path] = set()
+_initialized_lock = threading.Lock()
+
+
+def normalize_query_text(text: str) -> str:
+    """Canonical form used for cache keys: NFC, trimmed, whitespace collapsed."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def default_query_embedding_cache_path() -> Path:
+    """Shared cache location below the runtime data root."""
+    return runtime_data_path("cache", "query_embeddings.db")
+
+
+class QueryEmbeddingCache:
+    """Size-bounded, process-shared ``(model, text) -> vector`` cache."""
+
+    def __init__(self, db_path: Path | None = None, *, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_path = Path(db_path) if db_path else default_query_embedding_cache_path()
+        self.max_bytes = max_bytes
+        self._ready = self._initialize()
+
+    @staticmethod
+    def _key(model: str, text: str) -> str:
+        payload = f"{model}\0{normalize_query_text(text)}".encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    def _initialize(self) -> bool:
+        """Create the database and schema unless this process already did."""
+        with _initialized_lock:
+            if self.db_path in _initialized_paths:
+                return True
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = self._connect()
+                try:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError) as exc:
+                logger.warning("Query embedding cache unavailable: %s", exc)
+                return False
+            _initialized_paths.add(self.db_path)
+            return True
+
+    def _usable(self) -> bool:
+        """Retry setup after an earlier failure; True once the schema exists."""
+        if not self._ready:
+            self._ready = self._initialize()
+        return self._ready
+
+    def _failed(self, action: str, exc: Exception) -> None:
+        """Log a storage error and set the database up again on next use."""
+        logger.warning("Query embedding cache %s failed: %s", action, exc)
+        with _initialized_lock:
+            _initialized_paths.discard(self.db_path)
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=_BUSY_TIMEOUT_SECONDS)
+
+    def get(self, model: str, text: str) -> tuple[float, ...] | None:
+        """Return the cached vector for ``text`` under ``model``, or ``None``."""
+        if not model or not normalize_query_text(text) or not self._usable():
+            return None
+        key = self._key(model, text)
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    row = conn.execute(
+                        "SELECT dims, vector FROM query_embeddings WHERE key = ? AND model = ?", (key, model)
+                    ).fetchone()
+                    if row is None:
+                        return None
+                    conn.execute("UPDATE query_embeddings SET last_used = ? WHERE key = ?", (time.time(), key))
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as exc:
+            self._failed("read", exc)
+            return None
+        dims, blob = row
+        vector = np.frombuffer(blob, dtype="<f8")
+        if len(vector) != dims:
+            return None
+        return tuple(vector.tolist())
+
+    def put(self, model: str, text: str, vector: Sequence[float] | np.ndarray) -> None:
+        """Store ``vector`` for ``text`` under ``model`` and evict past the byte bound."""
+        if not model or not normalize_query_text(text):
+            return
+        array = np.asarray(vector, dtype="<f8").ravel()
+        if array.size == 0 or not np.isfinite(array).all():
+            return
+        blob = array.tobytes()
+        if len(blob) > self.max_bytes or not self._usable():
+            return
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO query_embeddings (key, model, dims, vector, size_bytes, last_used) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (self._key(model, text), model, int(array.size), blob, len(blob), time.time()),
+                    )
+                    self._evict(conn)
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as exc:
+            self._failed("write", exc)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM query_embeddings").fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        stale: list[str] = []
+        for key, size in conn.execute("SELECT key, size_bytes FROM query_embeddings ORDER BY last_used ASC"):
+            if freed >= excess:
+                break
+            stale.append(key)
+            freed += size
+        conn.executemany("DELETE FROM query_embeddings WHERE key = ?", [(key,) for key in stale])
+
+    def stats(self) -> dict[str, int]:
+        """Entry count and stored vector bytes."""
+        if not self._usable():
+            return {"entries": 0, "size_bytes": 0, "max_bytes": self.max_bytes}
+        try:
+            conn = self._connect()
+            try:
+                count, total = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM query_embeddings"
+                ).fetchone()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as exc:
+            self._failed("stats", exc)
+            return {"entries": 0, "size_bytes": 0, "max_bytes": self.max_bytes}
+        return {"entries": int(count), "size_bytes": int(total), "max_bytes": self.max_bytes}
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "QueryEmbeddingCache",
+    "default_query_embedding_cache_path",
+    "normalize_query_text",
+]
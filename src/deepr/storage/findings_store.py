@@ -25,12 +25,13 @@ Usage:
 """
 
 import hashlib
+import heapq
 import json
 import math
 import re
 import sqlite3
 import threading
-from collections import Counter
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -45,6 +46,10 @@ def _utc_now() -> datetime:
 # Default database path
 DEFAULT_DB_PATH = Path("data/findings.db")
 
+# BM25 term-frequency saturation and length normalization.
+_BM25_K1 = 1.5
+_BM25_B = 0.75
+
 
 @dataclass
 class StoredFinding:
@@ -106,8 +111,10 @@ class StoredFinding:
 class FindingsStore:
     """Persistent storage for research findings.
 
-    Uses SQLite for storage with simple TF-IDF-like retrieval
-    for finding relevant findings.
+    Uses SQLite for storage and BM25 for retrieval. Token postings carry
+    their job ID, so a query reads only the matching postings of one job
+    and scores them against that job's document statistics. Nothing is
+    held in memory between calls.
 
     Attributes:
         db_path: Path to SQLite database
@@ -128,17 +135,11 @@ class FindingsStore:
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._create_tables()
 
-        # Lock guarding the in-memory index. The connection accepts
-        # cross-thread access (``check_same_thread=False``); without
-        # this lock two concurrent ``store_finding`` calls would race
-        # on the dict mutations below.
+        # The connection accepts cross-thread access
+        # (``check_same_thread=False``); this lock keeps concurrent
+        # writers from interleaving statements and commits.
         self._lock = threading.RLock()
 
-        # In-memory token index for fast retrieval
-        self._token_index: dict[str, dict[str, int]] = {}  # token -> {finding_id: count}
-        self._doc_lengths: dict[str, int] = {}  # finding_id -> token count
-        self._load_index()
-
     def _create_tables(self) -> None:
         """Create database tables."""
         self._conn.executescript("""
@@ -151,7 +152,8 @@ class FindingsStore:
                 source TEXT,
                 finding_type TEXT NOT NULL DEFAULT 'fact',
                 timestamp TEXT NOT NULL,
-                metadata_json TEXT NOT NULL DEFAULT '{}'
+                metadata_json TEXT NOT NULL DEFAULT '{}',
+                token_count INTEGER NOT NULL DEFAULT 0
             );
 
             CREATE INDEX IF NOT EXISTS idx_findings_job ON findings(job_id);
@@ -161,23 +163,33 @@ class FindingsStore:
                 finding_id TEXT NOT NULL,
                 token TEXT NOT NULL,
                 count INTEGER NOT NULL DEFAULT 1,
+                job_id TEXT,
                 PRIMARY KEY (finding_id, token),
                 FOREIGN KEY (finding_id) REFERENCES findings(id) ON DELETE CASCADE
             );
 
             CREATE INDEX IF NOT EXISTS idx_tokens_token ON finding_tokens(token);
         """)
+        self._migrate_job_scoped_tokens()
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tokens_job_token ON finding_tokens(job_id, token)")
         self._conn.commit()
 
-    def _load_index(self) -> None:
-        """Load token index from database."""
-        rows = self._conn.execute("SELECT finding_id, token, count FROM finding_tokens").fetchall()
-
-        for finding_id, token, count in rows:
-            if token not in self._token_index:
-                self._token_index[token] = {}
-            self._token_index[token][finding_id] = count
-            self._doc_lengths[finding_id] = self._doc_lengths.get(finding_id, 0) + count
+    def _migrate_job_scoped_tokens(self) -> None:
+        """Backfill posting job IDs and finding lengths in older databases."""
+        finding_columns = {str(row[1]) for row in self._conn.execute("PRAGMA table_info(findings)").fetchall()}
+        if "token_count" not in finding_columns:
+            self._conn.execute("ALTER TABLE findings ADD COLUMN token_count INTEGER NOT NULL DEFAULT 0")
+            self._conn.execute(
+                """UPDATE findings SET token_count =
+                   (SELECT COALESCE(SUM(count), 0) FROM finding_tokens WHERE finding_id = findings.id)"""
+            )
+        token_columns = {str(row[1]) for row in self._conn.execute("PRAGMA table_info(finding_tokens)").fetchall()}
+        if "job_id" not in token_columns:
+            self._conn.execute("ALTER TABLE finding_tokens ADD COLUMN job_id TEXT")
+            self._conn.execute(
+                """UPDATE finding_tokens SET job_id =
+                   (SELECT job_id FROM findings WHERE id = finding_tokens.finding_id)"""
+            )
 
     async def store_finding(
         self,
@@ -223,15 +235,15 @@ class FindingsStore:
             metadata=metadata,
         )
 
-        # Guard the full SQLite write + in-memory index mutation. The
-        # shared connection is check_same_thread=False; concurrent
+        # The shared connection is check_same_thread=False; concurrent
         # store_finding calls must not interleave statements/commits.
         token_counts = Counter(finding.tokens)
         with self._lock:
             self._conn.execute(
                 """INSERT OR REPLACE INTO findings
-                   (id, job_id, phase, text, confidence, source, finding_type, timestamp, metadata_json)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                   (id, job_id, phase, text, confidence, source, finding_type, timestamp, metadata_json,
+                    token_count)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (
                     finding.id,
                     finding.job_id,
@@ -242,23 +254,15 @@ class FindingsStore:
                     finding.finding_type,
                     finding.timestamp.isoformat(),
                     json.dumps(finding.metadata),
+                    len(finding.tokens),
                 ),
             )
-
-            for token, count in token_counts.items():
-                self._conn.execute(
-                    """INSERT OR REPLACE INTO finding_tokens
-                       (finding_id, token, count)
-                       VALUES (?, ?, ?)""",
-                    (finding.id, token, count),
-                )
-
-                # Update in-memory index
-                if token not in self._token_index:
-                    self._token_index[token] = {}
-                self._token_index[token][finding.id] = count
-
-            self._doc_lengths[finding.id] = sum(token_counts.values())
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO finding_tokens
+                   (finding_id, token, count, job_id)
+                   VALUES (?, ?, ?, ?)""",
+                ((finding.id, token, count, job_id) for token, count in token_counts.items()),
+            )
             self._conn.commit()
 
         return finding
@@ -273,7 +277,8 @@ class FindingsStore:
     ) -> list[StoredFinding]:
         """Retrieve findings relevant to a query.
 
-        Uses TF-IDF-like scoring for relevance ranking.
+        Ranks the job's findings by BM25, with document frequencies and
+        the average length taken from that job's findings only.
 
         Args:
             job_id: Job to search within
@@ -285,37 +290,24 @@ class FindingsStore:
         Returns:
             List of relevant StoredFinding objects
         """
-        # Tokenize query
-        query_tokens = StoredFinding._tokenize(query)
-
-        if not query_tokens:
-            return []
-
-        # Get candidate findings
-        candidates = await self._get_candidates(job_id, query_tokens, phase)
-
-        if not candidates:
+        query_tokens = list(dict.fromkeys(StoredFinding._tokenize(query)))
+        if not query_tokens or top_k <= 0:
             return []
 
-        # Score candidates using TF-IDF-like scoring
-        scored = []
-        total_docs = len(self._doc_lengths)
-
-        for finding_id in candidates:
-            score = self._calculate_relevance_score(finding_id, query_tokens, total_docs)
-            scored.append((finding_id, score))
-
-        # Sort by score
-        scored.sort(key=lambda x: x[1], reverse=True)
-
-        # Retrieve top findings
-        result = []
-        for finding_id, _score in scored[:top_k]:
-            finding = await self._get_finding(finding_id)
-            if finding and finding.confidence >= min_confidence:
-                result.append(finding)
+        with self._lock:
+            doc_count, avg_length = self._conn.execute(
+                "SELECT COUNT(*), AVG(token_count) FROM findings WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            postings = self._conn.execute(
+                """SELECT t.finding_id, t.token, t.count, f.token_count, f.phase, f.confidence
+                   FROM finding_tokens t JOIN findings f ON f.id = t.finding_id
+                   WHERE t.job_id = ? AND t.token IN (SELECT value FROM json_each(?))""",
+                (job_id, json.dumps(query_tokens)),
+            ).fetchall()
 
-        return result
+        scores = self._bm25_scores(postings, doc_count, avg_length or 1.0, phase, min_confidence)
+        top = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return await self._get_findings([finding_id for finding_id, _score in top])
 
     async def get_findings_by_phase(
         self,
@@ -378,29 +370,14 @@ class FindingsStore:
             Number of findings deleted
         """
         with self._lock:
-            rows = self._conn.execute("SELECT id FROM findings WHERE job_id = ?", (job_id,)).fetchall()
-            finding_ids = {row[0] for row in rows}
-
             try:
-                self._conn.executemany(
-                    "DELETE FROM finding_tokens WHERE finding_id = ?",
-                    ((finding_id,) for finding_id in finding_ids),
-                )
+                self._conn.execute("DELETE FROM finding_tokens WHERE job_id = ?", (job_id,))
                 cursor = self._conn.execute("DELETE FROM findings WHERE job_id = ?", (job_id,))
                 self._conn.commit()
             except Exception:
                 self._conn.rollback()
                 raise
 
-            for token in list(self._token_index):
-                token_findings = self._token_index[token]
-                for finding_id in finding_ids:
-                    token_findings.pop(finding_id, None)
-                if not token_findings:
-                    del self._token_index[token]
-            for finding_id in finding_ids:
-                self._doc_lengths.pop(finding_id, None)
-
             return cursor.rowcount
 
     async def get_stats(self, job_id: str | None = None) -> dict[str, Any]:
@@ -425,106 +402,62 @@ class FindingsStore:
             ).fetchone()
 
         count, avg_conf, distinct = row
+        unique_tokens, indexed_documents = self._conn.execute(
+            "SELECT COUNT(DISTINCT token), COUNT(DISTINCT finding_id) FROM finding_tokens"
+        ).fetchone()
 
         return {
             "total_findings": count or 0,
             "average_confidence": avg_conf or 0.0,
             "distinct_jobs_or_phases": distinct or 0,
-            "unique_tokens": len(self._token_index),
-            "indexed_documents": len(self._doc_lengths),
+            "unique_tokens": unique_tokens,
+            "indexed_documents": indexed_documents,
         }
 
-    async def _get_candidates(
-        self,
-        job_id: str,
-        query_tokens: list[str],
+    @staticmethod
+    def _bm25_scores(
+        postings: list[tuple[Any, ...]],
+        doc_count: int,
+        avg_length: float,
         phase: int | None,
-    ) -> set[str]:
-        """Get candidate finding IDs for a query.
+        min_confidence: float,
+    ) -> dict[str, float]:
+        """Score findings from one job's postings for the query tokens.
 
         Args:
-            job_id: Job identifier
-            query_tokens: Query tokens
+            postings: ``(finding_id, token, count, token_count, phase, confidence)`` rows
+            doc_count: Number of findings in the job
+            avg_length: Average token count of the job's findings
             phase: Optional phase filter
+            min_confidence: Minimum confidence filter
 
         Returns:
-            Set of candidate finding IDs
-        """
-        candidates: set[str] = set()
-
-        for token in query_tokens:
-            if token in self._token_index:
-                candidates.update(self._token_index[token].keys())
-
-        # Filter to job and phase
-        if phase is not None:
-            rows = self._conn.execute(
-                "SELECT id FROM findings WHERE job_id = ? AND phase = ?", (job_id, phase)
-            ).fetchall()
-        else:
-            rows = self._conn.execute("SELECT id FROM findings WHERE job_id = ?", (job_id,)).fetchall()
-
-        valid_ids = {row[0] for row in rows}
-        return candidates & valid_ids
-
-    def _calculate_relevance_score(
-        self,
-        finding_id: str,
-        query_tokens: list[str],
-        total_docs: int,
-    ) -> float:
-        """Calculate TF-IDF-like relevance score.
-
-        Args:
-            finding_id: Finding to score
-            query_tokens: Query tokens
-            total_docs: Total number of documents
-
-        Returns:
-            Relevance score
+            Score per matching finding ID
         """
-        score = 0.0
-        doc_length = self._doc_lengths.get(finding_id, 1)
-
-        for token in query_tokens:
-            if token not in self._token_index:
+        # Document frequencies span the whole job, before the filters.
+        doc_freqs = Counter(token for _finding_id, token, *_rest in postings)
+        scores: dict[str, float] = defaultdict(float)
+        for finding_id, token, count, length, finding_phase, confidence in postings:
+            if (phase is not None and finding_phase != phase) or confidence < min_confidence:
                 continue
-
-            token_findings = self._token_index[token]
-            if finding_id not in token_findings:
-                continue
-
-            # Term frequency
-            tf = token_findings[finding_id] / doc_length
-
-            # Inverse document frequency
-            doc_freq = len(token_findings)
-            idf = math.log((total_docs + 1) / (doc_freq + 1))
-
-            score += tf * idf
-
-        return score
-
-    async def _get_finding(self, finding_id: str) -> StoredFinding | None:
-        """Get a finding by ID.
-
-        Args:
-            finding_id: Finding identifier
-
-        Returns:
-            StoredFinding or None
-        """
-        row = self._conn.execute(
+            df = doc_freqs[token]
+            idf = math.log((doc_count - df + 0.5) / (df + 0.5) + 1)
+            norm = count + _BM25_K1 * (1 - _BM25_B + _BM25_B * length / avg_length)
+            scores[finding_id] += idf * count * (_BM25_K1 + 1) / norm
+        return scores
+
+    async def _get_findings(self, finding_ids: list[str]) -> list[StoredFinding]:
+        """Get findings by ID, in the given order."""
+        if not finding_ids:
+            return []
+        rows = self._conn.execute(
             """SELECT id, job_id, phase, text, confidence, source,
                       finding_type, timestamp, metadata_json
-               FROM findings WHERE id = ?""",
-            (finding_id,),
-        ).fetchone()
-
-        if not row:
-            return None
-
-        return StoredFinding.from_row(row)
+               FROM findings WHERE id IN (SELECT value FROM json_each(?))""",
+            (json.dumps(finding_ids),),
+        ).fetchall()
+        by_id = {row[0]: StoredFinding.from_row(row) for row in rows}
+        return [by_id[finding_id] for finding_id in finding_ids if finding_id in by_id]
 
     def close(self) -> None:
         """Close database connection."""
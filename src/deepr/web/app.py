@@ -200,7 +200,14 @@ from deepr.config import experts_root, load_config
 from deepr.core.costs import CostController, CostEstimator
 from deepr.providers.base import ResearchRequest, ToolConfig
 from deepr.providers.openai_provider import OpenAIProvider
-from deepr.queue.base import JobStatus, ResearchJob, client_job_metadata, public_job_metadata
+from deepr.queue.base import (
+    JobStatus,
+    ResearchJob,
+    client_job_metadata,
+    encode_job_cursor,
+    public_job_metadata,
+    summarize_report,
+)
 from deepr.queue.local_queue import SQLiteQueue
 from deepr.services.job_provider import create_job_provider
 from deepr.services.provider_status import (
@@ -499,7 +506,13 @@ def _handle_completion(loop, job, response):
         provider_factory=_provider_factory_for_job(job),
     )
     research_costs.finalize_completed_job(
-        loop=loop, queue=queue, job=job, actual_cost=cost, tokens=tokens, report_saved=bool(report_text)
+        loop=loop,
+        queue=queue,
+        job=job,
+        actual_cost=cost,
+        tokens=tokens,
+        report_saved=bool(report_text),
+        report_text=report_text,
     )
 
     updated_job = loop.run_until_complete(queue.get_job(job.id))
@@ -1202,26 +1215,18 @@ def get_cost_trends():
         days = max(1, min(_safe_int(request.args.get("days", 30), 30), 365))
 
         now = datetime.now(UTC)
-        cutoff = now - timedelta(days=days)
+        day_keys = [(now - timedelta(days=days - 1 - i)).strftime("%Y-%m-%d") for i in range(days)]
 
-        # Group ledger events by day - every spend path writes the ledger,
-        # so the trend reflects research jobs, expert learning, and tool
-        # calls alike (queue job costs missed everything but jobs).
-        events = CostLedger().with_locked_accounting_events(
-            lambda ledger_events: [event for event in ledger_events if event.timestamp >= cutoff]
-        )
-        daily_costs = {}
-        for event in events:
-            if event.cost_usd:
-                day_key = event.timestamp.strftime("%Y-%m-%d")
-                daily_costs[day_key] = daily_costs.get(day_key, 0) + event.cost_usd
+        # Per-UTC-day totals from the ledger's checkpointed rollup - every
+        # spend path writes the ledger, so the trend reflects research jobs,
+        # expert learning, and tool calls alike (queue job costs missed
+        # everything but jobs). Only the days shown are looked up.
+        daily_costs = CostLedger().with_locked_rollup(lambda rollup: [rollup.daily.get(day, 0.0) for day in day_keys])
 
         # Build trend data
         trends = []
         cumulative = 0
-        for i in range(days):
-            day = (now - timedelta(days=days - 1 - i)).strftime("%Y-%m-%d")
-            cost = daily_costs.get(day, 0)
+        for day, cost in zip(day_keys, daily_costs, strict=True):
             cumulative += cost
             trends.append({"date": day, "cost": round(cost, 2), "cumulative": round(cumulative, 2)})
 
@@ -1451,72 +1456,72 @@ def update_cost_limits():
 # =============================================================================
 
 
+# /api/results ``sort_by`` values -> QueueBackend.list_jobs sort keys.
+_RESULT_SORT_KEYS = {"date": "completed_at", "cost": "cost", "model": "model"}
+
+
+def _result_listing_entry(job: ResearchJob) -> dict:
+    """Build a results-library row from the preview stored at completion."""
+    preview, citations = job.result_preview, job.citations_count
+    if preview is None:
+        # Completed before previews were stored on the job: read the report
+        # once and keep its summary on the row for later listings.
+        try:
+            content = run_async(storage.get_report(job_id=job.id, filename="report.md")).decode("utf-8")
+            preview, citations = summarize_report(content)
+            run_async(queue.store_result_summary(job.id, content))
+        except Exception as exc:
+            logger.debug("Could not load result preview for job %s: %s", job.id, exc, exc_info=exc)
+    return {
+        "id": job.id,
+        "job_id": job.id,
+        "prompt": job.prompt,
+        "model": job.model,
+        "cost": job.cost or 0,
+        "tokens_used": job.tokens_used or 0,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        "created_at": job.submitted_at.isoformat() if job.submitted_at else None,
+        "citations_count": citations or 0,
+        "content": preview or "",
+        "tags": job.tags if hasattr(job, "tags") else [],
+        "enable_web_search": job.enable_web_search,
+    }
+
+
 @app.route("/api/results", methods=["GET"])
 def list_results():
-    """List completed research results."""
+    """List completed research results.
+
+    Filtering, sorting and paging run in the queue. Pass the response's
+    ``next_cursor`` back as ``cursor`` for the following page; ``offset``
+    is still accepted.
+    """
     try:
-        search = request.args.get("search", "")
-        sort_by = request.args.get("sort_by", "date")
+        search = request.args.get("search", "") or None
+        sort_by = _RESULT_SORT_KEYS.get(request.args.get("sort_by", "date"), "completed_at")
         limit = min(_safe_int(request.args.get("limit", 50), 50), _MAX_QUERY_LIMIT)
         offset = _safe_int(request.args.get("offset", 0), 0)
+        cursor = request.args.get("cursor") or None
 
-        # Get completed jobs
-        all_jobs = run_async(queue.list_jobs(limit=1000))
-        completed = [j for j in all_jobs if j.status == JobStatus.COMPLETED]
-
-        # Filter by search
-        if search:
-            search_lower = search.lower()
-            completed = [j for j in completed if search_lower in j.prompt.lower()]
-
-        # Sort
-        if sort_by == "cost":
-            completed.sort(key=lambda j: j.cost or 0, reverse=True)
-        elif sort_by == "model":
-            completed.sort(key=lambda j: j.model or "")
-        else:  # date
-            completed.sort(
-                key=lambda j: (
-                    _ensure_utc(j.completed_at) or _ensure_utc(j.submitted_at) or datetime.min.replace(tzinfo=UTC)
-                ),
-                reverse=True,
+        try:
+            jobs = run_async(
+                queue.list_jobs(
+                    status=JobStatus.COMPLETED,
+                    limit=limit,
+                    offset=offset,
+                    search=search,
+                    sort_by=sort_by,
+                    cursor=cursor,
+                )
             )
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+        total = run_async(queue.count_jobs(status=JobStatus.COMPLETED, search=search))
+        next_cursor = encode_job_cursor(jobs[-1], sort_by) if len(jobs) == limit else None
 
-        # Paginate
-        total = len(completed)
-        completed = completed[offset : offset + limit]
-
-        # Build results with content preview
-        results = []
-        for job in completed:
-            result_data = {
-                "id": job.id,
-                "job_id": job.id,
-                "prompt": job.prompt,
-                "model": job.model,
-                "cost": job.cost or 0,
-                "tokens_used": job.tokens_used or 0,
-                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                "created_at": job.submitted_at.isoformat() if job.submitted_at else None,
-                "citations_count": 0,
-                "content": "",
-                "tags": job.tags if hasattr(job, "tags") else [],
-                "enable_web_search": job.enable_web_search,
-            }
-
-            # Try to get content preview
-            try:
-                content = run_async(storage.get_report(job_id=job.id, filename="report.md"))
-                content_str = content.decode("utf-8")
-                result_data["content"] = content_str[:500] if len(content_str) > 500 else content_str
-                # Count citations (rough estimate by counting URLs)
-                result_data["citations_count"] = content_str.count("http")
-            except Exception as exc:
-                logger.debug("Could not load result preview for job %s: %s", job.id, exc, exc_info=exc)
-
-            results.append(result_data)
-
-        return jsonify({"results": results, "total": total})
+        return jsonify(
+            {"results": [_result_listing_entry(job) for job in jobs], "total": total, "next_cursor": next_cursor}
+        )
 
     except Exception as e:
         logger.error(f"Error listing results: {e}")
@@ -1620,26 +1625,20 @@ def search_results():
         if not query:
             return jsonify({"results": [], "total": 0})
 
-        # Get completed jobs and search
-        all_jobs = run_async(queue.list_jobs(limit=1000))
-        completed = [j for j in all_jobs if j.status == JobStatus.COMPLETED]
-
-        query_lower = query.lower()
-        matches = []
-
-        for job in completed:
-            if query_lower in job.prompt.lower():
-                matches.append(
-                    {
-                        "id": job.id,
-                        "prompt": job.prompt,
-                        "model": job.model,
-                        "cost": job.cost or 0,
-                        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                    }
-                )
+        jobs = run_async(queue.list_jobs(status=JobStatus.COMPLETED, limit=limit, search=query))
+        total = run_async(queue.count_jobs(status=JobStatus.COMPLETED, search=query))
+        matches = [
+            {
+                "id": job.id,
+                "prompt": job.prompt,
+                "model": job.model,
+                "cost": job.cost or 0,
+                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+            }
+            for job in jobs
+        ]
 
-        return jsonify({"results": matches[:limit], "total": len(matches)})
+        return jsonify({"results": matches, "total": total})
 
     except Exception as e:
         logger.error(f"Error searching results: {e}")
@@ -1742,28 +1741,14 @@ def _expert_counts(profile) -> tuple[int, int, int]:
     an expert with 7 documents and 25 absorbed beliefs displayed as
     "2 docs, 0 findings". Documents come from the profile counter (which
     learning/integration updates), findings from the canonical belief store,
-    gaps from the manifest backlog.
+    gaps from the manifest backlog. The last two are read through the cached
+    roster summary, which is rebuilt only when the expert's state files change.
     """
-    doc_count = max(
-        int(getattr(profile, "total_documents", 0) or 0),
-        len(getattr(profile, "source_files", []) or []),
-    )
-
-    finding_count = len(getattr(profile, "research_jobs", []) or [])
-    try:
-        from deepr.experts.beliefs import BeliefStore
-
-        finding_count = max(finding_count, len(BeliefStore(profile.name).beliefs))
-    except Exception as exc:
-        logger.debug("Could not read belief store for %s: %s", profile.name, exc, exc_info=exc)
-
-    gap_count = 0
-    try:
-        gap_count = len(profile.get_manifest().gaps)
-    except Exception as exc:
-        logger.debug("Could not read expert manifest for %s: %s", profile.name, exc, exc_info=exc)
+    from deepr.experts.roster_summary import read_roster_summary
 
-    return doc_count, finding_count, gap_count
+    summary = read_roster_summary(profile)
+    finding_count = max(len(getattr(profile, "research_jobs", []) or []), summary.belief_count)
+    return summary.document_count, finding_count, summary.gap_count
 
 
 register_expert_read_apis(app, _experts_dir, _decode_expert_name, _safe_int, _MAX_QUERY_LIMIT, logger)
@@ -3362,6 +3347,7 @@ def load_demo_data():
                     report_paths={"markdown": "report.md"} if not is_failed else {},
                     cost=sample["cost"],
                     tokens_used=sample["tokens"],
+                    report_text=None if is_failed else report_content,
                 )
             )
             created_jobs += 1
@@ -224,24 +224,19 @@ def _register_evidence_route(app: Flask, resolve: Resolver, logger: logging.Logg
 
 
 def _corpus_records(index: Path) -> list[dict[str, Any]]:
-    """Every line in the index that describes a source.
+    """One record per source in the index, in sha256 order.
 
     Keyed on the presence of `sha256` rather than on position, so the schema
     header is excluded by not being a source rather than by being first, and a
     second header line or a reordered file changes nothing. One malformed line
-    is skipped rather than hiding the rest of the corpus.
+    is skipped rather than hiding the rest of the corpus. The index is appended
+    between compactions, so a superseded source's later line replaces its
+    first.
     """
-    records: list[dict[str, Any]] = []
-    for line in index.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        try:
-            record = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(record, dict) and "sha256" in record:
-            records.append(record)
-    return records
+    from deepr.experts.corpus_store import index_records
+
+    records = index_records(index.read_text(encoding="utf-8"))
+    return [records[sha] for sha in sorted(records)]
 
 
 def _register_corpus_route(app: Flask, resolve: Resolver, logger: logging.Logger) -> None:
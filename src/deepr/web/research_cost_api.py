@@ -333,6 +333,7 @@ class WebResearchCostCoordinator:
         actual_cost: float | None,
         tokens: int | None,
         report_saved: bool = True,
+        report_text: str | None = None,
     ) -> None:
         """Persist results, settle cost, and only then mark completion.
 
@@ -356,6 +357,7 @@ class WebResearchCostCoordinator:
                     report_paths={"markdown": "report.md"},
                     cost=accounted_cost,
                     tokens_used=tokens,
+                    report_text=report_text,
                 )
             )
             loop.run_until_complete(queue.update_status(job_id=job.id, status=JobStatus.COMPLETED))
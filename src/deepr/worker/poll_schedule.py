@@ -0,0 +1,182 @@
+"""Per-job provider polling schedule for ``JobPoller``.
+
+Each active job has its own next-check time, kept in a min-heap. The
+schedule keeps the most recent completion times of each model and plans
+checks from their percentiles. No check happens before the model's 10th
+percentile duration. After that, each check is placed where a further 15%
+of the remaining completion probability has passed. Near the likely
+completion window gaps are capped at ``near_delay``. Past the 95th
+percentile the cap rises to ``max_delay``. Gaps are never shorter than
+``min_delay``. A model with too few recorded completions is checked every
+``default_delay`` seconds. Every delay gets random jitter so jobs submitted
+together do not poll in lockstep.
+
+``wake`` makes a job due immediately, which is how a webhook notification
+short-circuits the schedule.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+import random
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+
+# Recent completions kept per model.
+_DURATION_SAMPLES = 100
+# Completions needed before a model's percentiles are trusted.
+_MIN_DURATION_SAMPLES = 5
+# Share of a model's jobs expected to finish before the first check.
+_FIRST_CHECK_QUANTILE = 0.1
+# Share of the remaining completion probability each later check waits for.
+_CHECK_STEP = 0.15
+# Past this share of completions, checks fall back to ``max_delay``.
+_NEAR_QUANTILE = 0.95
+
+
+class PollSchedule:
+    """Next-check times for active jobs, ordered in a heap.
+
+    Not thread-safe; the poller drives it from its event loop. Times are
+    ``time.monotonic()`` seconds supplied by the caller.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_delay: float,
+        max_delay: float,
+        near_delay: float | None = None,
+        default_delay: float | None = None,
+        jitter: float = 0.2,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        near_delay = max_delay if near_delay is None else near_delay
+        if min_delay <= 0 or not min_delay <= near_delay <= max_delay:
+            raise ValueError("delays must satisfy 0 < min_delay <= near_delay <= max_delay")
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.near_delay = near_delay
+        self.default_delay = max_delay if default_delay is None else default_delay
+        self.jitter = jitter
+        self._rand = rand
+        self._heap: list[tuple[float, int, str]] = []
+        self._due: dict[str, float] = {}
+        self._recent: dict[str, deque[float]] = {}
+        self._sorted: dict[str, list[float]] = {}
+        self._sequence = itertools.count()
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._due
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def record_duration(self, model: str, seconds: float) -> None:
+        """Add one observed completion time to the model's recent sample."""
+        if seconds <= 0:
+            return
+        recent = self._recent.setdefault(model, deque())
+        ordered = self._sorted.setdefault(model, [])
+        if len(recent) == _DURATION_SAMPLES:
+            del ordered[bisect.bisect_left(ordered, recent.popleft())]
+        recent.append(seconds)
+        bisect.insort(ordered, seconds)
+
+    def duration_percentile(self, model: str, share: float) -> float | None:
+        """Return the duration ``share`` of the model's recent jobs finished within, if known."""
+        ordered = self._sorted.get(model, [])
+        if len(ordered) < _MIN_DURATION_SAMPLES:
+            return None
+        return ordered[min(len(ordered) - 1, max(0, int(share * len(ordered))))]
+
+    def first_check_delay(self, model: str, elapsed: float) -> float:
+        """Return how long a newly seen job can wait before its first check."""
+        first = self.duration_percentile(model, _FIRST_CHECK_QUANTILE)
+        return 0.0 if first is None else max(0.0, first - elapsed)
+
+    def sync(self, job_ids: Iterable[str], now: float, first_delays: Mapping[str, float] | None = None) -> None:
+        """Track exactly ``job_ids`` and drop the rest.
+
+        A new job is due after its ``first_delays`` entry, or now without one.
+        """
+        active = dict.fromkeys(job_ids)
+        delays = first_delays or {}
+        for job_id in list(self._due):
+            if job_id not in active:
+                del self._due[job_id]
+        for job_id in active:
+            if job_id not in self._due:
+                self._push(job_id, now + delays.get(job_id, 0.0))
+
+    def discard(self, job_id: str) -> None:
+        """Stop tracking a job until the next ``sync`` lists it again."""
+        self._due.pop(job_id, None)
+
+    def wake(self, job_id: str, now: float) -> None:
+        """Make a tracked job due immediately."""
+        if job_id in self._due and self._due[job_id] > now:
+            self._push(job_id, now)
+
+    def pop_due(self, now: float) -> list[str]:
+        """Remove and return the jobs due at ``now``, earliest first.
+
+        A popped job has no next check until ``reschedule`` gives it one.
+        """
+        due: list[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _, job_id = heapq.heappop(self._heap)
+            if self._due.get(job_id) == when:
+                self._due[job_id] = float("inf")
+                due.append(job_id)
+        return due
+
+    def reschedule(self, job_id: str, *, model: str, elapsed: float, now: float) -> float:
+        """Schedule a job's next check after a check at ``now``; return the delay.
+
+        Args:
+            job_id: Tracked job
+            model: Job model, for its recent durations
+            elapsed: Seconds since the provider started the job
+            now: Current monotonic time
+        """
+        if job_id not in self._due:
+            return 0.0
+        delay = self._planned_delay(model, elapsed)
+        delay *= 1 + self.jitter * (2 * self._rand() - 1)
+        self._push(job_id, now + delay)
+        return delay
+
+    def next_due(self) -> float | None:
+        """Return the earliest pending check time, or None when nothing is scheduled."""
+        while self._heap and self._due.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def _planned_delay(self, model: str, elapsed: float) -> float:
+        """Return the unjittered gap before the next check of a job ``elapsed`` seconds old."""
+        ordered = self._sorted.get(model, [])
+        if len(ordered) < _MIN_DURATION_SAMPLES:
+            return self.default_delay
+        finished = bisect.bisect_right(ordered, elapsed) / len(ordered)
+        if finished >= 1.0:
+            return self.max_delay
+        cap = self.near_delay
+        if finished < _FIRST_CHECK_QUANTILE:
+            target, cap = _FIRST_CHECK_QUANTILE, self.max_delay
+        else:
+            target = finished + _CHECK_STEP * (1.0 - finished)
+            if finished >= _NEAR_QUANTILE:
+                cap = self.max_delay
+        delay = ordered[min(len(ordered) - 1, int(target * len(ordered)))] - elapsed
+        return min(cap, max(self.min_delay, delay))
+
+    def _push(self, job_id: str, when: float) -> None:
+        # Superseded heap entries stay until they surface and are skipped.
+        self._due[job_id] = when
+        heapq.heappush(self._heap, (when, next(self._sequence), job_id))
+
+
+__all__ = ["PollSchedule"]
@@ -1,7 +1,10 @@
 """Job polling worker for local deployment."""
 
+import argparse
 import asyncio
 import logging
+import threading
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -27,10 +30,18 @@ from ..services.provider_status import (
 )
 from ..storage import create_storage
 from ..storage.base import StorageBackend
+from .poll_schedule import PollSchedule
 
 logger = logging.getLogger(__name__)
 _MAX_CONCURRENT_POLLS = 8
 _MIN_POLL_INTERVAL_SECONDS = 30
+# Bounds on the gap between two status checks of one job. Gaps are held to
+# the near bound while the job is inside its model's usual completion window.
+_MIN_CHECK_DELAY_SECONDS = 10.0
+_NEAR_CHECK_DELAY_SECONDS = 25.0
+_MAX_CHECK_DELAY_SECONDS = 60.0
+# Recent completions read at start-up to seed per-model durations.
+_DURATION_HISTORY_JOBS = 200
 _MAX_PROVIDER_RECONCILIATION_AGE = timedelta(hours=24)
 
 
@@ -52,6 +63,13 @@ class JobPoller:
 
     This is the local-first approach that doesn't require webhooks or ngrok.
     Works reliably on workstations, containers, and cloud deployments.
+
+    Each job is checked on its own schedule (see ``PollSchedule``), planned
+    from the percentiles of its model's recent durations. The queue is
+    re-read every ``poll_interval`` seconds, or sooner when a webhook
+    arrives; in between, due checks run against the last scan. ``on_webhook``
+    can be passed to ``create_webhook_server`` to have a provider
+    notification trigger an immediate status check.
     """
 
     def __init__(
@@ -66,7 +84,7 @@ class JobPoller:
         Initialize job poller.
 
         Args:
-            poll_interval: Seconds between polls (default: 30)
+            poll_interval: Longest wait between queue scans (default: 30)
             socketio: Optional Socket.IO instance for real-time events
         """
         if type(poll_interval) is not int or poll_interval <= 0:
@@ -79,6 +97,23 @@ class JobPoller:
         # not re-add the same job's spend to in-process daily/monthly totals.
         self._cost_controller_recorded_job_ids: set[str] = set()
         self._expired_reconciliation_attempted_job_ids: set[str] = set()
+        self._schedule = PollSchedule(
+            min_delay=_MIN_CHECK_DELAY_SECONDS,
+            near_delay=_NEAR_CHECK_DELAY_SECONDS,
+            max_delay=_MAX_CHECK_DELAY_SECONDS,
+            default_delay=float(self.poll_interval),
+        )
+        # Active jobs from the last queue scan, and when the next scan is due.
+        self._active_jobs: list[ResearchJob] = []
+        self._next_scan = 0.0
+        # Jobs that reached a terminal status; they leave the schedule until a
+        # rescan shows whether local finalization needs a retry.
+        self._finished_job_ids: set[str] = set()
+        self._wake = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Provider job IDs named by webhooks, filled from the webhook thread.
+        self._webhook_lock = threading.Lock()
+        self._webhook_provider_job_ids: set[str] = set()
 
         # Load config
         config = load_config()
@@ -105,7 +140,9 @@ class JobPoller:
     async def start(self) -> None:
         """Start the polling worker."""
         self.running = True
-        logger.info(f"Job poller started (interval: {self.poll_interval}s)")
+        self._loop = asyncio.get_running_loop()
+        await self._seed_model_durations()
+        logger.info(f"Job poller started (queue scan interval: {self.poll_interval}s)")
 
         while self.running:
             try:
@@ -115,16 +152,102 @@ class JobPoller:
 
                 logger.error("Error in poll cycle: %s", sanitize_log_message(str(exc)))
 
-            await asyncio.sleep(self.poll_interval)
+            await self._wait_for_next_check()
 
         logger.info("Job poller stopped")
 
     async def stop(self) -> None:
         """Stop the polling worker."""
         self.running = False
+        self._wake.set()
+
+    def on_webhook(self, provider_job_id: str | None, payload: dict[str, Any] | None = None) -> None:
+        """Check a job now because its provider reported an update.
+
+        Safe to call from the webhook server's thread. The payload is not
+        trusted: it only moves the job's next status check forward.
+        """
+        if not provider_job_id:
+            return
+        with self._webhook_lock:
+            self._webhook_provider_job_ids.add(provider_job_id)
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake.set)
+
+    async def _seed_model_durations(self) -> None:
+        """Seed per-model durations from recently completed jobs."""
+        try:
+            jobs = await self.queue.list_jobs(
+                status=JobStatus.COMPLETED, limit=_DURATION_HISTORY_JOBS, sort_by="completed_at"
+            )
+        except Exception:
+            logger.debug("Could not read completed jobs to seed poll schedule", exc_info=True)
+            return
+        for job in reversed(jobs):
+            elapsed = self._provider_reconciliation_age(job, until=job.completed_at)
+            if elapsed is not None and job.completed_at is not None:
+                self._schedule.record_duration(str(job.model), elapsed.total_seconds())
+
+    async def _wait_for_next_check(self) -> None:
+        """Sleep until the next job is due, the next queue scan, or a wake-up."""
+        delay = max(0.0, self._next_scan - time.monotonic())
+        next_due = self._schedule.next_due()
+        if next_due is not None:
+            delay = min(delay, max(0.0, next_due - time.monotonic()))
+        sleeper = asyncio.ensure_future(asyncio.sleep(delay))
+        waker = asyncio.ensure_future(self._wake.wait())
+        try:
+            await asyncio.wait({sleeper, waker}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sleeper.cancel()
+            waker.cancel()
+        self._wake.clear()
 
     async def _poll_cycle(self) -> None:
-        """Execute one poll cycle."""
+        """Execute one poll cycle: rescan the queue if needed and check the jobs that are due."""
+        with self._webhook_lock:
+            notified, self._webhook_provider_job_ids = self._webhook_provider_job_ids, set()
+        if notified or time.monotonic() >= self._next_scan:
+            await self._scan_active_jobs()
+        unique_jobs = self._active_jobs
+        now = time.monotonic()
+        for job in unique_jobs:
+            if job.provider_job_id in notified:
+                self._schedule.wake(str(job.id), now)
+
+        if not unique_jobs:
+            logger.debug("No active jobs to poll")
+            return
+
+        due_ids = set(self._schedule.pop_due(now))
+        due_jobs = [job for job in unique_jobs if str(job.id) in due_ids]
+        if not due_jobs:
+            logger.debug("No active job due for a status check")
+            return
+
+        logger.info("Polling %s of %s active jobs", len(due_jobs), len(unique_jobs))
+        for offset in range(0, len(due_jobs), _MAX_CONCURRENT_POLLS):
+            batch = due_jobs[offset : offset + _MAX_CONCURRENT_POLLS]
+            await asyncio.gather(*(self._poll_job(job) for job in batch))
+
+    async def _scan_active_jobs(self) -> None:
+        """Re-read the active jobs and schedule the first check of each new one."""
+        jobs = await self._list_active_jobs()
+        now = time.monotonic()
+        self._active_jobs = jobs
+        self._next_scan = now + self.poll_interval
+        self._finished_job_ids.clear()
+        first_delays = {}
+        for job in jobs:
+            if str(job.id) not in self._schedule:
+                elapsed = self._provider_reconciliation_age(job)
+                age = elapsed.total_seconds() if elapsed is not None else 0.0
+                first_delays[str(job.id)] = self._schedule.first_check_delay(str(job.model), age)
+        self._schedule.sync((str(job.id) for job in jobs), now, first_delays)
+
+    async def _list_active_jobs(self) -> list[ResearchJob]:
+        """Return every PROCESSING job once."""
         # Page through every PROCESSING job. A single limit=100 newest-first
         # slice starved older jobs once the backlog exceeded one page.
         page_size = 100
@@ -143,10 +266,6 @@ class JobPoller:
                 break
             page_offset += page_size
 
-        if not jobs:
-            logger.debug("No active jobs to poll")
-            return
-
         unique_jobs: list[ResearchJob] = []
         seen_job_ids: set[str] = set()
         for job in jobs:
@@ -156,18 +275,31 @@ class JobPoller:
                 continue
             seen_job_ids.add(job_id)
             unique_jobs.append(job)
-
-        logger.info("Polling %s active jobs", len(unique_jobs))
-        for offset in range(0, len(unique_jobs), _MAX_CONCURRENT_POLLS):
-            batch = unique_jobs[offset : offset + _MAX_CONCURRENT_POLLS]
-            await asyncio.gather(*(self._poll_job(job) for job in batch))
+        return unique_jobs
 
     async def _poll_job(self, job: ResearchJob) -> None:
-        """Check one job while isolating non-cancellation failures."""
+        """Check one job while isolating non-cancellation failures, then schedule its next check."""
         try:
             await self.check_job_status(job)
         except Exception:
             logger.exception("Error checking job %s", job.id)
+        finally:
+            self._schedule_next_check(job)
+
+    def _schedule_next_check(self, job: ResearchJob) -> None:
+        """Reschedule a checked job, or drop it once it reached a terminal status."""
+        job_id = str(job.id)
+        if job_id in self._finished_job_ids:
+            self._schedule.discard(job_id)
+            self._active_jobs = [active for active in self._active_jobs if str(active.id) != job_id]
+            return
+        elapsed = self._provider_reconciliation_age(job)
+        self._schedule.reschedule(
+            job_id,
+            model=str(job.model),
+            elapsed=elapsed.total_seconds() if elapsed is not None else 0.0,
+            now=time.monotonic(),
+        )
 
     async def check_job_status(self, job: ResearchJob) -> None:
         """Poll one job unless the same job is already in flight."""
@@ -207,6 +339,9 @@ class JobPoller:
 
             # Handle completion
             if provider_status == "completed":
+                elapsed = self._provider_reconciliation_age(job)
+                if elapsed is not None:
+                    self._schedule.record_duration(str(job.model), elapsed.total_seconds())
                 await self._handle_completion(job, response)
 
             elif terminal_error := terminal_provider_error(provider_status):
@@ -235,8 +370,8 @@ class JobPoller:
             # Don't mark as failed yet, might be temporary network issue
 
     @staticmethod
-    def _provider_reconciliation_age(job: ResearchJob) -> timedelta | None:
-        """Return durable provider-job age, or None for an unsafe snapshot."""
+    def _provider_reconciliation_age(job: ResearchJob, until: datetime | None = None) -> timedelta | None:
+        """Return durable provider-job age (at ``until``, default now), or None for an unsafe snapshot."""
         started_at = getattr(job, "started_at", None)
         submitted_at = getattr(job, "submitted_at", None)
         anchor = started_at if isinstance(started_at, datetime) else submitted_at
@@ -244,7 +379,10 @@ class JobPoller:
             return None
         if anchor.tzinfo is None:
             anchor = anchor.replace(tzinfo=UTC)
-        return datetime.now(UTC) - anchor
+        end = until or datetime.now(UTC)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=UTC)
+        return end - anchor
 
     async def _expire_provider_reconciliation(self, job: ResearchJob, reason: str) -> None:
         """Make one cancellation attempt, then stop automatic external traffic."""
@@ -379,6 +517,7 @@ class JobPoller:
         """Handle job completion."""
         from ..queue.base import JobStatus
 
+        self._finished_job_ids.add(str(job.id))
         try:
             logger.info(f"Job {job.id} completed, saving results")
 
@@ -406,6 +545,7 @@ class JobPoller:
                 report_paths={"markdown": "report.md"} if report_saved else {},
                 cost=cost,
                 tokens_used=tokens,
+                report_text=content if report_saved else None,
             )
             if not results_updated:
                 raise RuntimeError(f"Queue update_results failed for job {job.id}")
@@ -454,6 +594,7 @@ class JobPoller:
         terminal_on_cleanup_failure: bool = False,
     ) -> None:
         """Close a terminal provider outcome and persist its local status."""
+        self._finished_job_ids.add(str(job.id))
         try:
             logger.error("Job %s reached %s: %s", job.id, status.value, error)
             try:
@@ -539,13 +680,35 @@ class JobPoller:
             logger.exception("Error handling failure for job %s", job.id)
 
 
-async def run_poller(poll_interval: int = 30) -> None:
+def start_webhook_listener(poller: JobPoller, port: int, host: str = "127.0.0.1") -> threading.Thread:
+    """Serve provider webhooks on a daemon thread, waking ``poller`` on each one."""
+    from ..webhooks import create_webhook_server
+
+    app = create_webhook_server(poller.on_webhook, host=host, port=port)
+    thread = threading.Thread(
+        target=app.run,
+        kwargs={"host": host, "port": port, "use_reloader": False},
+        name="deepr-webhook",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+async def run_poller(poll_interval: int = 30, webhook_port: int | None = None, webhook_host: str = "127.0.0.1") -> None:
     """
     Run the job poller.
 
     This is the main entry point for the worker process.
+
+    Args:
+        poll_interval: Longest wait between queue scans
+        webhook_port: Also serve provider webhooks on this port
+        webhook_host: Interface the webhook listener binds
     """
     poller = JobPoller(poll_interval=poll_interval)
+    if webhook_port is not None:
+        start_webhook_listener(poller, webhook_port, host=webhook_host)
 
     try:
         await poller.start()
@@ -554,9 +717,29 @@ async def run_poller(poll_interval: int = 30) -> None:
         await poller.stop()
 
 
-if __name__ == "__main__":
-    # Set up logging
+def main(argv: list[str] | None = None) -> None:
+    """Run the worker from the command line.
+
+    ``--webhook`` serves provider webhooks on the configured
+    ``webhook.host``/``webhook.port`` (``DEEPR_WEBHOOK_HOST``,
+    ``DEEPR_WEBHOOK_PORT``); ``--webhook-port`` picks the port directly.
+    """
+    from ..core.settings import get_settings
+
+    parser = argparse.ArgumentParser(prog="python -m deepr.worker.poller", description="Poll active research jobs.")
+    parser.add_argument("--poll-interval", type=int, default=30, help="Longest wait between queue scans (seconds)")
+    parser.add_argument("--webhook", action="store_true", help="Serve provider webhooks on the configured port")
+    parser.add_argument("--webhook-port", type=int, help="Serve provider webhooks on this port")
+    args = parser.parse_args(argv)
+
+    webhook = get_settings().webhook
+    webhook_port = args.webhook_port
+    if webhook_port is None and args.webhook and webhook.enabled:
+        webhook_port = webhook.port
+
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(run_poller(poll_interval=args.poll_interval, webhook_port=webhook_port, webhook_host=webhook.host))
 
-    # Run poller
-    asyncio.run(run_poller())
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,10 @@ The fixtures are designed to enable comprehensive testing without
 making actual API calls or incurring costs.
 """
 
+import atexit
 import os
+import shutil
+import tempfile
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
@@ -42,6 +45,16 @@ if os.getenv("DEEPR_RUN_LIVE_TESTS") != "1":
     for _credential_name in _METERED_CREDENTIAL_ENV_VARS:
         os.environ.pop(_credential_name, None)
 
+# deepr.api.app and deepr.web.app open the queue and report storage at import
+# time, which for test modules happens during collection, before any fixture
+# runs. Point the queue and reports at a throwaway directory during collection
+# so those imports never create queue/ or data/reports/ in the working
+# directory; _isolate_runtime_data_root still gives every test its own paths.
+_COLLECTION_DATA_ROOT = tempfile.mkdtemp(prefix="deepr-test-data-")
+atexit.register(shutil.rmtree, _COLLECTION_DATA_ROOT, ignore_errors=True)
+os.environ["DEEPR_QUEUE_DB_PATH"] = os.path.join(_COLLECTION_DATA_ROOT, "queue", "research_queue.db")
+os.environ["DEEPR_REPORTS_PATH"] = os.path.join(_COLLECTION_DATA_ROOT, "reports")
+
 # Suppress slow-generation health checks globally - property tests use complex
 # strategies (nested dicts, filtered text) that can be slow on CI/Windows.
 hypothesis_settings.register_profile(
@@ -302,13 +315,15 @@ def _isolate_runtime_data_root(tmp_path, monkeypatch):
 
     ``DEEPR_DATA_DIR`` roots the local queue and expert store. Without this
     isolation, no-path CLI and library calls can write into the workspace queue
-    or the user's experts. Point the entire runtime root at a per-test temp
-    directory. Resolution tests may override the variables with ``monkeypatch``
-    after this fixture and their values win.
+    or the user's experts, and modules that build report storage at import time
+    create ``data/reports`` in the working directory. Point the entire runtime
+    root at a per-test temp directory. Resolution tests may override the
+    variables with ``monkeypatch`` after this fixture and their values win.
     """
     runtime_root = tmp_path / "data"
     monkeypatch.setenv("DEEPR_DATA_DIR", str(runtime_root))
     monkeypatch.setenv("DEEPR_QUEUE_DB_PATH", str(runtime_root / "queue" / "research_queue.db"))
+    monkeypatch.setenv("DEEPR_REPORTS_PATH", str(runtime_root / "reports"))
 
 
 @pytest.fixture(autouse=True)
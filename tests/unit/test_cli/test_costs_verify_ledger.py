@@ -0,0 +1,46 @@
+"""Tests for `deepr costs verify-ledger` - monthly segment index verification."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from deepr.cli.commands.costs import costs
+from deepr.observability.cost_ledger import CostLedger
+
+
+def _seed(tmp_path: Path) -> Path:
+    ledger_path = tmp_path / "cost_ledger.jsonl"
+    ledger = CostLedger(ledger_path=ledger_path)
+    ledger.record_event(operation="research", provider="openai", cost_usd=1.5, idempotency_key="one")
+    ledger.record_event(operation="chat", provider="xai", cost_usd=0.25)
+    return ledger_path
+
+
+def test_verify_ledger_builds_index_and_passes(tmp_path: Path) -> None:
+    ledger_path = _seed(tmp_path)
+
+    result = CliRunner().invoke(costs, ["verify-ledger", "--json", "--ledger-path", str(ledger_path)])
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.output)
+    assert payload["ok"] is True
+    assert [segment["event_count"] for segment in payload["segments"]] == [2]
+    assert (tmp_path / "cost_ledger.jsonl.segments").exists()
+
+
+def test_verify_ledger_fails_on_rewritten_segment(tmp_path: Path) -> None:
+    ledger_path = _seed(tmp_path)
+    runner = CliRunner()
+    runner.invoke(costs, ["verify-ledger", "--ledger-path", str(ledger_path)])
+    ledger_path.write_bytes(ledger_path.read_bytes().replace(b'"cost_usd": 1.5', b'"cost_usd": 0.5'))
+
+    result = runner.invoke(costs, ["verify-ledger", "--json", "--ledger-path", str(ledger_path)])
+
+    assert result.exit_code == 1
+    payload = json.loads(result.output)
+    assert payload["ok"] is False
+    assert payload["problems"] == [f"segment 1 ({payload['segments'][0]['month']}) content hash mismatch"]
+
+    rebuilt = runner.invoke(costs, ["verify-ledger", "--rebuild", "--ledger-path", str(ledger_path)])
+    assert rebuilt.exit_code == 0, rebuilt.output
@@ -152,7 +152,7 @@ class TestRunSingleAsync:
     """Test the _run_single async function."""
 
     @pytest.mark.asyncio
-    async def test_run_single_estimates_cost(self, monkeypatch):
+    async def test_run_single_estimates_cost(self, monkeypatch, tmp_path):
         """Test that _run_single estimates cost before proceeding."""
         from deepr.cli.commands.run import _run_single
         from deepr.cli.output import OutputContext, OutputMode
@@ -168,7 +168,8 @@ class TestRunSingleAsync:
                 mock_provider.submit_research = AsyncMock(return_value="job-123")
                 mock_create.return_value = mock_provider
 
-                with patch("deepr.config.load_config", return_value={"api_key": "test"}):
+                config = {"api_key": "test", "queue_db_path": str(tmp_path / "research_queue.db")}
+                with patch("deepr.config.load_config", return_value=config):
                     with (
                         patch("deepr.cli.commands.run.SQLiteQueue") as mock_queue_class,
                         patch("deepr.cli.commands.run._enqueue_reserved_job", new_callable=AsyncMock),
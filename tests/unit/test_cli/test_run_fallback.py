@@ -34,7 +34,7 @@ COMMON_PATCHES = {
 
 
 @pytest.fixture(autouse=True)
-def _enable_legacy_fallback_characterization(monkeypatch):
+def _enable_legacy_fallback_characterization(monkeypatch, tmp_path):
     """Exercise the retired fallback algorithm without enabling it in product."""
     monkeypatch.setattr("deepr.cli.commands.run.METERED_PROVIDER_FALLBACK_ENABLED", True)
     # The characterized request envelope is $1.78. Its explicit test-only
@@ -48,7 +48,12 @@ def _enable_legacy_fallback_characterization(monkeypatch):
         monkeypatch.setenv(name, "2")
     monkeypatch.setattr(
         "deepr.config.load_config",
-        lambda: {"max_cost_per_job": 2.0, "max_daily_cost": 2.0, "max_monthly_cost": 2.0},
+        lambda: {
+            "max_cost_per_job": 2.0,
+            "max_daily_cost": 2.0,
+            "max_monthly_cost": 2.0,
+            "queue_db_path": str(tmp_path / "research_queue.db"),
+        },
     )
     monkeypatch.setattr(
         "deepr.services.research_bounds.require_research_storage_accounting",
@@ -7,6 +7,7 @@ generic exception handler swallowed it, and the job stayed "processing" forever
 with its cost reservation open. The fix coerces the error to `str` first.
 """
 
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,7 +24,9 @@ class _ProviderErrorObject:
 
 
 @pytest.mark.asyncio
-async def test_provider_failed_job_is_marked_failed_with_string_error(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_provider_failed_job_is_marked_failed_with_string_error(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
     job = MagicMock()
     job.id = "research-test123"
     job.status = JobStatus.PROCESSING
@@ -48,7 +51,10 @@ async def test_provider_failed_job_is_marked_failed_with_string_error(monkeypatc
     with (
         patch.object(status_module, "SQLiteQueue", return_value=queue),
         patch("deepr.providers.create_provider", return_value=provider),
-        patch("deepr.config.load_config", return_value={"api_key": "test-key"}),
+        patch(
+            "deepr.config.load_config",
+            return_value={"api_key": "test-key", "results_dir": str(tmp_path / "reports")},
+        ),
     ):
         await status_module._get_results("research-test123")
 
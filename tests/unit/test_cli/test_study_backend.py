@@ -77,6 +77,19 @@ class TestPreferenceOrder:
         with pytest.raises(StudyBackendError):
             build_study_backend(profile=profile, plan="claude")
 
+    def test_a_pool_serves_one_call_per_plan(self, monkeypatch, profile):
+        from deepr.experts import backend_pool
+
+        pool = backend_pool.BackendPool(
+            backends=[backend_pool.PooledBackend(name=name, completion=lambda prompt: None) for name in ("a", "b", "c")]
+        )
+        monkeypatch.setattr(backend_pool, "build_pool", lambda profile, plans: pool)
+
+        backend = build_study_backend(profile=profile, plan="a,b,c")
+
+        assert backend.capacity_source == "plan:a+b+c"
+        assert backend.concurrency == 3
+
 
 class TestAutoRoutableSet:
     def test_only_genuinely_free_and_confined_adapters_are_preferred(self):
@@ -276,27 +276,27 @@ class TestSettings:
         assert provider == "test"
         assert model == "test-model"
 
-    def test_validate_missing_provider(self):
+    def test_validate_missing_provider(self, tmp_path):
         """Test validate() catches missing provider config."""
-        settings = Settings()
+        settings = Settings(data_dir=str(tmp_path / "data"))
         settings.default_provider = "nonexistent"
         settings.providers = {}
 
         errors = settings.validate()
         assert any("not configured" in err for err in errors)
 
-    def test_validate_missing_api_key(self):
+    def test_validate_missing_api_key(self, tmp_path):
         """Test validate() catches missing API key."""
-        settings = Settings()
+        settings = Settings(data_dir=str(tmp_path / "data"))
         settings.default_provider = "openai"
         settings.providers["openai"] = ProviderSettings(name="openai")
 
         errors = settings.validate()
         assert any("No API key" in err for err in errors)
 
-    def test_validate_invalid_budget(self):
+    def test_validate_invalid_budget(self, tmp_path):
         """Test validate() catches invalid budget limits."""
-        settings = Settings()
+        settings = Settings(data_dir=str(tmp_path / "data"))
         settings.providers["xai"] = ProviderSettings(name="xai", api_key="test")
         settings.budget.daily_limit = -0.01
 
@@ -600,6 +600,49 @@ class TestCostAggregator:
         # Aggregator should see the new entry
         assert abs(aggregator.get_daily_total() - 0.50) < 0.0001
 
+    def test_bucketed_breakdowns_match_entry_scan(self):
+        """Day-bucket breakdowns should equal a per-entry scan, boundary days included."""
+        base = datetime(2026, 3, 1, tzinfo=UTC)
+        entries = [
+            CostEntry(
+                operation=("research", "chat")[index % 2],
+                provider=("openai", "xai", "anthropic")[index % 3],
+                model=("", "gpt-5")[index % 2],
+                cost=0.01 * (index + 1),
+                timestamp=base + timedelta(hours=7 * index),
+            )
+            for index in range(60)
+        ]
+        aggregator = CostAggregator(entries)
+        start = base + timedelta(days=3, hours=5)
+        end = base + timedelta(days=9, hours=13)
+
+        bucketed = aggregator.get_all_breakdowns(start, end)
+
+        in_range = [e for e in entries if start <= e.timestamp <= end]
+        assert bucketed["by_provider"] == pytest.approx(aggregator._aggregate_by_field(in_range, lambda e: e.provider))
+        assert bucketed["by_model"] == pytest.approx(
+            aggregator._aggregate_by_field(in_range, lambda e: e.model or "unknown")
+        )
+        assert aggregator.get_daily_totals(date(2026, 3, 2), date(2026, 3, 3)) == pytest.approx(
+            {
+                date(2026, 3, 2): sum(e.cost for e in entries if e.date == date(2026, 3, 2)),
+                date(2026, 3, 3): sum(e.cost for e in entries if e.date == date(2026, 3, 3)),
+            }
+        )
+        assert aggregator.get_monthly_total(2026, 3) == pytest.approx(sum(e.cost for e in entries))
+
+    def test_buckets_rebuild_when_entries_shrink(self):
+        """Clearing the shared list should drop the buckets."""
+        entries = [CostEntry(operation="test", provider="openai", cost=0.50)]
+        aggregator = CostAggregator(entries)
+        assert aggregator.get_daily_total() == 0.50
+
+        entries.clear()
+
+        assert aggregator.get_daily_total() == 0.0
+        assert aggregator.get_breakdown_by_provider() == {}
+
 
 class TestCostDashboard:
     """Tests for CostDashboard class."""
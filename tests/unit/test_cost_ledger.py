@@ -109,7 +109,7 @@ def test_idempotency_refresh_read_error_fails_closed_before_duplicate_append(
     real_open = open
 
     def guarded_open(file, mode="r", *args, **kwargs):
-        if Path(file) == path and mode == "r":
+        if Path(file) == path and mode in {"r", "rb"}:
             raise PermissionError("blocked canonical read")
         return real_open(file, mode, *args, **kwargs)
 
@@ -526,3 +526,214 @@ def test_multiple_valid_corrections_for_one_target_are_ambiguous_and_fail_closed
     attributed = ledger.get_attributed_events()
 
     assert [(event.model, event.cost_usd) for event in attributed] == [("qwen2.5-coder:32b", 0.2)]
+
+
+def test_rollup_matches_strict_accounting_totals(tmp_path: Path):
+    path = tmp_path / "cost_ledger.jsonl"
+    ledger = CostLedger(ledger_path=path)
+    ledger.record_event("research", "openai", 1.25, source="cli", idempotency_key="a")
+    ledger.record_event("chat", "xai", 0.5, source="web")
+    ledger.record_event("research", "openai", 1.25, source="cli", idempotency_key="a")
+    old = json.loads(path.read_text(encoding="utf-8").splitlines()[1])
+    old["timestamp"] = "2026-01-15T23:30:00-02:00"
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(old) + "\n")
+
+    rollup = ledger.with_locked_rollup(lambda snapshot: snapshot)
+    events = ledger.with_locked_accounting_events(list)
+
+    assert rollup.event_count == len(events) == 3
+    assert rollup.total_usd == pytest.approx(sum(event.cost_usd for event in events))
+    assert rollup.daily["2026-01-16"] == pytest.approx(0.5)
+    assert rollup.monthly["2026-01"] == pytest.approx(0.5)
+    assert rollup.by_source == pytest.approx({"cli": 1.25, "web": 1.0})
+    assert rollup.by_provider == pytest.approx({"openai": 1.25, "xai": 1.0})
+    assert rollup.total_since(datetime(2026, 2, 1, tzinfo=UTC)) == pytest.approx(1.75)
+    assert ledger.get_total_cost(source="web") == pytest.approx(1.0)
+    assert ledger.has_idempotency_key("a") is True
+    assert ledger.has_idempotency_key("b") is False
+
+
+def test_total_cost_counts_a_sibling_ledger_replay_once_on_both_paths(tmp_path: Path):
+    path = tmp_path / "cost_ledger.jsonl"
+    sibling = tmp_path / "legacy" / "cost_ledger.jsonl"
+    ledger = CostLedger(ledger_path=path)
+    ledger.record_event("research", "openai", 1.0, idempotency_key="job:a")
+    ledger.record_event("chat", "xai", 0.5)
+    sibling.parent.mkdir()
+    sibling.write_text(path.read_text(encoding="utf-8").splitlines(keepends=True)[0], encoding="utf-8")
+    ledger._sibling_ledger_paths = lambda: (sibling,)
+
+    midnight = datetime(2020, 1, 1, tzinfo=UTC)
+    assert ledger.get_total_cost() == pytest.approx(1.5)
+    assert ledger.get_total_cost(start_date=midnight) == pytest.approx(1.5)
+    assert ledger.get_total_cost(start_date=midnight + timedelta(seconds=1)) == pytest.approx(1.5)
+
+
+def test_total_cost_reads_a_ledger_whose_durability_cannot_be_confirmed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    import deepr.observability.cost_ledger as cost_ledger_module
+
+    path = tmp_path / "cost_ledger.jsonl"
+    ledger = CostLedger(ledger_path=path)
+    ledger.record_event("research", "openai", 1.25, idempotency_key="k")
+
+    def read_only_fsync(_fd: int) -> None:
+        raise OSError(30, "Read-only file system")
+
+    monkeypatch.setattr(cost_ledger_module.os, "fsync", read_only_fsync)
+    fresh = CostLedger(ledger_path=path)
+
+    with pytest.raises(CostLedgerDurabilityError):
+        fresh.with_locked_rollup(lambda rollup: rollup.total_usd)
+    assert fresh.get_total_cost() == pytest.approx(1.25)
+    assert fresh.get_total_cost(start_date=datetime(2020, 1, 1, tzinfo=UTC)) == pytest.approx(1.25)
+
+
+def test_rollup_checkpoint_parses_only_appended_events(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    import deepr.observability.cost_ledger as cost_ledger_module
+
+    path = tmp_path / "cost_ledger.jsonl"
+    ledger = CostLedger(ledger_path=path)
+    for index in range(5):
+        ledger.record_event("research", "openai", 0.25, idempotency_key=f"k{index}")
+    ledger._rollups.save()
+
+    parsed: list[bytes] = []
+    real_parse = cost_ledger_module._parse_ledger_line
+
+    def counting_parse(line: bytes):
+        parsed.append(line)
+        return real_parse(line)
+
+    monkeypatch.setattr(cost_ledger_module, "_parse_ledger_line", counting_parse)
+    fresh = CostLedger(ledger_path=path)
+    assert parsed == []
+
+    _event, created = fresh.record_event("research", "openai", 0.25, idempotency_key="k5")
+
+    assert created is True
+    assert len(parsed) == 1
+    assert fresh.get_total_cost() == pytest.approx(1.5)
+
+
+def test_rollup_rebuilds_when_ledger_changes_below_checkpoint(tmp_path: Path):
+    path = tmp_path / "cost_ledger.jsonl"
+    ledger = CostLedger(ledger_path=path)
+    ledger.record_event("research", "openai", 1.0, idempotency_key="first")
+    ledger.record_event("research", "openai", 2.0, idempotency_key="second")
+    ledger._rollups.save()
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    path.write_text(lines[1] + lines[0].replace('"cost_usd": 1.0', '"cost_usd": 4.0'), encoding="utf-8")
+
+    fresh = CostLedger(ledger_path=path)
+
+    assert fresh.with_locked_rollup(lambda rollup: rollup.total_usd) == pytest.approx(6.0)
+    with pytest.raises(CostLedgerIdempotencyConflict, match="conflicts"):
+        fresh.record_event("research", "openai", 1.0, idempotency_key="first")
+
+
+def _write_monthly_ledger(path: Path) -> None:
+    lines = [
+        CostLedgerEvent(operation="research", provider="openai", cost_usd=cost, timestamp=timestamp).to_dict()
+        for cost, timestamp in [
+            (1.0, datetime(2026, 1, 5, tzinfo=UTC)),
+            (2.0, datetime(2026, 1, 20, tzinfo=UTC)),
+            (4.0, datetime(2026, 2, 3, tzinfo=UTC)),
+            (8.0, datetime(2026, 3, 9, tzinfo=UTC)),
+        ]
+    ]
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8")
+
+
+def test_segment_index_reads_only_overlapping_months(tmp_path: Path):
+    path = tmp_path / "cost_ledger.jsonl"
+    _write_monthly_ledger(path)
+    ledger = CostLedger(ledger_path=path)
+
+    segments, problems = ledger.verify_segment_index()
+    assert problems == []
+    assert [(segment.month, segment.event_count) for segment in segments] == [(202601, 2), (202602, 1), (202603, 1)]
+
+    # Same-length tamper inside January: a March window never opens those bytes.
+    raw = path.read_bytes()
+    path.write_bytes(raw.replace(b'"cost_usd": 1.0', b'"cost_usd": 9.0', 1))
+    index_before = (tmp_path / "cost_ledger.jsonl.segments").read_bytes()
+    march = ledger.get_events(start_date=datetime(2026, 3, 1, tzinfo=UTC))
+    assert [event.cost_usd for event in march] == [8.0]
+    assert (tmp_path / "cost_ledger.jsonl.segments").read_bytes() == index_before
+
+    _segments, problems = ledger.verify_segment_index()
+    assert problems == ["segment 1 (2026-01) content hash mismatch"]
+    assert ledger.get_total_cost(end_date=datetime(2026, 1, 31, tzinfo=UTC)) == pytest.approx(11.0)
+    assert ledger.verify_segment_index()[1] == []
+
+
+def test_segment_index_extends_with_appends_and_unindexed_tail(tmp_path: Path):
+    path = tmp_path / "cost_ledger.jsonl"
+    _write_monthly_ledger(path)
+    ledger = CostLedger(ledger_path=path)
+    ledger.verify_segment_index()
+
+    ledger.record_event("chat", "xai", 0.5, source="web")
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"partial": ')
+
+    recent = ledger.get_events(start_date=datetime(2026, 3, 1, tzinfo=UTC))
+    assert [event.cost_usd for event in recent] == [8.0, 0.5]
+    segments, problems = ledger.verify_segment_index(rebuild=True)
+    assert problems == []
+    assert segments[-1].end == path.stat().st_size - len('{"partial": ')
+
+
+def test_group_commit_shares_fsync_and_preserves_idempotency(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    import deepr.observability.cost_ledger as cost_ledger_module
+
+    ledger = CostLedger(ledger_path=tmp_path / "cost_ledger.jsonl", group_commit_window_ms=50)
+    fsyncs: list[int] = []
+    real_fsync = os.fsync
+
+    def counting_fsync(fd: int) -> None:
+        fsyncs.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(cost_ledger_module.os, "fsync", counting_fsync)
+    writers = 16
+    barrier = Barrier(writers)
+
+    def write(index: int):
+        barrier.wait()
+        key = "shared" if index % 4 == 0 else f"own-{index}"
+        return ledger.record_event("research", "openai", 0.5, idempotency_key=key, require_fsync=True)
+
+    with ThreadPoolExecutor(max_workers=writers) as pool:
+        results = list(pool.map(write, range(writers)))
+
+    assert sum(created for _event, created in results) == writers - 3
+    assert len({event.timestamp for event, _created in results if event.idempotency_key == "shared"}) == 1
+    assert len(ledger.get_events()) == writers - 3
+    assert len(fsyncs) < writers
+    assert ledger.get_total_cost() == pytest.approx(0.5 * (writers - 3))
+
+
+def test_group_commit_fails_only_the_conflicting_append(tmp_path: Path):
+    ledger = CostLedger(ledger_path=tmp_path / "cost_ledger.jsonl", group_commit_window_ms=50)
+    barrier = Barrier(3)
+
+    def write(cost: float):
+        barrier.wait()
+        key = "same" if cost < 2 else "other"
+        return ledger.record_event("research", "openai", cost, idempotency_key=key)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(write, cost) for cost in (1.0, 1.5, 2.0)]
+    outcomes = [future.exception() or future.result() for future in futures]
+
+    assert sum(isinstance(outcome, CostLedgerIdempotencyConflict) for outcome in outcomes) == 1
+    assert sorted(event.cost_usd for event in ledger.get_events()) in ([1.0, 2.0], [1.5, 2.0])
+
+
+def test_group_commit_window_must_be_non_negative(tmp_path: Path):
+    with pytest.raises(ValueError, match="group_commit_window_ms"):
+        CostLedger(ledger_path=tmp_path / "cost_ledger.jsonl", group_commit_window_ms=-1)
@@ -6,6 +6,7 @@ import json
 from pathlib import Path
 from types import SimpleNamespace
 
+import numpy as np
 import pytest
 from click.testing import CliRunner
 
@@ -33,6 +34,7 @@ from deepr.evals.recall_quality import (
     write_recall_eval_report,
 )
 from deepr.evals.retrieval_metrics import RETRIEVAL_METRIC_CASE_FIELDS
+from deepr.experts import ann_index, belief_vector_index
 from deepr.experts.beliefs import Belief, BeliefStore
 
 
@@ -415,6 +417,27 @@ class TestRunEval:
         assert report["index"]["embedding_model"] == "nomic-embed-text"
         assert "path" not in report["index"]
 
+    async def test_report_checks_ann_recall_over_stored_vectors(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ann_index, "ANN_MIN_ROWS", 40)
+        monkeypatch.setattr(belief_vector_index, "ANN_MIN_ROWS", 40)
+        store = _store(tmp_path)
+        rng = np.random.default_rng(7)
+        centers = rng.normal(size=(6, 8))
+        for index in range(60):
+            belief, _ = store.add_belief(Belief(claim=f"Opaque claim {index:03d}.", confidence=0.8, domain="d"))
+            vector = centers[index % 6] + 0.05 * rng.normal(size=8)
+            store.upsert_belief_embedding(belief.id, vector.tolist(), model="nomic-embed-text")
+        cases = [RecallEvalCase("c1", "opaque claim", (belief.id,))]
+
+        report = await run_recall_quality_eval(store, cases, top_k=3)
+        small = await run_recall_quality_eval(_seeded_store(tmp_path / "small")[0], cases)
+
+        assert report["ann_recall"]["ann_active"] is True
+        assert report["ann_recall"]["row_count"] == 60
+        assert report["ann_recall"]["top_k"] == 3
+        assert report["ann_recall"]["status"] == "pass"
+        assert small["ann_recall"]["status"] == "exact_scan"
+
     async def test_precomputed_embeddings_require_full_case_coverage(self, tmp_path):
         store, power, _ = _seeded_store(tmp_path)
         cases = [RecallEvalCase("c1", "power", (power.id,))]
@@ -0,0 +1,128 @@
+"""Inverted-file ANN index behind belief, document and context recall."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from deepr.evals.recall_quality import build_ann_recall_self_check
+from deepr.experts import ann_index, belief_vector_index
+from deepr.experts.ann_index import IvfIndex, maintained_ann, rank_by_cosine
+from deepr.experts.belief_vector_index import BeliefVectorIndex
+from deepr.experts.beliefs import Belief
+
+
+def _clustered(rows: int, dims: int = 24, clusters: int = 12, seed: int = 5) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dims))
+    return (centers[rng.integers(clusters, size=rows)] + 0.15 * rng.normal(size=(rows, dims))).astype(np.float32)
+
+
+def test_probe_keeps_exact_top_k_on_clustered_vectors() -> None:
+    matrix = _clustered(2000)
+    ann = IvfIndex.build(matrix)
+
+    report = build_ann_recall_self_check(matrix, ann, source="unit", top_k=10, sample_size=50)
+
+    assert report["ann_active"] is True
+    assert report["status"] == "pass"
+    assert report["recall_at_k"] >= report["min_recall_at_k"]
+    probed = ann.candidates(matrix[0])
+    assert 0 < len(probed) < len(matrix)
+
+
+def test_small_matrices_report_exact_scan() -> None:
+    report = build_ann_recall_self_check(_clustered(20), None, source="unit")
+
+    assert report["status"] == "exact_scan"
+    assert report["recall_at_k"] == 1.0
+
+
+def test_update_assigns_appended_rows_and_retrains_after_doubling() -> None:
+    matrix = _clustered(400)
+    ann = IvfIndex.build(matrix[:300])
+
+    grown = ann.update(matrix)
+    assert grown is ann
+    assert len(ann.assignments) == 400
+    assert ann.trained_rows == 300
+
+    doubled = ann.update(np.vstack([matrix, matrix]))
+    assert doubled is not ann
+    assert doubled.trained_rows == 800
+
+
+def test_rank_falls_back_to_exact_when_probe_is_too_small() -> None:
+    matrix = _clustered(500)
+    ann = IvfIndex.build(matrix)
+    eligible = np.arange(0, 500, 50)
+
+    rows, scores = rank_by_cosine(matrix, matrix[7], limit=len(eligible), rows=eligible, ann=ann, nprobe=1)
+
+    assert sorted(rows.tolist()) == eligible.tolist()
+    assert list(scores) == sorted(scores, reverse=True)
+
+
+def test_saved_index_is_ignored_for_another_matrix(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ann_index, "ANN_MIN_ROWS", 10)
+    path = tmp_path / "vectors.ivf.npz"
+    matrix = _clustered(100)
+    maintained_ann(None, matrix, path, generation="aaaaaaaaaaaa")
+
+    assert IvfIndex.load(path, rows=100, width=matrix.shape[1], generation="aaaaaaaaaaaa") is not None
+    assert IvfIndex.load(path, rows=100, width=matrix.shape[1], generation="bbbbbbbbbbbb") is None
+    assert IvfIndex.load(path, rows=50, width=matrix.shape[1], generation="aaaaaaaaaaaa") is None
+
+    maintained_ann(None, matrix[:5], path)
+    assert not path.exists()
+
+
+def test_belief_index_maintains_ann_across_upsert_and_removal(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ann_index, "ANN_MIN_ROWS", 40)
+    monkeypatch.setattr(belief_vector_index, "ANN_MIN_ROWS", 40)
+    vectors = _clustered(60, dims=8)
+    beliefs = [Belief(claim=f"claim {i}", confidence=0.5, domain="d") for i in range(60)]
+    index = BeliefVectorIndex.for_belief_store(tmp_path)
+    for belief, vector in zip(beliefs, vectors, strict=True):
+        index.upsert_belief(belief, vector.tolist())
+    assert index.ann_path.exists()
+
+    index.remove(beliefs[0].id)
+    matrix, ann = index.ann_snapshot()
+    assert ann is not None
+    assert len(ann.assignments) == len(matrix) == 59
+
+    reopened = BeliefVectorIndex.for_belief_store(tmp_path)
+    query = vectors[10].tolist()
+    approx = reopened.search(query, 5, beliefs=beliefs[1:])
+    exact = reopened.search(query, 5, beliefs=beliefs[1:], exact=True)
+    assert approx[0][0] == exact[0][0] == beliefs[10].id
+    assert reopened.ann_snapshot()[1].generation == ann.generation
+
+
+def test_belief_index_reads_never_build_the_ann(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ann_index, "ANN_MIN_ROWS", 40)
+    monkeypatch.setattr(belief_vector_index, "ANN_MIN_ROWS", 40)
+    vectors = _clustered(60, dims=8)
+    beliefs = [Belief(claim=f"claim {i}", confidence=0.5, domain="d") for i in range(60)]
+    index = BeliefVectorIndex.for_belief_store(tmp_path)
+    for belief, vector in zip(beliefs, vectors, strict=True):
+        index.upsert_belief(belief, vector.tolist())
+    index.ann_path.unlink()
+
+    reopened = BeliefVectorIndex.for_belief_store(tmp_path)
+    monkeypatch.setattr(IvfIndex, "build", classmethod(lambda cls, *a, **k: pytest.fail("read built an ANN index")))
+    query = vectors[10].tolist()
+
+    assert reopened.search(query, 3, beliefs=beliefs)[0][0] == beliefs[10].id
+    assert reopened.ann_snapshot()[1] is None
+    assert not reopened.ann_path.exists()
+
+    monkeypatch.undo()
+    monkeypatch.setattr(ann_index, "ANN_MIN_ROWS", 40)
+    monkeypatch.setattr(belief_vector_index, "ANN_MIN_ROWS", 40)
+    reopened.upsert_belief(beliefs[0], (vectors[0] * 2).tolist())
+    assert reopened.ann_path.exists()
+    assert reopened.ann_snapshot()[1] is not None
@@ -0,0 +1,153 @@
+"""Snapshot + journal persistence for BeliefStore."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from deepr.experts import belief_journal
+from deepr.experts.beliefs import Belief, BeliefStore, BeliefStoreError
+
+
+def _store(tmp_path: Path) -> BeliefStore:
+    return BeliefStore(expert_name="test", storage_dir=tmp_path / "beliefs")
+
+
+def _snapshot(store: BeliefStore) -> dict:
+    return json.loads(store.storage_path.read_text(encoding="utf-8"))
+
+
+def _journal_lines(store: BeliefStore) -> list[dict]:
+    path = store.storage_dir / belief_journal.JOURNAL_FILENAME
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def test_first_save_writes_snapshot_then_mutations_append(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    first, _ = store.add_belief(Belief(claim="Rust has a borrow checker", confidence=0.7, domain="lang"))
+    snapshot_before = store.storage_path.read_text(encoding="utf-8")
+    assert first.id in _snapshot(store)["beliefs"]
+    assert _journal_lines(store) == []
+
+    second, _ = store.add_belief(Belief(claim="Go ships a garbage collector", confidence=0.6, domain="lang"))
+    store.update_belief(first.id, new_confidence=0.65, reason="recheck")
+
+    assert store.storage_path.read_text(encoding="utf-8") == snapshot_before
+    records = _journal_lines(store)
+    assert [record["seq"] for record in records] == [1, 2]
+    assert set(records[0]["beliefs"]) == {second.id}
+    assert set(records[1]["beliefs"]) == {first.id}
+    assert len(records[1]["changes"]) == 1
+
+
+def test_reload_replays_journal_into_identical_state(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    kept, _ = store.add_belief(Belief(claim="SQLite supports WAL mode", confidence=0.8, domain="db"))
+    gone, _ = store.add_belief(Belief(claim="Postgres has MVCC", confidence=0.7, domain="db"))
+    other, _ = store.add_belief(Belief(claim="Redis is single threaded", confidence=0.5, domain="db"), dedup=False)
+    store.add_edge(kept.id, other.id, "contradicts", provenance="test")
+    store.archive_belief(gone.id, reason="retired")
+    store.record_retrieval([kept.id])
+
+    reopened = _store(tmp_path)
+    assert reopened._unreadable is False
+    assert set(reopened.beliefs) == {kept.id, other.id}
+    assert reopened.beliefs[kept.id].retrieval_count == 1
+    assert reopened.beliefs[kept.id].contradictions_with == [other.id]
+    assert set(reopened.edges) == set(store.edges)
+    assert [c.to_dict() for c in reopened.changes] == [c.to_dict() for c in store.changes]
+    assert reopened.domain_index["db"] == {kept.id, other.id}
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(belief_journal, "_COMPACT_MIN_BYTES", 0)
+    store = _store(tmp_path)
+    for i in range(6):
+        store.add_belief(Belief(claim=f"fact number {i} about caching", confidence=0.5, domain=f"d{i}"))
+
+    snapshot = _snapshot(store)
+    assert snapshot["journal"]["seq"] >= 1
+    assert len(snapshot["beliefs"]) > 1
+    journal_path = store.storage_dir / belief_journal.JOURNAL_FILENAME
+    journal_bytes = journal_path.stat().st_size if journal_path.exists() else 0
+    assert journal_bytes <= store.storage_path.stat().st_size
+
+    reopened = _store(tmp_path)
+    assert set(reopened.beliefs) == set(store.beliefs)
+    assert len(reopened.changes) == len(store.changes)
+
+
+def test_stale_records_from_absorbed_generation_are_not_replayed(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.add_belief(Belief(claim="alpha", confidence=0.5, domain="d"))
+    store.add_belief(Belief(claim="beta", confidence=0.5, domain="d"), dedup=False)
+    journal_path = store.storage_dir / belief_journal.JOURNAL_FILENAME
+    pending = journal_path.read_bytes()
+
+    # Crash between the compacted snapshot write and the journal reset.
+    belief_journal.compact_belief_store(store)
+    journal_path.write_bytes(pending)
+
+    reopened = _store(tmp_path)
+    assert reopened._unreadable is False
+    assert len(reopened.changes) == len(store.changes)
+
+
+def test_torn_final_record_is_dropped_and_compacted(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.add_belief(Belief(claim="alpha", confidence=0.5, domain="d"))
+    store.record_retrieval(list(store.beliefs))
+    journal_path = store.storage_dir / belief_journal.JOURNAL_FILENAME
+    with journal_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"generation": "torn", "seq": 9')
+
+    reopened = _store(tmp_path)
+    assert reopened._unreadable is False
+    assert not journal_path.exists()
+    assert next(iter(reopened.beliefs.values())).retrieval_count == 1
+
+
+def test_malformed_mid_journal_record_refuses_writes(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.add_belief(Belief(claim="alpha", confidence=0.5, domain="d"))
+    store.record_retrieval(list(store.beliefs))
+    journal_path = store.storage_dir / belief_journal.JOURNAL_FILENAME
+    original = journal_path.read_text(encoding="utf-8")
+    journal_path.write_text("{not-json\n" + original, encoding="utf-8")
+
+    reopened = _store(tmp_path)
+    assert reopened._unreadable is True
+    with pytest.raises(BeliefStoreError, match="unreadable"):
+        reopened.add_belief(Belief(claim="gamma", confidence=0.5, domain="d"))
+
+
+def test_event_log_ahead_of_journal_still_fails_closed(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.add_belief(Belief(claim="alpha", confidence=0.5, domain="d"))
+    store.add_belief(Belief(claim="beta is unrelated", confidence=0.5, domain="d"))
+    journal_path = store.storage_dir / belief_journal.JOURNAL_FILENAME
+    # Drop the last journal append, as a crash after the event fsync would.
+    lines = journal_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    journal_path.write_text("".join(lines[:-1]), encoding="utf-8")
+
+    assert _store(tmp_path)._unreadable is True
+
+
+def test_legacy_snapshot_without_journal_marker_ignores_foreign_journal(tmp_path: Path) -> None:
+    storage_dir = tmp_path / "beliefs"
+    storage_dir.mkdir()
+    (storage_dir / "beliefs.json").write_text('{"beliefs": {}, "edges": [], "changes": []}', encoding="utf-8")
+    (storage_dir / belief_journal.JOURNAL_FILENAME).write_text(
+        json.dumps({"generation": "old", "seq": 1, "beliefs": {"x": {"claim": "x", "confidence": 0.5}}}) + "\n",
+        encoding="utf-8",
+    )
+
+    store = BeliefStore(expert_name="test", storage_dir=storage_dir)
+    assert store.beliefs == {}
+    store.add_belief(Belief(claim="fresh", confidence=0.5, domain="d"))
+    assert "journal" in _snapshot(store)
+    assert not (storage_dir / belief_journal.JOURNAL_FILENAME).exists()
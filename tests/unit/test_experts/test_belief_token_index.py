@@ -0,0 +1,105 @@
+"""Inverted token index behind the BeliefStore lexical routers."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+from deepr.experts.belief_token_index import RELATED_FLOOR, SIMILAR_THRESHOLD, BeliefTokenIndex, has_negation
+from deepr.experts.beliefs import Belief, BeliefStore
+from deepr.experts.conflict_resolver import ConflictResolver
+
+_VOCAB = "the cache is not fast slow python rust memory safe by default service runs on linux windows".split()
+
+
+def _claims(seed: int, count: int) -> list[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(_VOCAB) for _ in range(rng.randint(3, 9))) for _ in range(count)]
+
+
+def _scan_similarity(a: str, b: str) -> float:
+    a_words, b_words = set(a.lower().split()), set(b.lower().split())
+    return len(a_words & b_words) / max(len(a_words), len(b_words), 1)
+
+
+def test_router_results_match_a_full_domain_scan() -> None:
+    index = BeliefTokenIndex()
+    stored = [Belief(claim=claim, confidence=0.5, domain="d") for claim in _claims(7, 300)]
+    for belief in stored:
+        index.add(belief)
+
+    for query in (Belief(claim=claim, confidence=0.5, domain="d") for claim in _claims(11, 60)):
+        same_polarity = [b for b in stored if has_negation(b.claim) == has_negation(query.claim)]
+        scored = [(_scan_similarity(query.claim, b.claim), b.id) for b in same_polarity]
+
+        expected_similar = next(((bid, score) for score, bid in scored if score > SIMILAR_THRESHOLD), None)
+        assert index.similar(query) == expected_similar
+
+        expected_related = sorted(
+            (-score, bid) for score, bid in scored if RELATED_FLOOR <= score < SIMILAR_THRESHOLD and bid != query.id
+        )
+        assert index.related(query) == [bid for _, bid in expected_related[:3]]
+
+        expected_contradictions = sorted(b.id for b in stored if ConflictResolver.beliefs_contradict(query, b))
+        assert index.contradiction_candidates(query) == expected_contradictions
+
+
+def _linear_find_similar(store: BeliefStore, belief: Belief) -> tuple[Belief, float] | None:
+    """The router as it was before the index: the first match of a domain scan."""
+    words = set(belief.claim.lower().split())
+    for existing in (b for b in store.beliefs.values() if b.domain == belief.domain):
+        existing_words = set(existing.claim.lower().split())
+        if has_negation(existing.claim) != has_negation(belief.claim):
+            continue
+        similarity = len(words & existing_words) / max(len(words), len(existing_words), 1)
+        if similarity > SIMILAR_THRESHOLD:
+            return existing, similarity
+    return None
+
+
+def test_store_router_matches_the_linear_scan(tmp_path: Path) -> None:
+    store = BeliefStore(expert_name="test", storage_dir=tmp_path / "beliefs")
+    # Inserted directly: add_belief would merge the near-duplicates this needs.
+    # The first match is weaker than the second, and the scan stops at the first.
+    claims = ["python cache is fast on linux hosts today", "python cache is fast on linux hosts", *_claims(5, 120)]
+    for claim in claims:
+        belief = Belief(claim=claim, confidence=0.5, domain="d")
+        store.beliefs[belief.id] = belief
+        store._index_belief(belief)
+
+    queries = ["python cache is fast on linux hosts", *_claims(13, 80)]
+    for claim in queries:
+        query = Belief(claim=claim, confidence=0.5, domain="d")
+        assert store.find_similar_with_score(query) == _linear_find_similar(store, query)
+
+    first = store.find_similar_with_score(
+        Belief(claim="python cache is fast on linux hosts", confidence=0.5, domain="d")
+    )
+    assert first is not None and first[0].claim.endswith("today")
+
+
+def test_index_scopes_candidates_by_domain() -> None:
+    index = BeliefTokenIndex()
+    other = Belief(claim="python is memory safe by default", confidence=0.5, domain="other")
+    index.add(other)
+
+    assert index.similar(Belief(claim="python is memory safe by default", confidence=0.5, domain="d")) is None
+
+
+def test_revised_claim_is_reposted(tmp_path: Path) -> None:
+    store = BeliefStore(expert_name="test", storage_dir=tmp_path / "beliefs")
+    belief, _ = store.add_belief(Belief(claim="the queue uses sqlite storage", confidence=0.6, domain="d"))
+    store.revise_belief(belief.id, "the scheduler runs every five minutes", 0.7, reason="rewrite")
+
+    assert store._find_similar(Belief(claim="the queue uses sqlite storage", confidence=0.5, domain="d")) is None
+    probe = Belief(claim="the scheduler runs every five minutes", confidence=0.5, domain="d")
+    assert store._find_similar(probe) is store.beliefs[belief.id]
+
+
+def test_archived_belief_leaves_the_index(tmp_path: Path) -> None:
+    store = BeliefStore(expert_name="test", storage_dir=tmp_path / "beliefs")
+    belief, _ = store.add_belief(Belief(claim="the service runs on linux hosts", confidence=0.6, domain="d"))
+    store.archive_belief(belief.id, reason="retired")
+
+    assert len(store._token_index) == 0
+    assert store._find_similar(Belief(claim="the service runs on linux hosts", confidence=0.5, domain="d")) is None
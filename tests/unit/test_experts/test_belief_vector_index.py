@@ -0,0 +1,186 @@
+"""Binary matrix storage and top-k search for BeliefVectorIndex."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from deepr.experts import belief_vector_index
+from deepr.experts.belief_vector_index import (
+    LEGACY_BELIEF_VECTOR_INDEX_FILENAME,
+    BeliefVectorIndex,
+    belief_claim_hash,
+)
+from deepr.experts.beliefs import Belief, BeliefStore
+
+
+def _beliefs(count: int) -> list[Belief]:
+    return [Belief(claim=f"claim number {i}", confidence=0.5, domain="d") for i in range(count)]
+
+
+def test_search_matches_brute_force_cosine(tmp_path: Path) -> None:
+    rng = np.random.default_rng(3)
+    beliefs = _beliefs(200)
+    vectors = rng.normal(size=(len(beliefs), 16))
+    index = BeliefVectorIndex.for_belief_store(tmp_path)
+    for belief, vector in zip(beliefs, vectors, strict=True):
+        index.upsert_belief(belief, vector.tolist(), model="m")
+    index.compact()
+
+    reopened = BeliefVectorIndex.for_belief_store(tmp_path)
+    assert isinstance(reopened._matrix, np.memmap)
+    query = rng.normal(size=16)
+    expected = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+    top = np.argsort(-expected)[:10]
+
+    hits = reopened.search(query.tolist(), 10, beliefs=beliefs, model="m")
+    assert [belief_id for belief_id, _ in hits] == [beliefs[i].id for i in top]
+    assert [score for _, score in hits] == pytest.approx(expected[top].tolist(), abs=1e-5)
+    assert reopened.search(query.tolist(), 10, beliefs=beliefs, model="other") == []
+
+
+def test_search_skips_stale_claims_and_other_dimensions(tmp_path: Path) -> None:
+    stale, current, wide = _beliefs(3)
+    index = BeliefVectorIndex.for_belief_store(tmp_path)
+    index.upsert_belief(stale, [1.0, 0.0])
+    index.upsert_belief(current, [0.9, 0.1])
+    index.upsert_belief(wide, [1.0, 0.0, 0.0])
+    stale.claim = "revised after embedding"
+
+    assert [belief_id for belief_id, _ in index.search([1.0, 0.0], 5, beliefs=[stale, current, wide])] == [current.id]
+    assert [belief_id for belief_id, _ in index.search([1.0, 0.0], 5)] == [stale.id, current.id]
+
+
+def test_legacy_json_is_read_and_replaced_on_next_write(tmp_path: Path) -> None:
+    first, second = _beliefs(2)
+    legacy = tmp_path / LEGACY_BELIEF_VECTOR_INDEX_FILENAME
+    legacy.write_text(
+        json.dumps(
+            {
+                "records": {
+                    first.id: {
+                        "belief_id": first.id,
+                        "claim_hash": belief_claim_hash(first.claim),
+                        "model": "m",
+                        "embedding": [0.5, 0.5],
+                    }
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    index = BeliefVectorIndex.for_belief_store(tmp_path)
+    assert index.vectors_for([first], model="m") == {first.id: (0.5, 0.5)}
+    assert legacy.exists()
+
+    index.upsert_belief(second, [0.0, 1.0], model="m")
+
+    assert not legacy.exists()
+    reopened = BeliefVectorIndex.for_belief_store(tmp_path)
+    assert set(reopened.vectors_for([first, second], model="m")) == {first.id, second.id}
+
+
+def test_sidecar_is_the_commit_point(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first, second, third = _beliefs(3)
+    index = BeliefVectorIndex.for_belief_store(tmp_path)
+    index.upsert_belief(first, [1.0, 0.0])
+    index.upsert_belief(second, [0.0, 1.0])
+
+    def crash(*_args: object, **_kwargs: object) -> None:
+        raise OSError("simulated crash before the sidecar replace")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(belief_vector_index, "atomic_write_json", crash)
+        with pytest.raises(OSError):
+            index.compact()
+    assert len(list(tmp_path.glob("*.npy"))) == 2
+
+    reopened = BeliefVectorIndex.for_belief_store(tmp_path)
+    assert reopened.vectors_for([first, second]) == {first.id: (1.0, 0.0), second.id: (0.0, 1.0)}
+    reopened.upsert_belief(third, [0.5, 0.5])
+    reopened.compact()
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+    assert not reopened.journal_path.exists()
+    assert set(BeliefVectorIndex.for_belief_store(tmp_path).vectors_for([first, second, third])) == {
+        first.id,
+        second.id,
+        third.id,
+    }
+
+
+def test_upserts_append_to_the_journal_instead_of_rewriting_the_matrix(tmp_path: Path) -> None:
+    rng = np.random.default_rng(5)
+    beliefs = _beliefs(50)
+    vectors = rng.normal(size=(len(beliefs), 8)).astype(np.float32)
+    index = BeliefVectorIndex.for_belief_store(tmp_path)
+    index.upsert_belief(beliefs[0], vectors[0].tolist(), model="m")
+    (matrix_file,) = tmp_path.glob("*.npy")
+    written = matrix_file.stat().st_mtime_ns
+
+    for belief, vector in zip(beliefs[1:], vectors[1:], strict=True):
+        index.upsert_belief(belief, vector.tolist(), model="m")
+    index.upsert_belief(beliefs[3], [1.0, 2.0, 3.0], model="m")
+
+    assert list(tmp_path.glob("*.npy")) == [matrix_file]
+    assert matrix_file.stat().st_mtime_ns == written
+    assert len(index.journal_path.read_text(encoding="utf-8").splitlines()) == len(beliefs)
+    reopened = BeliefVectorIndex.for_belief_store(tmp_path)
+    expected = {belief.id: tuple(vector.tolist()) for belief, vector in zip(beliefs, vectors, strict=True)}
+    expected[beliefs[3].id] = (1.0, 2.0, 3.0)
+    assert reopened.vectors_for(beliefs, model="m") == expected
+    query = vectors[7].tolist()
+    assert reopened.search(query, 5, beliefs=beliefs) == index.search(query, 5, beliefs=beliefs)
+
+
+def test_torn_journal_tail_is_dropped_and_the_next_write_compacts(tmp_path: Path) -> None:
+    first, second, third = _beliefs(3)
+    index = BeliefVectorIndex.for_belief_store(tmp_path)
+    index.upsert_belief(first, [1.0, 0.0])
+    index.upsert_belief(second, [0.0, 1.0])
+    with open(index.journal_path, "ab") as handle:
+        handle.write(b'{"generation": "torn')
+
+    reopened = BeliefVectorIndex.for_belief_store(tmp_path)
+    assert reopened.vectors_for([first, second]) == {first.id: (1.0, 0.0), second.id: (0.0, 1.0)}
+    reopened.upsert_belief(third, [0.5, 0.5])
+
+    assert not reopened.journal_path.exists()
+    assert set(BeliefVectorIndex.for_belief_store(tmp_path).vectors_for([first, second, third])) == {
+        first.id,
+        second.id,
+        third.id,
+    }
+
+
+def test_journal_compacts_once_it_outgrows_the_matrix(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(belief_vector_index, "_COMPACT_MIN_BYTES", 0)
+    beliefs = _beliefs(40)
+    index = BeliefVectorIndex.for_belief_store(tmp_path)
+    generations = set()
+    for belief in beliefs:
+        index.upsert_belief(belief, [1.0, 0.5, 0.25, 0.125])
+        generations.add(index._generation)
+
+    assert 1 < len(generations) < len(beliefs) // 2
+    assert len(BeliefVectorIndex.for_belief_store(tmp_path).records) == len(beliefs)
+
+
+def test_removal_compacts_rows_and_store_recall_uses_search(tmp_path: Path) -> None:
+    store = BeliefStore("Vector Test", storage_dir=tmp_path / "beliefs")
+    kept, _ = store.add_belief(Belief(claim="accelerator supply is tight", confidence=0.8, domain="infra"))
+    gone, _ = store.add_belief(Belief(claim="policy review cycles are slow", confidence=0.8, domain="policy"))
+    store.upsert_belief_embedding(gone.id, [1.0, 0.0], model="m")
+    store.upsert_belief_embedding(kept.id, [0.8, 0.2], model="m")
+
+    store.archive_belief(gone.id, reason="retired")
+
+    index = BeliefVectorIndex.for_belief_store(store.storage_dir)
+    assert index._matrix.shape == (1, 2)
+    candidates = store.recall_belief_candidates(
+        "supply", query_embedding=[1.0, 0.0], embedding_model="m", include_lexical_fallback=False
+    )
+    assert [candidate.item_id for candidate in candidates] == [kept.id]
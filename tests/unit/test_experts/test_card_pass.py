@@ -5,10 +5,12 @@ you can grow a document at a time is a different thing from one that must be
 rebuilt, and the difference is what lets a corpus get large.
 """
 
+import asyncio
 import json
 
 import pytest
 
+from deepr.experts.backend_pool import BackendPool, PooledBackend
 from deepr.experts.card_pass import (
     build_one_card,
     card_path,
@@ -166,6 +168,19 @@ class TestIncremental:
         assert result.reused == 1
         assert result.built == 0
 
+    @pytest.mark.asyncio
+    async def test_a_reused_card_does_not_read_its_source(self, corpus, tmp_path, monkeypatch):
+        completion = _completion_returning(_GOOD)
+        await run_card_pass(expert_name="E", corpus=corpus, expert_dir=tmp_path, completion=completion)
+        reads: list[str] = []
+        original_read = corpus.read
+        monkeypatch.setattr(corpus, "read", lambda sha: reads.append(sha) or original_read(sha))
+
+        result = await run_card_pass(expert_name="E", corpus=corpus, expert_dir=tmp_path, completion=completion)
+
+        assert result.reused == 1
+        assert reads == []
+
     @pytest.mark.asyncio
     async def test_rebuild_forces_a_re_read(self, corpus, tmp_path):
         calls: list[str] = []
@@ -195,6 +210,56 @@ class TestIncremental:
         assert result.exit_code == 1
 
 
+class TestPooledPass:
+    """Cards have no order between them, so a pool of plans reads them side by side."""
+
+    @staticmethod
+    def _slow_backend(name: str, state: dict):
+        async def run(prompt: str) -> str:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            if "poison" in prompt:
+                raise RuntimeError("this source always fails")
+            return json.dumps(_GOOD)
+
+        return PooledBackend(name=name, completion=run)
+
+    @pytest.mark.asyncio
+    async def test_uncached_sources_fan_out_and_keep_corpus_order(self, corpus, tmp_path):
+        for i in range(7):
+            corpus.add(f"Retained document number {i} with its own body text.", origin_key=f"url:s{i}.org")
+        state = {"in_flight": 0, "peak": 0}
+        pool = BackendPool(backends=[self._slow_backend(f"plan{n}", state) for n in range(4)])
+
+        result = await run_card_pass(expert_name="E", corpus=corpus, expert_dir=tmp_path, pool=pool)
+
+        assert state["peak"] == 4
+        assert [card.sha256 for card in result.cards] == [e.sha256 for e in corpus.study_entries()]
+        assert result.built == 8
+        assert all(load_card(tmp_path, card.sha256) is not None for card in result.cards)
+        assert {usage["calls"] for usage in pool.usage().values()} == {2}
+
+    @pytest.mark.asyncio
+    async def test_a_failing_source_is_an_error_card_while_the_rest_build(self, corpus, tmp_path):
+        corpus.add("A poison document whose every read fails, on whichever plan.", origin_key="url:p.org")
+        state = {"in_flight": 0, "peak": 0}
+        pool = BackendPool(backends=[self._slow_backend(f"plan{n}", state) for n in range(2)])
+
+        result = await run_card_pass(expert_name="E", corpus=corpus, expert_dir=tmp_path, pool=pool)
+
+        assert (result.built, result.failed) == (1, 1)
+        assert [card.error != "" for card in result.cards] == [
+            entry.origin_key == "url:p.org" for entry in corpus.study_entries()
+        ]
+
+    @pytest.mark.asyncio
+    async def test_a_completion_or_a_pool_is_required(self, corpus, tmp_path):
+        with pytest.raises(ValueError):
+            await run_card_pass(expert_name="E", corpus=corpus, expert_dir=tmp_path)
+
+
 class TestPersistence:
     def test_a_card_round_trips(self, tmp_path):
         card = SourceCard(
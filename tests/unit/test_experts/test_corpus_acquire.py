@@ -6,6 +6,8 @@ between one page fetched seven times and seven independent sources, so every
 corroboration count inflated with the refresh cadence.
 """
 
+import asyncio
+import time
 from types import SimpleNamespace
 
 import pytest
@@ -124,3 +126,50 @@ class TestFailureIsolation:
         await acquire_sources(expert_name="E", urls=[url, url, url], corpus=store, fetch_page=fetch)
 
         assert fetch.calls == [url]
+
+
+class TestConcurrentAcquisition:
+    @pytest.mark.asyncio
+    async def test_fetches_overlap_within_the_limit_and_report_in_input_order(self, store, monkeypatch):
+        urls = [f"https://site{n}.example/page" for n in range(6)]
+        in_flight = peak = 0
+
+        async def fetch(url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later URLs finish first, so input order has to be restored.
+            await asyncio.sleep(0.01 * (len(urls) - urls.index(url)))
+            in_flight -= 1
+            return _page(f"{_BODY} {url}")
+
+        saves = []
+        original_save = store._save
+        monkeypatch.setattr(store, "_save", lambda: (saves.append(1), original_save()))
+
+        result = await acquire_sources(expert_name="E", urls=urls, corpus=store, fetch_page=fetch, concurrency=3)
+
+        assert peak == 3
+        assert [s.url for s in result.sources] == urls
+        assert all(s.status == "retained" for s in result.sources)
+        assert len(saves) == 1
+        assert len(CorpusStore("Acquire Expert", storage_dir=store.root).active_entries()) == 6
+
+    @pytest.mark.asyncio
+    async def test_each_origin_is_paced_by_its_own_bucket(self, store):
+        urls = ["https://ex.com/a", "https://ex.com/b", "https://ex.com/c", "https://other.example/a"]
+        started = {}
+
+        async def fetch(url):
+            started[url] = time.monotonic()
+            return _page(f"{_BODY} {url}")
+
+        await acquire_sources(
+            expert_name="E", urls=urls, corpus=store, fetch_page=fetch, origin_rate=20.0, origin_burst=1
+        )
+
+        same_origin = sorted(started[url] for url in urls[:3])
+        assert same_origin[1] - same_origin[0] >= 0.04
+        assert same_origin[2] - same_origin[1] >= 0.04
+        # Another publisher is not held behind ex.com's pacing.
+        assert started["https://other.example/a"] < same_origin[1]
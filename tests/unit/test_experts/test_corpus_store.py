@@ -1,8 +1,11 @@
 """Corpus retention: content-addressed, idempotent, origin-honest."""
 
+import json
+
 import pytest
 
-from deepr.experts.corpus_store import CorpusStore, active_source_count, content_hash
+from deepr.experts import corpus_store
+from deepr.experts.corpus_store import CorpusStore, active_source_count, content_hash, index_records
 
 
 @pytest.fixture
@@ -92,6 +95,61 @@ class TestPersistence:
         reloaded = CorpusStore("Torn Expert", storage_dir=tmp_path / "corpus")
         assert reloaded.stats().active_count == 1
 
+    def test_batch_writes_the_index_once_on_exit(self, tmp_path):
+        store = CorpusStore("Batch Expert", storage_dir=tmp_path / "corpus")
+        with pytest.raises(RuntimeError), store.batch():
+            store.add("first body", origin_key="url:example.org")
+            store.add("second body", origin_key="url:example.org")
+            assert not store.index_path.exists()
+            raise RuntimeError("interrupted")
+
+        # Sources already on disk are indexed even when the block fails.
+        reloaded = CorpusStore("Batch Expert", storage_dir=tmp_path / "corpus")
+        assert reloaded.stats().active_count == 2
+
+
+class TestAppendOnlyIndex:
+    def test_writes_append_and_replay_to_the_same_entries(self, store):
+        first, _ = store.add("first body", origin_key="url:example.org")
+        size = store.index_path.stat().st_size
+        second, _ = store.add("second body", origin_key="url:example.org")
+        store.supersede(first.sha256, second.sha256)
+
+        text = store.index_path.read_text(encoding="utf-8")
+        assert len(text) > size
+        # Header, two adds and the superseded revision of the first entry.
+        assert len(text.splitlines()) == 4
+        reloaded = CorpusStore("Corpus Test Expert", storage_dir=store.root)
+        assert reloaded.entries == store.entries
+        assert active_source_count(text) == 1
+        assert index_records(text)[first.sha256]["superseded_by"] == second.sha256
+
+    def test_a_long_tail_is_compacted_into_sorted_form(self, store, monkeypatch):
+        monkeypatch.setattr(corpus_store, "_COMPACT_MIN_LINES", 3)
+        first, _ = store.add("first body", origin_key="url:example.org")
+        second, _ = store.add("second body", origin_key="url:example.org")
+        # Each supersede appends a line without adding an entry; the third
+        # pushes the tail past the floor and the index is rewritten.
+        for _ in range(3):
+            store.supersede(first.sha256, second.sha256)
+
+        lines = store.index_path.read_text(encoding="utf-8").splitlines()[1:]
+        assert [json.loads(line)["sha256"] for line in lines] == sorted(store.entries)
+        assert CorpusStore("Corpus Test Expert", storage_dir=store.root).entries == store.entries
+
+    def test_a_torn_tail_is_rewritten_rather_than_appended_to(self, tmp_path):
+        store = CorpusStore("Torn Expert", storage_dir=tmp_path / "corpus")
+        store.add("good body", origin_key="url:example.org")
+        with store.index_path.open("a", encoding="utf-8") as handle:
+            handle.write('{"sha256": "torn')
+
+        reloaded = CorpusStore("Torn Expert", storage_dir=tmp_path / "corpus")
+        reloaded.add("later body", origin_key="url:example.org")
+
+        text = reloaded.index_path.read_text(encoding="utf-8")
+        assert "torn" not in text
+        assert CorpusStore("Torn Expert", storage_dir=tmp_path / "corpus").stats().active_count == 2
+
 
 class TestActiveSourceCount:
     def test_header_and_superseded_lines_are_not_active(self):
@@ -160,10 +218,40 @@ class TestStudyMaterial:
         assert len(material[0][1]) == 1000
 
 
+class TestLazyStudyMaterial:
+    def test_material_is_read_only_as_it_is_consumed(self, store, monkeypatch):
+        for i in range(5):
+            store.add(f"source {i} " * 50, origin_key=f"url:s{i}.org")
+        reads: list[str] = []
+        original_read = store.read
+        monkeypatch.setattr(store, "read", lambda sha: reads.append(sha) or original_read(sha))
+
+        material = store.iter_study_material()
+        first = next(material)
+
+        assert reads == [first[0].sha256]
+        assert [e.sha256 for e, _ in [first, *material]] == [e.sha256 for e in store.study_entries()]
+
+    def test_chunks_are_packed_as_the_corpus_is_read(self, store, monkeypatch):
+        for i in range(6):
+            store.add(f"s{i} " + "x" * 4000, origin_key=f"url:s{i}.org")
+        reads: list[str] = []
+        original_read = store.read
+        monkeypatch.setattr(store, "read", lambda sha: reads.append(sha) or original_read(sha))
+
+        chunks = store.iter_study_chunks(chunk_chars=10000)
+        first = next(chunks)
+
+        # Two sources fill the first chunk; the third is what closed it.
+        assert len(first) == 2
+        assert len(reads) == 3
+        assert sum(len(chunk) for chunk in [first, *chunks]) == 6
+
+
 class TestStudyChunks:
     def test_a_large_source_splits_into_several_chunks(self, store):
         store.add("q" * 45000, origin_key="url:a.org")
-        chunks = store.iter_study_chunks(chunk_chars=14000)
+        chunks = list(store.iter_study_chunks(chunk_chars=14000))
         assert len(chunks) == 4
         assert all(len(text) <= 14000 for chunk in chunks for _, text in chunk)
 
@@ -171,7 +259,7 @@ class TestStudyChunks:
         """A source too big to share a slice keeps its own provenance."""
         store.add("a" * 20000, origin_key="url:a.org")
         store.add("b" * 20000, origin_key="url:b.org")
-        chunks = store.iter_study_chunks(chunk_chars=14000)
+        chunks = list(store.iter_study_chunks(chunk_chars=14000))
         assert all(len(chunk) == 1 for chunk in chunks)
 
     def test_sources_share_a_chunk_when_the_budget_allows(self, store):
@@ -183,7 +271,7 @@ class TestStudyChunks:
         """
         store.add("short one", origin_key="url:a.org")
         store.add("short two", origin_key="url:b.org")
-        chunks = store.iter_study_chunks(chunk_chars=14000)
+        chunks = list(store.iter_study_chunks(chunk_chars=14000))
         assert len(chunks) == 1
         assert {entry.origin_key for entry, _ in chunks[0]} == {"url:a.org", "url:b.org"}
 
@@ -191,7 +279,7 @@ class TestStudyChunks:
         store.add("a" * 6000, origin_key="url:a.org")
         store.add("b" * 6000, origin_key="url:b.org")
         store.add("c" * 6000, origin_key="url:c.org")
-        chunks = store.iter_study_chunks(chunk_chars=10000)
+        chunks = list(store.iter_study_chunks(chunk_chars=10000))
         assert len(chunks) == 3
         assert all(sum(len(t) for _, t in chunk) <= 10000 for chunk in chunks)
 
@@ -199,12 +287,12 @@ class TestStudyChunks:
         """An off-by-one that dropped or duplicated text would pass a count check."""
         store.add("a" * 25000, origin_key="url:a.org")
         store.add("b" * 3000, origin_key="url:b.org")
-        chunks = store.iter_study_chunks(chunk_chars=10000)
+        chunks = list(store.iter_study_chunks(chunk_chars=10000))
         rebuilt = "".join(text for chunk in chunks for _, text in chunk)
         assert rebuilt.count("a") == 25000
         assert rebuilt.count("b") == 3000
 
     def test_chunking_respects_the_overall_budget(self, store):
         store.add("m" * 40000, origin_key="url:a.org")
-        chunks = store.iter_study_chunks(chunk_chars=10000, max_chars=20000)
+        chunks = list(store.iter_study_chunks(chunk_chars=10000, max_chars=20000))
         assert sum(len(text) for chunk in chunks for _, text in chunk) <= 20000
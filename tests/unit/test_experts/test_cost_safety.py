@@ -722,7 +722,7 @@ class TestCostSafetyManager:
     def test_record_cost_writes_ledger_event(self):
         """record_cost should write canonical ledger event metadata."""
         with patch("deepr.experts.cost_safety.CostLedger") as mock_ledger_cls:
-            mock_ledger_cls.return_value.with_locked_accounting_events.return_value = (0.0, 0.0, 0.0)
+            mock_ledger_cls.return_value.with_locked_rollup.return_value = (0.0, 0.0, 0.0)
             manager = CostSafetyManager()
             mock_ledger = mock_ledger_cls.return_value
 
@@ -758,7 +758,7 @@ class TestCostSafetyManager:
         sensitive_path = tmp_path / "private" / "cost_ledger.jsonl"
         ledger_error = OSError(28, "No space left on device", str(sensitive_path))
         with patch("deepr.experts.cost_safety.CostLedger") as mock_ledger_cls:
-            mock_ledger_cls.return_value.with_locked_accounting_events.return_value = (0.0, 0.0, 0.0)
+            mock_ledger_cls.return_value.with_locked_rollup.return_value = (0.0, 0.0, 0.0)
             manager = CostSafetyManager()
             mock_ledger_cls.return_value.record_event.side_effect = ledger_error
 
@@ -782,7 +782,7 @@ class TestCostSafetyManager:
         sensitive_path = tmp_path / "private" / "cost_ledger.jsonl"
         ledger_error = OSError(28, "No space left on device", str(sensitive_path))
         with patch("deepr.experts.cost_safety.CostLedger") as mock_ledger_cls:
-            mock_ledger_cls.return_value.with_locked_accounting_events.return_value = (0.0, 0.0, 0.0)
+            mock_ledger_cls.return_value.with_locked_rollup.return_value = (0.0, 0.0, 0.0)
             manager = CostSafetyManager()
             mock_ledger_cls.return_value.record_event.side_effect = ledger_error
 
@@ -846,6 +846,18 @@ class TestGetCostSafetyManager:
         # Should be different instance with fresh state
         assert manager2.get_session_cost("test") == 0.0
 
+    @pytest.mark.parametrize(("value", "window"), [("4", 0.004), ("0", None), ("soon", None), ("nan", None)])
+    def test_group_commit_window_comes_from_the_environment(self, monkeypatch, value, window):
+        """DEEPR_COST_LEDGER_GROUP_COMMIT_MS turns on group commit for the shared ledger."""
+        monkeypatch.setenv("DEEPR_COST_LEDGER_GROUP_COMMIT_MS", value)
+
+        committer = get_cost_safety_manager()._ledger._group_commit
+
+        if window is None:
+            assert committer is None
+        else:
+            assert committer._window_seconds == pytest.approx(window)
+
 
 class TestResetCostSafetyManager:
     """Tests for reset_cost_safety_manager function."""
@@ -5,7 +5,8 @@ from unittest.mock import AsyncMock, MagicMock
 import numpy as np
 import pytest
 
-from deepr.experts import chat_capacity
+from deepr.experts import ann_index, chat_capacity, embedding_cache
+from deepr.experts.ann_index import IvfIndex
 from deepr.experts.embedding_cache import EmbeddingCache
 
 
@@ -99,7 +100,7 @@ class TestEmbeddingCachePersistence:
         assert cache2.index["abc123"]["filename"] == "test.md"
 
     def test_save_and_load_embeddings(self, tmp_path):
-        """Test embeddings are saved and loaded correctly."""
+        """Test embeddings are saved normalized and loaded correctly."""
         cache = EmbeddingCache("test-expert", cache_dir=tmp_path)
 
         # Add embeddings
@@ -112,7 +113,7 @@ class TestEmbeddingCachePersistence:
 
         assert cache2.embeddings is not None
         assert cache2.embeddings.shape == (2, 3)
-        np.testing.assert_array_equal(cache2.embeddings[0], [1.0, 2.0, 3.0])
+        np.testing.assert_allclose(cache2.embeddings[0], np.array([1.0, 2.0, 3.0]) / np.sqrt(14.0), rtol=1e-6)
 
 
 class TestEmbeddingCacheStats:
@@ -207,6 +208,30 @@ class TestEmbeddingCacheSearch:
         assert results[0]["filename"] == "doc2.md"
         assert results[0]["score"] > results[1]["score"]
 
+    @pytest.mark.asyncio
+    async def test_search_never_builds_or_writes_the_ann(self, tmp_path, monkeypatch, allow_embedding_unit_dispatch):
+        """A read loads a saved ANN index or scans exactly; only writes build one."""
+        monkeypatch.setattr(ann_index, "ANN_MIN_ROWS", 16)
+        monkeypatch.setattr(embedding_cache, "ANN_MIN_ROWS", 16)
+        cache_dir = tmp_path / "embeddings"
+        cache = EmbeddingCache("test-expert", cache_dir=cache_dir)
+        cache.embeddings = np.eye(32)
+        cache.index = {f"doc{n}": {"filename": f"doc{n}.md"} for n in range(32)}
+        cache._save_cache()
+        assert cache.ann_path.exists()
+        cache.ann_path.unlink()
+
+        reopened = EmbeddingCache("test-expert", cache_dir=cache_dir)
+        before = {path: path.stat().st_mtime_ns for path in cache_dir.rglob("*")}
+        monkeypatch.setattr(IvfIndex, "build", classmethod(lambda cls, *a, **k: pytest.fail("search built an index")))
+        mock_client = AsyncMock()
+        mock_client.embeddings.create = AsyncMock(return_value=MagicMock(data=[MagicMock(embedding=np.eye(32)[5])]))
+
+        results = await reopened.search("test query", mock_client, top_k=1)
+
+        assert results[0]["filename"] == "doc5.md"
+        assert {path: path.stat().st_mtime_ns for path in cache_dir.rglob("*")} == before
+
 
 class TestEmbeddingCacheAddDocuments:
     """Test document addition (mocked API calls)."""
@@ -290,3 +315,28 @@ class TestEmbeddingCacheAddDocuments:
 
         assert added == 0
         mock_client.embeddings.create.assert_not_called()
+
+
+class TestEmbeddingCacheRemoveDocuments:
+    """Test tombstoned documents drop out of search."""
+
+    @pytest.mark.asyncio
+    async def test_removed_document_is_not_returned(self, tmp_path, allow_embedding_unit_dispatch):
+        cache = EmbeddingCache("test-expert", cache_dir=tmp_path)
+        cache.embeddings = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+        cache.index = {
+            "doc1": {"filename": "doc1.md"},
+            "doc2": {"filename": "doc2.md"},
+            "doc3": {"filename": "doc3.md"},
+        }
+        cache._save_cache()
+
+        assert cache.remove_documents(["doc2"]) == 1
+
+        mock_client = AsyncMock()
+        mock_client.embeddings.create = AsyncMock(return_value=MagicMock(data=[MagicMock(embedding=[0.0, 1.0])]))
+        reloaded = EmbeddingCache("test-expert", cache_dir=tmp_path)
+        results = await reloaded.search("test query", mock_client, top_k=3)
+
+        assert [r["filename"] for r in results] == ["doc3.md", "doc1.md"]
+        assert "doc2" not in reloaded.index
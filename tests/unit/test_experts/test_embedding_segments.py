@@ -0,0 +1,118 @@
+"""Tests for append-only EmbeddingCache segment persistence."""
+
+import json
+
+import numpy as np
+
+from deepr.experts.embedding_segments import EmbeddingSegments
+
+
+def _meta(content_hash: str) -> dict:
+    return {"hash": content_hash, "filename": f"{content_hash}.md", "full_content": content_hash}
+
+
+def _append(segments: EmbeddingSegments, hashes: list[str], width: int = 4, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).normal(size=(len(hashes), width))
+    segments.append(vectors, [_meta(h) for h in hashes])
+    return vectors
+
+
+class TestAppend:
+    def test_first_write_creates_snapshot_and_segment(self, tmp_path):
+        segments = EmbeddingSegments(tmp_path)
+        _append(segments, ["a", "b"])
+
+        assert segments.snapshot_path.exists()
+        assert not segments.journal_path.exists()
+        assert len(list(segments.segments_dir.glob("seg-*.npy"))) == 1
+        np.testing.assert_allclose(np.linalg.norm(segments.matrix, axis=1), 1.0, rtol=1e-6)
+
+    def test_later_write_appends_without_rewriting_snapshot(self, tmp_path):
+        segments = EmbeddingSegments(tmp_path)
+        _append(segments, [f"doc{i}" for i in range(50)])
+        snapshot = segments.snapshot_path.read_bytes()
+
+        _append(segments, ["new"], seed=1)
+
+        assert segments.snapshot_path.read_bytes() == snapshot
+        records = [json.loads(line) for line in segments.journal_path.read_text().splitlines()]
+        assert [r["op"] for r in records] == ["add"]
+        assert list(records[0]["documents"]) == ["new"]
+        assert segments.row_of["new"] == 50
+
+    def test_reload_replays_journal(self, tmp_path):
+        segments = EmbeddingSegments(tmp_path)
+        first = _append(segments, [f"doc{i}" for i in range(50)])
+        second = _append(segments, ["x", "y"], seed=1)
+
+        reloaded = EmbeddingSegments(tmp_path)
+        reloaded.load()
+
+        assert reloaded.rows == 52
+        assert reloaded.row_ids[-2:] == ["x", "y"]
+        expected = np.vstack([first, second])
+        expected /= np.linalg.norm(expected, axis=1, keepdims=True)
+        np.testing.assert_allclose(reloaded.matrix, expected, rtol=1e-5)
+
+    def test_tail_merges_keep_segment_count_logarithmic(self, tmp_path):
+        segments = EmbeddingSegments(tmp_path)
+        _append(segments, [f"base{i}" for i in range(64)])
+        for batch in range(32):
+            _append(segments, [f"b{batch}"], seed=batch + 1)
+
+        assert len(segments.segments) <= 7
+        assert sum(seg["rows"] for seg in segments.segments) == segments.rows == 96
+        on_disk = {p.name for p in segments.segments_dir.glob("seg-*.npy")}
+        assert on_disk == {seg["name"] for seg in segments.segments}
+
+        reloaded = EmbeddingSegments(tmp_path)
+        reloaded.load()
+        np.testing.assert_array_equal(reloaded.matrix, segments.matrix)
+        assert reloaded.row_ids == segments.row_ids
+
+
+class TestRemove:
+    def test_remove_tombstones_row_and_survives_reload(self, tmp_path):
+        segments = EmbeddingSegments(tmp_path)
+        _append(segments, [f"doc{i}" for i in range(10)])
+
+        assert segments.remove(["doc3", "missing"]) == 1
+
+        assert "doc3" not in segments.documents
+        assert segments.row_ids[3] is None
+        assert segments.norms[3] == 0.0
+        reloaded = EmbeddingSegments(tmp_path)
+        reloaded.load()
+        assert reloaded.row_ids[3] is None
+        assert reloaded.norms[3] == 0.0
+        assert "doc3" not in reloaded.documents
+
+    def test_compaction_reclaims_tombstones(self, tmp_path):
+        segments = EmbeddingSegments(tmp_path)
+        _append(segments, [f"doc{i}" for i in range(8)])
+
+        segments.remove(["doc0", "doc1", "doc2"])
+
+        assert segments.rows == 5
+        assert None not in segments.row_ids
+        np.testing.assert_array_equal(segments.renumbered_rows, [3, 4, 5, 6, 7])
+        assert not segments.journal_path.exists()
+
+
+class TestLegacy:
+    def test_legacy_layout_is_read_and_converted_on_write(self, tmp_path):
+        (tmp_path / "index.json").write_text(json.dumps({"documents": {"a": _meta("a"), "b": _meta("b")}}))
+        np.save(tmp_path / "embeddings.npy", np.array([[3.0, 4.0], [0.0, 2.0]]))
+
+        segments = EmbeddingSegments(tmp_path)
+        segments.load()
+
+        assert segments.row_ids == ["a", "b"]
+        np.testing.assert_allclose(segments.matrix[0], [0.6, 0.8], rtol=1e-6)
+
+        segments.append(np.array([[1.0, 0.0]]), [_meta("c")])
+
+        assert not (tmp_path / "embeddings.npy").exists()
+        reloaded = EmbeddingSegments(tmp_path)
+        reloaded.load()
+        assert reloaded.row_ids == ["a", "b", "c"]
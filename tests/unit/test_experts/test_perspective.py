@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 
+from deepr.experts.belief_journal import compact_belief_store
 from deepr.experts.beliefs import Belief, BeliefChange, BeliefStore
 from deepr.experts.perspective import contested, temporal_edges, what_changed
 
@@ -488,9 +489,12 @@ class TestTypedEdges:
         challenger = _belief("X is not true", confidence=0.9)
         store.add_contested_belief(challenger, [existing])
 
-        # Simulate a pre-edge-store file: strip the edges key
+        # Simulate a pre-edge-store file: fold the journal into one full
+        # snapshot, then strip the edges key and the journal marker
+        compact_belief_store(store)
         data = _json.loads(store.storage_path.read_text(encoding="utf-8"))
         data.pop("edges", None)
+        data.pop("journal", None)
         store.storage_path.write_text(_json.dumps(data), encoding="utf-8")
 
         reloaded = BeliefStore("Test Expert", storage_dir=tmp_path / "beliefs")
@@ -0,0 +1,107 @@
+"""Cached roster counters: rebuilt only when an expert's state files change."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from deepr.experts.beliefs import Belief, BeliefStore
+from deepr.experts.paths import canonical_expert_dir
+from deepr.experts.profile import ExpertProfile
+from deepr.experts.roster_summary import SUMMARY_FILENAME, read_roster_summary
+
+
+class _CountingProfile(ExpertProfile):
+    manifest_reads = 0
+
+    def get_manifest(self, **kwargs):
+        type(self).manifest_reads += 1
+        return super().get_manifest(**kwargs)
+
+
+def _profile(name: str = "Roster Expert") -> _CountingProfile:
+    _CountingProfile.manifest_reads = 0
+    profile = _CountingProfile(name=name, vector_store_id="vs_test", total_documents=4)
+    canonical_expert_dir(name).mkdir(parents=True, exist_ok=True)
+    return profile
+
+
+def test_summary_is_cached_until_the_belief_store_changes():
+    profile = _profile()
+    store = BeliefStore(profile.name)
+    store.add_belief(Belief(claim="SQLite supports WAL mode", confidence=0.8, domain="db"))
+
+    first = read_roster_summary(profile)
+    second = read_roster_summary(profile)
+
+    assert _CountingProfile.manifest_reads == 1
+    assert first == second
+    assert (first.claim_count, first.belief_count, first.document_count) == (1, 1, 4)
+    assert first.avg_confidence == pytest.approx(next(iter(store.beliefs.values())).to_claim().confidence)
+    assert first.last_changed is not None
+    assert (canonical_expert_dir(profile.name) / SUMMARY_FILENAME).exists()
+
+    # The second add lands in the journal, not the snapshot.
+    store.add_belief(Belief(claim="Postgres has MVCC", confidence=0.6, domain="db"))
+    third = read_roster_summary(profile)
+
+    assert _CountingProfile.manifest_reads == 2
+    assert (third.claim_count, third.belief_count) == (2, 2)
+
+
+def test_gap_changes_invalidate_the_summary():
+    from deepr.experts.metacognition import MetaCognitionTracker
+
+    profile = _profile()
+    assert read_roster_summary(profile).gap_count == 0
+
+    MetaCognitionTracker(profile.name).record_knowledge_gap("vector clocks", confidence=0.1)
+    summary = read_roster_summary(profile)
+
+    assert _CountingProfile.manifest_reads == 2
+    assert (summary.gap_count, summary.open_gap_count) == (1, 1)
+
+
+def test_stale_or_corrupt_record_is_rebuilt():
+    profile = _profile()
+    read_roster_summary(profile)
+    path = canonical_expert_dir(profile.name) / SUMMARY_FILENAME
+    record = json.loads(path.read_text(encoding="utf-8"))
+    record["version"] = 0
+    path.write_text(json.dumps(record), encoding="utf-8")
+
+    read_roster_summary(profile)
+    path.write_text("{not json", encoding="utf-8")
+    summary = read_roster_summary(profile)
+
+    assert _CountingProfile.manifest_reads == 3
+    assert summary.manifest_available is True
+
+
+def test_unreadable_manifest_is_unknown_and_not_cached():
+    def get_manifest():
+        raise RuntimeError("belief store unreadable")
+
+    name = "Broken Expert"
+    canonical_expert_dir(name).mkdir(parents=True)
+    expert = SimpleNamespace(name=name, total_documents=2, get_manifest=get_manifest)
+
+    summary = read_roster_summary(expert)
+
+    assert summary.manifest_available is False
+    assert summary.is_empty is False
+    assert summary.document_count == 2
+    assert not (canonical_expert_dir(name) / SUMMARY_FILENAME).exists()
+
+
+def test_expert_without_a_directory_is_not_cached():
+    expert = SimpleNamespace(
+        name="Ghost Expert", total_documents=0, get_manifest=lambda: SimpleNamespace(claim_count=0, gaps=[])
+    )
+
+    summary = read_roster_summary(expert)
+
+    assert summary.is_empty is True
+    assert not (canonical_expert_dir("Ghost Expert") / SUMMARY_FILENAME).exists()
@@ -85,9 +85,10 @@ def test_belief_vector_index_persists_and_filters_stale_claims(tmp_path):
         "current_vector_count": 1,
         "missing_or_stale_count": 0,
         "dimensions": [2],
-        "path": str(store.storage_dir / "belief_vectors.json"),
+        "path": str(store.storage_dir / "belief_vectors.index.json"),
     }
-    assert loaded.vectors_for(store.beliefs.values(), model="local-test") == {belief.id: (0.7, 0.3)}
+    # Vectors are stored as float32.
+    assert loaded.vectors_for(store.beliefs.values(), model="local-test") == {belief.id: pytest.approx((0.7, 0.3))}
 
     belief.claim = "The claim changed after the vector was generated."
 
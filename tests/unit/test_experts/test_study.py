@@ -361,7 +361,7 @@ class TestRunStudy:
         assert "adversarial" in result.failed_lenses
         # One finding per chunk: the corpus has two sources, so the working
         # lens runs twice and its findings merge.
-        assert len(result.findings) == len(corpus.iter_study_chunks(chunk_chars=14000))
+        assert len(result.findings) == len(list(corpus.iter_study_chunks(chunk_chars=14000)))
 
     @pytest.mark.asyncio
     async def test_all_lenses_failing_is_exit_two(self, corpus):
@@ -0,0 +1,129 @@
+"""Lens x chunk calls run concurrently without changing what the pass records.
+
+Lenses are independent and so are the chunks within one, so a pooled backend
+can serve several at once. What must not move with the scheduling: outcomes in
+lens order, a checkpoint per finished lens, findings merged in chunk order, and
+a capacity failure stopping the pass rather than thinning it.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from deepr.experts.corpus_store import CorpusStore
+from deepr.experts.study import run_study
+from deepr.experts.study_contracts import LensOutcome
+from deepr.experts.study_lenses import LENSES
+
+SOURCES = [f"Source {n} explains how the reconciler handles slot number {n} under load." for n in range(4)]
+
+
+@pytest.fixture
+def chunked(tmp_path):
+    store = CorpusStore("Concurrent Study Expert", storage_dir=tmp_path / "corpus")
+    for n, text in enumerate(SOURCES):
+        store.add(text, origin_key=f"url:s{n}.example")
+    return store
+
+
+def _lens_of(prompt: str) -> str:
+    return next(key for key, lens in LENSES.items() if f'"{lens.output_field}"' in prompt)
+
+
+def _answer(prompt: str) -> str:
+    lens = LENSES[_lens_of(prompt)]
+    quoted = [text for text in SOURCES if text in prompt]
+    return json.dumps({lens.output_field: [{"name": text[:9], "anchors": [text[:40]]} for text in quoted]})
+
+
+def _study(corpus, completion, **kwargs):
+    # One source per chunk, so each lens is four calls.
+    options = {"lens_keys": ["failure", "mechanism", "contention"], "chunk_chars": 100}
+    options.update(kwargs)
+    return run_study(expert_name="E", corpus=corpus, completion=completion, **options)
+
+
+class TestConcurrentLenses:
+    @pytest.mark.asyncio
+    async def test_units_overlap_up_to_the_cap_and_results_match_a_serial_pass(self, chunked):
+        live = {"now": 0, "peak": 0}
+
+        async def slow(prompt: str) -> str:
+            live["now"] += 1
+            live["peak"] = max(live["peak"], live["now"])
+            # Later chunks answer first, so completion order is not chunk order.
+            await asyncio.sleep(0.01 * (4 - sum(text in prompt for text in SOURCES[:2])))
+            live["now"] -= 1
+            return _answer(prompt)
+
+        async def instant(prompt: str) -> str:
+            return _answer(prompt)
+
+        seen: list[list[str]] = []
+        concurrent = await _study(
+            chunked, slow, concurrency=4, checkpoint=lambda r: seen.append([o.lens for o in r.outcomes])
+        )
+        serial = await _study(chunked, instant)
+
+        assert live["peak"] == 4
+        assert [o.lens for o in concurrent.outcomes] == ["failure", "mechanism", "contention"]
+        assert [f.finding_id for f in concurrent.findings] == [f.finding_id for f in serial.findings]
+        # A checkpoint per finished lens, each listing only finished lenses in lens order.
+        assert seen == [["failure"], ["failure", "mechanism"], ["failure", "mechanism", "contention"]]
+
+    @pytest.mark.asyncio
+    async def test_each_outcome_carries_its_chunk_timings(self, chunked):
+        async def timed(prompt: str) -> str:
+            await asyncio.sleep(0.02 if _lens_of(prompt) == "mechanism" else 0)
+            return _answer(prompt)
+
+        result = await _study(chunked, timed, concurrency=8)
+
+        by_lens = {o.lens: o for o in result.outcomes}
+        assert all(len(o.chunk_elapsed_s) == o.chunks_total == 4 for o in result.outcomes)
+        assert min(by_lens["mechanism"].chunk_elapsed_s) > max(by_lens["failure"].chunk_elapsed_s)
+        assert by_lens["mechanism"].elapsed_s < sum(by_lens["mechanism"].chunk_elapsed_s)
+
+        restored = LensOutcome.from_dict(json.loads(json.dumps(by_lens["mechanism"].to_dict())))
+        assert restored.chunk_elapsed_s == pytest.approx(by_lens["mechanism"].chunk_elapsed_s, abs=0.01)
+
+
+class TestCapacityUnderConcurrency:
+    @pytest.mark.asyncio
+    async def test_exhaustion_stops_new_calls_and_keeps_finished_lenses(self, chunked):
+        calls: list[str] = []
+
+        async def dies_on_contention(prompt: str) -> str:
+            lens = _lens_of(prompt)
+            calls.append(lens)
+            if lens == "contention":
+                raise RuntimeError("plan quota exhausted")
+            return _answer(prompt)
+
+        result = await _study(
+            chunked, dies_on_contention, lens_keys=["failure", "contention", "mechanism"], concurrency=2
+        )
+
+        assert [o.lens for o in result.outcomes] == ["failure"]
+        # Nothing queued behind the failing call reaches the backend.
+        assert calls.count("contention") == 1
+        assert calls.count("mechanism") == 0
+        note = next(limit for limit in result.limitations if "Capacity ran out" in limit)
+        assert "lens 2/3 (contention)" in note
+        assert "2 lens(es) were never read" in note
+
+    @pytest.mark.asyncio
+    async def test_a_bug_in_one_unit_still_raises(self, chunked, monkeypatch):
+        from deepr.experts import study
+
+        def broken(*args, **kwargs):
+            raise KeyError("lens output shape")
+
+        monkeypatch.setattr(study, "build_findings", broken)
+
+        async def fine(prompt: str) -> str:
+            return _answer(prompt)
+
+        with pytest.raises(KeyError):
+            await _study(chunked, fine, concurrency=4)
@@ -16,6 +16,7 @@ Property tests validate:
 - Cache LRU eviction behavior
 """
 
+import math
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -667,7 +668,7 @@ class TestSubgraphCache:
         storage_dir.mkdir(parents=True, exist_ok=True)
         (storage_dir / "edges.json").write_text("[]", encoding="utf-8")
 
-        with patch("deepr.experts.lazy_graph_rag.json.load", side_effect=MemoryError("boom")):
+        with patch("deepr.experts.graph_store.json.load", side_effect=MemoryError("boom")):
             graph = KnowledgeGraph(expert_name="test_expert", storage_dir=storage_dir)
 
         assert graph is not None
@@ -690,6 +691,58 @@ class TestSubgraphCache:
         assert stats["max_size"] == 10
         assert stats["total_accesses"] >= 2
 
+    def test_key_ignores_case_spacing_and_punctuation(self):
+        """Normalized queries share one entry."""
+        cache = SubgraphCache(max_size=10)
+        cache.put("What is Python?", {"node1"})
+
+        assert cache.get("  what IS python ") is not None
+
+    def test_near_duplicate_lookup(self):
+        """Paraphrases hit only when a similarity threshold is configured."""
+        exact = SubgraphCache(max_size=10)
+        near = SubgraphCache(max_size=10, similarity_threshold=0.85)
+        for cache in (exact, near):
+            cache.put("how does quantum error correction work", {"node1"}, prompt_blocks=["Block"])
+            cache.put("battery chemistry", {"node2"})
+
+        assert exact.get("How do quantum error corrections work?") is None
+        hit = near.get("How do quantum error corrections work?")
+        assert hit is not None and hit.node_ids == {"node1"}
+        assert near.get("quantum battery chemistry") is None
+        stats = near.get_stats()
+        assert (stats["hits"], stats["near_hits"], stats["misses"]) == (1, 1, 1)
+
+    def test_invalidate_nodes_drops_only_touched_entries(self, tmp_path):
+        """Entries sharing a touched node go; the rest move to the new version."""
+        storage_path = tmp_path / "cache.json"
+        cache = SubgraphCache(max_size=10, storage_path=storage_path)
+        cache.bind_version("v1")
+        cache.put("query1", {"node1", "node2"})
+        cache.put("query2", {"node3"})
+
+        assert cache.invalidate_nodes({"node2", "other"}, graph_version="v2") == 1
+
+        assert cache.get("query1") is None
+        assert cache.get("query2").graph_version == "v2"
+        assert cache.get_stats()["invalidations"] == 1
+        reloaded = SubgraphCache(max_size=10, storage_path=storage_path)
+        assert reloaded.bind_version("v2") == 0
+        assert reloaded.get("query2") is not None
+
+    def test_bind_version_drops_entries_from_other_graph_states(self, tmp_path):
+        """A cache file written against another graph version serves nothing."""
+        storage_path = tmp_path / "cache.json"
+        cache = SubgraphCache(max_size=10, storage_path=storage_path)
+        cache.bind_version("v1")
+        cache.put("query1", {"node1"})
+
+        reloaded = SubgraphCache(max_size=10, storage_path=storage_path)
+
+        assert reloaded.bind_version("v9") == 1
+        assert reloaded.get("query1") is None
+        assert reloaded.get_stats()["invalidations"] == 1
+
 
 class TestKnowledgeGraph:
     """Tests for KnowledgeGraph class."""
@@ -878,6 +931,46 @@ class TestKnowledgeGraph:
         # Should find machine learning first
         assert results[0].text == "machine learning"
 
+    def test_search_ranks_by_boosted_jaccard_with_insertion_order_ties(self, tmp_path):
+        """Search scores concepts sharing a query word; ties keep insertion order."""
+        graph = KnowledgeGraph(expert_name="test_expert", storage_dir=tmp_path / "graph")
+        for text in ["graph storage", "graph traversal", "battery chemistry", "graph"]:
+            graph.add_concept(Concept(text=text))
+
+        results = graph.search("graph storage layout", top_k=10)
+
+        # graph storage: 2/3; graph: 1/3; graph traversal: 1/4; battery shares nothing.
+        assert [c.text for c in results] == ["graph storage", "graph", "graph traversal"]
+        assert [c.text for c in graph.search("graph", top_k=10)] == ["graph", "graph storage", "graph traversal"]
+
+    def test_adjacency_stays_sorted_when_edge_weight_grows(self, tmp_path):
+        """Re-weighting an edge re-slots it in both endpoints' neighbor lists."""
+        graph = KnowledgeGraph(expert_name="test_expert", storage_dir=tmp_path / "graph")
+        hub, a, b = (Concept(text=t) for t in ("hub", "alpha", "beta"))
+        for c in (hub, a, b):
+            graph.add_concept(c)
+        graph.add_edge(Edge(source_id=hub.id, target_id=a.id, edge_type=EdgeType.CO_OCCURS, weight=0.9))
+        graph.add_edge(Edge(source_id=hub.id, target_id=b.id, edge_type=EdgeType.CO_OCCURS, weight=0.2))
+
+        graph.add_edge(Edge(source_id=hub.id, target_id=b.id, edge_type=EdgeType.CO_OCCURS, weight=0.95))
+
+        assert [n.text for n, _ in graph.get_neighbors(hub.id)] == ["beta", "alpha"]
+        assert [e.weight for _, e in graph.adjacency[hub.id]] == [0.95, 0.9]
+        assert len(graph.adjacency[b.id]) == 1
+
+    def test_get_neighbors_min_weight_and_limit(self, tmp_path):
+        """Neighbor walks stop at the weight floor and the limit."""
+        graph = KnowledgeGraph(expert_name="test_expert", storage_dir=tmp_path / "graph")
+        hub = Concept(text="hub")
+        graph.add_concept(hub)
+        for i, weight in enumerate([0.1, 0.8, 0.5, 0.9, 0.3]):
+            other = Concept(text=f"n{i}")
+            graph.add_concept(other)
+            graph.add_edge(Edge(source_id=hub.id, target_id=other.id, edge_type=EdgeType.CO_OCCURS, weight=weight))
+
+        assert [e.weight for _, e in graph.get_neighbors(hub.id, min_weight=0.3)] == [0.9, 0.8, 0.5, 0.3]
+        assert [e.weight for _, e in graph.get_neighbors(hub.id, limit=2)] == [0.9, 0.8]
+
     def test_persistence(self, tmp_path):
         """Test graph persistence."""
         storage_dir = tmp_path / "graph"
@@ -900,6 +993,87 @@ class TestKnowledgeGraph:
         assert len(graph2.concepts) == 2
         assert len(graph2.edges) == 1
 
+    def test_save_rewrites_only_dirty_shards(self, tmp_path):
+        """A later save writes the changed concept's shard and the manifest only."""
+        from deepr.experts import graph_store
+
+        storage_dir = tmp_path / "graph"
+        graph = KnowledgeGraph(expert_name="test_expert", storage_dir=storage_dir)
+        for i in range(40):
+            graph.add_concept(Concept(text=f"topic {i}"))
+        graph.save()
+        assert (storage_dir / "manifest.json").exists()
+        assert len(list((storage_dir / "shards").glob("*.catalog.json"))) > 10
+
+        added = Concept(text="late topic")
+        graph.add_concept(added)
+        with patch.object(graph_store, "atomic_write_json", wraps=graph_store.atomic_write_json) as writes:
+            graph.save()
+
+        written = {call.args[0].name for call in writes.call_args_list}
+        key = graph_store.shard_key(added.id)
+        assert written == {"manifest.json", f"{key}.json", f"{key}.catalog.json"}
+
+    def test_reload_reads_only_touched_shards(self, tmp_path):
+        """Construction reads the manifest; traversal reads the shards it visits."""
+        storage_dir = tmp_path / "graph"
+        graph1 = KnowledgeGraph(expert_name="test_expert", storage_dir=storage_dir)
+        concepts = [Concept(text=f"node {i}") for i in range(60)]
+        for c in concepts:
+            graph1.add_concept(c)
+        graph1.add_edge(Edge(source_id=concepts[0].id, target_id=concepts[1].id, edge_type=EdgeType.CO_OCCURS))
+        graph1.save()
+
+        graph2 = KnowledgeGraph(expert_name="test_expert", storage_dir=storage_dir)
+        assert graph2._store._loaded == set()
+
+        visited = graph2.traverse([concepts[0].id], max_depth=1)
+
+        assert visited == {concepts[0].id, concepts[1].id}
+        assert len(graph2._store._loaded) <= 2
+        assert graph2.get_stats()["concept_count"] == 60
+        assert graph2.get_stats()["edge_types"] == {"co_occurs": 1}
+        assert [c.text for c in graph2.search("node", top_k=3)] == ["node 0", "node 1", "node 2"]
+
+    def test_legacy_graph_converted_on_save(self, tmp_path):
+        """concepts.json/edges.json graphs load in full and are sharded on save."""
+        import json
+
+        storage_dir = tmp_path / "graph"
+        storage_dir.mkdir(parents=True)
+        c1, c2 = Concept(text="machine learning"), Concept(text="neural networks")
+        edge = Edge(source_id=c1.id, target_id=c2.id, edge_type=EdgeType.CO_OCCURS, weight=0.7)
+        (storage_dir / "concepts.json").write_text(json.dumps([c1.to_dict(), c2.to_dict()]), encoding="utf-8")
+        (storage_dir / "edges.json").write_text(json.dumps([edge.to_dict()]), encoding="utf-8")
+
+        graph = KnowledgeGraph(expert_name="test_expert", storage_dir=storage_dir)
+        assert graph.get_concept_by_text("Machine Learning").id == c1.id
+        graph.save()
+
+        assert not (storage_dir / "concepts.json").exists()
+        assert not (storage_dir / "edges.json").exists()
+        reloaded = KnowledgeGraph(expert_name="test_expert", storage_dir=storage_dir)
+        assert [(n.text, e.weight) for n, e in reloaded.get_neighbors(c1.id)] == [("neural networks", 0.7)]
+        assert len(reloaded.edges) == 1
+
+    def test_unreadable_shard_refuses_overwrite(self, tmp_path):
+        """A corrupt shard read during traversal blocks later saves."""
+        from deepr.experts.graph_store import shard_key
+
+        storage_dir = tmp_path / "graph"
+        graph1 = KnowledgeGraph(expert_name="test_expert", storage_dir=storage_dir)
+        concept = Concept(text="machine learning")
+        graph1.add_concept(concept)
+        graph1.save()
+        shard = storage_dir / "shards" / f"{shard_key(concept.id)}.json"
+        shard.write_text("{not-json", encoding="utf-8")
+
+        graph2 = KnowledgeGraph(expert_name="test_expert", storage_dir=storage_dir)
+        assert graph2.get_concept(concept.id) is None
+        with pytest.raises(RuntimeError, match="unreadable graph"):
+            graph2.save()
+        assert shard.read_text(encoding="utf-8") == "{not-json"
+
     def test_unreadable_graph_refuses_overwrite(self, tmp_path):
         """Corrupt graph files must not be replaced by a later save."""
         storage_dir = tmp_path / "graph"
@@ -920,7 +1094,7 @@ class TestKnowledgeGraph:
         storage_dir.mkdir(parents=True, exist_ok=True)
         (storage_dir / "edges.json").write_text("[]", encoding="utf-8")
 
-        with patch("deepr.experts.lazy_graph_rag.json.load", side_effect=MemoryError("boom")):
+        with patch("deepr.experts.graph_store.json.load", side_effect=MemoryError("boom")):
             graph = KnowledgeGraph(expert_name="test_expert", storage_dir=storage_dir)
 
         assert graph is not None
@@ -994,6 +1168,106 @@ Neural networks are inspired by biological neurons.
         assert results["documents"] == 2
         assert results["concepts"] >= 0
 
+    @pytest.mark.asyncio
+    async def test_index_documents_saves_once_per_batch(self, tmp_path):
+        """Batches merge into the graph and save once each."""
+        rag = LazyGraphRAG(expert_name="test_expert", storage_dir=tmp_path / "rag")
+        documents = [{"id": f"doc{i}.md", "content": f"# Topic {i}\n\nPython handles topic {i}."} for i in range(5)]
+
+        with patch.object(rag.graph, "save", wraps=rag.graph.save) as save:
+            results = await rag.index_documents(documents, batch_size=2, workers=1)
+
+        assert save.call_count == 3
+        assert results["documents"] == 5
+        assert rag.graph.get_concept_by_text("python") is not None
+
+    @pytest.mark.asyncio
+    async def test_process_pool_indexing_matches_in_process(self, tmp_path):
+        """Worker-process extraction builds the same graph as in-process extraction."""
+        documents = [
+            {"id": "ml.md", "content": "# Machine Learning\n\nMachine learning uses neural networks."},
+            {"id": "bat.md", "content": "# Battery Chemistry\n\nBattery chemistry uses electrolytes."},
+            {"id": "mix.md", "content": "Neural networks predict battery chemistry."},
+        ]
+        serial = LazyGraphRAG(expert_name="test_expert", storage_dir=tmp_path / "serial")
+        pooled = LazyGraphRAG(expert_name="test_expert", storage_dir=tmp_path / "pooled")
+
+        await serial.index_documents(documents, workers=1)
+        await pooled.index_documents(documents, workers=2)
+
+        assert set(pooled.graph.concepts) == set(serial.graph.concepts)
+        assert set(pooled.graph.edges) == set(serial.graph.edges)
+        for concept_id, concept in serial.graph.concepts.items():
+            assert pooled.graph.concepts[concept_id].tf_idf_score == pytest.approx(concept.tf_idf_score)
+
+    @pytest.mark.asyncio
+    async def test_scores_do_not_depend_on_batch_size(self, tmp_path):
+        """IDF is taken over the whole call, not each merge batch."""
+        documents = [
+            {"id": f"doc{i}.md", "content": f"# Topic {i}\n\nPython handles topic {i % 2}. Graphs need python."}
+            for i in range(6)
+        ]
+        one = LazyGraphRAG(expert_name="test_expert", storage_dir=tmp_path / "one")
+        all_at_once = LazyGraphRAG(expert_name="test_expert", storage_dir=tmp_path / "all")
+
+        await one.index_documents(documents, batch_size=1)
+        await all_at_once.index_documents(documents, batch_size=100)
+
+        assert set(one.graph.concepts) == set(all_at_once.graph.concepts)
+        for concept_id, concept in all_at_once.graph.concepts.items():
+            assert one.graph.concepts[concept_id].tf_idf_score == pytest.approx(concept.tf_idf_score)
+
+    @pytest.mark.asyncio
+    async def test_small_calls_extract_in_process_by_default(self, tmp_path, monkeypatch):
+        """Chat indexes a few documents mid-turn; spawning workers for that is waste."""
+        from deepr.experts import graph_extraction
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("a process pool was started")
+
+        monkeypatch.setattr(graph_extraction, "ProcessPoolExecutor", no_pool)
+        rag = LazyGraphRAG(expert_name="test_expert", storage_dir=tmp_path / "rag")
+
+        results = await rag.index_documents([{"id": "a.md", "content": "Python handles graphs."}])
+
+        assert results["documents"] == 1
+        assert graph_extraction._pool_workers(graph_extraction.POOL_MIN_DOCUMENTS - 1, None) == 1
+        assert graph_extraction._pool_workers(graph_extraction.POOL_MIN_DOCUMENTS, None) >= 1
+        assert graph_extraction._pool_workers(3, 4) == 4
+
+    @pytest.mark.asyncio
+    async def test_ranking_does_not_depend_on_how_documents_are_grouped(self, tmp_path):
+        """Indexing documents one call at a time or all at once scores every concept the same."""
+        documents = [
+            {"id": f"doc{i}.md", "content": f"# Topic {i}\n\nPython handles topic {i % 3}. Graphs need python {i}."}
+            for i in range(6)
+        ]
+        one_by_one = LazyGraphRAG(expert_name="test_expert", storage_dir=tmp_path / "one")
+        all_at_once = LazyGraphRAG(expert_name="test_expert", storage_dir=tmp_path / "all")
+
+        for document in reversed(documents):
+            await one_by_one.index_document(document["id"], document["content"])
+        await all_at_once.index_documents(documents)
+
+        query = "python graphs topic handles"
+        assert [c.id for c in one_by_one.graph.search(query)] == [c.id for c in all_at_once.graph.search(query)]
+        for concept_id, concept in all_at_once.graph.concepts.items():
+            assert one_by_one.graph.concepts[concept_id].tf_idf_score == pytest.approx(concept.tf_idf_score)
+
+    @pytest.mark.asyncio
+    async def test_concepts_shared_across_documents_are_down_weighted(self, tmp_path):
+        """A concept in df graph documents scores 1 / (1 + ln df) of its best document score."""
+        rag = LazyGraphRAG(expert_name="test_expert", storage_dir=tmp_path / "rag")
+        await rag.index_document("alpha.md", "Python handles alpha. Python handles alpha.")
+        alone = rag.graph.get_concept_by_text("python").tf_idf_score
+
+        await rag.index_document("beta.md", "Python handles beta. Python handles beta.")
+
+        python = rag.graph.get_concept_by_text("python")
+        assert python.document_score == pytest.approx(alone)
+        assert python.tf_idf_score == pytest.approx(alone / (1 + math.log(2)))
+        assert rag.graph.get_concept_by_text("alpha").tf_idf_score == pytest.approx(alone)
+
     @pytest.mark.asyncio
     async def test_retrieve_simple_query(self, tmp_path):
         """Test retrieval with a simple query."""
@@ -1051,7 +1325,7 @@ Deep learning uses multiple layers of neural networks.
         storage_dir.mkdir(parents=True, exist_ok=True)
         (storage_dir / "edges.json").write_text("[]", encoding="utf-8")
 
-        with patch("deepr.experts.lazy_graph_rag.json.load", side_effect=MemoryError("boom")):
+        with patch("deepr.experts.graph_store.json.load", side_effect=MemoryError("boom")):
             graph = KnowledgeGraph(expert_name="test_expert", storage_dir=storage_dir)
 
         assert graph is not None
@@ -1070,6 +1344,38 @@ Deep learning uses multiple layers of neural networks.
         assert "cache" in stats
         assert stats["graph"]["concept_count"] >= 0
 
+    @pytest.mark.asyncio
+    async def test_indexing_invalidates_cached_subgraphs_it_touches(self, tmp_path):
+        """index_document drops cache entries whose concepts it touched."""
+        rag = LazyGraphRAG(expert_name="test_expert", storage_dir=tmp_path / "rag")
+        await rag.index_document("ml.md", "# Machine Learning\n\nMachine learning uses neural networks.")
+        await rag.index_document("bat.md", "# Battery Chemistry\n\nBattery chemistry uses electrolytes.")
+        ml = await rag.retrieve("machine learning")
+        battery = await rag.retrieve("battery chemistry")
+        assert ml["concepts"] and battery["concepts"]
+
+        await rag.index_document("ml2.md", "# Machine Learning\n\nMachine learning needs data.")
+
+        assert rag.cache.get("battery chemistry") is not None
+        assert rag.cache.get("machine learning") is None
+        assert rag.cache.get_stats()["invalidations"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_cache_from_another_graph_state_is_dropped(self, tmp_path):
+        """A fresh instance ignores subgraphs cached before the graph changed."""
+        storage_dir = tmp_path / "rag"
+        rag1 = LazyGraphRAG(expert_name="test_expert", storage_dir=storage_dir)
+        await rag1.index_document("ml.md", "# Machine Learning\n\nMachine learning uses neural networks.")
+        await rag1.retrieve("machine learning")
+        rag2 = LazyGraphRAG(expert_name="test_expert", storage_dir=storage_dir)
+        assert rag2.cache.get("machine learning") is not None
+
+        await rag2.index_document("bat.md", "# Battery Chemistry\n\nBattery chemistry uses electrolytes.")
+        rag1.cache.put("stale query", {"x"})  # older process writes the file with its old stamp
+
+        rag3 = LazyGraphRAG(expert_name="test_expert", storage_dir=storage_dir)
+        assert rag3.cache.get("stale query") is None
+
     @pytest.mark.asyncio
     async def test_persistence(self, tmp_path):
         """Test LazyGraphRAG persistence."""
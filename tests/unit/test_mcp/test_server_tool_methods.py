@@ -53,11 +53,11 @@ def _lifecycle_owner(*, settled_cost: float = 0.0, cancel_confirmed: bool = True
 
 
 @pytest.fixture
-def mock_server():
+def mock_server(tmp_path):
     """Build a DeeprMCPServer with mocked external collaborators."""
     with (
         patch("deepr.mcp.server.ExpertStore"),
-        patch("deepr.mcp.server.load_config", return_value={}),
+        patch("deepr.mcp.server.load_config", return_value={"results_dir": str(tmp_path / "reports")}),
         patch("deepr.mcp.server.get_resource_handler") as mock_rh,
     ):
         rh = MagicMock()
@@ -1,5 +1,6 @@
 """Tests for SQLite queue implementation."""
 
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,6 +10,7 @@ from deepr.experts.cost_safety import CostSafetyManager
 from deepr.experts.research_cost_gate import reserve_research_cost, settle_research_cost
 from deepr.observability.cost_ledger import CostLedger
 from deepr.queue import JobStatus, ResearchJob, SQLiteQueue
+from deepr.queue.base import encode_job_cursor
 
 
 @pytest.mark.asyncio
@@ -603,3 +605,188 @@ class TestSQLiteQueueAdvanced:
         assert stats["total"] == 0
         assert stats["queued"] == 0
         assert stats["processing"] == 0
+
+    async def test_concurrent_dequeue_claims_each_job_once(self, queue):
+        """Parallel workers never receive the same job."""
+        import asyncio
+
+        for index in range(20):
+            await queue.enqueue(ResearchJob(id=f"job-{index:02d}", prompt="p", priority=index % 3))
+
+        claimed = await asyncio.gather(*(queue.dequeue(f"worker-{n}") for n in range(30)))
+
+        jobs = [job for job in claimed if job is not None]
+        assert len(jobs) == 20
+        assert len({job.id for job in jobs}) == 20
+        assert all(job.status == JobStatus.PROCESSING and job.attempts == 1 for job in jobs)
+
+    async def test_dequeue_claim_uses_covering_index(self, queue):
+        """The claim subquery is answered from the (status, priority, submitted_at, id) index."""
+        plan = (
+            queue._conn()
+            .execute("""
+            EXPLAIN QUERY PLAN
+            SELECT id FROM research_queue
+            WHERE status = 'queued'
+            ORDER BY priority DESC, submitted_at ASC
+            LIMIT 1
+        """)
+            .fetchall()
+        )
+
+        assert any("COVERING INDEX idx_claim" in row[-1] for row in plan)
+
+    async def test_connections_are_reused_per_thread_and_closed(self, queue):
+        """A thread keeps one connection until close() drops the pool."""
+        first = queue._conn()
+        queue._enqueue_sync(ResearchJob(id="reused", prompt="p"))
+        assert queue._conn() is first
+
+        queue.close()
+
+        assert queue._conn() is not first
+        assert (await queue.get_job("reused")) is not None
+
+    async def test_open_connections_are_released(self, tmp_path):
+        """Leaving a with block, dropping the queue, or ending a thread closes its connections."""
+        import gc
+        import sqlite3
+        import threading
+
+        def closed(conn):
+            try:
+                conn.execute("SELECT 1")
+            except sqlite3.ProgrammingError:
+                return True
+            return False
+
+        with SQLiteQueue(str(tmp_path / "with.db")) as scoped:
+            in_block = scoped._conn()
+        assert closed(in_block)
+
+        queue = SQLiteQueue(str(tmp_path / "dropped.db"))
+        opened: list = []
+
+        def open_in_a_thread():
+            worker = threading.Thread(target=lambda pool=queue: opened.append(pool._conn()))
+            worker.start()
+            worker.join()
+
+        open_in_a_thread()
+        open_in_a_thread()
+        # The first worker had exited, so the second one's open closed its connection.
+        assert closed(opened[0])
+        assert not closed(opened[1])
+
+        mine = queue._conn()
+        queue = None
+        gc.collect()
+        assert closed(mine)
+        assert closed(opened[1])
+
+
+@pytest.mark.asyncio
+class TestSQLiteQueueListing:
+    """Server-side filtering, search and keyset paging in list_jobs."""
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        return SQLiteQueue(str(tmp_path / "test_queue.db"))
+
+    @staticmethod
+    def _job(n, **overrides):
+        fields = {
+            "id": f"job-{n:02d}",
+            "prompt": f"Quantum topic {n}" if n % 2 else f"Solar topic {n}",
+            "model": "o3-deep-research" if n % 3 else "o4-mini-deep-research",
+            "status": JobStatus.COMPLETED,
+            "submitted_at": datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=n),
+            "completed_at": datetime(2026, 1, 2, tzinfo=UTC) + timedelta(minutes=n % 4),
+            "cost": float(n % 5),
+        }
+        fields.update(overrides)
+        return ResearchJob(**fields)
+
+    async def _pages(self, queue, **options):
+        pages, cursor = [], None
+        while True:
+            page = await queue.list_jobs(limit=4, cursor=cursor, **options)
+            pages.append([job.id for job in page])
+            if len(page) < 4:
+                return pages
+            cursor = encode_job_cursor(page[-1], options.get("sort_by", "submitted_at"))
+
+    @pytest.mark.parametrize("sort_by", ["submitted_at", "completed_at", "cost", "model"])
+    async def test_keyset_pages_match_full_ordering(self, queue, sort_by):
+        jobs = [self._job(n) for n in range(11)]
+        for job in jobs:
+            await queue.enqueue(job)
+
+        pages = await self._pages(queue, status=JobStatus.COMPLETED, sort_by=sort_by)
+
+        expected = await queue.list_jobs(status=JobStatus.COMPLETED, sort_by=sort_by, limit=100)
+        assert [job_id for page in pages for job_id in page] == [job.id for job in expected]
+        assert [len(page) for page in pages] == [4, 4, 3]
+        if sort_by == "cost":
+            assert [job.cost for job in expected] == sorted((job.cost for job in jobs), reverse=True)
+
+    async def test_search_matches_substrings_case_insensitively(self, queue):
+        for n in range(6):
+            await queue.enqueue(self._job(n))
+        await queue.enqueue(self._job(20, prompt="Pending quantum work", status=JobStatus.QUEUED))
+
+        matches = await queue.list_jobs(status=JobStatus.COMPLETED, search="QUANT")
+        short = await queue.list_jobs(search="ar")
+
+        assert [job.id for job in matches] == ["job-05", "job-03", "job-01"]
+        assert await queue.count_jobs(status=JobStatus.COMPLETED, search="QUANT") == 3
+        assert await queue.count_jobs(search="quant") == 4
+        assert {job.id for job in short} == {"job-00", "job-02", "job-04"}
+
+    async def test_search_index_follows_deletes_and_backfills_existing_rows(self, queue, tmp_path):
+        await queue.enqueue(self._job(1))
+        await queue.enqueue(self._job(3, completed_at=datetime.now(UTC)))
+        conn = queue._conn()
+        conn.execute("DROP TABLE research_queue_fts")
+        conn.commit()
+        queue.close()
+
+        reopened = SQLiteQueue(str(tmp_path / "test_queue.db"))
+        assert await reopened.count_jobs(search="quantum") == 2
+
+        assert await reopened.cleanup_old_jobs(days=30) == 1
+        assert [job.id for job in await reopened.list_jobs(search="quantum")] == ["job-03"]
+
+    async def test_invalid_cursor_or_sort_raises(self, queue):
+        await queue.enqueue(self._job(1))
+        cursor = encode_job_cursor(self._job(1), "cost")
+
+        with pytest.raises(ValueError):
+            await queue.list_jobs(sort_by="model", cursor=cursor)
+        with pytest.raises(ValueError):
+            await queue.list_jobs(cursor="not-a-cursor")
+        with pytest.raises(ValueError):
+            await queue.list_jobs(sort_by="priority")
+
+    async def test_update_results_stores_report_summary(self, queue):
+        await queue.enqueue(self._job(1, cost=None))
+        report = "Intro https://a.example and http://b.example\n" + "x" * 600
+
+        assert await queue.update_results("job-01", {"markdown": "report.md"}, report_text=report)
+        assert await queue.update_results("job-01", {"markdown": "report.md"})
+
+        job = await queue.get_job("job-01")
+        assert job.result_preview == report[:500]
+        assert job.citations_count == 2
+
+    async def test_store_result_summary_fills_only_missing_previews(self, queue):
+        await queue.enqueue(self._job(1))
+        await queue.enqueue(self._job(2, result_preview="Stored", citations_count=0))
+
+        assert await queue.store_result_summary("job-01", "Legacy http://a")
+        assert not await queue.store_result_summary("job-02", "Rewritten http://b")
+        assert not await queue.store_result_summary("missing", "text")
+
+        legacy, stored = await queue.get_job("job-01"), await queue.get_job("job-02")
+        assert (legacy.result_preview, legacy.citations_count) == ("Legacy http://a", 1)
+        assert (stored.result_preview, stored.citations_count) == ("Stored", 0)
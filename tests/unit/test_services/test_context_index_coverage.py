@@ -3,7 +3,7 @@
 Targets:
 - DB / FTS schema bootstrap
 - _scan_reports / _is_indexed / _generate_report_id
-- index_reports (with embedding stubs)
+- index_reports (with embedding stubs), batching and segment appends
 - search (semantic + keyword + boost-on-overlap)
 - get_stats / clear
 - find_related (exclude job, missing path)
@@ -126,15 +126,19 @@ class TestIndexReports:
         client = MagicMock()
 
         async def fake_create(model, input):
-            # Return a deterministic embedding per input.
-            seed = sum(ord(c) for c in input) % 1024
-            vec = np.full(1536, seed / 1024.0, dtype=np.float32)
-            return MagicMock(data=[MagicMock(embedding=list(vec))])
+            # Return a deterministic embedding per input text in the batch.
+            data = []
+            for text in input:
+                seed = sum(ord(c) for c in text) % 1024
+                data.append(MagicMock(embedding=list(np.full(1536, seed / 1024.0, dtype=np.float32))))
+            return MagicMock(data=data)
 
         client.embeddings.create = AsyncMock(side_effect=fake_create)
         with patch("openai.AsyncOpenAI", return_value=client):
             n = await tmp_index.index_reports(include_semantic=True, max_total_cost_usd=1.0)
         assert n == 2
+        # One provider call for the whole batch.
+        client.embeddings.create.assert_awaited_once()
         # Embeddings persisted on disk.
         assert tmp_index.embeddings_path.exists()
         # Both reports recorded.
@@ -221,6 +225,91 @@ class TestIndexReports:
         assert n == 0
 
 
+def _per_text_client() -> MagicMock:
+    """Embedding client returning one distinct vector per input text."""
+
+    async def fake_create(model, input):
+        return MagicMock(data=[MagicMock(embedding=[float(len(text)), 1.0, 0.0]) for text in input])
+
+    client = MagicMock()
+    client.embeddings.create = AsyncMock(side_effect=fake_create)
+    return client
+
+
+class TestBulkIndexing:
+    @pytest.mark.asyncio
+    async def test_semantic_index_embeds_one_batch_per_call(self, tmp_index, monkeypatch):
+        monkeypatch.setattr("deepr.services.context_index.EMBEDDING_BATCH_SIZE", 2)
+        for n in range(5):
+            _write_report(tmp_index.reports_dir, f"j_{n}", "p" * (n + 1))
+        client = _per_text_client()
+
+        with patch("openai.AsyncOpenAI", return_value=client):
+            assert await tmp_index.index_reports(include_semantic=True, max_total_cost_usd=1.0) == 5
+
+        assert client.embeddings.create.await_count == 3
+        import sqlite3
+
+        with sqlite3.connect(tmp_index.db_path) as conn:
+            rows = conn.execute("SELECT prompt, embedding_idx FROM reports").fetchall()
+        for prompt, embedding_idx in rows:
+            assert tmp_index.embeddings[embedding_idx][0] == len(f"{prompt}\n\nReport body")
+
+    @pytest.mark.asyncio
+    async def test_later_runs_append_a_segment_instead_of_rewriting(self, tmp_index):
+        for job_id in ("j_a", "j_b"):
+            _write_report(tmp_index.reports_dir, job_id, f"prompt {job_id}")
+        with patch("openai.AsyncOpenAI", return_value=_per_text_client()):
+            await tmp_index.index_reports(include_semantic=True, max_total_cost_usd=1.0)
+            base = tmp_index.embeddings_path.read_bytes()
+            _write_report(tmp_index.reports_dir, "j_c", "prompt j_c")
+            await tmp_index.index_reports(include_semantic=True, max_total_cost_usd=1.0)
+
+        assert tmp_index.embeddings_path.read_bytes() == base
+        assert [p.name for p in tmp_index.segments_dir.iterdir()] == ["seg-000000002.npy"]
+        reopened = ContextIndex(data_dir=tmp_index.data_dir, reports_dir=tmp_index.reports_dir)
+        np.testing.assert_array_equal(reopened.embeddings, tmp_index.embeddings)
+        assert reopened.get_stats()["embedding_count"] == 3
+
+    def test_load_skips_segments_already_folded_into_the_base(self, tmp_index):
+        np.save(tmp_index.embeddings_path, np.eye(3))
+        tmp_index.segments_dir.mkdir()
+        np.save(tmp_index.segments_dir / "seg-000000002.npy", np.ones((1, 3)))
+        np.save(tmp_index.segments_dir / "seg-000000003.npy", np.full((1, 3), 7.0))
+
+        tmp_index._load_embeddings()
+
+        assert tmp_index.embeddings.shape == (4, 3)
+        assert tmp_index.embeddings[3][0] == 7.0
+
+    @pytest.mark.asyncio
+    async def test_fts_follows_reindex_and_clear(self, tmp_index):
+        _write_report(tmp_index.reports_dir, "j_fts", "kubernetes operators")
+
+        await tmp_index.index_reports()
+        await tmp_index.index_reports(force=True)
+
+        assert [r.job_id for r in tmp_index._keyword_search("kubernetes", 5)] == ["j_fts"]
+        tmp_index.clear()
+        assert tmp_index._keyword_search("kubernetes", 5) == []
+
+    def test_rows_indexed_before_triggers_are_rebuilt_into_fts(self, tmp_index):
+        import sqlite3
+
+        with sqlite3.connect(tmp_index.db_path) as conn:
+            for trigger in ("reports_fts_ai", "reports_fts_ad", "reports_fts_au"):
+                conn.execute(f"DROP TRIGGER {trigger}")
+            conn.execute(
+                "INSERT INTO reports (report_id, job_id, prompt, created_at, report_path, summary, indexed_at) "
+                "VALUES ('r1', 'j_old', 'legacy topic', '2026-01-01T00:00:00+00:00', '/tmp/x', '', '')"
+            )
+        assert tmp_index._keyword_search("legacy", 5) == []
+
+        reopened = ContextIndex(data_dir=tmp_index.data_dir, reports_dir=tmp_index.reports_dir)
+
+        assert [r.job_id for r in reopened._keyword_search("legacy", 5)] == ["j_old"]
+
+
 # ---------------------------------------------------------------------- #
 # search / find_related / keyword fallback
 # ---------------------------------------------------------------------- #
@@ -482,6 +482,7 @@ async def test_completion_persists_reserved_ceiling_when_usage_is_missing() -> N
         report_paths={"markdown": "report.md"},
         cost=0.75,
         tokens_used=0,
+        report_text="result\n",
     )
 
 
@@ -536,6 +537,7 @@ async def test_empty_completion_settles_cost_and_marks_failed() -> None:
         report_paths={},
         cost=0.75,
         tokens_used=0,
+        report_text=None,
     )
     queue.update_status.assert_awaited_once_with(
         job.id,
@@ -0,0 +1,110 @@
+"""Tests for the shared query-embedding cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from deepr.experts import chat_capacity
+from deepr.experts.embedding_cache import EmbeddingCache
+from deepr.services.query_embedding_cache import QueryEmbeddingCache, normalize_query_text
+
+
+def test_normalize_query_text_collapses_whitespace():
+    assert normalize_query_text("  what   is\n RAG? ") == "what is RAG?"
+
+
+def test_round_trip_is_exact_and_keyed_by_model(tmp_path):
+    cache = QueryEmbeddingCache(tmp_path / "q.db")
+    vector = [0.1, -0.25, 1.0 / 3.0]
+
+    cache.put("model-a", "What is RAG?", vector)
+
+    assert cache.get("model-a", "what is RAG?") is None
+    assert cache.get("model-a", "What  is RAG? ") == tuple(vector)
+    assert cache.get("model-b", "What is RAG?") is None
+
+
+def test_shared_between_instances(tmp_path):
+    QueryEmbeddingCache(tmp_path / "q.db").put("m", "query", [1.0, 2.0])
+
+    assert QueryEmbeddingCache(tmp_path / "q.db").get("m", "query") == (1.0, 2.0)
+
+
+def test_evicts_least_recently_used_past_byte_bound(tmp_path):
+    cache = QueryEmbeddingCache(tmp_path / "q.db", max_bytes=3 * 8 * 4)
+    for name in ("a", "b", "c"):
+        cache.put("m", name, [1.0] * 4)
+    assert cache.get("m", "a") is not None  # refresh "a"
+
+    cache.put("m", "d", [1.0] * 4)
+
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "a") is not None
+    assert cache.stats()["size_bytes"] <= cache.max_bytes
+
+
+def test_lookups_do_not_rerun_schema_setup(tmp_path, monkeypatch):
+    import sqlite3
+
+    from deepr.services import query_embedding_cache
+
+    QueryEmbeddingCache(tmp_path / "q.db").put("m", "query", [1.0])
+    statements: list[str] = []
+    connect = sqlite3.connect
+
+    def traced(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(query_embedding_cache.sqlite3, "connect", traced)
+    cache = QueryEmbeddingCache(tmp_path / "q.db")
+    cache.put("m", "other", [2.0])
+
+    assert cache.get("m", "query") == (1.0,)
+    assert statements
+    assert not [sql for sql in statements if "PRAGMA" in sql or "CREATE" in sql]
+
+
+def test_deleted_database_is_recreated_after_one_miss(tmp_path):
+    cache = QueryEmbeddingCache(tmp_path / "q.db")
+    cache.put("m", "query", [1.0])
+    (tmp_path / "q.db").unlink()
+    for sidecar in tmp_path.glob("q.db-*"):
+        sidecar.unlink()
+
+    assert cache.get("m", "query") is None
+    cache.put("m", "query", [1.0])
+    assert cache.get("m", "query") == (1.0,)
+
+
+def test_unreadable_database_is_a_miss(tmp_path):
+    path = tmp_path / "q.db"
+    path.write_bytes(b"not a sqlite database" * 10)
+    cache = QueryEmbeddingCache(path)
+
+    cache.put("m", "query", [1.0])
+
+    assert cache.get("m", "query") is None
+
+
+@pytest.mark.asyncio
+async def test_repeated_expert_search_skips_embedding_call(tmp_path, monkeypatch):
+    async def execute_test_call(*, call, **_kwargs):
+        return await call()
+
+    monkeypatch.setattr(chat_capacity, "require_expert_chat_dispatch", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("deepr.experts.chat_metered.execute_metered_chat_provider_call", execute_test_call)
+    cache = EmbeddingCache("test-expert", cache_dir=tmp_path / "embeddings")
+    cache.embeddings = np.array([[1.0, 0.0], [0.0, 1.0]])
+    cache.index = {"doc1": {"filename": "doc1.md"}, "doc2": {"filename": "doc2.md"}}
+    client = AsyncMock()
+    client.embeddings.create = AsyncMock(return_value=MagicMock(data=[MagicMock(embedding=[0.0, 1.0])]))
+
+    first = await cache.search("which doc?", client, top_k=1)
+    second = await cache.search("which  doc?", client, top_k=1)
+
+    assert first == second
+    assert first[0]["filename"] == "doc2.md"
+    client.embeddings.create.assert_awaited_once()
@@ -1,11 +1,12 @@
 """Tests for FindingsStore - covers the SQLite-backed findings index.
 
-Exercises store/retrieve, ranking, multi-finding queries, and the
-delete-by-job path.
+Exercises store/retrieve, ranking, multi-finding queries, the
+delete-by-job path, and the upgrade of older databases.
 """
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -88,6 +89,63 @@ class TestStoreAndRetrieve:
         remaining = await store.retrieve_relevant(job_id="keep-me", query="shared")
         assert [finding.text for finding in remaining] == ["beta shared"]
 
+    @pytest.mark.asyncio
+    async def test_ranking_uses_only_the_jobs_own_statistics(self, store):
+        # "common" is rare in job "j" but everywhere in the other job; only
+        # job "j" should decide how much a match on it is worth.
+        for n in range(20):
+            await store.store_finding(job_id="other", phase=1, text=f"common filler {n}")
+        await store.store_finding(job_id="j", phase=1, text="common signal")
+        for n in range(3):
+            await store.store_finding(job_id="j", phase=1, text=f"signal noise {n}")
+
+        results = await store.retrieve_relevant(job_id="j", query="common signal", top_k=2)
+
+        assert results[0].text == "common signal"
+        assert all(finding.job_id == "j" for finding in results)
+
+    @pytest.mark.asyncio
+    async def test_confidence_filter_applies_before_top_k(self, store):
+        await store.store_finding(job_id="j", phase=1, text="apple apple apple", confidence=0.1)
+        await store.store_finding(job_id="j", phase=1, text="apple pie", confidence=0.9)
+
+        results = await store.retrieve_relevant(job_id="j", query="apple", top_k=1, min_confidence=0.5)
+
+        assert [finding.text for finding in results] == ["apple pie"]
+
+
+class TestSchemaMigration:
+    @pytest.mark.asyncio
+    async def test_older_database_gains_job_scoped_postings(self, tmp_path: Path):
+        db_path = tmp_path / "findings.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE findings (
+                id TEXT PRIMARY KEY, job_id TEXT NOT NULL, phase INTEGER NOT NULL, text TEXT NOT NULL,
+                confidence REAL NOT NULL DEFAULT 0.5, source TEXT, finding_type TEXT NOT NULL DEFAULT 'fact',
+                timestamp TEXT NOT NULL, metadata_json TEXT NOT NULL DEFAULT '{}'
+            );
+            CREATE TABLE finding_tokens (
+                finding_id TEXT NOT NULL, token TEXT NOT NULL, count INTEGER NOT NULL DEFAULT 1,
+                PRIMARY KEY (finding_id, token)
+            );
+            INSERT INTO findings VALUES ('f1', 'old-job', 1, 'legacy apple note', 0.5, NULL, 'fact',
+                                         '2026-01-01T00:00:00+00:00', '{}');
+            INSERT INTO finding_tokens VALUES ('f1', 'legacy', 1), ('f1', 'apple', 1), ('f1', 'note', 1);
+        """)
+        conn.commit()
+        conn.close()
+
+        store = FindingsStore(db_path=db_path)
+        try:
+            results = await store.retrieve_relevant(job_id="old-job", query="apple")
+            length = store._conn.execute("SELECT token_count FROM findings WHERE id = 'f1'").fetchone()[0]
+        finally:
+            store.close()
+
+        assert [finding.id for finding in results] == ["f1"]
+        assert length == 3
+
 
 class TestTokenizer:
     def test_short_tokens_dropped(self):
@@ -174,3 +174,17 @@ def test_cost_estimate_fails_closed_on_invalid_estimate_bounds(
     payload = response.get_json()
     assert payload["allowed"] is False
     assert payload["money_state"] == "unknown"
+
+
+def test_cost_trends_read_daily_totals_from_ledger_rollup() -> None:
+    ledger = CostLedger()
+    ledger.record_event(operation="research", provider="openai", cost_usd=1.25, idempotency_key="trend-a")
+    ledger.record_event(operation="chat", provider="xai", cost_usd=0.5)
+    ledger.record_event(operation="research", provider="openai", cost_usd=1.25, idempotency_key="trend-a")
+
+    response = web_app.app.test_client().get("/api/cost/trends?days=3")
+
+    assert response.status_code == 200
+    trends = response.get_json()["trends"]
+    assert [day["cost"] for day in trends["daily"]] == [0, 0, 1.75]
+    assert trends["cumulative"] == 1.75
@@ -182,6 +182,21 @@ class TestASourceIsAddressedByItsHash:
         assert b"do not serve me" not in response.data
 
 
+class TestTheCorpus:
+    def test_a_superseded_source_is_listed_once(self, client, fleet) -> None:
+        """The index is appended between compactions, so a revision repeats a sha."""
+        from deepr.experts.corpus_store import CorpusStore
+
+        store = CorpusStore("flooding", storage_dir=fleet / "flooding" / "corpus")
+        old, _ = store.add("first revision", origin_key="url:example.org")
+        new, _ = store.add("second revision", origin_key="url:example.org")
+        store.supersede(old.sha256, new.sha256)
+
+        corpus = client.get("/api/experts/flooding/corpus").get_json()["corpus"]
+        assert [s["sha256"] for s in corpus["sources"]] == sorted([old.sha256, new.sha256])
+        assert [s["sha256"] for s in corpus["active"]] == [new.sha256]
+
+
 class TestFleetHealth:
     def test_never_consulted_expert_does_not_500(self, client, fleet, monkeypatch: pytest.MonkeyPatch) -> None:
         """`.get(name)` is None for experts with no consult trace; to_dict used to crash."""
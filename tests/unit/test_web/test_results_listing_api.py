@@ -0,0 +1,111 @@
+"""Results library listing: queue-side paging and stored previews."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from deepr.queue import JobStatus, ResearchJob, SQLiteQueue
+from deepr.web import app as web_app
+
+
+class _RecordingStorage:
+    def __init__(self, reports: dict[str, str] | None = None):
+        self.reports = reports or {}
+        self.reads: list[str] = []
+
+    async def get_report(self, job_id: str, filename: str) -> bytes:
+        self.reads.append(job_id)
+        return self.reports[job_id].encode("utf-8")
+
+
+@pytest.fixture
+def results_queue(tmp_path, monkeypatch):
+    queue = SQLiteQueue(str(tmp_path / "queue.db"))
+    for n in range(5):
+        queue._enqueue_sync(
+            ResearchJob(
+                id=f"job-{n}",
+                prompt=f"Topic {n}",
+                status=JobStatus.COMPLETED,
+                submitted_at=datetime(2026, 1, 1, tzinfo=UTC),
+                completed_at=datetime(2026, 1, 1, tzinfo=UTC) + timedelta(hours=n),
+                result_preview=f"Preview {n} https://example.com",
+                citations_count=1,
+            )
+        )
+    queue._enqueue_sync(ResearchJob(id="queued", prompt="Topic queued"))
+    monkeypatch.setattr(web_app, "queue", queue)
+    return queue
+
+
+def test_results_pages_by_cursor_without_reading_reports(results_queue, monkeypatch):
+    storage = _RecordingStorage()
+    monkeypatch.setattr(web_app, "storage", storage)
+    client = web_app.app.test_client()
+
+    first = client.get("/api/results?limit=2").get_json()
+    second = client.get(f"/api/results?limit=2&cursor={first['next_cursor']}").get_json()
+    last = client.get(f"/api/results?limit=2&cursor={second['next_cursor']}").get_json()
+
+    assert [row["id"] for row in first["results"]] == ["job-4", "job-3"]
+    assert [row["id"] for row in second["results"]] == ["job-2", "job-1"]
+    assert [row["id"] for row in last["results"]] == ["job-0"]
+    assert last["next_cursor"] is None
+    assert first["total"] == 5
+    assert second["results"][0]["content"] == "Preview 2 https://example.com"
+    assert second["results"][0]["citations_count"] == 1
+    assert storage.reads == []
+
+
+def test_results_fall_back_to_report_for_rows_without_preview(results_queue, monkeypatch):
+    results_queue._enqueue_sync(
+        ResearchJob(
+            id="legacy",
+            prompt="Legacy topic",
+            status=JobStatus.COMPLETED,
+            completed_at=datetime(2026, 2, 1, tzinfo=UTC),
+        )
+    )
+    storage = _RecordingStorage({"legacy": "Old report http://a http://b"})
+    monkeypatch.setattr(web_app, "storage", storage)
+
+    client = web_app.app.test_client()
+    body = client.get("/api/results?search=legacy").get_json()
+    again = client.get("/api/results?search=legacy").get_json()
+
+    assert body["total"] == 1
+    assert body["results"][0]["content"] == "Old report http://a http://b"
+    assert body["results"][0]["citations_count"] == 2
+    # The first listing stores the summary, so the report is read only once.
+    assert again["results"] == body["results"]
+    assert storage.reads == ["legacy"]
+    stored = results_queue._list_jobs_sync("SELECT * FROM research_queue WHERE id = 'legacy'", [])[0]
+    assert (stored.result_preview, stored.citations_count) == ("Old report http://a http://b", 2)
+
+
+def test_results_reject_malformed_cursor(results_queue, monkeypatch):
+    monkeypatch.setattr(web_app, "storage", SimpleNamespace())
+
+    response = web_app.app.test_client().get("/api/results?cursor=bogus")
+
+    assert response.status_code == 400
+
+
+def test_results_search_filters_in_queue(results_queue):
+    body = web_app.app.test_client().get("/api/results/search?q=topic 3").get_json()
+
+    assert body == {
+        "results": [
+            {
+                "id": "job-3",
+                "prompt": "Topic 3",
+                "model": "o3-deep-research",
+                "cost": 0,
+                "completed_at": "2026-01-01T03:00:00+00:00",
+            }
+        ],
+        "total": 1,
+    }
@@ -0,0 +1,122 @@
+"""Tests for the per-job provider polling schedule."""
+
+import pytest
+
+from deepr.worker.poll_schedule import PollSchedule
+
+
+def _schedule(**overrides):
+    # rand() == 0.5 cancels the jitter, so delays are exact.
+    options = {"min_delay": 10.0, "near_delay": 25.0, "max_delay": 60.0, "default_delay": 30.0, "rand": lambda: 0.5}
+    options.update(overrides)
+    return PollSchedule(**options)
+
+
+def _tracked(schedule, job_id="a"):
+    schedule.sync([job_id], now=0.0)
+    schedule.pop_due(0.0)
+    return schedule
+
+
+def _with_history(schedule, model="m"):
+    # Durations 200, 210, ..., 1190 seconds: the p-th percentile is 200 + 1000 * p.
+    for seconds in range(200, 1200, 10):
+        schedule.record_duration(model, float(seconds))
+    return schedule
+
+
+def test_new_jobs_are_due_immediately_and_missing_jobs_are_dropped():
+    schedule = _schedule()
+    schedule.sync(["a", "b"], now=100.0)
+
+    assert schedule.pop_due(100.0) == ["a", "b"]
+
+    schedule.sync(["b"], now=101.0)
+    assert "a" not in schedule
+    assert len(schedule) == 1
+
+
+def test_without_history_jobs_keep_the_default_cadence():
+    schedule = _tracked(_schedule())
+    for _ in range(4):
+        schedule.record_duration("m", 300.0)
+
+    assert schedule.first_check_delay("m", elapsed=0.0) == 0.0
+    assert schedule.duration_percentile("m", 0.5) is None
+    assert [schedule.reschedule("a", model="m", elapsed=e, now=0.0) for e in (0.0, 900.0)] == [30.0, 30.0]
+
+
+def test_first_check_waits_for_the_tenth_percentile():
+    schedule = _with_history(_schedule())
+
+    assert schedule.duration_percentile("m", 0.1) == 300.0
+    assert schedule.first_check_delay("m", elapsed=40.0) == 260.0
+    assert schedule.first_check_delay("m", elapsed=500.0) == 0.0
+
+    schedule.sync(["a", "b"], now=0.0, first_delays={"a": 260.0})
+    assert schedule.pop_due(0.0) == ["b"]
+    assert schedule.pop_due(259.0) == []
+    assert schedule.pop_due(260.0) == ["a"]
+
+
+def test_checks_tighten_inside_the_completion_window():
+    schedule = _tracked(_with_history(_schedule(max_delay=600.0)))
+
+    # Before the first percentile the wait is long; inside the window it is capped.
+    assert schedule.reschedule("a", model="m", elapsed=50.0, now=0.0) == 250.0
+    assert schedule.reschedule("a", model="m", elapsed=300.0, now=0.0) == 25.0
+    # A step to 15% more of the remaining completions that fits under the cap is taken as is.
+    assert schedule.reschedule("a", model="m", elapsed=1100.0, now=0.0) == 20.0
+    # Steps never drop below the minimum, and past every sample the wait is the maximum.
+    assert schedule.reschedule("a", model="m", elapsed=1160.0, now=0.0) == 10.0
+    assert schedule.reschedule("a", model="m", elapsed=5000.0, now=0.0) == 600.0
+
+
+def test_history_keeps_only_recent_completions():
+    schedule = _with_history(_schedule())
+    for _ in range(100):
+        schedule.record_duration("m", 60.0)
+
+    assert schedule.duration_percentile("m", 0.9) == 60.0
+    assert schedule.duration_percentile("other", 0.5) is None
+
+
+def test_jitter_spreads_delays_within_bounds():
+    low = _tracked(_schedule(rand=lambda: 0.0))
+    high = _tracked(_schedule(rand=lambda: 1.0))
+
+    assert low.reschedule("a", model="m", elapsed=0.0, now=0.0) == pytest.approx(24.0)
+    assert high.reschedule("a", model="m", elapsed=0.0, now=0.0) == pytest.approx(36.0)
+
+
+def test_wake_makes_a_scheduled_job_due_and_next_due_skips_stale_entries():
+    schedule = _schedule()
+    schedule.sync(["a", "b"], now=0.0)
+    schedule.pop_due(0.0)
+    schedule.reschedule("a", model="m", elapsed=0.0, now=0.0)
+    schedule.reschedule("b", model="m", elapsed=0.0, now=1.0)
+
+    schedule.wake("b", now=2.0)
+
+    assert schedule.next_due() == 2.0
+    assert schedule.pop_due(2.0) == ["b"]
+    assert schedule.next_due() == 30.0
+    schedule.wake("unknown", now=2.0)
+    assert "unknown" not in schedule
+
+
+def test_discarded_jobs_return_on_the_next_sync():
+    schedule = _tracked(_schedule())
+    schedule.discard("a")
+
+    assert "a" not in schedule
+    assert schedule.next_due() is None
+    schedule.sync(["a"], now=5.0)
+    assert schedule.pop_due(5.0) == ["a"]
+
+
+def test_rejects_inverted_delay_bounds():
+    with pytest.raises(ValueError):
+        PollSchedule(min_delay=10.0, max_delay=5.0)
+    with pytest.raises(ValueError):
+        PollSchedule(min_delay=10.0, near_delay=90.0, max_delay=60.0)
@@ -7,6 +7,7 @@ _handle_completion success + queue-update-failure, _handle_failure persistence.
 
 import asyncio
 import sys
+import time
 from collections import Counter
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -389,3 +390,157 @@ class TestHandleFailure:
     async def test_internal_exception_swallowed(self, poller):
         poller.queue.update_status = AsyncMock(side_effect=RuntimeError("db gone"))
         await poller._handle_failure(_job(), "broke")
+
+
+class TestAdaptiveSchedule:
+    @pytest.mark.asyncio
+    async def test_in_progress_job_waits_for_its_next_check(self, poller):
+        poller.queue.list_jobs = AsyncMock(return_value=[_job(id="a")])
+        poller.provider.get_status = AsyncMock(return_value=MagicMock(status="in_progress"))
+
+        await poller._poll_cycle()
+        await poller._poll_cycle()
+
+        poller.provider.get_status.assert_awaited_once_with("prov_1")
+        assert poller._schedule.next_due() > time.monotonic()
+
+    @pytest.mark.asyncio
+    async def test_webhook_makes_job_due_immediately(self, poller):
+        poller.queue.list_jobs = AsyncMock(return_value=[_job(id="a"), _job(id="b", provider_job_id="prov_2")])
+        poller.provider.get_status = AsyncMock(return_value=MagicMock(status="in_progress"))
+        await poller._poll_cycle()
+
+        poller.on_webhook("prov_2", {"status": "completed"})
+        poller.on_webhook(None)
+        await poller._poll_cycle()
+
+        assert [call.args[0] for call in poller.provider.get_status.await_args_list] == ["prov_1", "prov_2", "prov_2"]
+
+    @pytest.mark.asyncio
+    async def test_webhook_from_another_thread_ends_the_wait(self, poller):
+        import threading
+
+        poller.poll_interval = 60
+        poller._next_scan = time.monotonic() + 60
+        poller._loop = asyncio.get_running_loop()
+        wait = asyncio.create_task(poller._wait_for_next_check())
+        await asyncio.sleep(0)
+
+        threading.Thread(target=poller.on_webhook, args=("prov_9",)).start()
+
+        await asyncio.wait_for(wait, timeout=1.0)
+        assert poller._webhook_provider_job_ids == {"prov_9"}
+
+    @pytest.mark.asyncio
+    async def test_completion_durations_seed_the_schedule(self, poller):
+        history = []
+        for minutes in (4, 5, 6, 7, 8):
+            completed = MagicMock()
+            completed.model = "o4-mini"
+            completed.started_at = datetime(2026, 1, 1, tzinfo=UTC)
+            completed.completed_at = completed.started_at + timedelta(minutes=minutes)
+            history.append(completed)
+        poller.queue.list_jobs = AsyncMock(return_value=history)
+
+        await poller._seed_model_durations()
+
+        poller.queue.list_jobs.assert_awaited_once_with(status=JobStatus.COMPLETED, limit=200, sort_by="completed_at")
+        assert poller._schedule.duration_percentile("o4-mini", 0.5) == 360.0
+
+    @pytest.mark.asyncio
+    async def test_observed_completion_updates_model_duration(self, poller):
+        for _ in range(4):
+            poller._schedule.record_duration("m", 30.0)
+        job = _job(submitted_at=datetime.now(UTC) - timedelta(seconds=90))
+        poller.provider.get_status = AsyncMock(return_value=MagicMock(status="completed"))
+        poller._handle_completion = AsyncMock()
+
+        await poller._check_job_status(job)
+
+        assert poller._schedule.duration_percentile("m", 0.9) == pytest.approx(90.0, abs=5.0)
+
+    @pytest.mark.asyncio
+    async def test_first_check_waits_for_the_models_early_completions(self, poller):
+        for _ in range(5):
+            poller._schedule.record_duration("m", 600.0)
+        poller.queue.list_jobs = AsyncMock(return_value=[_job(id="a", submitted_at=datetime.now(UTC))])
+        poller.provider.get_status = AsyncMock()
+
+        await poller._poll_cycle()
+
+        poller.provider.get_status.assert_not_awaited()
+        assert poller._schedule.next_due() == pytest.approx(time.monotonic() + 600.0, abs=5.0)
+
+    @pytest.mark.asyncio
+    async def test_queue_is_rescanned_only_after_the_interval_or_a_webhook(self, poller):
+        poller.queue.list_jobs = AsyncMock(return_value=[_job(id="a")])
+        poller.provider.get_status = AsyncMock(return_value=MagicMock(status="in_progress"))
+
+        await poller._poll_cycle()
+        await poller._poll_cycle()
+        assert poller.queue.list_jobs.await_count == 1
+
+        poller.on_webhook("prov_1")
+        await poller._poll_cycle()
+        assert poller.queue.list_jobs.await_count == 2
+
+        poller._next_scan = time.monotonic()
+        await poller._poll_cycle()
+        assert poller.queue.list_jobs.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_finished_job_leaves_the_schedule_until_the_next_scan(self, poller):
+        poller.queue.list_jobs = AsyncMock(return_value=[_job(id="a")])
+        poller.provider.get_status = AsyncMock(return_value=MagicMock(status="completed"))
+        poller._handle_completion = AsyncMock(side_effect=lambda job, _response: poller._finished_job_ids.add(job.id))
+
+        await poller._poll_cycle()
+
+        assert "a" not in poller._schedule
+        assert poller._active_jobs == []
+        # Finalization left the job PROCESSING, so the next scan retries it.
+        poller._next_scan = time.monotonic()
+        await poller._poll_cycle()
+        assert poller._handle_completion.await_count == 2
+
+
+def test_cli_serves_webhooks_on_the_configured_port(monkeypatch):
+    from deepr.core.settings import get_settings
+    from deepr.worker import poller as poller_module
+
+    monkeypatch.setenv("DEEPR_WEBHOOK_PORT", "5123")
+    get_settings(reset=True)
+    run = AsyncMock()
+    monkeypatch.setattr(poller_module, "run_poller", run)
+    try:
+        poller_module.main(["--webhook", "--poll-interval", "45"])
+        poller_module.main(["--webhook-port", "6000"])
+        poller_module.main([])
+    finally:
+        monkeypatch.delenv("DEEPR_WEBHOOK_PORT")
+        get_settings(reset=True)
+
+    assert [call.kwargs for call in run.await_args_list] == [
+        {"poll_interval": 45, "webhook_port": 5123, "webhook_host": "127.0.0.1"},
+        {"poll_interval": 30, "webhook_port": 6000, "webhook_host": "127.0.0.1"},
+        {"poll_interval": 30, "webhook_port": None, "webhook_host": "127.0.0.1"},
+    ]
+
+
+def test_webhook_server_wakes_poller(poller, monkeypatch):
+    import hashlib
+    import hmac
+
+    from deepr.webhooks.server import create_webhook_server
+
+    monkeypatch.setenv("DEEPR_WEBHOOK_SECRET", "secret")
+    app = create_webhook_server(on_completion=poller.on_webhook)
+    body = b'{"id": "resp_1", "status": "completed"}'
+    signature = "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+
+    response = app.test_client().post(
+        "/webhook", data=body, content_type="application/json", headers={"X-Webhook-Signature": signature}
+    )
+
+    assert response.status_code == 200
+    assert poller._webhook_provider_job_ids == {"resp_1"}